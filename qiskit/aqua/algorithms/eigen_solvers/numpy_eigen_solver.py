@@ -19,9 +19,13 @@ import warnings
 import numpy as np
 from scipy import sparse as scisparse
 
+from qiskit.circuit import ParameterExpression
+
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import ClassicalAlgorithm
-from qiskit.aqua.operators import OperatorBase, LegacyBaseOperator, I, StateFn, ListOp
+from qiskit.aqua.operators import (OperatorBase, LegacyBaseOperator, I, StateFn, ListOp,
+                                   SummedOp, PauliOp)
+from qiskit.aqua.operators.legacy import PackedPauliTable
 from qiskit.aqua.utils.validation import validate_min
 from .eigen_solver import Eigensolver, EigensolverResult
 
@@ -31,6 +35,16 @@ logger = logging.getLogger(__name__)
 # pylint: disable=invalid-name
 
 
+def _pauli_table(operator: OperatorBase) -> Optional[PackedPauliTable]:
+    """ The table of the weighted Paulis of a sum of Paulis, None for other operators. """
+    # pylint: disable=protected-access
+    if isinstance(operator, PauliOp) and not isinstance(operator.coeff, ParameterExpression):
+        return PackedPauliTable.from_paulis([[operator.coeff, operator.primitive]])
+    if isinstance(operator, SummedOp) and operator._is_pauli_sum():
+        return operator._pauli_table()
+    return None
+
+
 class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
     r"""
     The NumPy Eigensolver algorithm.
@@ -42,13 +56,17 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         Operators are automatically converted to :class:`~qiskit.aqua.operators.MatrixOperator`
         as needed and this conversion can be costly in terms of memory and performance as the
         operator size, mostly in terms of number of qubits it represents, gets larger.
+        With ``matrix_free``, sums of Paulis are instead applied to the vectors by bitwise
+        kernels, so that only a few vectors of dimension :math:`2^n` are held in memory.
     """
 
     def __init__(self,
                  operator: Optional[Union[OperatorBase, LegacyBaseOperator]] = None,
                  k: int = 1,
                  aux_operators: Optional[List[Optional[Union[OperatorBase,
-                                                             LegacyBaseOperator]]]] = None
+                                                             LegacyBaseOperator]]]] = None,
+                 matrix_free: bool = False,
+                 warm_start: bool = False
                  ) -> None:
         """
         Args:
@@ -58,6 +76,11 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 application stack use this algorithm with an operator it creates.
             k: How many eigenvalues are to be computed, has a min. value of 1.
             aux_operators: Auxiliary operators to be evaluated at each eigenvalue
+            matrix_free: Whether the operator and the auxiliary operators which are sums of Paulis
+                are applied without building their matrices. The eigenvalues are then computed
+                by ARPACK, ``eigsh`` being used for Hermitian operators.
+            warm_start: Whether the lowest eigenvector of the previous run is the starting vector
+                of ARPACK, e.g. for the close operators of a scan of geometries.
         """
         validate_min('k', k, 1)
         super().__init__()
@@ -66,6 +89,9 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         self._aux_operators = None
         self._in_k = k
         self._k = k
+        self._matrix_free = matrix_free
+        self._warm_start = warm_start
+        self._last_eigvec = None  # type: Optional[np.ndarray]
 
         self.operator = operator
         self.aux_operators = aux_operators
@@ -121,6 +147,26 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         self._in_k = k
         self._check_set_k()
 
+    @property
+    def matrix_free(self) -> bool:
+        """ returns whether sums of Paulis are applied without building their matrices """
+        return self._matrix_free
+
+    @matrix_free.setter
+    def matrix_free(self, matrix_free: bool) -> None:
+        """ sets whether sums of Paulis are applied without building their matrices """
+        self._matrix_free = matrix_free
+
+    @property
+    def warm_start(self) -> bool:
+        """ returns whether ARPACK starts from the lowest eigenvector of the previous run """
+        return self._warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start: bool) -> None:
+        """ sets whether ARPACK starts from the lowest eigenvector of the previous run """
+        self._warm_start = warm_start
+
     def supports_aux_operators(self) -> bool:
         return True
 
@@ -134,6 +180,10 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 self._k = self._in_k
 
     def _solve(self) -> None:
+        table = _pauli_table(self._operator) if self._matrix_free else None
+        if table is not None and self._k < 2**(self._operator.num_qubits) - 1:
+            self._solve_matrix_free(table)
+            return
         sp_mat = self._operator.to_spmatrix()
         # If matrix is diagonal, the elements on the diagonal are the eigenvalues. Solve by sorting.
         if scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
@@ -148,12 +198,52 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 logger.debug("SciPy doesn't support to get all eigenvalues, using NumPy instead.")
                 eigval, eigvec = np.linalg.eig(self._operator.to_matrix())
             else:
-                eigval, eigvec = scisparse.linalg.eigs(self._operator.to_spmatrix(),
-                                                       k=self._k, which='SR')
+                eigval, eigvec = scisparse.linalg.eigs(
+                    sp_mat, k=self._k, which='SR',
+                    v0=self._start_vector(sp_mat.shape[0], sp_mat.dtype))
         if self._k > 1:
             idx = eigval.argsort()
             eigval = eigval[idx]
             eigvec = eigvec[:, idx]
+        self._last_eigvec = eigvec[:, 0]
+        self._ret['eigvals'] = eigval
+        self._ret['eigvecs'] = eigvec.T
+
+    def _start_vector(self, dim: int, dtype: np.dtype) -> Optional[np.ndarray]:
+        """ The starting vector of ARPACK, the lowest eigenvector of the previous run if warm
+        started on an operator of the same size. """
+        if not self._warm_start or self._last_eigvec is None \
+                or self._last_eigvec.shape != (dim,):
+            return None
+        if np.issubdtype(dtype, np.complexfloating):
+            return self._last_eigvec.astype(dtype)
+        # remove the global phase of a complex eigenvector before taking its real part
+        largest = self._last_eigvec[np.argmax(np.abs(self._last_eigvec))]
+        return np.real(self._last_eigvec * np.conj(largest) / abs(largest)).astype(dtype)
+
+    def _solve_matrix_free(self, table: PackedPauliTable) -> None:
+        dim = 2**(self._operator.num_qubits)
+        if not np.any(table.x):
+            # diagonal, the eigenvalues are the elements of the diagonal
+            diag = table.to_linear_operator().matvec(np.ones(dim))
+            temp = np.argsort(diag.real, kind='stable')[:self._k]
+            eigval = diag[temp]
+            eigvec = np.zeros((dim, self._k))
+            eigvec[temp, np.arange(self._k)] = 1.0
+        else:
+            # a sum of Paulis with real weights is Hermitian
+            simplified, _ = table.simplify()
+            hermitian = np.all(np.imag(simplified.coeffs) == 0)
+            operator = simplified.to_linear_operator()
+            v0 = self._start_vector(dim, operator.dtype)
+            if hermitian:
+                eigval, eigvec = scisparse.linalg.eigsh(operator, k=self._k, which='SA', v0=v0)
+            else:
+                eigval, eigvec = scisparse.linalg.eigs(operator, k=self._k, which='SR', v0=v0)
+            idx = eigval.real.argsort()
+            eigval = eigval[idx]
+            eigvec = eigvec[:, idx]
+        self._last_eigvec = eigvec[:, 0]
         self._ret['eigvals'] = eigval
         self._ret['eigvecs'] = eigvec.T
 
@@ -171,31 +261,60 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
             energies[i] = self._ret['eigvals'][i].real
         self._ret['energies'] = energies
         if self._aux_operators:
+            if self._matrix_free:
+                self._ret['aux_ops'] = self._eval_aux_operators_matrix_free(
+                    self._ret['eigvecs'])
+                return
             aux_op_vals = []
             for i in range(self._k):
                 aux_op_vals.append(self._eval_aux_operators(self._ret['eigvecs'][i]))
             self._ret['aux_ops'] = aux_op_vals
 
-    def _eval_aux_operators(self, wavefn, threshold: float = 1e-12) -> np.ndarray:
-        values = []  # type: List[Tuple[float, int]]
+    def _eval_aux_operators_matrix_free(self, wavefns: np.ndarray,
+                                        threshold: float = 1e-12) -> List[np.ndarray]:
+        """ The values of the auxiliary operators at all the eigenvectors at once, the sums of
+        Paulis being applied to all of them in one product. """
+        columns = []  # type: List[List[Optional[Tuple[float, int]]]]
         for operator in self._aux_operators:
             if operator is None:
-                values.append(None)
+                columns.append([None] * len(wavefns))
                 continue
-            value = 0.0
-            if operator.coeff != 0:
-                mat = operator.to_spmatrix()
-                # Terra doesn't support sparse yet, so do the matmul directly if so
-                # This is necessary for the particle_hole and other chemistry tests because the
-                # pauli conversions are 2^12th large and will OOM error if not sparse.
-                if isinstance(mat, scisparse.spmatrix):
-                    value = mat.dot(wavefn).dot(np.conj(wavefn))
-                else:
-                    value = StateFn(operator, is_measurement=True).eval(wavefn)
-                value = value.real if abs(value.real) > threshold else 0.0
-            values.append((value, 0))
+            table = _pauli_table(operator) if operator.coeff != 0 else None
+            if table is None:
+                columns.append([None if value is None else tuple(value) for value in
+                                [self._eval_single_aux_operator(operator, wavefn, threshold)
+                                 for wavefn in wavefns]])
+                continue
+            products = table.to_linear_operator().matmat(np.transpose(wavefns))
+            values = np.sum(np.conj(np.transpose(wavefns)) * products, axis=0)
+            columns.append([(value.real if abs(value.real) > threshold else 0.0, 0)
+                            for value in values])
+        return [np.array([column[i] for column in columns], dtype=object)
+                for i in range(len(wavefns))]
+
+    def _eval_aux_operators(self, wavefn, threshold: float = 1e-12) -> np.ndarray:
+        values = [self._eval_single_aux_operator(operator, wavefn, threshold)
+                  for operator in self._aux_operators]
         return np.array(values, dtype=object)
 
+    @staticmethod
+    def _eval_single_aux_operator(operator: Optional[OperatorBase], wavefn,
+                                  threshold: float) -> Optional[Tuple[float, int]]:
+        if operator is None:
+            return None
+        value = 0.0
+        if operator.coeff != 0:
+            mat = operator.to_spmatrix()
+            # Terra doesn't support sparse yet, so do the matmul directly if so
+            # This is necessary for the particle_hole and other chemistry tests because the
+            # pauli conversions are 2^12th large and will OOM error if not sparse.
+            if isinstance(mat, scisparse.spmatrix):
+                value = mat.dot(wavefn).dot(np.conj(wavefn))
+            else:
+                value = StateFn(operator, is_measurement=True).eval(wavefn)
+            value = value.real if abs(value.real) > threshold else 0.0
+        return (value, 0)
+
     def compute_eigenvalues(
             self,
             operator: Optional[Union[OperatorBase, LegacyBaseOperator]] = None,
@@ -33,14 +33,21 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
     def __init__(self,
                  operator: Optional[Union[OperatorBase, LegacyBaseOperator]] = None,
                  aux_operators: Optional[List[Optional[Union[OperatorBase,
-                                                             LegacyBaseOperator]]]] = None
+                                                             LegacyBaseOperator]]]] = None,
+                 matrix_free: bool = False,
+                 warm_start: bool = False
                  ) -> None:
         """
         Args:
             operator: Operator instance
             aux_operators: Auxiliary operators to be evaluated at minimum eigenvalue
+            matrix_free: Whether the operator and the auxiliary operators which are sums of Paulis
+                are applied without building their matrices.
+            warm_start: Whether the minimum eigenvector of the previous run is the starting vector
+                of ARPACK, e.g. for the close operators of a scan of geometries.
         """
-        self._ces = NumPyEigensolver(operator, 1, aux_operators)
+        self._ces = NumPyEigensolver(operator, 1, aux_operators,
+                                     matrix_free=matrix_free, warm_start=warm_start)
         # TODO remove
         self._ret = {}  # type: Dict[str, Any]
 
@@ -62,6 +69,26 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
                                                                   LegacyBaseOperator]]]]) -> None:
         self._ces.aux_operators = aux_operators
 
+    @property
+    def matrix_free(self) -> bool:
+        """ returns whether sums of Paulis are applied without building their matrices """
+        return self._ces.matrix_free
+
+    @matrix_free.setter
+    def matrix_free(self, matrix_free: bool) -> None:
+        """ sets whether sums of Paulis are applied without building their matrices """
+        self._ces.matrix_free = matrix_free
+
+    @property
+    def warm_start(self) -> bool:
+        """ returns whether ARPACK starts from the minimum eigenvector of the previous run """
+        return self._ces.warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start: bool) -> None:
+        """ sets whether ARPACK starts from the minimum eigenvector of the previous run """
+        self._ces.warm_start = warm_start
+
     def supports_aux_operators(self) -> bool:
         return self._ces.supports_aux_operators()
 
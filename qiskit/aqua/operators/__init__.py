@@ -138,7 +138,7 @@ from .legacy import (LegacyBaseOperator, WeightedPauliOperator, Z2Symmetries,
 
 # New Operators
 from .operator_base import OperatorBase
-from .primitive_ops import PrimitiveOp, PauliOp, MatrixOp, CircuitOp
+from .primitive_ops import PrimitiveOp, PauliOp, MatrixOp, CircuitOp, IsingOp
 from .state_fns import (StateFn, DictStateFn, VectorStateFn,
                         CircuitStateFn, OperatorStateFn)
 from .list_ops import ListOp, SummedOp, ComposedOp, TensoredOp
@@ -167,7 +167,7 @@ __all__ = [
     'MatrixOperator',
     # Operators
     'OperatorBase',
-    'PrimitiveOp', 'PauliOp', 'MatrixOp', 'CircuitOp',
+    'PrimitiveOp', 'PauliOp', 'MatrixOp', 'CircuitOp', 'IsingOp',
     'StateFn', 'DictStateFn', 'VectorStateFn', 'CircuitStateFn', 'OperatorStateFn',
     'ListOp', 'SummedOp', 'ComposedOp', 'TensoredOp',
     # Converters
@@ -12,13 +12,18 @@
 
 """ CircuitSampler Class """
 
-from typing import Optional, Dict, List, Union, cast, Any
+from typing import Optional, Dict, List, Union, cast, Any, Callable, Tuple
+import copy
 import logging
 from functools import partial
 from time import time
 
+import numpy as np
+import sympy
+
 from qiskit.providers import BaseBackend
-from qiskit.circuit import QuantumCircuit, Parameter, ParameterExpression
+from qiskit.circuit import (QuantumCircuit, Parameter, ParameterExpression, Instruction,
+                            ControlledGate)
 from qiskit import QiskitError
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua.utils.backend_utils import is_aer_provider, is_statevector_backend
@@ -31,6 +36,149 @@ from qiskit.aqua.operators.converters.converter_base import ConverterBase
 
 logger = logging.getLogger(__name__)
 
+_STANDARD_GATES_MODULE = 'qiskit.circuit.library.standard_gates'
+
+
+class _CircuitBinder:
+    """
+    Binds many parameterizations of a circuit template. The positions of the parameterized
+    instruction params are indexed once, and their expressions compiled to NumPy functions,
+    so that the bound circuits share all the unparameterized instructions of the template
+    instead of being copied and rebound entirely as in ``QuantumCircuit.assign_parameters``.
+    """
+
+    def __init__(self, circuit: QuantumCircuit) -> None:
+        self._circuit = circuit
+        self._parameters = set(circuit.parameters)
+        self._expressions = []  # type: List[ParameterExpression]
+        # (instruction index, param index, expression index) of each parameterized param
+        self._locations = []  # type: List[Tuple[int, int, int]]
+        expression_indices = {}  # type: Dict[ParameterExpression, int]
+        # only the instructions whose definition only depends on their params can be patched
+        self._patchable = not circuit.calibrations
+        for inst_index, (inst, _, _) in enumerate(circuit.data):
+            for param_index, param in enumerate(inst.params):
+                if not isinstance(param, ParameterExpression) or not param.parameters:
+                    continue
+                if param not in expression_indices:
+                    expression_indices[param] = len(self._expressions)
+                    self._expressions.append(param)
+                self._locations.append((inst_index, param_index, expression_indices[param]))
+                self._patchable = self._patchable and \
+                    type(inst).__module__.startswith(_STANDARD_GATES_MODULE)
+        self._global_phase_index = None  # type: Optional[int]
+        if isinstance(circuit.global_phase, ParameterExpression) \
+                and circuit.global_phase.parameters:
+            self._global_phase_index = len(self._expressions)
+            self._expressions.append(circuit.global_phase)
+        self._functions = [self._compile(expr) for expr in self._expressions]
+
+    @staticmethod
+    def _compile(expr: ParameterExpression) -> Optional[Callable]:
+        if isinstance(expr, Parameter):
+            return None
+        # pylint: disable=protected-access
+        params = list(expr._parameter_symbols.keys())
+        try:
+            # valid identifiers spare lambdify from replacing the symbols one by one
+            symbols = sympy.symbols('x_:{}'.format(len(params)), seq=True)
+            symbol_expr = expr._symbol_expr.xreplace(
+                {expr._parameter_symbols[param]: symbol for param, symbol in zip(params, symbols)})
+            function = sympy.lambdify(symbols, symbol_expr, 'numpy')
+        except Exception:  # pylint: disable=broad-except
+            return partial(_CircuitBinder._bind_expression, expr)
+        return lambda bindings: function(*[np.array([binding[param] for binding in bindings])
+                                           for param in params])
+
+    @staticmethod
+    def _bind_expression(expr: ParameterExpression,
+                         bindings: List[Dict[Parameter, float]]) -> List[complex]:
+        return [complex(expr.bind({param: binding[param] for param in expr.parameters}))
+                for binding in bindings]
+
+    def _values(self, bindings: List[Dict[Parameter, float]]) -> List[List[float]]:
+        """ Evaluates the parameterized expressions, returns the list of the values of each
+        expression for all the bindings. """
+        ret = []
+        for expr, function in zip(self._expressions, self._functions):
+            if function is None:
+                values = np.array([binding[expr] for binding in bindings])
+            else:
+                values = np.broadcast_to(function(bindings), (len(bindings),))
+            if np.iscomplexobj(values) and not np.any(np.imag(values)):
+                values = np.real(values)
+            ret.append(values.tolist())
+        return ret
+
+    def bind(self, bindings: List[Dict[Parameter, float]]) -> List[QuantumCircuit]:
+        """
+        Bind the template to each of the parameterizations.
+
+        Args:
+            bindings: the binding of each circuit, which must assign all the parameters of
+                the template.
+
+        Returns:
+            the bound circuits
+        """
+        # pylint: disable=protected-access
+        if not self._patchable or any(binding.keys() != self._parameters
+                                      for binding in bindings):
+            return [self._circuit.assign_parameters(binding) for binding in bindings]
+
+        values = self._values(bindings)
+        template = self._circuit
+        ret = []
+        for j in range(len(bindings)):
+            global_phase = template.global_phase
+            if self._global_phase_index is not None:
+                global_phase = values[self._global_phase_index][j]
+            # the instructions without parameters are shared with the template
+            bound = QuantumCircuit(*template.qregs, *template.cregs, name=template.name,
+                                   global_phase=global_phase)
+            bound._data = list(template._data)
+            new_insts = {}  # type: Dict[int, Instruction]
+            for inst_index, param_index, expr_index in self._locations:
+                new_inst = new_insts.get(inst_index)
+                if new_inst is None:
+                    inst, qargs, cargs = template._data[inst_index]
+                    new_inst = copy.copy(inst)
+                    if isinstance(inst, ControlledGate):
+                        # the params of a controlled gate are the ones of its base gate
+                        new_inst.base_gate = copy.copy(inst.base_gate)
+                        new_inst.base_gate._definition = None
+                    new_inst.params = list(inst.params)
+                    # standard gates define themselves from their params when needed
+                    new_inst._definition = None
+                    new_insts[inst_index] = new_inst
+                    bound._data[inst_index] = (new_inst, qargs, cargs)
+                new_inst.params[param_index] = values[expr_index][j]
+            ret.append(bound)
+        return ret
+
+    def aer_parameterizations(self, bindings: List[Dict[Parameter, float]]) -> List[List[Any]]:
+        """
+        Build the Aer ``parameterizations`` run config of each binding, the list of the
+        position in the template and the value of each parameterized instruction param.
+
+        Args:
+            bindings: the binding of each circuit
+
+        Returns:
+            the parameterization of each binding
+
+        Raises:
+            ValueError: a binding does not assign all the parameters of the template.
+        """
+        for binding in bindings:
+            for param in self._parameters:
+                if param not in binding:
+                    raise ValueError('unexpected parameter: {0}'.format(param))
+        values = self._values(bindings)
+        return [[[[inst_index, param_index], [values[expr_index][j]]]
+                 for inst_index, param_index, expr_index in self._locations]
+                for j in range(len(bindings))]
+
 
 class CircuitSampler(ConverterBase):
     """
@@ -82,6 +230,7 @@ class CircuitSampler(ConverterBase):
         self._circuit_ops_cache = {}  # type: Dict[int, CircuitStateFn]
         self._transpiled_circ_cache = None  # type: Optional[List[Any]]
         self._transpiled_circ_templates = None  # type: Optional[List[Any]]
+        self._circuit_binders = None  # type: Optional[List[_CircuitBinder]]
         self._transpile_before_bind = True
         self._binding_mappings = None
 
@@ -170,6 +319,7 @@ class CircuitSampler(ConverterBase):
             self._reduced_op_cache = None
             self._circuit_ops_cache = None
             self._transpiled_circ_cache = None
+            self._circuit_binders = None
             self._transpile_before_bind = True
 
         if not self._reduced_op_cache:
@@ -256,10 +406,14 @@ class CircuitSampler(ConverterBase):
                              r'now, but this can hurt performance due to repeated transpilation.')
                 self._transpile_before_bind = False
                 self._transpiled_circ_cache = circuits
+            self._circuit_binders = None
         else:
             circuit_sfns = list(self._circuit_ops_cache.values())
 
         if param_bindings is not None:
+            if self._circuit_binders is None:
+                self._circuit_binders = [_CircuitBinder(circ)
+                                         for circ in self._transpiled_circ_cache]
             if self._param_qobj:
                 start_time = time()
                 ready_circs = self._prepare_parameterized_run_config(param_bindings)
@@ -267,9 +421,8 @@ class CircuitSampler(ConverterBase):
                 logger.info('Parameter conversion %.5f (ms)', (end_time - start_time) * 1000)
             else:
                 start_time = time()
-                ready_circs = [circ.assign_parameters(binding)
-                               for circ in self._transpiled_circ_cache
-                               for binding in param_bindings]
+                ready_circs = [circ for binder in self._circuit_binders
+                               for circ in binder.bind(param_bindings)]
                 end_time = time()
                 logger.info('Parameter binding %.5f (ms)', (end_time - start_time) * 1000)
         else:
@@ -317,28 +470,6 @@ class CircuitSampler(ConverterBase):
             sampled_statefn_dicts[id(op_c)] = c_statefns
         return sampled_statefn_dicts
 
-    def _generate_aer_params(self,
-                             circuit: QuantumCircuit,
-                             input_params: Dict[Parameter, List[float]]
-                             ) -> List[List[Any]]:
-        ret = []
-
-        gate_index = 0
-        for inst, _, _ in circuit.data:
-            param_index = 0
-            for inst_param in inst.params:
-                param_mappings = {}
-                if isinstance(inst_param, ParameterExpression):
-                    for param in inst_param._parameter_symbols.keys():
-                        if param not in input_params:
-                            raise ValueError('unexpected parameter: {0}'.format(param))
-                        param_mappings[param] = input_params[param]
-                    val = float(inst_param.bind(param_mappings))
-                    ret.append([[gate_index, param_index], [val]])
-                param_index += 1
-            gate_index += 1
-        return ret
-
     def _prepare_parameterized_run_config(self, param_bindings:
                                           List[Dict[Parameter, List[float]]]) -> List[Any]:
 
@@ -349,15 +480,14 @@ class CircuitSampler(ConverterBase):
 
             # temporally resolve parameters of self._transpiled_circ_cache
             # They will be overridden in Aer from the next iterations
-            self._transpiled_circ_templates = [circ.assign_parameters(param_bindings[0])
-                                               for circ in self._transpiled_circ_cache]
+            self._transpiled_circ_templates = [binder.bind(param_bindings[:1])[0]
+                                               for binder in self._circuit_binders]
 
         ready_circ = []
-        for circ, temp in zip(self._transpiled_circ_cache, self._transpiled_circ_templates):
-            for param_binding in param_bindings:
-                self.quantum_instance._run_config.parameterizations.append(
-                    self._generate_aer_params(circ, param_binding))
-                ready_circ.append(temp)
+        for binder, temp in zip(self._circuit_binders, self._transpiled_circ_templates):
+            self.quantum_instance._run_config.parameterizations.extend(
+                binder.aer_parameterizations(param_bindings))
+            ready_circ.extend([temp] * len(param_bindings))
 
         return ready_circ
 
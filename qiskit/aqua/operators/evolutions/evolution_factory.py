@@ -48,8 +48,10 @@ class EvolutionFactory:
         if 'Matrix' in primitives:
             return MatrixEvolution()
 
-        elif 'Pauli' in primitives:
+        elif 'Pauli' in primitives or 'Ising' in primitives:
             # TODO figure out what to do based on qubits and hamming weight.
+            # IsingOps are exponentiated exactly by exp_i, the remaining EvolvedOps of IsingOps
+            # are converted to Paulis.
             return PauliTrotterEvolution()
 
         else:
@@ -12,10 +12,13 @@
 
 """ PauliTrotterEvolution Class """
 
-from typing import Optional, Union, cast
+from typing import Optional, Union, List, Tuple, cast
 import logging
 import numpy as np
 
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterExpression
+from qiskit.aqua import AquaError
 from ..operator_base import OperatorBase
 from ..operator_globals import Z, I
 from .evolution_base import EvolutionBase
@@ -24,8 +27,7 @@ from ..list_ops.summed_op import SummedOp
 from ..primitive_ops.pauli_op import PauliOp
 from ..primitive_ops.primitive_op import PrimitiveOp
 from ..converters.pauli_basis_change import PauliBasisChange
-# TODO uncomment when we implement Abelian grouped evolution.
-# from ..converters.abelian_grouper import AbelianGrouper
+from ..converters.abelian_grouper import AbelianGrouper
 from .evolved_op import EvolvedOp
 from .trotterizations.trotterization_base import TrotterizationBase
 from .trotterizations.trotterization_factory import TrotterizationFactory
@@ -43,13 +45,16 @@ class PauliTrotterEvolution(EvolutionBase):
     evolve the Z by the desired evolution time with an rZ gate, and change the basis back using
     the adjoint of the original basis change circuit. For sums of Paulis, the individual Pauli
     evolution circuits are composed together by Trotterization scheme.
+
+    With ``group_paulis``, the sums are first split into Abelian groups. The Paulis of a group are
+    diagonalized together by a single Clifford circuit, and evolved by a single diagonal circuit
+    of rZ gates on the parities of the qubits, so only the groups are trotterized.
     """
 
     def __init__(self,
                  trotter_mode: Optional[Union[str, TrotterizationBase]] = 'trotter',
                  reps: Optional[int] = 1,
-                 # TODO uncomment when we implement Abelian grouped evolution.
-                 # group_paulis: Optional[bool] = False
+                 group_paulis: Optional[bool] = False
                  ) -> None:
         """
         Args:
@@ -58,10 +63,9 @@ class PauliTrotterEvolution(EvolutionBase):
                 individual Pauli evolution circuits to equal the exponentiation of the Pauli sum.
             reps: How many Trotterization repetitions to make, to improve the approximation
                 accuracy.
-            # TODO uncomment when we implement Abelian grouped evolution.
-            # group_paulis: Whether to group Pauli sums into Abelian
-            #     sub-groups, so a single diagonalization circuit can be used for each group
-            #     rather than each Pauli.
+            group_paulis: Whether to group Pauli sums into Abelian
+                sub-groups, so a single diagonalization circuit can be used for each group
+                rather than each Pauli.
         """
 
         if isinstance(trotter_mode, TrotterizationBase):
@@ -69,8 +73,7 @@ class PauliTrotterEvolution(EvolutionBase):
         else:
             self._trotter = TrotterizationFactory.build(mode=trotter_mode, reps=reps)
 
-        # TODO uncomment when we implement Abelian grouped evolution.
-        # self._grouper = AbelianGrouper() if group_paulis else None
+        self._grouper = AbelianGrouper(traverse=False) if group_paulis else None
 
     @property
     def trotter(self) -> TrotterizationBase:
@@ -93,10 +96,6 @@ class PauliTrotterEvolution(EvolutionBase):
         Returns:
             The converted operator.
         """
-        # TODO uncomment when we implement Abelian grouped evolution.
-        # if self._grouper:
-        #     # Sort into commuting groups
-        #     operator = self._grouper.convert(operator).reduce()
         return self._recursive_convert(operator)
 
     def _recursive_convert(self, operator: OperatorBase) -> OperatorBase:
@@ -111,12 +110,7 @@ class PauliTrotterEvolution(EvolutionBase):
                 operator = EvolvedOp(pauli_ham, coeff=operator.coeff)
 
             if isinstance(operator.primitive, SummedOp):
-                # TODO uncomment when we implement Abelian grouped evolution.
-                # if operator.primitive.abelian:
-                #     return self.evolution_for_abelian_paulisum(operator.primitive)
-                # else:
-                trotterized = self.trotter.convert(operator.primitive)
-                return self._recursive_convert(trotterized)
+                return self._evolve_pauli_sum(operator.primitive)
             elif isinstance(operator.primitive, PauliOp):
                 return self.evolution_for_pauli(operator.primitive)
             # Covers ListOp, ComposedOp, TensoredOp
@@ -128,6 +122,21 @@ class PauliTrotterEvolution(EvolutionBase):
 
         return operator
 
+    def _evolve_pauli_sum(self, op_sum: SummedOp) -> OperatorBase:
+        """ Evolve a sum at once if it is Abelian, or else trotterize it, into its Abelian groups
+        if the Paulis are grouped. """
+        is_pauli_sum = all(isinstance(op, PauliOp) for op in op_sum.oplist)
+        if is_pauli_sum and self._grouper is not None and not op_sum.abelian:
+            # Sort into commuting groups, here rather than in convert so that the groups
+            # are not summed up again by a reduce
+            grouped = self._grouper.convert(op_sum)
+            if not isinstance(grouped, SummedOp) or not grouped.abelian:
+                return self._recursive_convert(self.trotter.convert(grouped))
+            op_sum = grouped
+        if is_pauli_sum and op_sum.abelian:
+            return self.evolution_for_abelian_paulisum(op_sum)
+        return self._recursive_convert(self.trotter.convert(op_sum))
+
     def evolution_for_pauli(self, pauli_op: PauliOp) -> PrimitiveOp:
         r"""
         Compute evolution Operator for a single Pauli using a ``PauliBasisChange``.
@@ -153,7 +162,173 @@ class PauliTrotterEvolution(EvolutionBase):
         cob = PauliBasisChange(destination_basis=destination, replacement_fn=replacement_fn)
         return cast(PrimitiveOp, cob.convert(pauli_op))
 
-    # TODO implement Abelian grouped evolution.
     def evolution_for_abelian_paulisum(self, op_sum: SummedOp) -> PrimitiveOp:
-        """ Evolution for abelian pauli sum """
-        raise NotImplementedError
+        r"""
+        Compute evolution Operator for a sum of mutually commuting Paulis. A Clifford circuit
+        :math:`U` maps each Pauli to :math:`U P_j U^\dagger = \pm Z^{z_j}`, and the evolution
+        is :math:`U^\dagger e^{-i \sum_j \pm w_j Z^{z_j}} U`, the diagonal part being a single
+        sequence of rZ gates on qubits which hold the parities :math:`z_j` of the inputs.
+
+        Args:
+            op_sum: The ``SummedOp`` of mutually commuting ``PauliOp`` to evolve.
+
+        Returns:
+            The evolution ``CircuitOp``.
+
+        Raises:
+            AquaError: If the Paulis do not commute.
+        """
+        num_qubits = op_sum.num_qubits
+        x = np.array([op.primitive.x for op in op_sum.oplist], dtype=bool)  # type: ignore
+        z = np.array([op.primitive.z for op in op_sum.oplist], dtype=bool)  # type: ignore
+        # the symplectic product of each pair of Paulis is zero if they commute
+        symplectic = (x.astype(np.uint8) @ z.T.astype(np.uint8)
+                      + z.astype(np.uint8) @ x.T.astype(np.uint8)) % 2
+        if np.any(symplectic):
+            raise AquaError('The Paulis of an Abelian sum must commute.')
+
+        clifford, z_masks, signs = _diagonalize_commuting_paulis(x, z)
+        angles = []  # type: List[Union[float, ParameterExpression]]
+        for op, sign in zip(op_sum.oplist, signs):
+            weight = op_sum.coeff * op.coeff
+            if not isinstance(weight, ParameterExpression):
+                weight = np.real(weight)
+            angles.append(-weight if sign else weight)
+
+        circuit = QuantumCircuit(num_qubits)
+        circuit.compose(clifford, inplace=True)
+        _append_phase_polynomial(circuit, z_masks, angles)
+        circuit.compose(clifford.inverse(), inplace=True)
+        return cast(PrimitiveOp, PrimitiveOp(circuit))
+
+
+def _diagonalize_commuting_paulis(x: np.ndarray,
+                                  z: np.ndarray) -> Tuple[QuantumCircuit, List[int], np.ndarray]:
+    """ A Clifford circuit U mapping each of the commuting Paulis (x, z) to a signed Z string,
+    U P U^dagger = (-1)^sign Z^mask, with the masks of the qubits of the Z strings. The signs are
+    tracked by the update rules of Aaronson and Gottesman, https://arxiv.org/abs/quant-ph/0406196.
+    """
+    x, z = x.copy(), z.copy()
+    signs = np.zeros(len(x), dtype=bool)
+    num_qubits = x.shape[1]
+    circuit = QuantumCircuit(num_qubits)
+
+    def apply_h(qubit):
+        signs[:] ^= x[:, qubit] & z[:, qubit]
+        x[:, qubit], z[:, qubit] = z[:, qubit].copy(), x[:, qubit].copy()
+        circuit.h(qubit)
+
+    def apply_s(qubit):
+        signs[:] ^= x[:, qubit] & z[:, qubit]
+        z[:, qubit] ^= x[:, qubit]
+        circuit.s(qubit)
+
+    def apply_cx(control, target):
+        signs[:] ^= x[:, control] & z[:, target] & ~(x[:, target] ^ z[:, control])
+        x[:, target] ^= x[:, control]
+        z[:, control] ^= z[:, target]
+        circuit.cx(control, target)
+
+    # rotate the qubits on which all the Paulis act with the same X or Y, as for a group of
+    # qubit-wise commuting Paulis
+    for qubit in range(num_qubits):
+        active = x[:, qubit] | z[:, qubit]
+        if np.any(x[:, qubit]) and np.all(x[active, qubit]) \
+                and np.all(z[active, qubit] == z[active, qubit][0]):
+            if z[active, qubit][0]:
+                apply_s(qubit)
+            apply_h(qubit)
+
+    # the Pauli of lowest X weight left is reduced to a single X by CNOTs, then rotated to Z,
+    # which keeps the Paulis already diagonal as they commute with it
+    weights = x.sum(axis=1)
+    while np.any(weights):
+        row = np.argmin(np.where(weights > 0, weights, num_qubits + 1))
+        pivot, *others = np.flatnonzero(x[row])
+        for target in others:
+            apply_cx(pivot, target)
+        if z[row, pivot]:
+            apply_s(pivot)
+        apply_h(pivot)
+        weights = x.sum(axis=1)
+
+    masks = [int(mask) for mask in z.astype(np.int64) @ (1 << np.arange(num_qubits))] \
+        if num_qubits < 63 else [sum(1 << int(q) for q in np.flatnonzero(row)) for row in z]
+    return circuit, masks, signs
+
+
+def _gray_rank(mask: int) -> int:
+    """ The position of a mask in the binary reflected Gray code. """
+    rank = 0
+    while mask:
+        rank ^= mask
+        mask >>= 1
+    return rank
+
+
+def _append_phase_polynomial(circuit: QuantumCircuit,
+                             masks: List[int],
+                             angles: List[Union[float, ParameterExpression]]) -> None:
+    """ Append exp(-i sum_j angle_j Z^mask_j) to the circuit. Each qubit holds the parity of some
+    inputs, the CNOTs making a qubit hold a mask only add to the current parities so that the
+    masks close to each other share them, and the inputs are restored at the end. The masks are
+    taken in Gray code order, so that consecutive masks differ by few inputs, and the parity
+    overwritten is the one of most inputs, the least likely to be needed again. """
+    num_qubits = circuit.num_qubits
+    # parities[q] is the mask of the inputs whose parity qubit q holds, and inverse[j] the mask
+    # of the qubits whose parities add up to input j
+    parities = [1 << qubit for qubit in range(num_qubits)]
+    inverse = [1 << qubit for qubit in range(num_qubits)]
+    cnots = []  # type: List[Tuple[int, int]]
+
+    def apply_cx(control, target):
+        parities[target] ^= parities[control]
+        for j in range(num_qubits):
+            if (inverse[j] >> target) & 1:
+                inverse[j] ^= 1 << control
+        cnots.append((control, target))
+        circuit.cx(control, target)
+
+    # the global phase of a circuit cannot be bound, it is applied by gates if it is a parameter
+    parameter_phase = 0  # type: Union[float, ParameterExpression]
+    for mask, angle in sorted(zip(masks, angles), key=lambda term: _gray_rank(term[0])):
+        if mask == 0:
+            if isinstance(angle, ParameterExpression):
+                parameter_phase += angle
+            else:
+                circuit.global_phase -= angle
+            continue
+        qubits = 0
+        for j in range(num_qubits):
+            if (mask >> j) & 1:
+                qubits ^= inverse[j]
+        subset = [qubit for qubit in range(num_qubits) if (qubits >> qubit) & 1]
+        target = max(subset, key=lambda qubit: (bin(parities[qubit]).count('1'), qubit))
+        for control in subset:
+            if control != target:
+                apply_cx(control, target)
+        circuit.rz(2 * angle, target)
+
+    # restore the inputs by Gauss-Jordan elimination, or by undoing the CNOTs if shorter
+    restore = []  # type: List[Tuple[int, int]]
+    rows = list(parities)
+    for col in range(num_qubits):
+        if not (rows[col] >> col) & 1:
+            source = next(q for q in range(col + 1, num_qubits) if (rows[q] >> col) & 1)
+            rows[col] ^= rows[source]
+            restore.append((source, col))
+        for qubit in range(num_qubits):
+            if qubit != col and (rows[qubit] >> col) & 1:
+                rows[qubit] ^= rows[col]
+                restore.append((col, qubit))
+    if len(restore) > len(cnots):
+        restore = cnots[::-1]
+    for control, target in restore:
+        circuit.cx(control, target)
+
+    if isinstance(parameter_phase, ParameterExpression):
+        # exp(-i phase) = X P(-phase) X P(-phase)
+        circuit.p(-parameter_phase, 0)
+        circuit.x(0)
+        circuit.p(-parameter_phase, 0)
+        circuit.x(0)
@@ -33,12 +33,15 @@ class QDrift(TrotterizationBase):
     of Earl Campbell in https://arxiv.org/abs/1811.08017.
     """
 
-    def __init__(self, reps: int = 1) -> None:
+    def __init__(self, reps: int = 1, lazy: bool = False) -> None:
         r"""
         Args:
             reps: The number of times to repeat the Trotterization circuit.
+            lazy: Whether to build the evolution of each term once, as a parameterized gate,
+                and return a ``CircuitOp`` of references to these gates, instead of the
+                exponential of each term before the sampling.
         """
-        super().__init__(reps=reps)
+        super().__init__(reps=reps, lazy=lazy)
 
     def convert(self, operator: OperatorBase) -> OperatorBase:
         if not isinstance(operator, SummedOp):
@@ -51,6 +54,15 @@ class QDrift(TrotterizationBase):
         N = 2 * (lambd ** 2) * (summed_op.coeff ** 2)
 
         factor = lambd * summed_op.coeff / (N * self.reps)
+        if self.lazy:
+            # the same samples as below, the terms being drawn by index
+            indices = aqua_globals.random.choice(len(summed_op.oplist),
+                                                 size=(int(N * self.reps),),  # type: ignore
+                                                 p=weights / lambd)
+            steps = [(index, factor / summed_op.oplist[index].coeff) for index in indices]
+            evolution = self._shared_evolution(summed_op.oplist, steps)
+            if evolution is not None:
+                return evolution
         # The protocol calls for the removal of the individual coefficients,
         # and multiplication by a constant factor.
         scaled_ops = \
@@ -12,7 +12,8 @@
 
 """ Suzuki Class """
 
-from typing import List, Union, cast
+from typing import List, Tuple, Union, cast
+from qiskit.circuit import ParameterExpression
 from qiskit.quantum_info import Pauli
 
 from .trotterization_base import TrotterizationBase
@@ -29,17 +30,25 @@ class Suzuki(TrotterizationBase):
     ``reps`` times.
 
     Detailed in https://arxiv.org/pdf/quant-ph/0508139.pdf.
+
+    With ``lazy``, the evolution of each term is built once and the expansion is a circuit of
+    gates referencing it, the whole composed circuit being a single gate repeated ``reps``
+    times, so the size of the conversion does not grow with the number of exponentials.
     """
     def __init__(self,
                  reps: int = 1,
-                 order: int = 2) -> None:
+                 order: int = 2,
+                 lazy: bool = False) -> None:
         """
         Args:
             reps: The number of times to repeat the expansion circuit.
             order: The order of the expansion to perform.
+            lazy: Whether to build the evolution of each term once, as a parameterized gate,
+                and return a ``CircuitOp`` of references to these gates, whose definitions are
+                only built when the circuit is decomposed.
 
         """
-        super().__init__(reps=reps)
+        super().__init__(reps=reps, lazy=lazy)
         self._order = order
 
     @property
@@ -56,6 +65,13 @@ class Suzuki(TrotterizationBase):
         if not isinstance(operator, SummedOp):
             raise TypeError('Trotterization converters can only convert SummedOps.')
 
+        if self.lazy:
+            steps = Suzuki._suzuki_time_steps(len(operator.oplist), operator.coeff,
+                                              self.order, self.reps)
+            evolution = self._shared_evolution(operator.oplist, steps, self.reps)
+            if evolution is not None:
+                return evolution
+
         composition_list = Suzuki._suzuki_recursive_expansion(
             cast(List[List[Union[complex, Pauli]]], operator.oplist),
             cast(float, operator.coeff),
@@ -84,17 +100,39 @@ class Suzuki(TrotterizationBase):
         Returns:
             The evolution list after expansion.
         """
+        steps = Suzuki._suzuki_time_steps(len(op_list), evo_time, expansion_order, reps)
+        return [(op_list[index] * time).exp_i() for index, time in steps]  # type: ignore
+
+    @staticmethod
+    def _suzuki_time_steps(num_terms: int,
+                           evo_time: Union[float, ParameterExpression],
+                           expansion_order: int,
+                           reps: int) -> List[Tuple[int, Union[float, ParameterExpression]]]:
+        """
+        Compute the index of the term and its evolution time of each exponential of a single
+        slice of the suzuki expansion, following the paper
+        https://arxiv.org/pdf/quant-ph/0508139.pdf.
+
+        Args:
+            num_terms: The number of terms of the slice's weighted Pauli list
+            evo_time: The parameter lambda as defined in said paper,
+                adjusted for the evolution time and the number of time slices
+            expansion_order: The order for the Suzuki expansion.
+            reps: The number of times to repeat the expansion circuit.
+
+        Returns:
+            The list of the index of the term and the evolution time of each exponential.
+        """
         if expansion_order == 1:
             # Base first-order Trotter case
-            return [(op * (evo_time / reps)).exp_i() for op in op_list]  # type: ignore
+            return [(index, evo_time / reps) for index in range(num_terms)]
         if expansion_order == 2:
-            half = Suzuki._suzuki_recursive_expansion(op_list, evo_time / 2,
-                                                      expansion_order - 1, reps)
+            half = Suzuki._suzuki_time_steps(num_terms, evo_time / 2, expansion_order - 1, reps)
             return list(reversed(half)) + half
         else:
             p_k = (4 - 4 ** (1 / (2 * expansion_order - 1))) ** -1
-            side = 2 * Suzuki._suzuki_recursive_expansion(op_list, evo_time
-                                                          * p_k, expansion_order - 2, reps)
-            middle = Suzuki._suzuki_recursive_expansion(op_list, evo_time * (1 - 4 * p_k),
-                                                        expansion_order - 2, reps)
+            side = 2 * Suzuki._suzuki_time_steps(num_terms, evo_time * p_k,
+                                                 expansion_order - 2, reps)
+            middle = Suzuki._suzuki_time_steps(num_terms, evo_time * (1 - 4 * p_k),
+                                               expansion_order - 2, reps)
             return side + middle + side
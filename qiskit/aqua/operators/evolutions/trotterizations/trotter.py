@@ -21,9 +21,12 @@ class Trotter(Suzuki):
     together ``reps`` times and dividing the evolution time of each by ``reps``.
     """
     def __init__(self,
-                 reps: int = 1) -> None:
+                 reps: int = 1,
+                 lazy: bool = False) -> None:
         r"""
         Args:
             reps: The number of times to repeat the Trotterization circuit.
+            lazy: Whether to build the evolution of each term once, as a parameterized gate,
+                and return a ``CircuitOp`` of references to these gates.
         """
-        super().__init__(order=1, reps=1)
+        super().__init__(order=1, reps=1, lazy=lazy)
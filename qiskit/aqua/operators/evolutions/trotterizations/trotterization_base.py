@@ -12,10 +12,17 @@
 
 """ Trotterization Algorithm Base """
 
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 from abc import abstractmethod
 
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, Gate, Parameter, ParameterExpression
 from ...operator_base import OperatorBase
+from ...list_ops.summed_op import SummedOp
+from ...primitive_ops.primitive_op import PrimitiveOp
+from ...primitive_ops.pauli_op import PauliOp
 from ..evolution_base import EvolutionBase
 
 # TODO centralize handling of commuting groups
@@ -28,9 +35,10 @@ class TrotterizationBase(EvolutionBase):
     operator sums by compositions of exponentiations.
     """
 
-    def __init__(self, reps: int = 1) -> None:
+    def __init__(self, reps: int = 1, lazy: bool = False) -> None:
 
         self._reps = reps
+        self._lazy = lazy
 
     @property
     def reps(self) -> int:
@@ -44,6 +52,19 @@ class TrotterizationBase(EvolutionBase):
         r""" Set the number of repetitions to use in the Trotterization. """
         self._reps = reps
 
+    @property
+    def lazy(self) -> bool:
+        """ Whether the evolution of each term is built once, as a parameterized gate, and the
+        product formula is a ``CircuitOp`` of references to these gates whose definitions are
+        only built when the circuit is decomposed.
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, lazy: bool) -> None:
+        r""" Set whether the evolution of each term is built once, as a parameterized gate. """
+        self._lazy = lazy
+
     @abstractmethod
     def convert(self, operator: OperatorBase) -> OperatorBase:
         r"""
@@ -62,4 +83,104 @@ class TrotterizationBase(EvolutionBase):
         """
         raise NotImplementedError
 
+    def _shared_evolution(self,
+                          terms: List[OperatorBase],
+                          steps: List[Tuple[int, Union[float, ParameterExpression]]],
+                          reps: int = 1) -> Optional[OperatorBase]:
+        r"""
+        Build the ``CircuitOp`` of the composition of the exponentials e^-i*time*``terms[index]``
+        for the (index, time) ``steps``, repeated ``reps`` times. The evolution circuit of each
+        term is built once, with a parameter for the time, and the composition is a single gate
+        whose definition, the steps referencing these circuits and then their repetitions, is
+        only built when the circuit is decomposed.
+
+        Args:
+            terms: The terms of the ``SummedOp`` to evolve.
+            steps: The index of the term and the time of its evolution, of each step in the order
+                of the composition, i.e. the last step is the first evolution of the circuit.
+            reps: The number of repetitions of the steps.
+
+        Returns:
+            The ``CircuitOp``, or None if the evolution of a term cannot be parameterized, as for
+            parameterized terms which are not ``PauliOp``.
+        """
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from ..pauli_trotter_evolution import PauliTrotterEvolution
+
+        time = Parameter('t')
+        templates = {}  # type: Dict[int, QuantumCircuit]
+        scales = {}  # type: Dict[int, Union[complex, ParameterExpression]]
+        for index in sorted({index for index, _ in steps}):
+            term = terms[index]
+            if isinstance(term, PauliOp):
+                unit, scales[index] = PauliOp(term.primitive), term.coeff
+            elif isinstance(term, (PrimitiveOp, SummedOp)) and not term.parameters:
+                unit, scales[index] = term, 1.0
+            else:
+                return None
+            evolution = PauliTrotterEvolution().convert((unit * time).exp_i())
+            templates[index] = evolution.to_circuit()
+
+        indices = []
+        values = []  # type: List[Union[float, ParameterExpression]]
+        for index, step_time in reversed(steps):
+            value = scales[index] * step_time
+            indices.append(index)
+            values.append(value if isinstance(value, ParameterExpression) else np.real(value))
+        circuit = QuantumCircuit(terms[0].num_qubits)
+        circuit.append(_ProductFormulaGate(templates, time, indices, values, reps),
+                       circuit.qubits)
+        return PrimitiveOp(circuit)
+
     # TODO @abstractmethod - trotter_error_bound
+
+
+class _EvolutionGate(Gate):
+    """ The evolution of a term for some time, defined by binding the time parameter of the
+    evolution circuit of the term, which is shared by all its evolutions. """
+
+    def __init__(self,
+                 template: QuantumCircuit,
+                 time: Parameter,
+                 value: Union[float, ParameterExpression]) -> None:
+        self._template = template
+        self._time = time
+        super().__init__('evolution', template.num_qubits, [value])
+
+    def _define(self):
+        if self._time in self._template.parameters:
+            self.definition = self._template.assign_parameters({self._time: self.params[0]})
+        else:
+            self.definition = self._template.copy()
+
+
+class _ProductFormulaGate(Gate):
+    """ The evolutions of the terms for the times of the steps, the parameters of the gate,
+    repeated ``reps`` times. The definition is built only when needed, which is after the
+    parameters are bound, and repeats a single gate of the steps. """
+
+    def __init__(self,
+                 templates: Dict[int, QuantumCircuit],
+                 time: Parameter,
+                 indices: List[int],
+                 values: List[Union[float, ParameterExpression]],
+                 reps: int = 1) -> None:
+        self._templates = templates
+        self._time = time
+        self._indices = indices
+        self._reps = reps
+        num_qubits = next(iter(templates.values())).num_qubits
+        super().__init__('product_formula', num_qubits, values)
+
+    def _define(self):
+        definition = QuantumCircuit(self.num_qubits)
+        if self._reps == 1:
+            for index, value in zip(self._indices, self.params):
+                definition.append(_EvolutionGate(self._templates[index], self._time, value),
+                                  definition.qubits)
+        else:
+            steps = _ProductFormulaGate(self._templates, self._time, self._indices,
+                                        list(self.params))
+            for _ in range(self._reps):
+                definition.append(steps, definition.qubits)
+        self.definition = definition
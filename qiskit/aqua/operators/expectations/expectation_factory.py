@@ -113,5 +113,10 @@ class ExpectationFactory:
         elif primitives == {'Matrix'}:
             return MatrixExpectation()
 
+        # Ising observables are diagonal, their energies are computed from samples of the
+        # computational basis, or from the amplitudes with a statevector backend.
+        elif primitives == {'Ising'}:
+            return PauliExpectation()
+
         else:
             raise ValueError('Expectations of Mixed Operators not yet supported.')
@@ -13,17 +13,23 @@
 """ PauliExpectation Class """
 
 import logging
-from typing import Union
+from typing import Optional, Union
 import numpy as np
 
 from .expectation_base import ExpectationBase
 from ..operator_base import OperatorBase
 from ..list_ops.list_op import ListOp
 from ..list_ops.composed_op import ComposedOp
+from ..list_ops.summed_op import SummedOp
+from ..primitive_ops.pauli_op import PauliOp
+from ..primitive_ops.ising_op import IsingOp
 from ..state_fns.state_fn import StateFn
 from ..state_fns.operator_state_fn import OperatorStateFn
+from ..state_fns.dict_state_fn import DictStateFn
 from ..converters.pauli_basis_change import PauliBasisChange
 from ..converters.abelian_grouper import AbelianGrouper
+from ..legacy.packed_counts import PackedCounts
+from ..legacy.pauli_table import PackedPauliTable
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +66,10 @@ class PauliExpectation(ExpectationBase):
         """
 
         if isinstance(operator, OperatorStateFn) and operator.is_measurement:
+            # Ising observables are already diagonal in the computational basis
+            if {'Ising'} == operator.primitive_strings():
+                return operator
+
             # Change to Pauli representation if necessary
             if not {'Pauli'} == operator.primitive_strings():
                 logger.warning('Measured Observable is not composed of only Paulis, converting to '
@@ -91,8 +101,13 @@ class PauliExpectation(ExpectationBase):
                 sfdict = operator.oplist[1]
                 measurement = operator.oplist[0]
                 average = measurement.eval(sfdict)
-                variance = sum([(v * (measurement.eval(b) - average))**2
-                                for (b, v) in sfdict.primitive.items()])
+                diagonal = _diagonal_values(measurement, sfdict)
+                if diagonal is None:
+                    variance = sum([(v * (measurement.eval(b) - average))**2
+                                    for (b, v) in sfdict.primitive.items()])
+                else:
+                    amplitudes = np.array(list(sfdict.primitive.values()))
+                    variance = np.sum((amplitudes * (diagonal - average))**2)
                 return operator.coeff * variance
 
             elif isinstance(operator, ListOp):
@@ -101,3 +116,28 @@ class PauliExpectation(ExpectationBase):
             return 0.0
 
         return sum_variance(exp_op)
+
+
+def _diagonal_values(measurement: OperatorBase, sfdict: OperatorBase) -> Optional[np.ndarray]:
+    """ Evaluate a diagonal Pauli measurement on all the bitstrings of a DictStateFn at once.
+
+    Args:
+        measurement: The measurement, expected to be a sum of {Z, I}^n Paulis or an ``IsingOp``.
+        sfdict: The sampled DictStateFn.
+
+    Returns:
+        The value of the measurement on each bitstring of ``sfdict``, or None if the
+        measurement is not a diagonal Pauli sum.
+    """
+    if not isinstance(measurement, OperatorStateFn) or not isinstance(sfdict, DictStateFn):
+        return None
+    primitive = measurement.primitive
+    if isinstance(primitive, IsingOp):
+        return measurement.coeff * primitive.energies(list(sfdict.primitive.keys()))
+    oplist = primitive.oplist if isinstance(primitive, SummedOp) else [primitive]
+    if not all(isinstance(op, PauliOp) and not np.any(op.primitive.x) for op in oplist):
+        return None
+    coeff = measurement.coeff * (primitive.coeff if isinstance(primitive, SummedOp) else 1)
+    table = PackedPauliTable.from_paulis([[coeff * op.coeff, op.primitive] for op in oplist])
+    signs = PackedCounts(sfdict.primitive).signs(table.z)
+    return signs.dot(table.coeffs)
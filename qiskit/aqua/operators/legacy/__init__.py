@@ -51,7 +51,13 @@ Legacy Operator support
     commutator
     check_commutativity
     PauliGraph
+    PackedPauliTable
+    PackedCounts
     Z2Symmetries
+    pack_operators
+    unpack_operators
+    pack_z2_symmetries
+    unpack_z2_symmetries
 """
 from .common import (evolution_instruction, suzuki_expansion_slice_pauli_list, pauli_measurement,
                      measure_pauli_z, covariance, row_echelon_F2,
@@ -62,6 +68,10 @@ from .weighted_pauli_operator import WeightedPauliOperator, Z2Symmetries
 from .matrix_operator import MatrixOperator
 from .tpb_grouped_weighted_pauli_operator import TPBGroupedWeightedPauliOperator
 from .pauli_graph import PauliGraph
+from .pauli_table import PackedPauliTable
+from .packed_counts import PackedCounts
+from .packed_operators import (pack_operators, unpack_operators, pack_z2_symmetries,
+                               unpack_z2_symmetries)
 
 __all__ = [
     'evolution_instruction',
@@ -74,6 +84,12 @@ __all__ = [
     'commutator',
     'check_commutativity',
     'PauliGraph',
+    'PackedPauliTable',
+    'PackedCounts',
+    'pack_operators',
+    'unpack_operators',
+    'pack_z2_symmetries',
+    'unpack_z2_symmetries',
     'LegacyBaseOperator',
     'WeightedPauliOperator',
     'Z2Symmetries',
@@ -22,6 +22,8 @@ from qiskit.qasm import pi
 from qiskit.circuit import Parameter, ParameterExpression
 
 from qiskit.aqua import AquaError
+from .packed_counts import PackedCounts
+from .pauli_table import PackedPauliTable
 
 logger = logging.getLogger(__name__)
 
@@ -68,16 +70,8 @@ def measure_pauli_z(data, pauli):
     Returns:
         float: Expected value of paulis given data
     """
-    observable = 0.0
-    num_shots = sum(data.values())
-    p_z_or_x = np.logical_or(pauli.z, pauli.x)
-    for key, value in data.items():
-        bitstr = np.asarray(list(key))[::-1].astype(np.int).astype(np.bool)
-        # pylint: disable=no-member
-        sign = -1.0 if np.logical_xor.reduce(np.logical_and(bitstr, p_z_or_x)) else 1.0
-        observable += sign * value
-    observable /= num_shots
-    return observable
+    table = PackedPauliTable.from_paulis([[1.0, pauli]])
+    return PackedCounts(data).means(table)[0]
 
 
 def covariance(data, pauli_1, pauli_2, avg_1, avg_2):
@@ -96,22 +90,8 @@ def covariance(data, pauli_1, pauli_2, avg_1, avg_2):
     Returns:
         float: the element of the covariance matrix between two Paulis
     """
-    cov = 0.0
-    num_shots = sum(data.values())
-
-    if num_shots == 1:
-        return cov
-
-    p1_z_or_x = np.logical_or(pauli_1.z, pauli_1.x)
-    p2_z_or_x = np.logical_or(pauli_2.z, pauli_2.x)
-    for key, value in data.items():
-        bitstr = np.asarray(list(key))[::-1].astype(np.int).astype(np.bool)
-        # pylint: disable=no-member
-        sign_1 = -1.0 if np.logical_xor.reduce(np.logical_and(bitstr, p1_z_or_x)) else 1.0
-        sign_2 = -1.0 if np.logical_xor.reduce(np.logical_and(bitstr, p2_z_or_x)) else 1.0
-        cov += (sign_1 - avg_1) * (sign_2 - avg_2) * value
-    cov /= (num_shots - 1)
-    return cov
+    table = PackedPauliTable.from_paulis([[1.0, pauli_1], [1.0, pauli_2]])
+    return PackedCounts(data).covariance(table, means=np.array([avg_1, avg_2]))[0, 1]
 
 
 def row_echelon_F2(matrix_in):  # pylint: disable=invalid-name
@@ -127,14 +107,11 @@ def row_echelon_F2(matrix_in):  # pylint: disable=invalid-name
     size = matrix_in.shape
 
     for i in range(size[0]):
-        pivot_index = 0
-        for j in range(size[1]):
-            if matrix_in[i, j] == 1:
-                pivot_index = j
-                break
-        for k in range(size[0]):
-            if k != i and matrix_in[k, pivot_index] == 1:
-                matrix_in[k, :] = np.mod(matrix_in[k, :] + matrix_in[i, :], 2)
+        ones = np.flatnonzero(matrix_in[i, :] == 1)
+        pivot_index = ones[0] if ones.size else 0
+        rows = matrix_in[:, pivot_index] == 1
+        rows[i] = False
+        matrix_in[rows, :] = np.mod(matrix_in[rows, :] + matrix_in[i, :], 2)
 
     matrix_out_temp = copy.deepcopy(matrix_in)
     indices = []
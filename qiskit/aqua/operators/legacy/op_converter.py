@@ -15,29 +15,17 @@
 # pylint: disable=cyclic-import
 
 from typing import Union, Callable, cast
-import itertools
 import logging
-import sys
 
-import numpy as np
-from qiskit.quantum_info import Pauli
-from qiskit.tools.parallel import parallel_map
-from qiskit.tools.events import TextProgressBar
-
-from qiskit.aqua import AquaError, aqua_globals
+from qiskit.aqua import AquaError
 from .weighted_pauli_operator import WeightedPauliOperator
 from .matrix_operator import MatrixOperator
 from .tpb_grouped_weighted_pauli_operator import TPBGroupedWeightedPauliOperator
+from .pauli_table import PackedPauliTable
 
 logger = logging.getLogger(__name__)
 
 
-def _conversion(basis, matrix):
-    pauli = Pauli.from_label(''.join(basis))
-    trace_value = np.sum(matrix.dot(pauli.to_spmatrix()).diagonal())
-    return trace_value, pauli
-
-
 def to_weighted_pauli_operator(
         operator: Union[WeightedPauliOperator, TPBGroupedWeightedPauliOperator, MatrixOperator]) \
         -> WeightedPauliOperator:
@@ -52,9 +40,9 @@ def to_weighted_pauli_operator(
         AquaError: Unsupported type to convert
 
     Warnings:
-        Converting time from a MatrixOperator to a Pauli-type Operator grows exponentially.
-        If you are converting a system with large number of qubits, it will take time.
-        You can turn on DEBUG logging to check the progress.
+        Converting time from a MatrixOperator to a Pauli-type Operator grows exponentially,
+        as n 4^n for n qubits. If you are converting a system with large number of qubits,
+        it will take time.
     """
     if operator.__class__ == WeightedPauliOperator:
         return cast(WeightedPauliOperator, operator)
@@ -67,31 +55,16 @@ def to_weighted_pauli_operator(
         op_m = cast(MatrixOperator, operator)
         if op_m.is_empty():
             return WeightedPauliOperator(paulis=[])
-        if op_m.num_qubits > 10:
+        if op_m.num_qubits > 16:
             logger.warning("Converting time from a MatrixOperator to a Pauli-type Operator grows "
                            "exponentially. If you are converting a system with large number of "
                            "qubits, it will take time. And now you are converting a %s-qubit "
-                           "Hamiltonian. You can turn on DEBUG logging to check the progress."
-                           "", op_m.num_qubits)
-        num_qubits = op_m.num_qubits
-        coeff = 2 ** (-num_qubits)
-
-        paulis = []
-        possible_basis = 'IXYZ'
-        if op_m.dia_matrix is not None:
-            possible_basis = 'IZ'
-
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Converting a MatrixOperator to a Pauli-type Operator:")
-            TextProgressBar(sys.stderr)
-        results = parallel_map(_conversion,
-                               list(itertools.product(possible_basis, repeat=num_qubits)),
-                               task_kwargs={"matrix": op_m._matrix},
-                               num_processes=aqua_globals.num_processes)
-        for trace_value, pauli in results:
-            weight = trace_value * coeff
-            if weight != 0.0 and np.abs(weight) > op_m.atol:
-                paulis.append([weight, pauli])
+                           "Hamiltonian.", op_m.num_qubits)
+
+        # the coefficients of all the Paulis are found by a Walsh-Hadamard transform of the
+        # matrix, the x parts without elements being skipped, e.g. all but I and Z for a
+        # diagonal matrix
+        paulis = PackedPauliTable.from_matrix(op_m._matrix, atol=op_m.atol).to_paulis()
 
         return WeightedPauliOperator(paulis, z2_symmetries=operator.z2_symmetries,
                                      name=operator.name)
@@ -117,9 +90,8 @@ def to_matrix_operator(
         op_w = cast(WeightedPauliOperator, operator)
         if op_w.is_empty():
             return MatrixOperator(None)
-        hamiltonian = 0
-        for weight, pauli in op_w.paulis:
-            hamiltonian += weight * pauli.to_spmatrix()
+        # all the rows of the sum are written at once
+        hamiltonian = PackedPauliTable.from_paulis(op_w.paulis).to_spmatrix()
         return MatrixOperator(matrix=hamiltonian, z2_symmetries=op_w.z2_symmetries,
                               name=op_w.name)
     elif operator.__class__ == TPBGroupedWeightedPauliOperator:
@@ -0,0 +1,136 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Packed measurement outcomes for batched Pauli expectation values """
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .pauli_table import PackedPauliTable, bitstrings_to_packed, popcount
+
+# upper bound of the number of (outcome, pauli) pairs evaluated at once
+_BLOCK_SIZE = 1 << 22
+
+
+class PackedCounts:
+    """
+    Measurement counts parsed once into packed outcomes plus a weight vector.
+
+    The parity of each outcome on the support of each Pauli gives the +1/-1 samples,
+    from which the means and the covariance matrix of all Paulis of a group are
+    computed with matrix operations. Appropriate post-rotations on the state are assumed.
+    """
+
+    def __init__(self, counts: Dict[str, float]) -> None:
+        """
+        Args:
+            counts: a dictionary of the form {'00101': 10}, the keys are bitstrings
+                with the qubit 0 on the right, the values are the counts or probabilities.
+        """
+        self._weights = np.array(list(counts.values()), dtype=float)
+        self._outcomes, self._num_bits = bitstrings_to_packed(list(counts.keys()))
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        """ packed outcomes, uint64 array of shape (num_outcomes, num_words) """
+        return self._outcomes
+
+    @property
+    def weights(self) -> np.ndarray:
+        """ the counts of each outcome """
+        return self._weights
+
+    @property
+    def num_bits(self) -> int:
+        """ the number of measured bits """
+        return self._num_bits
+
+    @property
+    def num_shots(self) -> float:
+        """ the total counts """
+        return self._weights.sum()
+
+    def signs(self, masks: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the +1/-1 sample of every outcome on every mask.
+
+        Args:
+            masks: packed masks of the measured qubits, uint64 array of shape
+                (num_masks, num_words).
+
+        Returns:
+            float array of shape (num_outcomes, num_masks), -1 if the outcome has odd parity
+            on the mask, 1 otherwise.
+        """
+        masks = np.ascontiguousarray(masks, dtype=np.uint64)
+        num_words = min(masks.shape[1], self._outcomes.shape[1])
+        masks = masks[:, :num_words]
+        outcomes = self._outcomes[:, :num_words]
+        ret = np.empty((outcomes.shape[0], masks.shape[0]))
+        block = max(1, _BLOCK_SIZE // max(1, masks.shape[0]))
+        for start in range(0, outcomes.shape[0], block):
+            parity = popcount(outcomes[start:start + block, None, :] & masks[None, :, :]) & 1
+            ret[start:start + block] = 1.0 - 2.0 * parity
+        return ret
+
+    def means(self, table: PackedPauliTable, signs: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the expectation value of every Pauli of the table.
+
+        Args:
+            table: the measured Paulis, the weights of the table are ignored.
+            signs: the precomputed result of `signs` for the table.
+
+        Returns:
+            the expectation values
+        """
+        signs = self.signs(table.x | table.z) if signs is None else signs
+        return self._weights.dot(signs) / self.num_shots
+
+    def covariance(self,
+                   table: PackedPauliTable,
+                   means: Optional[np.ndarray] = None,
+                   signs: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute the covariance matrix of all Paulis of the table.
+
+        Args:
+            table: the measured Paulis, the weights of the table are ignored.
+            means: the precomputed result of `means` for the table.
+            signs: the precomputed result of `signs` for the table.
+
+        Returns:
+            the covariance matrix of shape (num_paulis, num_paulis)
+        """
+        num_shots = self.num_shots
+        if num_shots == 1:
+            return np.zeros((len(table), len(table)))
+        signs = self.signs(table.x | table.z) if signs is None else signs
+        means = self.means(table, signs) if means is None else means
+        centered = signs - means[None, :]
+        return centered.T.dot(centered * self._weights[:, None]) / (num_shots - 1)
+
+    def mean_and_variance(self, table: PackedPauliTable):
+        """
+        Compute the weighted sum of the Paulis of the table and its variance.
+
+        Args:
+            table: the measured Paulis with their weights.
+
+        Returns:
+            tuple(complex, complex): the mean and the variance
+        """
+        signs = self.signs(table.x | table.z)
+        means = self.means(table, signs)
+        cov = self.covariance(table, means, signs)
+        return table.coeffs.dot(means), table.coeffs.dot(cov).dot(table.coeffs)
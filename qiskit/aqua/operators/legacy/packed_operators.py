@@ -0,0 +1,155 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Packing of weighted Pauli operators into named numpy arrays, e.g. for .npz files """
+
+from typing import Any, Dict, List, Optional, Tuple
+import json
+
+import numpy as np
+from qiskit.quantum_info import Pauli
+
+from .pauli_table import PackedPauliTable
+from .weighted_pauli_operator import WeightedPauliOperator, Z2Symmetries
+
+# bumped when the layout of the packed arrays changes
+_FORMAT_VERSION = 1
+
+
+def _pack_paulis(arrays: Dict[str, np.ndarray], prefix: str, paulis: List[Pauli]) -> None:
+    table = PackedPauliTable.from_paulis([[1, pauli] for pauli in paulis])
+    arrays[prefix + '_x'] = table.x
+    arrays[prefix + '_z'] = table.z
+
+
+def _unpack_paulis(arrays, prefix: str, num_qubits: int) -> List[Pauli]:
+    table = PackedPauliTable(arrays[prefix + '_x'], arrays[prefix + '_z'],
+                             np.ones(len(arrays[prefix + '_x'])), num_qubits)
+    return [pauli for _, pauli in table.to_paulis()]
+
+
+def pack_z2_symmetries(arrays: Dict[str, np.ndarray],
+                       prefix: str,
+                       z2_symmetries: Optional[Z2Symmetries]) -> Optional[Dict[str, Any]]:
+    """
+    Pack Z2 symmetries into named arrays.
+
+    Args:
+        arrays: the arrays the packed Paulis are added to
+        prefix: the prefix of the names of the added arrays
+        z2_symmetries: the symmetries, which may be None
+
+    Returns:
+        the JSON serializable remainder of the symmetries, to be given to
+        :func:`unpack_z2_symmetries`, or None if there are no symmetries.
+    """
+    if z2_symmetries is None or z2_symmetries.is_empty():
+        return None
+    _pack_paulis(arrays, prefix + '_symmetries', z2_symmetries.symmetries)
+    _pack_paulis(arrays, prefix + '_sq_paulis', z2_symmetries.sq_paulis)
+    tapering_values = z2_symmetries.tapering_values
+    if tapering_values is not None:
+        tapering_values = [int(i) for i in tapering_values]
+    return {'num_qubits': z2_symmetries.symmetries[0].num_qubits,
+            'sq_list': [int(i) for i in z2_symmetries.sq_list],
+            'tapering_values': tapering_values}
+
+
+def unpack_z2_symmetries(arrays,
+                         prefix: str,
+                         meta: Optional[Dict[str, Any]]) -> Optional[Z2Symmetries]:
+    """
+    Unpack the Z2 symmetries packed by :func:`pack_z2_symmetries`.
+
+    Args:
+        arrays: the named arrays, e.g. loaded from an .npz file
+        prefix: the prefix the symmetries were packed with
+        meta: the remainder returned by :func:`pack_z2_symmetries`
+
+    Returns:
+        the symmetries, or None if there were none.
+    """
+    if meta is None:
+        return None
+    return Z2Symmetries(_unpack_paulis(arrays, prefix + '_symmetries', meta['num_qubits']),
+                        _unpack_paulis(arrays, prefix + '_sq_paulis', meta['num_qubits']),
+                        meta['sq_list'], meta['tapering_values'])
+
+
+def pack_operators(operators: List[Optional[WeightedPauliOperator]],
+                   z2_symmetries: Optional[Z2Symmetries] = None,
+                   values: Optional[Dict[str, Any]] = None) -> Dict[str, np.ndarray]:
+    """
+    Pack operators into named arrays, e.g. to be saved by ``numpy.savez_compressed``. The
+    Paulis of each operator are packed in a :class:`PackedPauliTable`, the other content is
+    serialized to JSON, so that loading the arrays does not need pickle.
+
+    Args:
+        operators: the operators, which may be None
+        z2_symmetries: symmetries stored along with the operators
+        values: other values stored along with the operators, must be JSON serializable
+
+    Returns:
+        the named arrays, to be given to :func:`unpack_operators`.
+    """
+    arrays = {}  # type: Dict[str, np.ndarray]
+    operators_meta = []
+    for i, operator in enumerate(operators):
+        if operator is None:
+            operators_meta.append(None)
+            continue
+        prefix = 'op{}'.format(i)
+        table = PackedPauliTable.from_paulis(operator.paulis, operator.num_qubits)
+        arrays[prefix + '_x'] = table.x
+        arrays[prefix + '_z'] = table.z
+        arrays[prefix + '_coeffs'] = table.coeffs.astype(complex)
+        operators_meta.append({'name': operator.name,
+                               'num_qubits': table.num_qubits,
+                               'z2_symmetries': pack_z2_symmetries(arrays, prefix,
+                                                                   operator.z2_symmetries)})
+    meta = {'version': _FORMAT_VERSION,
+            'operators': operators_meta,
+            'z2_symmetries': pack_z2_symmetries(arrays, 'z2', z2_symmetries),
+            'values': values}
+    arrays['meta'] = np.array(json.dumps(meta))
+    return arrays
+
+
+def unpack_operators(arrays) -> Optional[Tuple[List[Optional[WeightedPauliOperator]],
+                                               Optional[Z2Symmetries],
+                                               Optional[Dict[str, Any]]]]:
+    """
+    Unpack the operators packed by :func:`pack_operators`.
+
+    Args:
+        arrays: the named arrays, e.g. loaded from an .npz file
+
+    Returns:
+        the operators, the symmetries and the values, or None if the arrays were packed in
+        another version of the layout.
+    """
+    meta = json.loads(str(arrays['meta']))
+    if meta['version'] != _FORMAT_VERSION:
+        return None
+    operators = []  # type: List[Optional[WeightedPauliOperator]]
+    for i, op_meta in enumerate(meta['operators']):
+        if op_meta is None:
+            operators.append(None)
+            continue
+        prefix = 'op{}'.format(i)
+        table = PackedPauliTable(arrays[prefix + '_x'], arrays[prefix + '_z'],
+                                 arrays[prefix + '_coeffs'], op_meta['num_qubits'])
+        operators.append(WeightedPauliOperator(
+            paulis=table.to_paulis(), name=op_meta['name'],
+            z2_symmetries=unpack_z2_symmetries(arrays, prefix, op_meta['z2_symmetries'])))
+    z2_symmetries = unpack_z2_symmetries(arrays, 'z2', meta['z2_symmetries'])
+    return operators, z2_symmetries, meta['values']
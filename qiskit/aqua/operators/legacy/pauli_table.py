@@ -0,0 +1,731 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Packed symplectic table of weighted Paulis """
+
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse as scisparse
+from scipy.sparse.linalg import LinearOperator
+from qiskit.quantum_info import Pauli
+
+# number of set bits for every byte value, used to popcount the packed words
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# i^k for k = 0, 1, 2, 3
+_PHASES = np.array([1, 1j, -1, -1j])
+
+# upper bound of the number of rows materialized at once by the outer product
+_DOT_BLOCK_SIZE = 1 << 20
+
+# upper bound of the number of matrix elements transformed at once by the Pauli decomposition
+_DECOMPOSITION_BLOCK_SIZE = 1 << 20
+
+# upper bound of the number of diagonal elements a linear operator keeps between products
+_LINEAR_OPERATOR_CACHE_SIZE = 1 << 25
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Count the set bits of packed uint64 words along the last axis.
+
+    Args:
+        words: array of uint64 words, the bits are counted over the last axis.
+
+    Returns:
+        the number of set bits of each row.
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    as_bytes = words.view(np.uint8).reshape(words.shape[:-1] + (words.shape[-1] * 8,))
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """
+    Pack a 2-D boolean array into rows of little-endian uint64 words.
+
+    Args:
+        bits: boolean array of shape (num_rows, num_qubits).
+
+    Returns:
+        uint64 array of shape (num_rows, ceil(num_qubits / 64)).
+    """
+    bits = np.asarray(bits, dtype=bool)
+    num_rows, num_qubits = bits.shape
+    num_words = max(1, -(-num_qubits // 64))
+    packed = np.zeros((num_rows, num_words * 8), dtype=np.uint8)
+    packed[:, :-(-num_qubits // 8)] = np.packbits(bits, axis=1, bitorder='little')
+    return packed.view(np.uint64)
+
+
+def unpack_bits(words: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Unpack rows of little-endian uint64 words into a 2-D boolean array.
+
+    Args:
+        words: uint64 array of shape (num_rows, num_words).
+        num_qubits: number of bits to keep in each row.
+
+    Returns:
+        boolean array of shape (num_rows, num_qubits).
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    as_bytes = words.view(np.uint8).reshape(words.shape[0], words.shape[1] * 8)
+    return np.unpackbits(as_bytes, axis=1, count=num_qubits, bitorder='little').astype(bool)
+
+
+def bitstrings_to_packed(bitstrings: List[str]) -> Tuple[np.ndarray, int]:
+    """
+    Pack bitstrings, with the qubit 0 on the right, into rows of uint64 words.
+
+    Args:
+        bitstrings: the bitstrings, all of the same length, spaces are ignored.
+
+    Returns:
+        the packed bitstrings, uint64 array of shape (num_bitstrings, num_words),
+        and the number of bits.
+    """
+    bitstrings = [bitstr.replace(' ', '') for bitstr in bitstrings]
+    if not bitstrings:
+        return pack_bits(np.zeros((0, 0), dtype=bool)), 0
+    num_bits = len(bitstrings[0])
+    bits = np.frombuffer(''.join(bitstrings).encode('ascii'), dtype=np.uint8)
+    bits = bits.reshape(len(bitstrings), num_bits)[:, ::-1] == ord('1')
+    return pack_bits(bits), num_bits
+
+
+def packed_to_bitstrings(words: np.ndarray, num_bits: int) -> List[str]:
+    """
+    Convert rows of uint64 words back to bitstrings with the qubit 0 on the right.
+
+    Args:
+        words: uint64 array of shape (num_bitstrings, num_words).
+        num_bits: the number of bits of each bitstring.
+
+    Returns:
+        the bitstrings
+    """
+    if num_bits == 0:
+        return [''] * words.shape[0]
+    chars = np.ascontiguousarray(unpack_bits(words, num_bits)[:, ::-1].astype(np.uint8)
+                                 + ord('0'))
+    return chars.view('S{}'.format(num_bits)).ravel().astype(str).tolist()
+
+
+def unique_rows(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the distinct rows of a 2-D array, in order of their first appearance.
+
+    Args:
+        rows: 2-D array
+
+    Returns:
+        the indices of the first appearance of each distinct row and,
+        for each row, the index of its distinct row.
+    """
+    if rows.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    rows = np.ascontiguousarray(rows)
+    keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return first[order], rank[inverse.ravel()]
+
+
+def sum_by_index(values: np.ndarray, indices: np.ndarray, size: int) -> np.ndarray:
+    """
+    Accumulate the values which share the same index.
+
+    Args:
+        values: the values to be summed up
+        indices: the target index of each value
+        size: the length of the output
+
+    Returns:
+        the sum of the values of each index
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'biuf':
+        return np.bincount(indices, weights=values.astype(float), minlength=size)
+    if values.dtype.kind == 'c':
+        return np.bincount(indices, weights=values.real, minlength=size) \
+            + 1j * np.bincount(indices, weights=values.imag, minlength=size)
+    ret = np.zeros(size, dtype=values.dtype)
+    np.add.at(ret, indices, values)
+    return ret
+
+
+def chop_coeffs(coeffs: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Truncate the real and imaginary parts of the weights by `threshold`.
+
+    Args:
+        coeffs: the weights
+        threshold: the parts whose absolute values are less than it are set to zero.
+
+    Returns:
+        the truncated complex weights and the mask of the weights that are not zero.
+    """
+    coeffs = np.asarray(coeffs)
+    real = np.real(coeffs).astype(float)
+    imag = np.imag(coeffs).astype(float)
+    real = np.where(np.abs(real) >= threshold, real, 0.0)
+    imag = np.where(np.abs(imag) >= threshold, imag, 0.0)
+    mask = (real != 0.0) | (imag != 0.0)
+    return real + 1j * imag, mask
+
+
+def walsh_hadamard(values: np.ndarray) -> np.ndarray:
+    """
+    Unnormalized fast Walsh-Hadamard transform along the last axis,
+    i.e., out[..., z] = sum_c (-1)^(z.c) values[..., c].
+
+    Args:
+        values: array whose last dimension is a power of 2.
+
+    Returns:
+        the transformed array
+    """
+    values = np.array(values)
+    dim = values.shape[-1]
+    half = 1
+    while half < dim:
+        # pairs of the elements which differ in the bit of `half`
+        butterflies = values.reshape(-1, dim // (2 * half), 2, half)
+        upper, lower = butterflies[:, :, 0, :], butterflies[:, :, 1, :]
+        diff = upper - lower
+        upper += lower
+        lower[...] = diff
+        half *= 2
+    return values
+
+
+def _xz_blocks(matrix: Union[np.ndarray, scisparse.spmatrix],
+               atol: float) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Gather the elements M[c xor x, c] of the matrix into rows indexed by x, a block of rows at
+    a time, skipping the rows whose Pauli coefficients are all bounded by `atol`.
+    """
+    dim = matrix.shape[0]
+    block_size = max(1, _DECOMPOSITION_BLOCK_SIZE // dim)
+    cols = np.arange(dim)
+    if scisparse.issparse(matrix):
+        matrix = matrix.tocoo()
+        matrix.sum_duplicates()
+        x_offsets = matrix.row ^ matrix.col
+        # only the x with elements are gathered, e.g. x = 0 for a diagonal matrix
+        x_values, x_rows = np.unique(x_offsets, return_inverse=True)
+        bounds = np.bincount(x_rows, weights=np.abs(matrix.data), minlength=len(x_values)) / dim
+        kept = np.flatnonzero(bounds > atol)
+        row_of = np.full(len(x_values), -1)
+        row_of[kept] = np.arange(len(kept))
+        x_rows = row_of[x_rows]
+        valid = np.flatnonzero(x_rows >= 0)
+        order = valid[np.argsort(x_rows[valid], kind='stable')]
+        x_rows, col, data = x_rows[order], matrix.col[order], matrix.data[order]
+        for start in range(0, len(kept), block_size):
+            end = min(start + block_size, len(kept))
+            low, high = np.searchsorted(x_rows, [start, end])
+            rows = np.zeros((end - start, dim), dtype=matrix.dtype)
+            rows[x_rows[low:high] - start, col[low:high]] = data[low:high]
+            yield x_values[kept[start:end]], rows
+    else:
+        matrix = np.asarray(matrix)
+        for start in range(0, dim, block_size):
+            x_values = np.arange(start, min(start + block_size, dim))
+            rows = matrix[cols[np.newaxis, :] ^ x_values[:, np.newaxis], cols[np.newaxis, :]]
+            # |coefficient of (x, z)| <= sum_c |M[c xor x, c]| / dim
+            kept = np.abs(rows).sum(axis=1) / dim > atol
+            yield x_values[kept], rows[kept]
+
+
+def _walsh_function(z_int: int, num_qubits: int) -> np.ndarray:
+    """ (-1)^(z.c) for all c of `num_qubits` bits """
+    signs = np.ones(1)
+    for qubit in range(num_qubits):
+        signs = np.concatenate((signs, -signs if (z_int >> qubit) & 1 else signs))
+    return signs
+
+
+def _xor_rows(array: np.ndarray, x_int: int, num_qubits: int) -> np.ndarray:
+    """ The view of the contiguous `array` whose row r is the row r xor x_int, without an
+    index array. XOR with a run of set bits reverses the index within the run, so the rows are
+    reshaped into the runs of set and unset bits and the axes of the set runs are reversed.
+    The view keeps this shape, a row being the flattened index of its leading axes. """
+    shape = []
+    slices = []
+    qubit = num_qubits
+    while qubit > 0:
+        flipped = (x_int >> (qubit - 1)) & 1
+        length = 0
+        while qubit > 0 and (x_int >> (qubit - 1)) & 1 == flipped:
+            qubit -= 1
+            length += 1
+        shape.append(1 << length)
+        slices.append(slice(None, None, -1) if flipped else slice(None))
+    return array.reshape(shape + [-1])[tuple(slices)]
+
+
+class PackedPauliTable:
+    """
+    Array-backed storage of weighted Paulis.
+
+    Each Pauli is stored as a row of packed uint64 words for its x and z bits,
+    the weights are kept in a separated coefficient vector. All the operations work
+    on the whole table at once instead of term by term.
+    """
+
+    def __init__(self,
+                 x: np.ndarray,
+                 z: np.ndarray,
+                 coeffs: np.ndarray,
+                 num_qubits: int) -> None:
+        """
+        Args:
+            x: packed x bits, uint64 array of shape (num_terms, num_words)
+            z: packed z bits, uint64 array of shape (num_terms, num_words)
+            coeffs: the weights of the Paulis
+            num_qubits: the number of qubits of the Paulis
+        """
+        self._x_words = np.ascontiguousarray(x, dtype=np.uint64)
+        self._z_words = np.ascontiguousarray(z, dtype=np.uint64)
+        self._coeffs = np.asarray(coeffs)
+        self._num_qubits = num_qubits
+
+    @classmethod
+    def from_bool(cls,
+                  x: np.ndarray,
+                  z: np.ndarray,
+                  coeffs: Optional[np.ndarray] = None) -> 'PackedPauliTable':
+        """
+        Create a table from boolean x and z matrices.
+
+        Args:
+            x: boolean array of shape (num_terms, num_qubits)
+            z: boolean array of shape (num_terms, num_qubits)
+            coeffs: the weights, all weights are 1 if it is None.
+
+        Returns:
+            the packed table
+        """
+        x = np.asarray(x, dtype=bool)
+        z = np.asarray(z, dtype=bool)
+        if coeffs is None:
+            coeffs = np.ones(x.shape[0], dtype=complex)
+        return cls(pack_bits(x), pack_bits(z), coeffs, x.shape[1])
+
+    @classmethod
+    def from_paulis(cls,
+                    paulis: List[List[Union[complex, Pauli]]],
+                    num_qubits: Optional[int] = None) -> 'PackedPauliTable':
+        """
+        Create a table from a list of weighted Paulis.
+
+        Args:
+            paulis: the list of weighted Paulis, [[weight, Pauli], ...]
+            num_qubits: the number of qubits, only used when `paulis` is empty.
+
+        Returns:
+            the packed table
+        """
+        if not paulis:
+            num_qubits = num_qubits or 0
+            return cls.from_bool(np.zeros((0, num_qubits), dtype=bool),
+                                 np.zeros((0, num_qubits), dtype=bool),
+                                 np.zeros(0, dtype=complex))
+        x = np.array([pauli.x for _, pauli in paulis], dtype=bool)
+        z = np.array([pauli.z for _, pauli in paulis], dtype=bool)
+        coeffs = np.array([weight for weight, _ in paulis])
+        return cls.from_bool(x, z, coeffs)
+
+    @classmethod
+    def from_matrix(cls,
+                    matrix: Union[np.ndarray, scisparse.spmatrix],
+                    atol: float = 1e-12) -> 'PackedPauliTable':
+        """
+        Decompose a matrix into weighted Paulis.
+
+        The coefficient of the Pauli (x, z) is
+        2^-n i^-(x.z) sum_c (-1)^(z.c) M[c xor x, c], so the coefficients of all z
+        are the Walsh-Hadamard transform of the elements M[c xor x, c], which takes
+        O(n 4^n) instead of a trace with each of the 4^n Paulis. For a sparse matrix
+        only the x of its elements are transformed, e.g. only x = 0 for a diagonal one.
+
+        Args:
+            matrix: the dense or sparse matrix, of dimension 2^n.
+            atol: the Paulis whose weights are not greater than it in absolute value are
+                dropped; the x whose weights are all bounded by it are not transformed.
+
+        Returns:
+            the Paulis of non-zero weight, in the order of their labels with I < X < Y < Z.
+
+        Raises:
+            ValueError: if the matrix is not square or its dimension is not a power of 2.
+        """
+        dim = matrix.shape[0]
+        num_qubits = int(dim).bit_length() - 1
+        if matrix.ndim != 2 or matrix.shape[1] != dim or dim != 2 ** num_qubits:
+            raise ValueError('The matrix of shape {} is not a matrix of qubits.'.format(
+                matrix.shape))
+        z_values = np.arange(dim)
+        all_x, all_z, all_coeffs = [], [], []
+        for x_values, rows in _xz_blocks(matrix, atol):
+            coeffs = walsh_hadamard(rows.astype(complex)) / dim
+            coeffs *= _PHASES[np.mod(-popcount((x_values[:, np.newaxis] & z_values).astype(
+                np.uint64)[..., np.newaxis]), 4)]
+            x_idx, z_idx = np.nonzero((np.abs(coeffs) > atol) & (coeffs != 0))
+            all_x.append(x_values[x_idx])
+            all_z.append(z_idx)
+            all_coeffs.append(coeffs[x_idx, z_idx])
+        x_ints = np.concatenate(all_x) if all_x else np.zeros(0, dtype=int)
+        z_ints = np.concatenate(all_z) if all_z else np.zeros(0, dtype=int)
+        coeffs = np.concatenate(all_coeffs) if all_coeffs else np.zeros(0, dtype=complex)
+        x = (x_ints[:, np.newaxis] >> np.arange(num_qubits)) & 1 == 1
+        z = (z_ints[:, np.newaxis] >> np.arange(num_qubits)) & 1 == 1
+        # I, X, Y, Z are 0, 1, 2, 3, the qubit n-1 being the most significant
+        codes = 2 * z + (x ^ z)
+        order = np.lexsort(codes.T) if num_qubits else np.arange(len(coeffs))
+        return cls.from_bool(x[order], z[order], coeffs[order])
+
+    @property
+    def x(self) -> np.ndarray:
+        """ packed x bits """
+        return self._x_words
+
+    @property
+    def z(self) -> np.ndarray:
+        """ packed z bits """
+        return self._z_words
+
+    @property
+    def coeffs(self) -> np.ndarray:
+        """ the weights of the Paulis """
+        return self._coeffs
+
+    @property
+    def num_qubits(self) -> int:
+        """ number of qubits """
+        return self._num_qubits
+
+    def __len__(self) -> int:
+        return self._x_words.shape[0]
+
+    def __getitem__(self, key) -> 'PackedPauliTable':
+        return PackedPauliTable(self._x_words[key], self._z_words[key], self._coeffs[key],
+                                self._num_qubits)
+
+    def to_bool(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Unpack the table.
+
+        Returns:
+            the boolean x and z matrices, each of shape (num_terms, num_qubits)
+        """
+        return (unpack_bits(self._x_words, self._num_qubits),
+                unpack_bits(self._z_words, self._num_qubits))
+
+    def to_paulis(self) -> List[List[Union[complex, Pauli]]]:
+        """
+        Convert the table back to a list of weighted Paulis.
+
+        Returns:
+            the list of weighted Paulis, [[weight, Pauli], ...]
+        """
+        x, z = self.to_bool()
+        return [[weight, Pauli(z[i], x[i])] for i, weight in enumerate(self._coeffs.tolist())]
+
+    def y_phases(self) -> np.ndarray:
+        """
+        Get i^(number of Y) of each Pauli, i.e., the phase of P|b> = i^(#Y) (-1)^(b.z) |b xor x>.
+
+        Returns:
+            the complex phases
+        """
+        return _PHASES[np.mod(popcount(self._x_words & self._z_words), 4)]
+
+    def unique(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the distinct Paulis of the table, in order of their first appearance.
+
+        Returns:
+            the indices of the first appearance of each distinct Pauli and,
+            for each row, the index of its distinct Pauli.
+        """
+        return unique_rows(np.concatenate((self._x_words, self._z_words), axis=1))
+
+    def row_keys(self) -> List[bytes]:
+        """
+        Hashable keys of the Paulis of the table, identical Paulis having equal keys.
+
+        Returns:
+            the bytes of the packed bits of each row
+        """
+        rows = np.ascontiguousarray(np.concatenate((self._x_words, self._z_words), axis=1))
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel().tolist()
+
+    def simplify(self) -> Tuple['PackedPauliTable', np.ndarray]:
+        """
+        Merge identical Paulis by summing up their weights.
+
+        Returns:
+            the simplified table, with distinct Paulis in order of their first appearance,
+            and the index of each original row in the simplified table.
+        """
+        first, inverse = self.unique()
+        coeffs = sum_by_index(self._coeffs, inverse, len(first))
+        return PackedPauliTable(self._x_words[first], self._z_words[first], coeffs,
+                                self._num_qubits), inverse
+
+    def chop_mask(self, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Truncate the real and imaginary parts of the weights by `threshold`.
+
+        Args:
+            threshold: the parts whose absolute values are less than it are set to zero.
+
+        Returns:
+            the truncated weights and the mask of the weights that are not zero.
+        """
+        return chop_coeffs(self._coeffs, threshold)
+
+    def concatenate(self, other: 'PackedPauliTable') -> 'PackedPauliTable':
+        """
+        Stack the rows of two tables.
+
+        Args:
+            other: the table to be appended.
+
+        Returns:
+            the stacked table
+        """
+        return PackedPauliTable(np.concatenate((self._x_words, other.x)),
+                                np.concatenate((self._z_words, other.z)),
+                                np.concatenate((self._coeffs, other.coeffs)),
+                                max(self._num_qubits, other.num_qubits))
+
+    def _x_groups(self) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray]]:
+        """
+        Group the Paulis by their x bits, which give the offset ``row xor column`` of all
+        their matrix elements.
+
+        Returns:
+            the x of each group and the z of each Pauli, as integers, and the Paulis of
+            each group.
+        """
+        if self._num_qubits > 62:
+            raise ValueError('The matrix of {} qubits cannot be indexed.'.format(
+                self._num_qubits))
+        x_ints = self._x_words[:, 0].astype(np.int64)
+        z_ints = self._z_words[:, 0].astype(np.int64)
+        first, groups = unique_rows(self._x_words)
+        order = np.argsort(groups, kind='stable')
+        members = np.split(order, np.cumsum(np.bincount(groups))[:-1]) if len(first) else []
+        return x_ints[first], z_ints, members
+
+    def _group_diagonals(self,
+                         z_ints: np.ndarray,
+                         weights: np.ndarray,
+                         members: List[np.ndarray]) -> np.ndarray:
+        """
+        The values d[c] = sum_t weight_t (-1)^(z_t.c) of the groups of Paulis, that is the
+        elements M[c xor x, c] of their Paulis, given by the Walsh-Hadamard transform of
+        the weights over z, or summed directly for the groups of fewer Paulis than qubits.
+        """
+        dim = 2 ** self._num_qubits
+        diagonals = np.zeros((len(members), dim), dtype=weights.dtype)
+        for row, terms in enumerate(members):
+            if len(terms) < self._num_qubits:
+                for term in terms:
+                    diagonals[row] += weights[term] * _walsh_function(z_ints[term],
+                                                                      self._num_qubits)
+            else:
+                diagonals[row] = walsh_hadamard(
+                    sum_by_index(weights[terms], z_ints[terms], dim).astype(weights.dtype))
+        return diagonals
+
+    def _matrix_weights(self) -> np.ndarray:
+        """ the weights times i^(#Y), real if all of them are """
+        weights = self._coeffs * self.y_phases()
+        if np.all(np.imag(weights) == 0):
+            return np.real(weights).astype(float)
+        return weights.astype(complex)
+
+    def to_spmatrix(self) -> scisparse.csr_matrix:
+        """
+        Build the sparse matrix of the sum of the weighted Paulis. The Paulis sharing x bits
+        fill the same element of every row, ``column = row xor x``, so the values of all of
+        them are computed at once and written as a single pass over the rows, without the
+        sparse matrix of each Pauli.
+
+        Returns:
+            the CSR matrix, whose rows hold the elements in order of their columns.
+        """
+        dim = 2 ** self._num_qubits
+        x_groups, z_ints, members = self._x_groups()
+        weights = self._matrix_weights()
+        index_dtype = np.int32 if dim * max(1, len(x_groups)) < 2 ** 31 else np.int64
+        rows = np.arange(dim, dtype=index_dtype)
+        # the columns of a row in ascending order are the groups ordered by row xor x
+        indices = np.empty((dim, len(x_groups)), dtype=index_dtype)
+        data = np.empty((dim, len(x_groups)), dtype=weights.dtype)
+        diagonals = self._group_diagonals(z_ints, weights, members)
+        for group, x_int in enumerate(x_groups):
+            cols = rows ^ index_dtype(x_int)
+            indices[:, group] = cols
+            data[:, group] = diagonals[group][cols]
+        order = np.argsort(indices, axis=1, kind='stable')
+        indices = np.take_along_axis(indices, order, axis=1)
+        data = np.take_along_axis(data, order, axis=1)
+        indptr = np.arange(0, dim * len(x_groups) + 1, len(x_groups), dtype=index_dtype) \
+            if len(x_groups) else np.zeros(dim + 1, dtype=index_dtype)
+        matrix = scisparse.csr_matrix((data.ravel(), indices.ravel(), indptr),
+                                      shape=(dim, dim))
+        matrix.has_sorted_indices = True
+        matrix.eliminate_zeros()
+        return matrix
+
+    def to_linear_operator(self) -> LinearOperator:
+        """
+        Build the matrix-free operator of the sum of the weighted Paulis for iterative solvers
+        such as ``scipy.sparse.linalg.eigsh``. The product is
+        ``(M v)[r] = sum_x d_x[r xor x] v[r xor x]`` over the x of the Paulis, with the values
+        ``d_x`` of the Paulis sharing x kept between products only if they fit in memory, and
+        the rows ``r xor x`` taken as a reversed view, so that no index array is ever stored.
+
+        Returns:
+            the linear operator, of real dtype if all the matrix elements are real.
+        """
+        dim = 2 ** self._num_qubits
+        x_groups, z_ints, members = self._x_groups()
+        weights = self._matrix_weights()
+        cached = None
+        if len(x_groups) * dim <= _LINEAR_OPERATOR_CACHE_SIZE:
+            cached = self._group_diagonals(z_ints, weights, members)
+
+        def matmat(vectors):
+            vectors = np.asarray(vectors).reshape(dim, -1)
+            out = np.zeros(vectors.shape, dtype=np.result_type(weights, vectors))
+            product = np.empty_like(out)
+            for group, x_int in enumerate(x_groups):
+                diagonal = cached[group] if cached is not None else self._group_diagonals(
+                    z_ints, weights, members[group:group + 1])[0]
+                np.multiply(diagonal[:, np.newaxis], vectors, out=product)
+                product_xor = _xor_rows(product, int(x_int), self._num_qubits)
+                out_view = out.reshape(product_xor.shape)
+                out_view += product_xor
+            return out
+
+        return LinearOperator((dim, dim), matvec=matmat, matmat=matmat, dtype=weights.dtype)
+
+    def dot(self, other: 'PackedPauliTable') -> 'PackedPauliTable':
+        """
+        Multiply every Pauli of self with every Pauli of other and track the phases,
+        i.e., the rows of the result follow the order (self_0 * other_0, self_0 * other_1, ...).
+
+        Args:
+            other: the right-hand side table
+
+        Returns:
+            the product table, not simplified.
+        """
+        num_left, num_right = len(self), len(other)
+        if num_left == 0 or num_right == 0:
+            return PackedPauliTable(np.zeros((0, self._x_words.shape[1]), dtype=np.uint64),
+                                    np.zeros((0, self._x_words.shape[1]), dtype=np.uint64),
+                                    np.zeros(0, dtype=complex), self._num_qubits)
+        # Y = i X Z, so a Pauli is i^(x.z) X^x Z^z and the product of two Paulis is
+        # i^(x1.z1 + x2.z2 + 2 z1.x2 - x3.z3) X^x3 Z^z3
+        right_phase = popcount(other.x & other.z)
+        block = max(1, _DOT_BLOCK_SIZE // num_right)
+        x_rows, z_rows, coeffs = [], [], []
+        for start in range(0, num_left, block):
+            x_1 = self._x_words[start:start + block, None, :]
+            z_1 = self._z_words[start:start + block, None, :]
+            x_3 = x_1 ^ other.x[None, :, :]
+            z_3 = z_1 ^ other.z[None, :, :]
+            phase = popcount(x_1 & z_1) + right_phase[None, :] \
+                + 2 * popcount(z_1 & other.x[None, :, :]) - popcount(x_3 & z_3)
+            coeff = self._coeffs[start:start + block, None] * other.coeffs[None, :] \
+                * _PHASES[np.mod(phase, 4)]
+            x_rows.append(x_3.reshape(-1, x_3.shape[-1]))
+            z_rows.append(z_3.reshape(-1, z_3.shape[-1]))
+            coeffs.append(coeff.ravel())
+        return PackedPauliTable(np.concatenate(x_rows), np.concatenate(z_rows),
+                                np.concatenate(coeffs),
+                                max(self._num_qubits, other.num_qubits))
+
+    def multiply(self,
+                 other: 'PackedPauliTable',
+                 rows: np.ndarray,
+                 other_rows: np.ndarray) -> 'PackedPauliTable':
+        """
+        Multiply Paulis of self and other pairwise and track the phases, i.e., the row ``t`` of
+        the result is ``self[rows[t]] * other[other_rows[t]]``.
+
+        Args:
+            other: the right-hand side table
+            rows: the rows of self
+            other_rows: the rows of other, of the same length as `rows`
+
+        Returns:
+            the product table, not simplified.
+        """
+        x_1, z_1 = self._x_words[rows], self._z_words[rows]
+        x_2, z_2 = other.x[other_rows], other.z[other_rows]
+        x_3 = x_1 ^ x_2
+        z_3 = z_1 ^ z_2
+        # same phase as in dot
+        phase = popcount(x_1 & z_1) + popcount(x_2 & z_2) \
+            + 2 * popcount(z_1 & x_2) - popcount(x_3 & z_3)
+        coeffs = self._coeffs[rows] * other.coeffs[other_rows] * _PHASES[np.mod(phase, 4)]
+        return PackedPauliTable(x_3, z_3, coeffs, max(self._num_qubits, other.num_qubits))
+
+    def commutator(self, other: 'PackedPauliTable') -> 'PackedPauliTable':
+        """
+        Compute the commutator ``self * other - other * self``. The commuting pairs of Paulis
+        cancel out and an anticommuting pair gives twice its product, so only the
+        anticommuting pairs, found with the symplectic test, are multiplied.
+
+        Args:
+            other: the right-hand side table
+
+        Returns:
+            the commutator table, not simplified.
+        """
+        block = max(1, _DOT_BLOCK_SIZE // max(1, len(other)))
+        rows, other_rows = [], []
+        for start in range(0, len(self), block):
+            anticommuting = ~self[start:start + block].commutes_with(other)
+            block_rows, block_other_rows = np.nonzero(anticommuting)
+            rows.append(block_rows + start)
+            other_rows.append(block_other_rows)
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        other_rows = np.concatenate(other_rows) if other_rows else np.zeros(0, dtype=np.int64)
+        table = self.multiply(other, rows, other_rows)
+        return PackedPauliTable(table.x, table.z, 2 * table.coeffs, table.num_qubits)
+
+    def commutes_with(self, other: 'PackedPauliTable') -> np.ndarray:
+        """
+        Symplectic commutation test between every pair of Paulis.
+
+        Args:
+            other: the other table
+
+        Returns:
+            boolean matrix of shape (len(self), len(other)), True if the pair commutes.
+        """
+        sym = popcount(self._x_words[:, None, :] & other.z[None, :, :]) \
+            + popcount(self._z_words[:, None, :] & other.x[None, :, :])
+        return np.mod(sym, 2) == 0
@@ -28,9 +28,10 @@ from qiskit.tools.events import TextProgressBar
 
 from qiskit.aqua import AquaError, aqua_globals
 from .base_operator import LegacyBaseOperator
-from .common import (measure_pauli_z, covariance, pauli_measurement,
-                     kernel_F2, suzuki_expansion_slice_pauli_list,
+from .common import (pauli_measurement, kernel_F2, suzuki_expansion_slice_pauli_list,
                      check_commutativity, evolution_instruction)
+from .packed_counts import PackedCounts
+from .pauli_table import PackedPauliTable, chop_coeffs, sum_by_index
 
 logger = logging.getLogger(__name__)
 
@@ -61,8 +62,9 @@ class WeightedPauliOperator(LegacyBaseOperator):
         """
         super().__init__(basis, z2_symmetries, name)
         # plain store the paulis, the group information is store in the basis
-        self._paulis_table = None
         self._paulis = paulis
+        # the index of each pauli keyed by its packed bits, see _pauli_indices
+        self._paulis_table = None
         self._basis = \
             [(pauli[1], [i]) for i, pauli in enumerate(paulis)] if basis is None else basis
         # combine the paulis and remove those with zero weight
@@ -96,7 +98,7 @@ class WeightedPauliOperator(LegacyBaseOperator):
     def to_opflow(self, reverse_endianness=False):
         """ to op flow """
         # pylint: disable=import-outside-toplevel
-        from qiskit.aqua.operators import PrimitiveOp
+        from qiskit.aqua.operators import PrimitiveOp, SummedOp
 
         pauli_ops = []
         for [w, p] in self.paulis:
@@ -104,7 +106,9 @@ class WeightedPauliOperator(LegacyBaseOperator):
             # Adding the imaginary is necessary to handle the imaginary coefficients in UCCSD.
             # TODO fix these or add support for them in Terra.
             pauli_ops += [PrimitiveOp(pauli, coeff=np.real(w) + np.imag(w))]
-        return sum(pauli_ops)
+        if len(pauli_ops) < 2:
+            return sum(pauli_ops)
+        return SummedOp.from_terms(pauli_ops)
 
     @property
     def paulis(self):
@@ -180,20 +184,48 @@ class WeightedPauliOperator(LegacyBaseOperator):
                 raise AquaError("Can not add/sub two operators with different number of qubits.")
 
         ret_op = self.copy() if copy else self
-
-        for pauli in other.paulis:
-            pauli_label = pauli[1].to_label()
-            idx = ret_op._paulis_table.get(pauli_label, None)
-            if idx is not None:
-                ret_op._paulis[idx][0] = operation(ret_op._paulis[idx][0], pauli[0])
+        if other.is_empty():
+            return ret_op
+
+        indices = ret_op._pauli_indices()
+        # the weights of other are accumulated on the position of the first appearance
+        table, _ = PackedPauliTable.from_paulis(other.paulis).simplify()
+        weights = table.coeffs.tolist()
+        appended = []
+        for row, key in enumerate(table.row_keys()):
+            idx = indices.get(key)
+            if idx is None:
+                indices[key] = len(ret_op._paulis) + len(appended)
+                appended.append(row)
             else:
-                new_pauli = deepcopy(pauli)
-                ret_op._paulis_table[pauli_label] = len(ret_op._paulis)
-                ret_op._basis.append((new_pauli[1], [len(ret_op._paulis)]))
-                new_pauli[0] = operation(0.0, pauli[0])
-                ret_op._paulis.append(new_pauli)
+                ret_op._paulis[idx][0] = operation(ret_op._paulis[idx][0], weights[row])
+
+        new_paulis = table[np.asarray(appended, dtype=int)].to_paulis()
+        for row, (_, new_pauli) in zip(appended, new_paulis):
+            ret_op._basis.append((new_pauli, [len(ret_op._paulis)]))
+            ret_op._paulis.append([operation(0.0, weights[row]), new_pauli])
+        ret_op._paulis_table = (ret_op._paulis, len(ret_op._paulis), indices)
         return ret_op
 
+    def _pauli_indices(self):
+        """
+        The index of each pauli, keyed by its packed bits. It is built once and kept up to
+        date by the additions, and built again if the list of paulis has been changed otherwise.
+
+        Returns:
+            dict: the index of the first appearance of each pauli
+        """
+        if self._paulis_table is not None:
+            paulis, size, indices = self._paulis_table
+            if paulis is self._paulis and size == len(self._paulis):
+                return indices
+        keys = PackedPauliTable.from_paulis(self._paulis).row_keys() if self._paulis else []
+        indices = {}
+        for idx, key in enumerate(keys):
+            indices.setdefault(key, idx)
+        self._paulis_table = (self._paulis, len(self._paulis), indices)
+        return indices
+
     def add(self, other, copy=False):
         """
         Perform self + other.
@@ -271,14 +303,11 @@ class WeightedPauliOperator(LegacyBaseOperator):
         Returns:
             WeightedPauliOperator: the multiplied operator
         """
-        ret_op = WeightedPauliOperator(paulis=[])
-        for existed_weight, existed_pauli in self.paulis:
-            for weight, pauli in other.paulis:
-                new_pauli, sign = Pauli.sgn_prod(existed_pauli, pauli)
-                new_weight = existed_weight * weight * sign
-                pauli_term = [new_weight, new_pauli]
-                ret_op += WeightedPauliOperator(paulis=[pauli_term])
-        return ret_op
+        if self.is_empty() or other.is_empty():
+            return WeightedPauliOperator(paulis=[])
+        table = _multiply_tables(PackedPauliTable.from_paulis(self.paulis),
+                                 PackedPauliTable.from_paulis(other.paulis))
+        return _from_simplified_paulis(table.to_paulis())
 
     def __rmul__(self, other):
         """ Overload other * self """
@@ -325,7 +354,25 @@ class WeightedPauliOperator(LegacyBaseOperator):
 
     def copy(self):
         """ Get a copy of self """
-        return deepcopy(self)
+        # copy the bits of the Paulis directly, the generic deepcopy is too slow for large operators
+        memo = {}
+        for pauli in itertools.chain((p for _, p in self._paulis), (b for b, _ in self._basis)):
+            if isinstance(pauli, Pauli) and id(pauli) not in memo:
+                memo[id(pauli)] = Pauli(pauli.z.copy(), pauli.x.copy())
+        ret = self.__class__.__new__(self.__class__)
+        for key, value in self.__dict__.items():
+            if key == '_paulis':
+                value = [[weight, memo[id(pauli)]] for weight, pauli in value]
+            elif key == '_paulis_table':
+                # it refers to the list of paulis of self
+                value = None
+            elif key == '_basis':
+                value = [(memo[id(basis)] if id(basis) in memo else deepcopy(basis, memo),
+                          list(indices)) for basis, indices in value]
+            else:
+                value = deepcopy(value, memo)
+            setattr(ret, key, value)
+        return ret
 
     def simplify(self, copy=False):
         """
@@ -345,46 +392,25 @@ class WeightedPauliOperator(LegacyBaseOperator):
 
         op = self.copy() if copy else self
 
-        new_paulis = []
-        new_paulis_table = {}
-        old_to_new_indices = {}
-        curr_idx = 0
-        for curr_weight, curr_pauli in op.paulis:
-            pauli_label = curr_pauli.to_label()
-            new_idx = new_paulis_table.get(pauli_label, None)
-            if new_idx is not None:
-                new_paulis[new_idx][0] += curr_weight
-                old_to_new_indices[curr_idx] = new_idx
-            else:
-                new_paulis_table[pauli_label] = len(new_paulis)
-                old_to_new_indices[curr_idx] = len(new_paulis)
-                new_paulis.append([curr_weight, curr_pauli])
-            curr_idx += 1
+        if op.is_empty():
+            op._paulis = []
+            op._basis = []
+            return op
 
-        op._paulis = new_paulis
-        op._paulis_table = new_paulis_table
+        table = PackedPauliTable.from_paulis(op.paulis)
+        first, old_to_new_indices = table.unique()
+        weights = sum_by_index(table.coeffs, old_to_new_indices, len(first))
+        is_default_basis = op._is_default_basis()
+        op._paulis = [[weight, op.paulis[idx][1]]
+                      for idx, weight in zip(first.tolist(), weights.tolist())]
 
         # update the grouping info, since this method only reduce the number
         # of paulis, we can handle it here for both
         # pauli and tpb grouped pauli
-        # should have a better way to rebuild the basis here.
-        new_basis = []
-        for basis, indices in op.basis:
-            new_indices = []
-            found = False
-            if new_basis:
-                for b, ind in new_basis:
-                    if b == basis:
-                        new_indices = ind
-                        found = True
-                        break
-            for idx in indices:
-                new_idx = old_to_new_indices[idx]
-                if new_idx is not None and new_idx not in new_indices:
-                    new_indices.append(new_idx)
-            if new_indices and not found:
-                new_basis.append((basis, new_indices))
-        op._basis = new_basis
+        if is_default_basis:
+            op._basis = [(pauli, [i]) for i, (_, pauli) in enumerate(op._paulis)]
+        else:
+            op._basis = _merge_basis(op.basis, old_to_new_indices.tolist())
         op.chop(0.0)
         return op
 
@@ -424,49 +450,39 @@ class WeightedPauliOperator(LegacyBaseOperator):
         """
         threshold = self._atol if threshold is None else threshold
 
-        def chop_real_imag(weight):
-            temp_real = weight.real if np.absolute(weight.real) >= threshold else 0.0
-            temp_imag = weight.imag if np.absolute(weight.imag) >= threshold else 0.0
-            if temp_real == 0.0 and temp_imag == 0.0:
-                return 0.0
-            else:
-                new_weight = temp_real + 1j * temp_imag
-                return new_weight
-
         op = self.copy() if copy else self
 
         if op.is_empty():
             return op
 
-        paulis = []
-        old_to_new_indices = {}
-        curr_idx = 0
-        for idx, weighted_pauli in enumerate(op.paulis):
-            weight, pauli = weighted_pauli
-            new_weight = chop_real_imag(weight)
-            if new_weight != 0.0:
-                old_to_new_indices[idx] = curr_idx
-                curr_idx += 1
-                paulis.append([new_weight, pauli])
-
-        op._paulis = paulis
-        op._paulis_table = \
-            {weighted_pauli[1].to_label(): i for i, weighted_pauli in enumerate(paulis)}
+        weights, mask = chop_coeffs([weight for weight, _ in op.paulis], threshold)
+        kept = np.flatnonzero(mask)
+        old_to_new_indices = np.full(len(op.paulis), -1, dtype=np.int64)
+        old_to_new_indices[kept] = np.arange(len(kept))
+
+        is_default_basis = op._is_default_basis()
+        op._paulis = [[weight, op.paulis[idx][1]]
+                      for idx, weight in zip(kept.tolist(), weights[kept].tolist())]
+        if is_default_basis:
+            op._basis = [(pauli, [i]) for i, (_, pauli) in enumerate(op._paulis)]
+            return op
         # update the grouping info, since this method only remove pauli,
         # we can handle it here for both
         # pauli and tpb grouped pauli
         new_basis = []
         for basis, indices in op.basis:
-            new_indices = []
-            for idx in indices:
-                new_idx = old_to_new_indices.get(idx, None)
-                if new_idx is not None:
-                    new_indices.append(new_idx)
+            new_indices = [idx for idx in old_to_new_indices[list(indices)].tolist() if idx >= 0]
             if new_indices:
                 new_basis.append((basis, new_indices))
         op._basis = new_basis
         return op
 
+    def _is_default_basis(self):
+        """ Check whether each pauli is its own basis, i.e., the paulis are not grouped """
+        return len(self._basis) == len(self._paulis) and \
+            all(len(indices) == 1 and indices[0] == idx and basis is self._paulis[idx][1]
+                for idx, (basis, indices) in enumerate(self._basis))
+
     def commute_with(self, other):
         """ Commutes with """
         return check_commutativity(self, other)
@@ -802,22 +818,9 @@ class WeightedPauliOperator(LegacyBaseOperator):
     @staticmethod
     def _routine_compute_mean_and_var(args):
         paulis, measured_results = args
-        avg_paulis = []
-        avg = 0.0
-        variance = 0.0
-        for weight, pauli in paulis:
-            observable = measure_pauli_z(measured_results, pauli)
-            avg += weight * observable
-            avg_paulis.append(observable)
-
-        for idx_1, weighted_pauli_1 in enumerate(paulis):
-            weight_1, pauli_1 = weighted_pauli_1
-            for idx_2, weighted_pauli_2 in enumerate(paulis):
-                weight_2, pauli_2 = weighted_pauli_2
-                variance += weight_1 * weight_2 * covariance(measured_results, pauli_1, pauli_2,
-                                                             avg_paulis[idx_1], avg_paulis[idx_2])
-
-        return avg, variance
+        # parse the counts once and evaluate all paulis of the group together
+        return PackedCounts(measured_results).mean_and_variance(
+            PackedPauliTable.from_paulis(paulis))
 
     def reorder_paulis(self) -> List[List[Union[complex, Pauli]]]:
         """
@@ -943,6 +946,55 @@ class WeightedPauliOperator(LegacyBaseOperator):
         return instruction
 
 
+def _multiply_tables(table_1, table_2):
+    """ the product of two operators given as tables, simplified and without zero weights """
+    table, _ = table_1.dot(table_2).simplify()
+    weights, mask = table.chop_mask(0.0)
+    return PackedPauliTable(table.x[mask], table.z[mask], weights[mask], table.num_qubits)
+
+
+def _from_simplified_paulis(paulis, z2_symmetries=None, name=None):
+    """ build an operator from distinct Paulis with nonzero weights, skipping the simplification
+    done by the constructor """
+    ret_op = WeightedPauliOperator(paulis=[], z2_symmetries=z2_symmetries, name=name)
+    ret_op._paulis = paulis
+    ret_op._basis = [(pauli, [i]) for i, (_, pauli) in enumerate(paulis)]
+    return ret_op
+
+
+def _merge_basis(basis, old_to_new_indices):
+    """
+    Remap the indices of the grouping basis and merge the groups with the identical basis.
+
+    Args:
+        basis (list[tuple(object, [int])]): the grouping basis
+        old_to_new_indices (list[int]): the new index of each old pauli
+
+    Returns:
+        list[tuple(object, [int])]: the new grouping basis
+    """
+    new_basis = []
+    # locate the merged group of a Pauli basis by its bits instead of comparing to every group
+    basis_table = {}
+    for curr_basis, indices in basis:
+        key = (curr_basis.x.tobytes(), curr_basis.z.tobytes()) \
+            if isinstance(curr_basis, Pauli) else None
+        group_idx = basis_table.get(key, None) if key is not None else \
+            next((i for i, (b, _) in enumerate(new_basis) if b == curr_basis), None)
+        new_indices = new_basis[group_idx][1] if group_idx is not None else []
+        seen = set(new_indices)
+        for idx in indices:
+            new_idx = old_to_new_indices[idx]
+            if new_idx not in seen:
+                seen.add(new_idx)
+                new_indices.append(new_idx)
+        if new_indices and group_idx is None:
+            if key is not None:
+                basis_table[key] = len(new_basis)
+            new_basis.append((curr_basis, new_indices))
+    return new_basis
+
+
 class Z2Symmetries:
     """ Z2 Symmetries """
 
@@ -1076,16 +1128,12 @@ class Z2Symmetries:
         sq_paulis = []
         sq_list = []
 
-        stacked_paulis = []
-
         if operator.is_empty():
             logger.info("Operator is empty.")
             return cls([], [], [], None)
 
-        for pauli in operator.paulis:
-            stacked_paulis.append(np.concatenate((pauli[1].x, pauli[1].z), axis=0).astype(np.int))
-
-        stacked_matrix = np.array(np.stack(stacked_paulis))
+        x, z = PackedPauliTable.from_paulis(operator.paulis).to_bool()
+        stacked_matrix = np.concatenate((x, z), axis=1).astype(int)
         symmetries = kernel_F2(stacked_matrix)
 
         if not symmetries:
@@ -1176,7 +1224,8 @@ class Z2Symmetries:
                 otherwise, :class:`WeightedPauliOperator`
 
         Raises:
-            AquaError: Z2 symmetries, single qubit pauli and single qubit list cannot be empty
+            AquaError: Z2 symmetries, single qubit pauli and single qubit list cannot be empty,
+                or the tapering values are not 1 or -1
         """
         if not self._symmetries or not self._sq_paulis or not self._sq_list:
             raise AquaError("Z2 symmetries, single qubit pauli and "
@@ -1186,36 +1235,48 @@ class Z2Symmetries:
             logger.warning("The operator is empty, return the empty operator directly.")
             return operator
 
-        for clifford in self.cliffords:
-            operator = clifford * operator * clifford
-
         tapering_values = tapering_values if tapering_values is not None else self._tapering_values
-
-        def _taper(op, curr_tapering_values):
-            z2_symmetries = self.copy()
-            z2_symmetries.tapering_values = curr_tapering_values
-            operator_out = WeightedPauliOperator(paulis=[], z2_symmetries=z2_symmetries,
-                                                 name=operator.name)
-            for pauli_term in op.paulis:
-                coeff_out = pauli_term[0]
-                for idx, qubit_idx in enumerate(self._sq_list):
-                    if not (not pauli_term[1].z[qubit_idx] and not pauli_term[1].x[qubit_idx]):
-                        coeff_out = curr_tapering_values[idx] * coeff_out
-                z_temp = np.delete(pauli_term[1].z.copy(), np.asarray(self._sq_list))
-                x_temp = np.delete(pauli_term[1].x.copy(), np.asarray(self._sq_list))
-                pauli_term_out = WeightedPauliOperator(paulis=[[coeff_out, Pauli(z_temp, x_temp)]])
-                operator_out += pauli_term_out
-            operator_out.chop(0.0)
-            return operator_out
-
         if tapering_values is None:
-            tapered_ops = []
-            for coeff in itertools.product([1, -1], repeat=len(self._sq_list)):
-                tapered_ops.append(_taper(operator, list(coeff)))
+            sectors = [list(coeff) for coeff in itertools.product([1, -1],
+                                                                  repeat=len(self._sq_list))]
         else:
-            tapered_ops = _taper(operator, tapering_values)
+            sectors = [tapering_values]
+        if any(value not in (1, -1) for sector in sectors for value in sector):
+            raise AquaError("The tapering values must be 1 or -1.")
+
+        table = PackedPauliTable.from_paulis(operator.paulis)
+        for clifford in self.cliffords:
+            clifford_table = PackedPauliTable.from_paulis(clifford.paulis)
+            table = _multiply_tables(_multiply_tables(clifford_table, table), clifford_table)
+
+        x, z = table.to_bool()
+        sq_list = np.asarray(self._sq_list)
+        # the sign of a Pauli in a sector is the product of the tapering values of the
+        # single qubits where the Pauli is not the identity, i.e., -1 to the number of
+        # such qubits whose value is -1.
+        support = (x[:, sq_list] | z[:, sq_list]).astype(np.int64)
+        flips = (np.asarray(sectors) == -1).astype(np.int64)
+        signs = 1 - 2 * np.mod(support @ flips.T, 2)
+
+        # the remaining qubits are the same in all the sectors, only the weights differ
+        kept = np.ones(table.num_qubits, dtype=bool)
+        kept[sq_list] = False
+        tapered = PackedPauliTable.from_bool(x[:, kept], z[:, kept])
+        first, inverse = tapered.unique()
+        paulis = [pauli for _, pauli in tapered[first].to_paulis()]
+
+        tapered_ops = []
+        for sector, sector_signs in zip(sectors, signs.T):
+            weights = sum_by_index(table.coeffs * sector_signs, inverse, len(first))
+            weights, mask = chop_coeffs(weights, 0.0)
+            z2_symmetries = self.copy()
+            z2_symmetries.tapering_values = sector
+            tapered_ops.append(_from_simplified_paulis(
+                [[weight, paulis[idx]]
+                 for idx, weight in zip(np.flatnonzero(mask).tolist(), weights[mask].tolist())],
+                z2_symmetries=z2_symmetries, name=operator.name))
 
-        return tapered_ops
+        return tapered_ops if tapering_values is None else tapered_ops[0]
 
     @staticmethod
     def two_qubit_reduction(operator, num_particles):
@@ -12,15 +12,17 @@
 
 """ SummedOp Class """
 
-from typing import List, Union, cast
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union, cast
 import warnings
 
 import numpy as np
+from scipy.sparse import spmatrix
 
 from qiskit import QuantumCircuit
 from qiskit.circuit import ParameterExpression
 from .list_op import ListOp
 from ..legacy.base_operator import LegacyBaseOperator
+from ..legacy.pauli_table import PackedPauliTable
 from ..legacy.weighted_pauli_operator import WeightedPauliOperator
 from ..operator_base import OperatorBase
 from ... import AquaError
@@ -56,6 +58,72 @@ class SummedOp(ListOp):
     def distributive(self) -> bool:
         return True
 
+    def eval(self,
+             front: Optional[Union[str, Dict[str, complex], OperatorBase]] = None
+             ) -> Union[OperatorBase, float, complex, list]:
+        """
+        Evaluate the sum on ``front``. A sum of ``PauliOp`` evaluated on a ``DictStateFn`` is
+        applied to all the bitstrings in a single pass and returns a single ``DictStateFn``,
+        otherwise each summand is evaluated as in ``ListOp.eval``.
+
+        Args:
+            front: The bitstring, dict of bitstrings (with values being coefficients), or
+                StateFn to evaluated by the Operator's underlying function.
+
+        Returns:
+            The evaluation result.
+
+        Raises:
+            ValueError: front and self have different numbers of qubits.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from ..primitive_ops.pauli_op import PauliOp, pauli_sum_eval_dict
+        from ..state_fns.dict_state_fn import DictStateFn
+
+        if all(isinstance(op, PauliOp) and not isinstance(op.coeff, ParameterExpression)
+               for op in self.oplist):
+            dict_front = DictStateFn(front) if isinstance(front, (str, dict)) else front
+            if isinstance(dict_front, DictStateFn) and not dict_front.is_measurement:
+                if self.num_qubits != dict_front.num_qubits:
+                    raise ValueError(
+                        'eval does not support operands with differing numbers of qubits, '
+                        '{} and {}, respectively.'.format(self.num_qubits,
+                                                          dict_front.num_qubits))
+                new_dict = pauli_sum_eval_dict([op.primitive for op in self.oplist],
+                                               [op.coeff for op in self.oplist],
+                                               dict_front.primitive)
+                return DictStateFn(new_dict, coeff=self.coeff * dict_front.coeff)
+
+        return super().eval(front)
+
+    @classmethod
+    def from_terms(cls,
+                   terms: Iterable[OperatorBase],
+                   coeff: Union[int, float, complex, ParameterExpression] = 1.0,
+                   abelian: bool = False) -> 'SummedOp':
+        """
+        Build the sum of many Operators at once, which avoids copying the oplist at each
+        addition of a chain of ``+``. Summands which are ``SummedOp`` are flattened into the
+        result with their coefficient distributed over their own summands, like in :meth:`add`.
+        Duplicate summands are not collapsed, see :meth:`collapse_summands`.
+
+        Args:
+            terms: The Operators being summed.
+            coeff: A coefficient multiplying the sum.
+            abelian: Indicates whether the summands are known to mutually commute.
+
+        Returns:
+            A ``SummedOp`` equivalent to the sum of ``terms``.
+        """
+        oplist = []  # type: List[OperatorBase]
+        for term in terms:
+            if isinstance(term, SummedOp):
+                oplist.extend(term.oplist if term.coeff == 1
+                              else [op.mul(term.coeff) for op in term.oplist])
+            else:
+                oplist.append(term)
+        return cls(oplist, coeff=coeff, abelian=abelian)
+
     def add(self, other: OperatorBase) -> OperatorBase:
         """Return Operator addition of ``self`` and ``other``, overloaded by ``+``.
 
@@ -71,14 +139,7 @@ class SummedOp(ListOp):
         Returns:
             A ``SummedOp`` equivalent to the sum of self and other.
         """
-        self_new_ops = self.oplist if self.coeff == 1 \
-            else [op.mul(self.coeff) for op in self.oplist]
-        if isinstance(other, SummedOp):
-            other_new_ops = other.oplist if other.coeff == 1 \
-                else [op.mul(other.coeff) for op in other.oplist]
-        else:
-            other_new_ops = [other]
-        return SummedOp(self_new_ops + other_new_ops)
+        return SummedOp.from_terms([self, other])
 
     def collapse_summands(self) -> 'SummedOp':
         """Return Operator by simplifying duplicate operators.
@@ -91,23 +152,32 @@ class SummedOp(ListOp):
         from qiskit.aqua.operators import PrimitiveOp
         oplist = []  # type: List[OperatorBase]
         coeffs = []  # type: List[Union[int, float, complex, ParameterExpression]]
+        # positions in oplist of the operators indexed by class and primitive key
+        key_indices = {}  # type: Dict[Tuple[type, Hashable], int]
+        # positions of the operators without key, which are compared with equals
+        unkeyed_indices = []  # type: List[int]
         for op in self.oplist:
             if isinstance(op, PrimitiveOp):
                 new_op = PrimitiveOp(op.primitive)
                 new_coeff = op.coeff * self.coeff
-                if new_op in oplist:
-                    index = oplist.index(new_op)
-                    coeffs[index] += new_coeff
-                else:
-                    oplist.append(new_op)
-                    coeffs.append(new_coeff)
+                key = op._primitive_key()
             else:
-                if op in oplist:
-                    index = oplist.index(op)
-                    coeffs[index] += self.coeff
-                else:
-                    oplist.append(op)
-                    coeffs.append(self.coeff)
+                new_op = op
+                new_coeff = self.coeff
+                key = None
+            if key is not None:
+                index = key_indices.get((type(new_op), key))
+                if index is None:
+                    key_indices[(type(new_op), key)] = len(oplist)
+            else:
+                index = next((i for i in unkeyed_indices if oplist[i] == new_op), None)
+                if index is None:
+                    unkeyed_indices.append(len(oplist))
+            if index is None:
+                oplist.append(new_op)
+                coeffs.append(new_coeff)
+            else:
+                coeffs[index] += new_coeff
         return SummedOp([op * coeff for op, coeff in zip(oplist, coeffs)])  # type: ignore
 
     # TODO be smarter about the fact that any two ops in oplist could be evaluated for sum.
@@ -121,7 +191,16 @@ class SummedOp(ListOp):
             A collapsed version of self, if possible.
         """
         # reduce constituents
-        reduced_ops = sum(op.reduce() for op in self.oplist) * self.coeff
+        reduced_oplist = [op.reduce() for op in self.oplist]
+        # add them up, once the partial sum is a SummedOp the remaining summands are
+        # appended all at once instead of copying the oplist at each addition
+        reduced_ops = 0  # type: Union[int, OperatorBase]
+        for i, op in enumerate(reduced_oplist):
+            if isinstance(reduced_ops, SummedOp):
+                reduced_ops = SummedOp.from_terms([reduced_ops] + reduced_oplist[i:])
+                break
+            reduced_ops = reduced_ops + op
+        reduced_ops = reduced_ops * self.coeff
 
         # group duplicate operators
         if isinstance(reduced_ops, SummedOp):
@@ -155,9 +234,43 @@ class SummedOp(ListOp):
         raise AquaError("The SummedOp can not be converted to circuit, because to_matrix_op did "
                         "not return a MatrixOp.")
 
+    def _is_pauli_sum(self) -> bool:
+        """ Whether this is a sum of ``PauliOp`` with numeric coefficients. """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from ..primitive_ops.pauli_op import PauliOp
+
+        return not isinstance(self.coeff, ParameterExpression) and \
+            all(isinstance(op, PauliOp) and not isinstance(op.coeff, ParameterExpression)
+                for op in self.oplist)
+
+    def _pauli_table(self) -> PackedPauliTable:
+        """ Returns the table of the weighted Paulis of a sum of ``PauliOp``. """
+        return PackedPauliTable.from_paulis([[self.coeff * op.coeff, op.primitive]
+                                             for op in self.oplist])
+
+    def to_spmatrix(self) -> Union[spmatrix, List[spmatrix]]:
+        """ Returns SciPy sparse matrix representation of the Operator. A sum of ``PauliOp`` is
+        written at once, row by row, instead of adding the matrix of each summand.
+
+        Returns:
+            CSR sparse matrix representation of the Operator.
+        """
+        if self._is_pauli_sum():
+            return self._pauli_table().to_spmatrix()
+        return super().to_spmatrix()
+
+    def to_matrix(self, massive: bool = False) -> np.ndarray:
+        if not self._is_pauli_sum() or (self.num_qubits > 16 and not massive):
+            return super().to_matrix(massive=massive)
+        return self._pauli_table().to_spmatrix().toarray().astype(complex)
+
     def to_matrix_op(self, massive: bool = False) -> OperatorBase:
         """ Returns an equivalent Operator composed of only NumPy-based primitives, such as
         ``MatrixOp`` and ``VectorStateFn``. """
+        if self._is_pauli_sum():
+            # pylint: disable=import-outside-toplevel,cyclic-import
+            from ..primitive_ops.matrix_op import MatrixOp
+            return MatrixOp(self.to_matrix(massive=massive))
         accum = self.oplist[0].to_matrix_op(massive=massive)  # type: ignore
         for i in range(1, len(self.oplist)):
             accum += self.oplist[i].to_matrix_op(massive=massive)  # type: ignore
@@ -12,14 +12,15 @@
 
 """ CircuitOp Class """
 
-from typing import Union, Optional, Set, List, Dict, cast
+from typing import Union, Optional, Set, List, Dict, Hashable, cast
 import logging
+import numbers
 import numpy as np
 
 import qiskit
 from qiskit import QuantumCircuit
 from qiskit.circuit.library import IGate
-from qiskit.circuit import Instruction, ParameterExpression
+from qiskit.circuit import Barrier, ControlledGate, Instruction, ParameterExpression
 
 from ..operator_base import OperatorBase
 from ..list_ops.summed_op import SummedOp
@@ -28,6 +29,8 @@ from .primitive_op import PrimitiveOp
 
 logger = logging.getLogger(__name__)
 
+_STANDARD_GATES_MODULE = 'qiskit.circuit.library.standard_gates'
+
 
 class CircuitOp(PrimitiveOp):
     """ Class for Operators backed by Terra's ``QuantumCircuit`` module.
@@ -89,6 +92,26 @@ class CircuitOp(PrimitiveOp):
 
         return self.primitive == other.primitive
 
+    def _primitive_key(self) -> Optional[Hashable]:
+        # the instruction sequence is a key only if it is made of standard gates with numeric
+        # parameters, the definitions of any other instruction would have to be compared
+        circuit = cast(QuantumCircuit, self.primitive)
+        if not isinstance(circuit.global_phase, numbers.Number):
+            return None
+        qubit_indices = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+        instructions = []
+        for inst, qargs, _ in circuit.data:
+            if not (isinstance(inst, Barrier) or
+                    type(inst).__module__.startswith(_STANDARD_GATES_MODULE)) or \
+                    inst.condition is not None or \
+                    not all(isinstance(param, numbers.Number) for param in inst.params):
+                return None
+            # the open controls of a gate are not part of its name
+            ctrl_state = inst.ctrl_state if isinstance(inst, ControlledGate) else None
+            instructions.append((inst.name, ctrl_state, tuple(inst.params),
+                                 tuple(qubit_indices[qubit] for qubit in qargs)))
+        return circuit.num_qubits, circuit.global_phase, tuple(instructions)
+
     def tensor(self, other: OperatorBase) -> OperatorBase:
         # pylint: disable=cyclic-import,import-outside-toplevel
         from .pauli_op import PauliOp
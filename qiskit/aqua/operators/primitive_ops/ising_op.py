@@ -0,0 +1,384 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" IsingOp Class """
+
+from typing import Union, Optional, Set, Dict, List, Hashable, Sequence
+import hashlib
+import logging
+import numpy as np
+import scipy.sparse
+from scipy.sparse import spmatrix
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterExpression
+from qiskit.quantum_info import Pauli
+
+from ..operator_base import OperatorBase
+from ..list_ops.summed_op import SummedOp
+from ..list_ops.tensored_op import TensoredOp
+from ..legacy.base_operator import LegacyBaseOperator
+from ..legacy.pauli_table import bitstrings_to_packed, unpack_bits
+from .primitive_op import PrimitiveOp
+from .pauli_op import PauliOp
+from .circuit_op import CircuitOp
+from ... import AquaError
+
+logger = logging.getLogger(__name__)
+
+# upper bound of the number of (state, qubit) pairs evaluated at once
+_ENERGY_BLOCK_SIZE = 1 << 22
+
+
+class IsingOp(PrimitiveOp):
+    r""" Class for diagonal Operators made of Z and ZZ terms only, such as the Ising
+    Hamiltonians of optimization problems
+
+    .. math::
+
+        H = \sum_i h_i Z_i + \sum_{i < j} J_{ij} Z_i Z_j,
+
+    backed by a SciPy sparse matrix holding :math:`h` on its diagonal and :math:`J` above it.
+    The energies of computational basis states are computed with sparse matrix operations on
+    the spins instead of a ``Pauli`` per term, and the diagonal of the Operator is only built
+    when it is needed.
+    """
+
+    def __init__(self,
+                 primitive: Union[np.ndarray, spmatrix] = None,
+                 coeff: Union[int, float, complex, ParameterExpression] = 1.0) -> None:
+        """
+        Args:
+            primitive: The square matrix of the coefficients, with the coefficient of :math:`Z_i`
+                at (i, i) and the coefficient of :math:`Z_i Z_j` split over (i, j) and (j, i).
+            coeff: A coefficient multiplying the primitive.
+
+        Raises:
+            TypeError: invalid parameters.
+            ValueError: the matrix is not square.
+        """
+        if isinstance(primitive, (list, np.ndarray)):
+            primitive = scipy.sparse.coo_matrix(np.asarray(primitive))
+
+        if not isinstance(primitive, spmatrix):
+            raise TypeError('IsingOp can only be instantiated with a numpy array or a SciPy '
+                            'sparse matrix, not {}'.format(type(primitive)))
+
+        if primitive.shape[0] != primitive.shape[1]:
+            raise ValueError('The matrix of an IsingOp must be square, not of shape '
+                             '{}'.format(primitive.shape))
+
+        super().__init__(_upper_triangular(primitive), coeff=coeff)
+        self._diagonal = None  # type: Optional[np.ndarray]
+
+    @classmethod
+    def from_pauli_op(cls, operator: Union[OperatorBase, LegacyBaseOperator]) -> 'IsingOp':
+        """ Build an IsingOp from a ``PauliOp`` or a ``SummedOp`` of ``PauliOp`` s with at most
+        two Z and no X.
+
+        Args:
+            operator: The diagonal Pauli operator.
+
+        Returns:
+            The equivalent IsingOp.
+
+        Raises:
+            AquaError: the operator is not made of Z and ZZ terms with numeric coefficients.
+        """
+        if isinstance(operator, LegacyBaseOperator):
+            operator = operator.to_opflow()
+        if isinstance(operator, SummedOp):
+            oplist, coeff = operator.oplist, operator.coeff
+        else:
+            oplist, coeff = [operator], 1.0
+
+        rows, cols, data = [], [], []
+        for op in oplist:
+            if not isinstance(op, PauliOp) or np.any(op.primitive.x) or \
+                    isinstance(op.coeff, ParameterExpression):
+                raise AquaError('An IsingOp can only be built from a sum of Z and ZZ Paulis '
+                                'with numeric coefficients, not from {}.'.format(op))
+            indices = np.flatnonzero(op.primitive.z)
+            if not 1 <= len(indices) <= 2:
+                raise AquaError('An IsingOp can only be built from Z and ZZ terms, keep the '
+                                'constant terms as an offset, not {}.'.format(op))
+            rows.append(indices[0])
+            cols.append(indices[-1])
+            data.append(op.coeff)
+
+        num_qubits = oplist[0].num_qubits
+        return cls(scipy.sparse.coo_matrix((data, (rows, cols)), shape=(num_qubits, num_qubits)),
+                   coeff=coeff)
+
+    def primitive_strings(self) -> Set[str]:
+        return {'Ising'}
+
+    @property
+    def num_qubits(self) -> int:
+        return self.primitive.shape[0]  # type: ignore
+
+    @property
+    def linear(self) -> np.ndarray:
+        """ The coefficients :math:`h_i` of the terms :math:`Z_i`, without ``coeff``. """
+        return self.primitive.diagonal()  # type: ignore
+
+    @property
+    def quadratic(self) -> spmatrix:
+        """ The coefficients :math:`J_{ij}` of the terms :math:`Z_i Z_j` as a strictly upper
+        triangular sparse matrix, without ``coeff``. """
+        return scipy.sparse.triu(self.primitive, k=1, format='csr')
+
+    def add(self, other: OperatorBase) -> OperatorBase:
+        if not self.num_qubits == other.num_qubits:
+            raise ValueError(
+                'Sum over operators with different numbers of qubits, {} and {}, is not well '
+                'defined'.format(self.num_qubits, other.num_qubits))
+
+        if isinstance(other, IsingOp) and \
+                not isinstance(self.coeff, ParameterExpression) and \
+                not isinstance(other.coeff, ParameterExpression):
+            return IsingOp(self.primitive * self.coeff + other.primitive * other.coeff)
+
+        return SummedOp([self, other])
+
+    def adjoint(self) -> OperatorBase:
+        return IsingOp(self.primitive.conj(), coeff=np.conj(self.coeff))  # type: ignore
+
+    def equals(self, other: OperatorBase) -> bool:
+        if not isinstance(other, IsingOp) or not self.coeff == other.coeff or \
+                self.num_qubits != other.num_qubits:
+            return False
+
+        return (self.primitive != other.primitive).nnz == 0  # type: ignore
+
+    def _primitive_key(self) -> Optional[Hashable]:
+        digest = hashlib.sha1()
+        for array in (self.primitive.data, self.primitive.indices,  # type: ignore
+                      self.primitive.indptr):  # type: ignore
+            digest.update(np.ascontiguousarray(array).view(np.uint8))
+        return self.primitive.shape, digest.digest()  # type: ignore
+
+    def _expand_dim(self, num_qubits: int) -> 'IsingOp':
+        size = self.num_qubits + num_qubits
+        coo = self.primitive.tocoo()  # type: ignore
+        return IsingOp(scipy.sparse.coo_matrix((coo.data, (coo.row, coo.col)),
+                                               shape=(size, size)), coeff=self.coeff)
+
+    def tensor(self, other: OperatorBase) -> OperatorBase:
+        return TensoredOp([self, other])
+
+    def permute(self, permutation: List[int]) -> 'IsingOp':
+        """Permutes the qubits of the operator.
+
+        Args:
+            permutation: A list defining where each qubit should be permuted. The qubit at index
+                j should be permuted to position permutation[j].
+
+        Returns:
+              A new IsingOp representing the permuted operator.
+
+        Raises:
+            AquaError: if indices do not define a new index for each qubit.
+        """
+        if len(permutation) != self.num_qubits:
+            raise AquaError("List of indices to permute must have the same size as Ising Operator")
+        size = max(permutation) + 1
+        indices = np.asarray(permutation)
+        coo = self.primitive.tocoo()  # type: ignore
+        return IsingOp(scipy.sparse.coo_matrix((coo.data, (indices[coo.row], indices[coo.col])),
+                                               shape=(size, size)), coeff=self.coeff)
+
+    def energies(self, states: Union[Sequence[str], Dict[str, float], np.ndarray]) -> np.ndarray:
+        """ Compute the energies of a batch of computational basis states.
+
+        Args:
+            states: Bitstrings with the qubit 0 on the right, the keys of a counts dictionary,
+                or a 2-D array of bits with one state per row and the qubit i in column i.
+
+        Returns:
+            The energy of each state, including ``coeff``.
+
+        Raises:
+            ValueError: the states and self have different numbers of qubits.
+        """
+        if isinstance(states, np.ndarray):
+            bits = states
+        else:
+            words, num_bits = bitstrings_to_packed(list(states))
+            bits = unpack_bits(words, num_bits)
+
+        if bits.shape[1] != self.num_qubits:
+            raise ValueError(
+                'The states have {} qubits, but the operator has {}.'.format(bits.shape[1],
+                                                                             self.num_qubits))
+
+        return self._spin_energies(1.0 - 2.0 * bits) * self.coeff
+
+    def expectation(self, counts: Dict[str, float]) -> Union[float, complex]:
+        """ Compute the expectation value from measurement counts in the computational basis.
+
+        Args:
+            counts: A dictionary of the form {'00101': 10}, the keys are bitstrings
+                with the qubit 0 on the right, the values are the counts or probabilities.
+
+        Returns:
+            The average energy of the counts.
+        """
+        weights = np.array(list(counts.values()), dtype=float)
+        return weights.dot(self.energies(list(counts.keys()))) / weights.sum()
+
+    def to_diagonal(self) -> np.ndarray:
+        """ Returns the diagonal of the matrix of the Operator, which is computed on the first
+        call and kept.
+
+        Returns:
+            The energies of all the computational basis states, indexed as the statevector.
+        """
+        if self._diagonal is None:
+            size = 2 ** self.num_qubits
+            shifts = np.arange(self.num_qubits, dtype=np.int64)
+            self._diagonal = np.empty(size, dtype=self.primitive.dtype)  # type: ignore
+            block = max(1, _ENERGY_BLOCK_SIZE // max(1, self.num_qubits))
+            for start in range(0, size, block):
+                indices = np.arange(start, min(start + block, size), dtype=np.int64)
+                bits = (indices[:, None] >> shifts[None, :]) & 1
+                self._diagonal[start:start + block] = self._spin_energies(1.0 - 2.0 * bits)
+        return self._diagonal * self.coeff
+
+    def _spin_energies(self, spins: np.ndarray) -> np.ndarray:
+        """ Energies, without coeff, of the spins +1/-1 given as a 2-D array with one state per row.
+        """
+        couplings = self.quadratic.dot(spins.T)
+        return spins.dot(self.linear) + np.einsum('ij,ji->i', spins, couplings)
+
+    def to_matrix(self, massive: bool = False) -> np.ndarray:
+        if self.num_qubits > 16 and not massive:
+            raise ValueError(
+                'to_matrix will return an exponentially large matrix, '
+                'in this case {0}x{0} elements.'
+                ' Set massive=True if you want to proceed.'.format(2 ** self.num_qubits))
+
+        return np.diag(self.to_diagonal())
+
+    def to_spmatrix(self) -> spmatrix:
+        """ Returns SciPy sparse matrix representation of the Operator.
+
+        Returns:
+            CSR sparse matrix representation of the Operator.
+        """
+        return scipy.sparse.diags(self.to_diagonal(), format='csr')
+
+    def __str__(self) -> str:
+        prim_str = str(self.primitive)
+        if self.coeff == 1.0:
+            return prim_str
+        else:
+            return "{} * {}".format(self.coeff, prim_str)
+
+    def eval(self,
+             front: Optional[Union[str, Dict[str, complex], np.ndarray, OperatorBase]] = None
+             ) -> Union[OperatorBase, float, complex]:
+        if front is None:
+            return self.to_matrix_op()
+
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from ..state_fns.state_fn import StateFn
+        from ..state_fns.dict_state_fn import DictStateFn
+        from ..state_fns.vector_state_fn import VectorStateFn
+        from ..list_ops.list_op import ListOp
+
+        if not isinstance(front, OperatorBase):
+            front = StateFn(front, is_measurement=False)
+
+        if isinstance(front, ListOp) and front.distributive:
+            return front.combo_fn([self.eval(front.coeff * front_elem)  # type: ignore
+                                   for front_elem in front.oplist])
+
+        if self.num_qubits != front.num_qubits:
+            raise ValueError(
+                'eval does not support operands with differing numbers of qubits, '
+                '{} and {}, respectively.'.format(
+                    self.num_qubits, front.num_qubits))
+
+        if isinstance(front, DictStateFn):
+            words, num_bits = bitstrings_to_packed(list(front.primitive.keys()))
+            energies = self._spin_energies(1.0 - 2.0 * unpack_bits(words, num_bits))
+            new_dict = {bitstr: value * energy for (bitstr, value), energy
+                        in zip(front.primitive.items(), energies)}
+            return StateFn(new_dict, coeff=self.coeff * front.coeff)
+
+        if isinstance(front, StateFn) and front.is_measurement:
+            raise ValueError('Operator composed with a measurement is undefined.')
+
+        if isinstance(front, VectorStateFn):
+            return VectorStateFn(self.to_diagonal() * front.primitive.data,
+                                 coeff=front.coeff)
+
+        if isinstance(front, StateFn):
+            return self.to_matrix_op().eval(front.to_matrix_op())  # type: ignore
+
+        return self.compose(front)
+
+    def exp_i(self) -> OperatorBase:
+        """ Return a ``CircuitOp`` equivalent to e^-iH for this operator H, made of RZ and RZZ
+        gates since all the terms commute.
+
+        Raises:
+            ValueError: if a coefficient has a non-zero imaginary part, H not being Hermitian.
+        """
+        coeff = self.coeff
+        coo = self.quadratic.tocoo()
+        if (not isinstance(coeff, ParameterExpression) and np.imag(coeff) != 0) \
+                or np.any(np.imag(self.linear) != 0) or np.any(np.imag(coo.data) != 0):
+            raise ValueError('The evolution of an IsingOp with complex coefficients is not '
+                             'unitary.')
+        if not isinstance(coeff, ParameterExpression):
+            coeff = np.real(coeff)
+        qc = QuantumCircuit(self.num_qubits)
+        for i, h_i in enumerate(self.linear):
+            if h_i != 0:
+                qc.rz(coeff * (2 * float(np.real(h_i))), i)
+        for i, j, j_ij in zip(coo.row, coo.col, coo.data):
+            qc.rzz(coeff * (2 * float(np.real(j_ij))), int(i), int(j))
+        return CircuitOp(qc)
+
+    def to_pauli_op(self, massive: bool = False) -> OperatorBase:
+        zero = np.zeros(self.num_qubits, dtype=bool)
+        pauli_ops = []
+        coo = self.primitive.tocoo()  # type: ignore
+        for i, j, value in zip(coo.row, coo.col, coo.data):
+            z = np.zeros(self.num_qubits, dtype=bool)
+            z[[i, j]] = True
+            pauli_ops.append(PauliOp(Pauli(z, zero), coeff=value))
+
+        if not pauli_ops:
+            # pylint: disable=import-outside-toplevel
+            from ..operator_globals import I
+            return (I ^ self.num_qubits) * 0.0
+        if len(pauli_ops) == 1:
+            return pauli_ops[0] * self.coeff
+        return SummedOp.from_terms(pauli_ops, coeff=self.coeff)
+
+    def to_legacy_op(self, massive: bool = False) -> LegacyBaseOperator:
+        return self.to_pauli_op(massive=massive).to_legacy_op(massive=massive)
+
+
+def _upper_triangular(matrix: spmatrix) -> spmatrix:
+    """ Fold the entries below the diagonal of a square matrix onto the entries above it. """
+    coo = scipy.sparse.coo_matrix(matrix)
+    rows = np.minimum(coo.row, coo.col)
+    cols = np.maximum(coo.row, coo.col)
+    # duplicate entries are summed up by the conversion
+    ret = scipy.sparse.coo_matrix((coo.data, (rows, cols)), shape=coo.shape).tocsr()
+    ret.eliminate_zeros()
+    ret.sort_indices()
+    return ret
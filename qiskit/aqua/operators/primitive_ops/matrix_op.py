@@ -12,7 +12,8 @@
 
 """ MatrixOp Class """
 
-from typing import Union, Optional, Set, Dict, List, cast
+from typing import Union, Optional, Set, Dict, List, Hashable, cast
+import hashlib
 import logging
 import numpy as np
 from scipy.sparse import spmatrix
@@ -108,6 +109,11 @@ class MatrixOp(PrimitiveOp):
             return self.coeff == other.coeff and self.primitive == other.primitive
         return self.coeff * self.primitive == other.coeff * other.primitive  # type: ignore
 
+    def _primitive_key(self) -> Optional[Hashable]:
+        # digest of the exact matrix, matrices only equal up to the tolerance get different keys
+        data = np.ascontiguousarray(self.primitive.data)  # type: ignore
+        return data.shape, hashlib.sha1(data.view(np.uint8)).digest()
+
     def _expand_dim(self, num_qubits: int) -> 'MatrixOp':
         identity = np.identity(2**num_qubits, dtype=complex)
         return MatrixOp(self.primitive.tensor(Operator(identity)), coeff=self.coeff)  # type: ignore
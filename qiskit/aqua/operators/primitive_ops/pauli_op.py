@@ -12,7 +12,7 @@
 
 """ PauliOp Class """
 
-from typing import Union, Set, Dict, cast, List, Optional
+from typing import Union, Set, Dict, cast, List, Optional, Hashable
 import logging
 import numpy as np
 from scipy.sparse import spmatrix
@@ -27,11 +27,16 @@ from .primitive_op import PrimitiveOp
 from ..list_ops.summed_op import SummedOp
 from ..list_ops.tensored_op import TensoredOp
 from ..legacy.weighted_pauli_operator import WeightedPauliOperator
+from ..legacy.pauli_table import (PackedPauliTable, bitstrings_to_packed, packed_to_bitstrings,
+                                  popcount, sum_by_index, unique_rows)
 from ... import AquaError
 
 logger = logging.getLogger(__name__)
 PAULI_GATE_MAPPING = {'X': XGate(), 'Y': YGate(), 'Z': ZGate(), 'I': IGate()}
 
+# upper bound of the number of (pauli, bitstring) pairs applied at once
+_EVAL_BLOCK_SIZE = 1 << 22
+
 
 class PauliOp(PrimitiveOp):
     """ Class for Operators backed by Terra's ``Pauli`` module.
@@ -81,6 +86,9 @@ class PauliOp(PrimitiveOp):
 
         return self.primitive == other.primitive
 
+    def _primitive_key(self) -> Optional[Hashable]:
+        return self.primitive.x.tobytes(), self.primitive.z.tobytes()
+
     def _expand_dim(self, num_qubits: int) -> 'PauliOp':
         return PauliOp(Pauli(label='I'*num_qubits).kron(self.primitive), coeff=self.coeff)
 
@@ -207,19 +215,8 @@ class PauliOp(PrimitiveOp):
 
             if isinstance(front, DictStateFn):
 
-                new_dict = {}  # type: Dict
-                corrected_x_bits = self.primitive.x[::-1]  # type: ignore
-                corrected_z_bits = self.primitive.z[::-1]  # type: ignore
-
-                for bstr, v in front.primitive.items():
-                    bitstr = np.asarray(list(bstr)).astype(np.int).astype(np.bool)
-                    new_b_str = np.logical_xor(bitstr, corrected_x_bits)
-                    new_str = ''.join(map(str, 1 * new_b_str))
-                    z_factor = np.product(1 - 2 * np.logical_and(bitstr, corrected_z_bits))
-                    y_factor = np.product(np.sqrt(1 - 2 * np.logical_and(corrected_x_bits,
-                                                                         corrected_z_bits) + 0j))
-                    new_dict[new_str] = (v * z_factor * y_factor) + new_dict.get(new_str, 0)
-                    new_front = StateFn(new_dict, coeff=self.coeff * front.coeff)
+                new_dict = pauli_sum_eval_dict([self.primitive], [1.0], front.primitive)
+                new_front = StateFn(new_dict, coeff=self.coeff * front.coeff)
 
             elif isinstance(front, StateFn) and front.is_measurement:
                 raise ValueError('Operator composed with a measurement is undefined.')
@@ -319,3 +316,43 @@ class PauliOp(PrimitiveOp):
         else:
             coeff = cast(float, self.coeff)
         return WeightedPauliOperator(paulis=[(coeff, self.primitive)])  # type: ignore
+
+
+def pauli_sum_eval_dict(paulis: List[Pauli],
+                        coeffs: List[Union[int, float, complex]],
+                        front: Dict[str, complex]) -> Dict[str, complex]:
+    """ Apply a weighted sum of Paulis on a dict of bitstrings in one pass.
+
+    All the bitstrings are packed into integers, the X flips and the Z and Y phases,
+    P|b> = i^(#Y) (-1)^(b.z) |b xor x>, are applied with bitwise array operations and the
+    amplitudes landing on the same bitstring are accumulated.
+
+    Args:
+        paulis: The Paulis.
+        coeffs: The coefficient of each Pauli.
+        front: The dict of bitstrings, with the qubit 0 on the right, and their amplitudes.
+
+    Returns:
+        The resulting dict, with the bitstrings in order of their first appearance.
+    """
+    if not front:
+        return {}
+    words, num_bits = bitstrings_to_packed(list(front.keys()))
+    values = np.asarray(list(front.values()))
+    table = PackedPauliTable.from_paulis([[coeff, pauli] for coeff, pauli in zip(coeffs, paulis)])
+    phases = table.y_phases() * table.coeffs
+
+    new_words, amplitudes = [], []
+    block = max(1, _EVAL_BLOCK_SIZE // words.shape[0])
+    for start in range(0, len(table), block):
+        x_bits = table.x[start:start + block, None, :]
+        z_bits = table.z[start:start + block, None, :]
+        signs = 1 - 2 * (popcount(words[None, :, :] & z_bits) & 1)
+        new_words.append((words[None, :, :] ^ x_bits).reshape(-1, words.shape[1]))
+        amplitudes.append((values[None, :] * signs * phases[start:start + block, None]).ravel())
+    new_words = np.concatenate(new_words)
+    amplitudes = np.concatenate(amplitudes)
+
+    first, inverse = unique_rows(new_words)
+    amplitudes = sum_by_index(amplitudes, inverse, len(first))
+    return dict(zip(packed_to_bitstrings(new_words[first], num_bits), amplitudes.tolist()))
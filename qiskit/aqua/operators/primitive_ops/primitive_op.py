@@ -12,7 +12,7 @@
 
 """ PrimitiveOp Class """
 
-from typing import Optional, Union, Set, List, Dict
+from typing import Optional, Union, Set, List, Dict, Hashable
 import logging
 import numpy as np
 from scipy.sparse import spmatrix
@@ -20,11 +20,12 @@ import scipy.linalg
 
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction, ParameterExpression
-from qiskit.quantum_info import Pauli, SparsePauliOp
+from qiskit.quantum_info import Pauli
 from qiskit.quantum_info import Operator as MatrixOperator
 
 from ..operator_base import OperatorBase
 from ..legacy.base_operator import LegacyBaseOperator
+from ..legacy.pauli_table import PackedPauliTable
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +133,13 @@ class PrimitiveOp(OperatorBase):
     def equals(self, other: OperatorBase) -> bool:
         raise NotImplementedError
 
+    def _primitive_key(self) -> Optional[Hashable]:
+        """ A hashable key of the primitive, ignoring the coefficient, such that two Operators of
+        the same class with equal keys have equal primitives. Equal primitives may still have
+        different keys. ``None`` if no such key can be computed cheaply, in which case the
+        Operator has to be compared with ``equals``. """
+        return None
+
     def mul(self, scalar: Union[int, float, complex, ParameterExpression]) -> OperatorBase:
         if not isinstance(scalar, (int, float, complex, ParameterExpression)):
             raise ValueError('Operators can only be scalar multiplied by float or complex, not '
@@ -271,12 +279,15 @@ class PrimitiveOp(OperatorBase):
     def to_pauli_op(self, massive: bool = False) -> OperatorBase:
         """ Returns a sum of ``PauliOp`` s equivalent to this Operator. """
         mat_op = self.to_matrix_op(massive=massive)
-        sparse_pauli = SparsePauliOp.from_operator(mat_op.primitive)  # type: ignore
-        if not sparse_pauli.to_list():
+        # decomposed by a Walsh-Hadamard transform, dropping the coefficients as
+        # SparsePauliOp.from_operator does
+        paulis = PackedPauliTable.from_matrix(mat_op.primitive.data,  # type: ignore
+                                              atol=1e-8).to_paulis()
+        if not paulis:
             # pylint: disable=import-outside-toplevel
             from ..operator_globals import I
             return (I ^ self.num_qubits) * 0.0
 
-        return sum([PrimitiveOp(Pauli.from_label(label),  # type: ignore
+        return sum([PrimitiveOp(pauli,  # type: ignore
                                 coeff.real if coeff == coeff.real else coeff)
-                    for (label, coeff) in sparse_pauli.to_list()]) * self.coeff
+                    for (coeff, pauli) in paulis]) * self.coeff
@@ -20,6 +20,7 @@ from qiskit.circuit import ParameterExpression
 from ..operator_base import OperatorBase
 from .state_fn import StateFn
 from .vector_state_fn import VectorStateFn
+from .dict_state_fn import DictStateFn
 from ..list_ops.list_op import ListOp
 from ..list_ops.summed_op import SummedOp
 
@@ -202,7 +203,12 @@ class OperatorStateFn(StateFn):
         if not isinstance(front, OperatorBase):
             front = StateFn(front)
 
-        if isinstance(self.primitive, ListOp) and self.primitive.distributive:
+        # a sum of Paulis is applied on all the bitstrings at once by SummedOp.eval
+        pauli_sum_on_dict = isinstance(self.primitive, SummedOp) and \
+            isinstance(front, DictStateFn) and self.primitive.primitive_strings() == {'Pauli'}
+
+        if isinstance(self.primitive, ListOp) and self.primitive.distributive and \
+                not pauli_sum_on_dict:
             coeff = self.coeff * self.primitive.coeff
             evals = [OperatorStateFn(op, coeff=coeff, is_measurement=self.is_measurement).eval(
                 front) for op in self.primitive.oplist]
@@ -12,7 +12,9 @@
 
 """ Quantum Instance module """
 
+from collections import OrderedDict
 import copy
+import hashlib
 import logging
 import time
 
@@ -27,6 +29,7 @@ from .utils.backend_utils import (is_ibmq_provider,
                                   is_aer_qasm,
                                   support_backend_options)
 from .utils.circuit_utils import summarize_circuits
+from .utils.transpile_cache import TranspileCache, circuit_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +65,8 @@ class QuantumInstance:
                  skip_qobj_validation=True,
                  measurement_error_mitigation_cls=None, cals_matrix_refresh_period=30,
                  measurement_error_mitigation_shots=None,
-                 job_callback=None):
+                 job_callback=None,
+                 transpile_cache_size=0, transpile_cache_dir=None):
         """
         Quantum Instance holds a Qiskit Terra backend as well as configuration for circuit
         transpilation and execution. When provided to an Aqua algorithm the algorithm will
@@ -103,6 +107,15 @@ class QuantumInstance:
                 to monitor job progress as jobs are submitted for processing by an Aqua algorithm.
                 The callback is provided the following arguments: `job_id, job_status,
                 queue_position, job`
+            transpile_cache_size (int, optional): The number of transpiled circuits kept in
+                memory by :meth:`transpile`, keyed by the structure of the circuits and the
+                transpiler settings. If 0, the default, the transpiled circuits are not cached.
+                The cache is not used with a custom `pass_manager`. On real devices the cache keys
+                include the date of the calibration, which is read from the backend properties
+                once every `cals_matrix_refresh_period` minutes.
+            transpile_cache_dir (str, optional): A directory where the transpiled circuits
+                are also stored, so that they can be reused after they are evicted from memory
+                or by other processes.
 
         Raises:
             AquaError: the shots exceeds the maximum number of shots
@@ -200,6 +213,11 @@ class QuantumInstance:
         self._skip_qobj_validation = skip_qobj_validation
         self._circuit_summary = False
         self._job_callback = job_callback
+        self._transpile_cache = None
+        self._backend_calibration = None
+        self._backend_calibration_timestamp = None
+        if transpile_cache_size:
+            self._transpile_cache = TranspileCache(transpile_cache_size, transpile_cache_dir)
         logger.info(self)
 
     def __str__(self) -> str:
@@ -228,10 +246,15 @@ class QuantumInstance:
             list[QuantumCircuit]: the transpiled circuits, it is always a list even though
                                   the length is one.
         """
-        transpiled_circuits = compiler.transpile(circuits, self._backend, **self._backend_config,
-                                                 **self._compile_config)
-        if not isinstance(transpiled_circuits, list):
-            transpiled_circuits = [transpiled_circuits]
+        config_key = self._transpile_config_key()
+        if config_key is None:
+            transpiled_circuits = compiler.transpile(circuits, self._backend,
+                                                     **self._backend_config,
+                                                     **self._compile_config)
+            if not isinstance(transpiled_circuits, list):
+                transpiled_circuits = [transpiled_circuits]
+        else:
+            transpiled_circuits = self._cached_transpile(circuits, config_key)
 
         if logger.isEnabledFor(logging.DEBUG) and self._circuit_summary:
             logger.debug("==== Before transpiler ====")
@@ -242,6 +265,72 @@ class QuantumInstance:
 
         return transpiled_circuits
 
+    def _transpile_config_key(self):
+        """ The part of the transpile cache keys given by the transpiler settings, or None if
+        the transpiled circuits can not be cached. """
+        if self._transpile_cache is None or self._compile_config['pass_manager'] is not None:
+            return None
+        coupling_map = self._backend_config['coupling_map']
+        if coupling_map is not None:
+            coupling_map = sorted(tuple(edge) for edge in
+                                  getattr(coupling_map, 'get_edges', lambda: coupling_map)())
+        basis_gates = self._backend_config['basis_gates']
+        backend_version = getattr(self._backend.configuration(), 'backend_version', None)
+        # the layout of real devices depends on their calibrations
+        last_update = None
+        if not self.is_simulator:
+            last_update = self._calibration_date()
+        return repr((self.backend_name, backend_version, str(last_update),
+                     None if basis_gates is None else list(basis_gates), coupling_map,
+                     repr(self._compile_config['initial_layout']),
+                     self._compile_config['seed_transpiler'],
+                     self._compile_config['optimization_level']))
+
+    def _calibration_date(self):
+        """ The date of the last calibration of the backend, the backend properties are only
+        queried again after `cals_matrix_refresh_period` minutes. """
+        if self._backend_calibration_timestamp is None or \
+                self.maybe_refresh_cals_matrix(self._backend_calibration_timestamp):
+            properties = self._backend.properties()
+            self._backend_calibration = getattr(properties, 'last_update_date', None)
+            self._backend_calibration_timestamp = time.time()
+        return self._backend_calibration
+
+    def _cached_transpile(self, circuits, config_key):
+        if not isinstance(circuits, list):
+            circuits = [circuits]
+        keys = []
+        for circuit in circuits:
+            fingerprint = circuit_fingerprint(circuit)
+            keys.append(None if fingerprint is None else
+                        hashlib.sha256((config_key + fingerprint).encode('utf8')).hexdigest())
+
+        transpiled_circuits = [self._transpile_cache.get(key, circuit)
+                               if key is not None else None
+                               for key, circuit in zip(keys, circuits)]
+        # transpile the missing circuits at once, and only once for identical circuits
+        missing = OrderedDict()  # type: OrderedDict
+        for i, (key, transpiled) in enumerate(zip(keys, transpiled_circuits)):
+            if transpiled is None:
+                missing.setdefault(i if key is None else key, []).append(i)
+        if missing:
+            indices = [positions[0] for positions in missing.values()]
+            new_circuits = compiler.transpile([circuits[i] for i in indices], self._backend,
+                                              **self._backend_config, **self._compile_config)
+            if not isinstance(new_circuits, list):
+                new_circuits = [new_circuits]
+            for positions, transpiled in zip(missing.values(), new_circuits):
+                key = keys[positions[0]]
+                transpiled_circuits[positions[0]] = transpiled
+                if key is not None:
+                    self._transpile_cache.put(key, transpiled)
+                    # the cached template is not handed out
+                    transpiled_circuits[positions[0]] = transpiled.copy()
+                    for i in positions[1:]:
+                        transpiled_circuits[i] = self._transpile_cache.get(key, circuits[i])
+        logger.debug('Transpile cache: %s', self._transpile_cache.stats())
+        return transpiled_circuits
+
     def assemble(self, circuits):
         """ assemble circuits """
         return compiler.assemble(circuits, **self._run_config.to_dict())
@@ -481,6 +570,12 @@ class QuantumInstance:
         """ sets measurement error mitigation shots """
         self._meas_error_mitigation_shots = new_value
 
+    @property
+    def transpile_cache(self):
+        """ Returns the cache of transpiled circuits, with its hit and miss statistics,
+        or None if it is disabled. """
+        return self._transpile_cache
+
     @property
     def backend(self):
         """Return BaseBackend backend object."""
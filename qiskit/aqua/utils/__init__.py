@@ -32,6 +32,9 @@ Utilities
    random_non_hermitian
    decimal_to_binary
    summarize_circuits
+   circuit_fingerprint
+   TranspileCache
+   atomic_write
    get_subsystem_density_matrix
    get_subsystems_counts
    get_entangler_map
@@ -55,6 +58,8 @@ from .random_matrix_generator import (random_unitary, random_h2_body,
                                       random_non_hermitian)
 from .decimal_to_binary import decimal_to_binary
 from .circuit_utils import summarize_circuits
+from .transpile_cache import circuit_fingerprint, TranspileCache
+from .file_utils import atomic_write
 from .subsystem import get_subsystem_density_matrix, get_subsystems_counts
 from .entangler_map import get_entangler_map, validate_entangler_map
 from .dataset_helper import (get_feature_dimension, get_num_classes,
@@ -74,6 +79,9 @@ __all__ = [
     'random_non_hermitian',
     'decimal_to_binary',
     'summarize_circuits',
+    'circuit_fingerprint',
+    'TranspileCache',
+    'atomic_write',
     'get_subsystem_density_matrix',
     'get_subsystems_counts',
     'get_entangler_map',
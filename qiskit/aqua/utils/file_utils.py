@@ -0,0 +1,43 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" File utilities """
+
+from typing import BinaryIO, Callable
+import os
+import tempfile
+
+
+def atomic_write(path: str, writer: Callable[[BinaryIO], None]) -> None:
+    """
+    Write a file so that other processes see either its previous content or its new content,
+    never a partially written file. The content is written to a temporary file of the same
+    directory, which then replaces the file.
+
+    Args:
+        path: the path of the file
+        writer: a function writing the content to the binary file object it is given
+
+    Raises:
+        Exception: any error raised by the writer or by the file system, after the temporary
+            file has been removed
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file_desc, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(file_desc, 'wb') as file:
+            writer(file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
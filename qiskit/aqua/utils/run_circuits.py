@@ -17,7 +17,9 @@ import logging
 import time
 import copy
 import os
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from qiskit.providers import BaseBackend, JobStatus, JobError
@@ -34,6 +36,11 @@ from qiskit.aqua.utils.backend_utils import (is_aer_provider,
 
 MAX_CIRCUITS_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_CIRCUITS_PER_JOB', None)
 MAX_GATES_PER_JOB = os.environ.get('QISKIT_AQUA_MAX_GATES_PER_JOB', None)
+MAX_JOBS_IN_FLIGHT = os.environ.get('QISKIT_AQUA_MAX_JOBS_IN_FLIGHT', None)
+
+_DEFAULT_MAX_JOBS_IN_FLIGHT = 5
+# seconds before the first status query of a job
+_INITIAL_POLL_INTERVAL = 0.5
 
 logger = logging.getLogger(__name__)
 
@@ -59,21 +66,28 @@ def find_regs_by_name(circuit, name, qreg=True):
     return found_reg
 
 
-def _combine_result_objects(results):
-    """Temporary helper function.
+def _combine_result_objects(result, new_result):
+    """Append the experiment results of ``new_result`` to those of ``result``, as the results
+    of the split qobjs are retrieved. The results of the jobs are not modified.
 
     TODO:
         This function would be removed after Terra supports job with infinite circuits.
     """
-    if len(results) == 1:
-        return results[0]
+    if result is None:
+        return new_result
 
-    new_result = copy.deepcopy(results[0])
+    combined = copy.copy(result)
+    combined.results = result.results + new_result.results
+    if result.success and not new_result.success:
+        combined.success = False
+        combined.status = new_result.status
+    return combined
 
-    for idx in range(1, len(results)):
-        new_result.results.extend(results[idx].results)
 
-    return new_result
+def _new_qobj_like(qobj):
+    # the chunks share the config and the header of the qobj, only the experiments differ
+    return QasmQobj(qobj_id=str(uuid.uuid4()),
+                    config=qobj.config, experiments=[], header=qobj.header)
 
 
 def _split_qobj_to_qobjs(qobj, chunk_size):
@@ -83,11 +97,8 @@ def _split_qobj_to_qobjs(qobj, chunk_size):
         qobjs = [qobj]
     else:
         if isinstance(qobj, QasmQobj):
-            qobj_template = QasmQobj(qobj_id=qobj.qobj_id,
-                                     config=qobj.config, experiments=[], header=qobj.header)
             for i in range(num_chunks):
-                temp_qobj = copy.deepcopy(qobj_template)
-                temp_qobj.qobj_id = str(uuid.uuid4())
+                temp_qobj = _new_qobj_like(qobj)
                 temp_qobj.experiments = qobj.experiments[i * chunk_size:(i + 1) * chunk_size]
                 qobjs = _maybe_split_qobj_by_gates(qobjs, temp_qobj)
         else:
@@ -104,11 +115,7 @@ def _maybe_split_qobj_by_gates(qobjs, qobj):
             total_num_gates += len(qobj.experiments[j].instructions)
         # split by gates if total number of gates in a qobj exceed MAX_GATES_PER_JOB
         if total_num_gates > max_gates_per_job:
-            qobj_template = QasmQobj(qobj_id=qobj.qobj_id,
-                                     config=qobj.config, experiments=[], header=qobj.header)
-            temp_qobj = copy.deepcopy(qobj_template)
-            temp_qobj.qobj_id = str(uuid.uuid4())
-            temp_qobj.experiments = []
+            temp_qobj = _new_qobj_like(qobj)
             num_gates = 0
             for i in range(len(qobj.experiments)):
                 num_gates += len(qobj.experiments[i].instructions)
@@ -117,8 +124,7 @@ def _maybe_split_qobj_by_gates(qobjs, qobj):
                 else:
                     qobjs.append(temp_qobj)
                     # Initialize for next temp_qobj
-                    temp_qobj = copy.deepcopy(qobj_template)
-                    temp_qobj.qobj_id = str(uuid.uuid4())
+                    temp_qobj = _new_qobj_like(qobj)
                     temp_qobj.experiments.append(qobj.experiments[i])
                     num_gates = len(qobj.experiments[i].instructions)
 
@@ -131,9 +137,34 @@ def _maybe_split_qobj_by_gates(qobjs, qobj):
     return qobjs
 
 
-def _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_validation):
+def _backoff_intervals(maximum):
+    """Yield the intervals between successive queries of a job, doubling from
+    ``_INITIAL_POLL_INTERVAL`` up to ``maximum`` seconds."""
+    interval = min(_INITIAL_POLL_INTERVAL, maximum)
+    while True:
+        yield interval
+        interval = min(2 * interval, maximum)
+
+
+def _check_stopped(stop_event):
+    if stop_event is not None and stop_event.is_set():
+        raise AquaError('The execution of the qobjs has been stopped.')
+
+
+def _sleep(seconds, stop_event):
+    """Sleep for ``seconds``, or until ``stop_event`` is set."""
+    if stop_event is None:
+        time.sleep(seconds)
+    else:
+        stop_event.wait(seconds)
+    _check_stopped(stop_event)
+
+
+def _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_validation,
+                      stop_event=None):
     # assure get job ids
     while True:
+        _check_stopped(stop_event)
         try:
             job = run_on_backend(backend, qobj, backend_options=backend_options,
                                  noise_config=noise_config,
@@ -169,8 +200,8 @@ def _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_va
     return job, job_id
 
 
-def _safe_get_job_status(job, job_id):
-
+def _safe_get_job_status(job, job_id, max_wait=5, stop_event=None):
+    intervals = _backoff_intervals(max_wait)
     while True:
         try:
             job_status = job.status()
@@ -179,7 +210,7 @@ def _safe_get_job_status(job, job_id):
             logger.warning("FAILURE: job id: %s, "
                            "status: 'FAIL_TO_GET_STATUS' "
                            "Terra job error: %s", job_id, ex)
-            time.sleep(5)
+            _sleep(next(intervals), stop_event)
         except Exception as ex:  # pylint: disable=broad-except
             raise AquaError("FAILURE: job id: {}, "
                             "status: 'FAIL_TO_GET_STATUS' "
@@ -187,6 +218,70 @@ def _safe_get_job_status(job, job_id):
     return job_status
 
 
+def _run_qobj_with_autorecover(qobj, backend, qjob_config, backend_options,
+                               noise_config, skip_qobj_validation, job_callback,
+                               stop_event=None):
+    """Submit a qobj and wait for its result, re-submitting it until the result is
+    available, or until ``stop_event`` is set."""
+    max_wait = qjob_config.get('wait', 5)
+    job, job_id = _safe_submit_qobj(qobj, backend,
+                                    backend_options, noise_config, skip_qobj_validation,
+                                    stop_event)
+    while True:
+        logger.info("Running qobj %s, job id: %s", qobj.qobj_id, job_id)
+        # try to get result if possible, the queries are spaced out more and more
+        # up to the wait of the qjob config
+        intervals = _backoff_intervals(max_wait)
+        while True:
+            job_status = _safe_get_job_status(job, job_id, max_wait, stop_event)
+            queue_position = 0
+            if job_status in JOB_FINAL_STATES:
+                # do callback again after the job is in the final states
+                if job_callback is not None:
+                    job_callback(job_id, job_status, queue_position, job)
+                break
+            if job_status == JobStatus.QUEUED:
+                queue_position = job.queue_position()
+                logger.info("Job id: %s is queued at position %s", job_id, queue_position)
+            else:
+                logger.info("Job id: %s, status: %s", job_id, job_status)
+            if job_callback is not None:
+                job_callback(job_id, job_status, queue_position, job)
+            _sleep(next(intervals), stop_event)
+
+        # get result after the status is DONE
+        if job_status == JobStatus.DONE:
+            while True:
+                result = job.result(**qjob_config)
+                if result.success:
+                    logger.info("COMPLETED qobj %s, job id: %s", qobj.qobj_id, job_id)
+                    return result
+
+                logger.warning("FAILURE: Job id: %s", job_id)
+                logger.warning("Job (%s) is completed anyway, retrieve result "
+                               "from backend again.", job_id)
+                _check_stopped(stop_event)
+                job = backend.retrieve_job(job_id)
+        # for other cases, resubmit the qobj until the result is available.
+        # since if there is no result returned, there is no way algorithm can do any process
+        # get back the qobj first to avoid for job is consumed
+        qobj = job.qobj()
+        if job_status == JobStatus.CANCELLED:
+            logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
+                           job_id)
+        elif job_status == JobStatus.ERROR:
+            logger.warning("FAILURE: Job id: %s encounters the error. "
+                           "Error is : %s. Re-submit the Qobj.",
+                           job_id, job.error_message())
+        else:
+            logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
+                            "Re-submit the Qobj.", job_id, job_status)
+
+        job, job_id = _safe_submit_qobj(qobj, backend,
+                                        backend_options,
+                                        noise_config, skip_qobj_validation, stop_event)
+
+
 def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
              noise_config=None, skip_qobj_validation=False, job_callback=None):
     """
@@ -195,6 +290,14 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
     The auto-recovery feature is only applied for non-simulator backend.
     This wrapper will try to get the result no matter how long it takes.
 
+    The qobj is split in several jobs if it exceeds the payload of the backend. With
+    auto-recovery, the jobs are run by a pool of threads which each submit a job, query its
+    status at exponentially increasing intervals, up to the ``wait`` of ``qjob_config``, and
+    retrieve its result, so that at most ``QISKIT_AQUA_MAX_JOBS_IN_FLIGHT`` jobs (5 by default)
+    are pending at any time and the next job is submitted as soon as one completes. The
+    results are combined in order as they are retrieved. If an error occurs, or if the wait
+    is interrupted, the threads stop polling and resubmitting the jobs.
+
     Args:
         qobj (QasmQobj): qobj to execute
         backend (BaseBackend): backend instance
@@ -205,7 +308,8 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
                                                only works for Aer and BasicAer providers
         job_callback (Callable, optional): callback used in querying info of the submitted job, and
                                            providing the following arguments:
-                                            job_id, job_status, queue_position, job
+                                            job_id, job_status, queue_position, job.
+                                           It may be called from several threads.
 
     Returns:
         Result: Result object
@@ -234,82 +338,41 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
     # split qobj if it exceeds the payload of the backend
 
     qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
-    jobs = []
-    job_ids = []
-    for qob in qobjs:
-        job, job_id = _safe_submit_qobj(qob, backend,
-                                        backend_options, noise_config, skip_qobj_validation)
-        job_ids.append(job_id)
-        jobs.append(job)
-
-    results = []
+
+    result = None
     if with_autorecover:
         logger.info("Backend status: %s", backend.status())
-        logger.info("There are %s jobs are submitted.", len(jobs))
-        logger.info("All job ids:\n%s", job_ids)
-        for idx, _ in enumerate(jobs):
-            job = jobs[idx]
-            job_id = job_ids[idx]
-            while True:
-                logger.info("Running %s-th qobj, job id: %s", idx, job_id)
-                # try to get result if possible
-                while True:
-                    job_status = _safe_get_job_status(job, job_id)
-                    queue_position = 0
-                    if job_status in JOB_FINAL_STATES:
-                        # do callback again after the job is in the final states
-                        if job_callback is not None:
-                            job_callback(job_id, job_status, queue_position, job)
-                        break
-                    if job_status == JobStatus.QUEUED:
-                        queue_position = job.queue_position()
-                        logger.info("Job id: %s is queued at position %s", job_id, queue_position)
-                    else:
-                        logger.info("Job id: %s, status: %s", job_id, job_status)
-                    if job_callback is not None:
-                        job_callback(job_id, job_status, queue_position, job)
-                    time.sleep(qjob_config['wait'])
-
-                # get result after the status is DONE
-                if job_status == JobStatus.DONE:
-                    while True:
-                        result = job.result(**qjob_config)
-                        if result.success:
-                            results.append(result)
-                            logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
-                            break
-
-                        logger.warning("FAILURE: Job id: %s", job_id)
-                        logger.warning("Job (%s) is completed anyway, retrieve result "
-                                       "from backend again.", job_id)
-                        job = backend.retrieve_job(job_id)
-                    break
-                # for other cases, resubmit the qobj until the result is available.
-                # since if there is no result returned, there is no way algorithm can do any process
-                # get back the qobj first to avoid for job is consumed
-                qobj = job.qobj()
-                if job_status == JobStatus.CANCELLED:
-                    logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.",
-                                   job_id)
-                elif job_status == JobStatus.ERROR:
-                    logger.warning("FAILURE: Job id: %s encounters the error. "
-                                   "Error is : %s. Re-submit the Qobj.",
-                                   job_id, job.error_message())
-                else:
-                    logging.warning("FAILURE: Job id: %s. Unknown status: %s. "
-                                    "Re-submit the Qobj.", job_id, job_status)
-
-                job, job_id = _safe_submit_qobj(qobj, backend,
-                                                backend_options,
-                                                noise_config, skip_qobj_validation)
-                jobs[idx] = job
-                job_ids[idx] = job_id
+        logger.info("There are %s jobs to submit.", len(qobjs))
+        max_jobs_in_flight = int(MAX_JOBS_IN_FLIGHT) if MAX_JOBS_IN_FLIGHT is not None \
+            else _DEFAULT_MAX_JOBS_IN_FLIGHT
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_jobs_in_flight, len(qobjs))))
+        futures = [executor.submit(_run_qobj_with_autorecover, qob, backend, qjob_config,
+                                   backend_options, noise_config, skip_qobj_validation,
+                                   job_callback, stop_event)
+                   for qob in qobjs]
+        try:
+            for idx, future in enumerate(futures):
+                result = _combine_result_objects(result, future.result())
+                logger.info("COMPLETED the %s-th qobj", idx)
+        except BaseException:
+            # do not submit the remaining qobjs, and stop the running threads without
+            # waiting for them
+            stop_event.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            raise
+        executor.shutdown()
     else:
-        results = []
-        for job in jobs:
-            results.append(job.result(**qjob_config))
-
-    result = _combine_result_objects(results) if results else None
+        jobs = []
+        for qob in qobjs:
+            job, _ = _safe_submit_qobj(qob, backend,
+                                       backend_options, noise_config, skip_qobj_validation)
+            jobs.append(job)
+        for idx, job in enumerate(jobs):
+            result = _combine_result_objects(result, job.result(**qjob_config))
+            jobs[idx] = None
 
     # If result was not successful then raise an exception with either the status msg or
     # extra information if this was an Aer partial result return
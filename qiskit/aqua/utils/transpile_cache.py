@@ -0,0 +1,246 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Cache of transpiled circuits keyed by a structural fingerprint """
+
+from typing import Dict, Hashable, Optional
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import pickle
+
+import numpy as np
+from qiskit.circuit import (QuantumCircuit, ParameterExpression, ControlledGate,
+                            Barrier, Measure, Reset)
+
+from .file_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+_STANDARD_GATES_MODULE = 'qiskit.circuit.library.standard_gates'
+_OPAQUE_INSTRUCTIONS = (Barrier, Measure, Reset)
+
+
+def _param_key(param) -> Hashable:
+    if isinstance(param, ParameterExpression):
+        # parameters are identified by name, see TranspileCache.get
+        return 'P', str(param)
+    if isinstance(param, np.ndarray):
+        return 'A', param.shape, str(param.dtype), hashlib.sha1(param.tobytes()).hexdigest()
+    if isinstance(param, QuantumCircuit):
+        return 'C', _circuit_key(param)
+    return type(param).__name__, repr(param)
+
+
+def _circuit_key(circuit: QuantumCircuit) -> Hashable:
+    # pylint: disable=protected-access
+    qubit_indices = {bit: i for i, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: i for i, bit in enumerate(circuit.clbits)}
+    instructions = []
+    for inst, qargs, cargs in circuit.data:
+        condition = None
+        if inst.condition is not None:
+            condition = (inst.condition[0].name, inst.condition[0].size, inst.condition[1])
+        definition = None
+        # gates of the same name may have different definitions, e.g. custom gates. The
+        # definitions which are not built yet are given by the class and the params.
+        if not isinstance(inst, _OPAQUE_INSTRUCTIONS) \
+                and not type(inst).__module__.startswith(_STANDARD_GATES_MODULE) \
+                and inst._definition is not None:
+            definition = _circuit_key(inst._definition)
+        # the open controls of the standard gates are not part of their name
+        control = None
+        if isinstance(inst, ControlledGate):
+            control = (inst.num_ctrl_qubits, inst.ctrl_state)
+        instructions.append((type(inst).__module__, type(inst).__qualname__,
+                             inst.name, inst.num_qubits, inst.num_clbits, control,
+                             tuple(_param_key(param) for param in inst.params),
+                             tuple(qubit_indices[qubit] for qubit in qargs),
+                             tuple(clbit_indices[clbit] for clbit in cargs),
+                             condition, definition))
+    return (tuple((reg.name, reg.size) for reg in circuit.qregs),
+            tuple((reg.name, reg.size) for reg in circuit.cregs),
+            _param_key(circuit.global_phase), tuple(instructions))
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> Optional[str]:
+    """
+    Compute a structural hash of a circuit: two circuits with the same registers, the same
+    instructions on the same bits and the same parameters (unbound parameters being compared
+    by name) share a fingerprint, regardless of the circuit names or of the ``Parameter``
+    objects. The fingerprint is stable across processes.
+
+    Args:
+        circuit: the circuit
+
+    Returns:
+        the hex digest of the fingerprint, or None if the circuit has distinct unbound
+        parameters of the same name, which can not be told apart.
+    """
+    parameters = circuit.parameters
+    if len({param.name for param in parameters}) != len(parameters):
+        return None
+    return hashlib.sha256(repr(_circuit_key(circuit)).encode('utf8')).hexdigest()
+
+
+class TranspileCache:
+    """
+    A least recently used cache of transpiled circuits.
+
+    The keys are built by the user of the cache, e.g. from :func:`circuit_fingerprint` and
+    the transpiler settings. If a directory is given, the entries are also pickled to it,
+    so that entries evicted from memory, or stored by another process, can be loaded again.
+    The cached circuits are templates: :meth:`get` returns a copy with the name and the
+    parameters of the requested circuit.
+    """
+
+    def __init__(self, max_size: int = 128, cache_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            max_size: the maximum number of circuits kept in memory.
+            cache_dir: a directory where the transpiled circuits are also stored, if given.
+
+        Raises:
+            ValueError: invalid max_size
+        """
+        if max_size < 1:
+            raise ValueError('The cache size must be positive, got {}'.format(max_size))
+        self._max_size = max_size
+        self._cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._circuits = OrderedDict()  # type: OrderedDict
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """ the maximum number of circuits kept in memory """
+        return self._max_size
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        """ the directory where the transpiled circuits are stored """
+        return self._cache_dir
+
+    @property
+    def hits(self) -> int:
+        """ the number of lookups found in the cache, including the ones loaded from disk """
+        return self._hits
+
+    @property
+    def disk_hits(self) -> int:
+        """ the number of lookups loaded from the cache directory """
+        return self._disk_hits
+
+    @property
+    def misses(self) -> int:
+        """ the number of lookups not found in the cache """
+        return self._misses
+
+    def stats(self) -> Dict[str, int]:
+        """ Returns the hit and miss counts and the current size of the cache. """
+        return {'hits': self._hits, 'disk_hits': self._disk_hits, 'misses': self._misses,
+                'size': len(self._circuits), 'max_size': self._max_size}
+
+    def __len__(self) -> int:
+        return len(self._circuits)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._circuits or \
+            (self._cache_dir is not None and os.path.exists(self._path(key)))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, '{}.pickle'.format(key))
+
+    def _load(self, key: str) -> Optional[QuantumCircuit]:
+        if self._cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning('Ignoring the unreadable transpiled circuit %s: %s',
+                           self._path(key), str(ex))
+            return None
+
+    def _store(self, key: str, circuit: QuantumCircuit) -> None:
+        self._circuits[key] = circuit
+        self._circuits.move_to_end(key)
+        while len(self._circuits) > self._max_size:
+            self._circuits.popitem(last=False)
+
+    def get(self, key: str, circuit: QuantumCircuit) -> Optional[QuantumCircuit]:
+        """
+        Look up the transpiled version of a circuit.
+
+        Args:
+            key: the cache key of the circuit.
+            circuit: the circuit before transpilation, which gives its name and its
+                parameters to the result.
+
+        Returns:
+            the transpiled circuit, or None if it is not in the cache.
+        """
+        template = self._circuits.get(key)
+        if template is not None:
+            self._circuits.move_to_end(key)
+        else:
+            template = self._load(key)
+            if template is not None:
+                self._disk_hits += 1
+                self._store(key, template)
+        if template is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+
+        parameters = {param.name: param for param in circuit.parameters}
+        mapping = {param: parameters[param.name] for param in template.parameters
+                   if param.name in parameters and parameters[param.name] != param}
+        if mapping:
+            transpiled = template.assign_parameters(mapping)
+        else:
+            transpiled = template.copy()
+        transpiled.name = circuit.name
+        return transpiled
+
+    def put(self, key: str, transpiled: QuantumCircuit) -> None:
+        """
+        Add a transpiled circuit to the cache, evicting the least recently used circuit
+        from memory if the cache is full.
+
+        Args:
+            key: the cache key of the circuit.
+            transpiled: the transpiled circuit, it is stored as is and must not be modified
+                afterwards.
+        """
+        self._store(key, transpiled)
+        if self._cache_dir is not None:
+            try:
+                atomic_write(self._path(key), lambda file: pickle.dump(
+                    transpiled, file, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.warning('Failed to store the transpiled circuit in %s: %s',
+                               self._cache_dir, str(ex))
+
+    def clear(self) -> None:
+        """ Remove all the circuits kept in memory and reset the statistics. The files of
+        the cache directory are kept. """
+        self._circuits.clear()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
@@ -12,7 +12,7 @@
 
 """ QEquationOfMotion algorithm """
 
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 import logging
 import copy
 import itertools
@@ -27,9 +27,8 @@ from qiskit.aqua import AquaError, aqua_globals
 from qiskit.aqua.operators import (LegacyBaseOperator,
                                    WeightedPauliOperator,
                                    Z2Symmetries,
-                                   TPBGroupedWeightedPauliOperator,
-                                   commutator)
-from qiskit.aqua.operators.legacy import op_converter
+                                   TPBGroupedWeightedPauliOperator)
+from qiskit.aqua.operators.legacy import op_converter, PackedPauliTable, PackedCounts
 
 from qiskit.chemistry.components.variational_forms import UCCSD
 from qiskit.chemistry import FermionicOperator
@@ -244,41 +243,66 @@ class QEquationOfMotion:
             mus = np.asarray(mus.flat)
             nus = np.asarray(nus.flat)
 
+        # the commutators [H, K] of the operator with every hopping operator K are shared
+        # by all the entries of the matrices, and all the sectors
+        hopping_tables = {key: PackedPauliTable.from_paulis(op.paulis, op.num_qubits)
+                          for key, op in hopping_operators.items()}
+        operator_table = PackedPauliTable.from_paulis(self._untapered_op.paulis)
+        keys = list(hopping_tables)
+        operator_commutators = dict(zip(keys, parallel_map(
+            QEquationOfMotion._build_operator_commutator,
+            [hopping_tables[key] for key in keys],
+            task_args=(operator_table,),
+            num_processes=aqua_globals.num_processes)))
+        # the pairs of hopping operators already computed, the same pair may show up in
+        # several entries and sectors
+        pair_commutators = {}  # type: Dict
+
         def _build_one_sector(available_hopping_ops):
 
+            entries = []
             to_be_computed_list = []
             for idx, _ in enumerate(mus):
                 m_u = mus[idx]
                 n_u = nus[idx]
-                left_op = available_hopping_ops.get(
-                    '_'.join([str(x) for x in excitations_list[m_u]]), None)
-                right_op_1 = available_hopping_ops.get(
-                    '_'.join([str(x) for x in excitations_list[n_u]]), None)
-                right_op_2 = available_hopping_ops.get(
-                    '_'.join([str(x) for x in reversed(excitations_list[n_u])]), None)
-                to_be_computed_list.append((m_u, n_u, left_op, right_op_1, right_op_2))
+                left_key = '_'.join([str(x) for x in excitations_list[m_u]])
+                right_key_1 = '_'.join([str(x) for x in excitations_list[n_u]])
+                right_key_2 = '_'.join([str(x) for x in reversed(excitations_list[n_u])])
+                if left_key not in available_hopping_ops:
+                    continue
+                right_key_1 = right_key_1 if right_key_1 in available_hopping_ops else None
+                right_key_2 = right_key_2 if right_key_2 in available_hopping_ops else None
+                entries.append((m_u, n_u, left_key, right_key_1, right_key_2))
+                for right_key in (right_key_1, right_key_2):
+                    pair = (left_key, right_key)
+                    if right_key is not None and pair not in pair_commutators:
+                        pair_commutators[pair] = None
+                        to_be_computed_list.append(pair)
 
             if logger.isEnabledFor(logging.INFO):
                 logger.info("Building all commutators:")
                 TextProgressBar(sys.stderr)
             results = parallel_map(QEquationOfMotion._build_commutator_rountine,
-                                   to_be_computed_list,
-                                   task_args=(self._untapered_op, self._z2_symmetries),
+                                   [(hopping_tables[left_key], operator_commutators[left_key],
+                                     hopping_tables[right_key], operator_commutators[right_key])
+                                    for left_key, right_key in to_be_computed_list],
+                                   task_args=(self._z2_symmetries,),
                                    num_processes=aqua_globals.num_processes)
-            for result in results:
-                m_u, n_u, q_mat_op, w_mat_op, m_mat_op, v_mat_op = result
-                q_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    q_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if q_mat_op is not None else q_commutators[m_u][n_u]
-                w_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    w_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if w_mat_op is not None else w_commutators[m_u][n_u]
-                m_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    m_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if m_mat_op is not None else m_commutators[m_u][n_u]
-                v_commutators[m_u][n_u] = op_converter.to_tpb_grouped_weighted_pauli_operator(
-                    v_mat_op, TPBGroupedWeightedPauliOperator.sorted_grouping) \
-                    if v_mat_op is not None else v_commutators[m_u][n_u]
+            pair_commutators.update(zip(to_be_computed_list, results))
+
+            for m_u, n_u, left_key, right_key_1, right_key_2 in entries:
+                if right_key_1 is not None:
+                    q_mat_op, w_mat_op = pair_commutators[(left_key, right_key_1)]
+                    if q_mat_op is not None:
+                        q_commutators[m_u][n_u] = q_mat_op
+                    if w_mat_op is not None:
+                        w_commutators[m_u][n_u] = w_mat_op
+                if right_key_2 is not None:
+                    m_mat_op, v_mat_op = pair_commutators[(left_key, right_key_2)]
+                    if m_mat_op is not None:
+                        m_commutators[m_u][n_u] = m_mat_op
+                    if v_mat_op is not None:
+                        v_commutators[m_u][n_u] = v_mat_op
 
         available_entry = 0
         if not self._z2_symmetries.is_empty():
@@ -352,51 +376,26 @@ class QEquationOfMotion:
 
         if quantum_instance is not None:
 
-            circuit_names = []
-            circuits = []
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-
-                for op in [q_commutators[m_u][n_u], w_commutators[m_u][n_u],
-                           m_commutators[m_u][n_u], v_commutators[m_u][n_u]]:
-                    if op is not None and not op.is_empty():
-                        curr_circuits = op.construct_evaluation_circuit(
-                            wave_function=wave_fn, statevector_mode=quantum_instance.is_statevector)
-                        for c in curr_circuits:
-                            if c.name not in circuit_names:
-                                circuits.append(c)
-                                circuit_names.append(c.name)
-
-            result = quantum_instance.execute(circuits)
-
-            # evaluate results
+            entries = []
+            ops = []
             for idx, _ in enumerate(mus):
                 m_u = mus[idx]
                 n_u = nus[idx]
-
-                def _get_result(op):
-                    mean, std = 0.0, 0.0
+                for mat_idx, commutators in enumerate([q_commutators, w_commutators,
+                                                       m_commutators, v_commutators]):
+                    op = commutators[m_u][n_u]
                     if op is not None and not op.is_empty():
-                        mean, std = \
-                            op.evaluate_with_result(
-                                result=result,
-                                statevector_mode=quantum_instance.is_statevector)
-                    return mean, std
-
-                q_mean, q_std = _get_result(q_commutators[m_u][n_u])
-                w_mean, w_std = _get_result(w_commutators[m_u][n_u])
-                m_mean, m_std = _get_result(m_commutators[m_u][n_u])
-                v_mean, v_std = _get_result(v_commutators[m_u][n_u])
-
-                q_mat[m_u][n_u] = q_mean if q_mean != 0.0 else q_mat[m_u][n_u]
-                w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
-                m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
-                v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
-                q_mat_std += q_std
-                w_mat_std += w_std
-                m_mat_std += m_std
-                v_mat_std += v_std
+                        entries.append((mat_idx, m_u, n_u))
+                        ops.append(op)
+
+            mats = [q_mat, w_mat, m_mat, v_mat]
+            stds = [0, 0, 0, 0]
+            for (mat_idx, m_u, n_u), (mean, std) in \
+                    zip(entries, self._evaluate_commutators(ops, wave_fn, quantum_instance)):
+                if mean != 0.0:
+                    mats[mat_idx][m_u][n_u] = mean
+                stds[mat_idx] += std
+            q_mat_std, w_mat_std, m_mat_std, v_mat_std = stds
         else:
             for idx, _ in enumerate(mus):
                 m_u = mus[idx]
@@ -413,6 +412,10 @@ class QEquationOfMotion:
                 w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
                 m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
                 v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
+                q_mat_std += q_std
+                w_mat_std += w_std
+                m_mat_std += m_std
+                v_mat_std += v_std
 
         # pylint: disable=unsubscriptable-object
         if self._is_eom_matrix_symmetric:
@@ -438,6 +441,69 @@ class QEquationOfMotion:
 
         return m_mat, v_mat, q_mat, w_mat, m_mat_std, v_mat_std, q_mat_std, w_mat_std
 
+    @staticmethod
+    def _evaluate_commutators(ops, wave_fn, quantum_instance):
+        """
+        Measure the commutators with a single evaluation of their distinct Paulis, which are
+        grouped together in qasm mode.
+
+        Args:
+            ops (list[WeightedPauliOperator]): the commutators, not empty
+            wave_fn (QuantumCircuit): the circuit generated wave function
+            quantum_instance (QuantumInstance): a quantum instance with configured settings
+
+        Returns:
+            list[tuple]: the mean and the standard deviation of each commutator
+        """
+        if not ops:
+            return []
+        tables = [PackedPauliTable.from_paulis(op.paulis) for op in ops]
+        offsets = np.cumsum([0] + [len(table) for table in tables])
+        all_paulis = PackedPauliTable(np.concatenate([table.x for table in tables]),
+                                      np.concatenate([table.z for table in tables]),
+                                      np.ones(offsets[-1]), ops[0].num_qubits)
+        first, inverse = all_paulis.unique()
+        distinct_op = WeightedPauliOperator(paulis=all_paulis[first].to_paulis())
+        statevector_mode = quantum_instance.is_statevector
+        if not statevector_mode:
+            distinct_op = op_converter.to_tpb_grouped_weighted_pauli_operator(
+                distinct_op, TPBGroupedWeightedPauliOperator.sorted_grouping)
+        circuits = distinct_op.construct_evaluation_circuit(wave_function=wave_fn,
+                                                            statevector_mode=statevector_mode)
+        result = quantum_instance.execute(circuits)
+
+        ret = []
+        if statevector_mode:
+            quantum_state = np.asarray(result.get_statevector('psi'))
+            values = np.ones(len(first), dtype=complex)
+            for idx, (_, pauli) in enumerate(all_paulis[first].to_paulis()):
+                if np.any(pauli.x) or np.any(pauli.z):
+                    values[idx] = np.vdot(quantum_state, result.get_statevector(pauli.to_label()))
+            for k, table in enumerate(tables):
+                ret.append((np.sum(table.coeffs * values[inverse[offsets[k]:offsets[k + 1]]]),
+                            0.0))
+            return ret
+
+        groups = {}
+        for group_idx, (_, indices) in enumerate(distinct_op.basis):
+            for idx in indices:
+                groups[distinct_op.paulis[idx][1].to_label()] = group_idx
+        group_of_paulis = np.array([groups[pauli.to_label()]
+                                    for _, pauli in all_paulis[first].to_paulis()])
+        counts = [PackedCounts(result.get_counts(basis.to_label()))
+                  for basis, _ in distinct_op.basis]
+        # pick the first result to get the total number of shots
+        num_shots = sum(list(result.get_counts(0).values()))
+        for k, table in enumerate(tables):
+            table_groups = group_of_paulis[inverse[offsets[k]:offsets[k + 1]]]
+            avg, variance = 0.0, 0.0
+            for group_idx in np.unique(table_groups):
+                mean, var = counts[group_idx].mean_and_variance(table[table_groups == group_idx])
+                avg += mean
+                variance += var
+            ret.append((avg, np.sqrt(variance / num_shots)))
+        return ret
+
     @staticmethod
     def compute_excitation_energies(m_mat, v_mat, q_mat, w_mat):
         """Diagonalizing M, V, Q, W matrices for excitation energies.
@@ -510,46 +576,40 @@ class QEquationOfMotion:
         return qubit_op, commutativities
 
     @staticmethod
-    def _build_commutator_rountine(params, operator, z2_symmetries):
-        m_u, n_u, left_op, right_op_1, right_op_2 = params
-        if left_op is None:
-            q_mat_op = None
-            w_mat_op = None
-            m_mat_op = None
-            v_mat_op = None
-        else:
-            if right_op_1 is None and right_op_2 is None:
-                q_mat_op = None
-                w_mat_op = None
-                m_mat_op = None
-                v_mat_op = None
-            else:
-                if right_op_1 is not None:
-                    q_mat_op = commutator(left_op, operator, right_op_1)
-                    w_mat_op = commutator(left_op, right_op_1)
-                    q_mat_op = None if q_mat_op.is_empty() else q_mat_op
-                    w_mat_op = None if w_mat_op.is_empty() else w_mat_op
-                else:
-                    q_mat_op = None
-                    w_mat_op = None
-
-                if right_op_2 is not None:
-                    m_mat_op = commutator(left_op, operator, right_op_2)
-                    v_mat_op = commutator(left_op, right_op_2)
-                    m_mat_op = None if m_mat_op.is_empty() else m_mat_op
-                    v_mat_op = None if v_mat_op.is_empty() else v_mat_op
-                else:
-                    m_mat_op = None
-                    v_mat_op = None
-
-                if not z2_symmetries.is_empty():
-                    if q_mat_op is not None and not q_mat_op.is_empty():
-                        q_mat_op = z2_symmetries.taper(q_mat_op)
-                    if w_mat_op is not None and not w_mat_op.is_empty():
-                        w_mat_op = z2_symmetries.taper(w_mat_op)
-                    if m_mat_op is not None and not m_mat_op.is_empty():
-                        m_mat_op = z2_symmetries.taper(m_mat_op)
-                    if v_mat_op is not None and not v_mat_op.is_empty():
-                        v_mat_op = z2_symmetries.taper(v_mat_op)
-
-        return m_u, n_u, q_mat_op, w_mat_op, m_mat_op, v_mat_op
+    def _build_operator_commutator(hopping_table, operator_table):
+        """ [H, K] of the operator H and a hopping operator K """
+        table, _ = operator_table.commutator(hopping_table).simplify()
+        return table
+
+    @staticmethod
+    def _build_commutator_rountine(params, z2_symmetries, threshold=1e-12):
+        """
+        The double commutator [A, H, C] and the commutator [A, C] of two hopping operators
+        A and C, where the symmetric double commutator
+        0.5 * (2AHC + 2CHA - HAC - CAH - ACH - HCA) is computed as
+        0.5 * ([A, [H, C]] - [[H, A], C]) from the commutators of H with A and C.
+        The operators are tapered if there are Z2 symmetries, and None if they are empty.
+        """
+        left, operator_left, right, operator_right = params
+        left_double = left.commutator(operator_right)
+        right_double = operator_left.commutator(right)
+        double_commutator = PackedPauliTable(
+            np.concatenate((left_double.x, right_double.x)),
+            np.concatenate((left_double.z, right_double.z)),
+            0.5 * np.concatenate((left_double.coeffs, -right_double.coeffs)),
+            left.num_qubits)
+
+        ops = []
+        for table in (double_commutator, left.commutator(right)):
+            table, _ = table.simplify()
+            weights, mask = table.chop_mask(threshold)
+            if not np.any(mask):
+                ops.append(None)
+                continue
+            table = PackedPauliTable(table.x[mask], table.z[mask], weights[mask],
+                                     table.num_qubits)
+            op = WeightedPauliOperator(paulis=table.to_paulis())
+            if not z2_symmetries.is_empty():
+                op = z2_symmetries.taper(op)
+            ops.append(op)
+        return tuple(ops)
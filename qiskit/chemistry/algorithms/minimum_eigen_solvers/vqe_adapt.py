@@ -27,6 +27,8 @@ from qiskit.aqua.algorithms import VQAlgorithm, VQE, VQEResult
 from qiskit.chemistry.components.variational_forms import UCCSD
 from qiskit.aqua.operators import WeightedPauliOperator
 from qiskit.aqua.operators import LegacyBaseOperator
+from qiskit.aqua.operators import (StateFn, CircuitStateFn, ListOp, CircuitSampler,
+                                   ExpectationFactory)
 from qiskit.aqua.components.optimizers import Optimizer
 from qiskit.aqua.components.variational_forms import VariationalForm
 from qiskit.aqua.utils.validation import validate_min
@@ -51,7 +53,8 @@ class VQEAdapt(VQAlgorithm):
                  max_iterations: Optional[int] = None,
                  max_evals_grouped: int = 1,
                  aux_operators: Optional[List[LegacyBaseOperator]] = None,
-                 quantum_instance: Optional[Union[QuantumInstance, BaseBackend]] = None) -> None:
+                 quantum_instance: Optional[Union[QuantumInstance, BaseBackend]] = None,
+                 batch_gradients: bool = True) -> None:
         """
         Args:
             operator: Qubit operator
@@ -66,6 +69,9 @@ class VQEAdapt(VQAlgorithm):
             max_evals_grouped: max number of evaluations performed simultaneously
             aux_operators: Auxiliary operators to be evaluated at each eigenvalue
             quantum_instance: Quantum Instance or Backend
+            batch_gradients: if True, the energies of the gradients of all the excitations of
+                the pool are evaluated in a single batch of circuits, otherwise a VQE instance
+                evaluates the gradient of each excitation in turn.
 
         Raises:
             ValueError: if var_form_base is not an instance of UCCSD.
@@ -91,6 +97,7 @@ class VQEAdapt(VQAlgorithm):
         self._threshold = threshold
         self._delta = delta
         self._max_iterations = max_iterations
+        self._batch_gradients = batch_gradients
         self._aux_operators = []
         if aux_operators is not None:
             aux_operators = \
@@ -114,6 +121,9 @@ class VQEAdapt(VQAlgorithm):
         Returns:
             list: List of pairs consisting of gradient and excitation operator.
         """
+        if self._batch_gradients:
+            return self._compute_gradients_batched(excitation_pool, theta, delta,
+                                                   var_form, operator)
         res = []
         # compute gradients for all excitation in operator pool
         for exc in excitation_pool:
@@ -133,6 +143,39 @@ class VQEAdapt(VQAlgorithm):
 
         return res
 
+    def _compute_gradients_batched(self, excitation_pool, theta, delta, var_form, operator):
+        """
+        Computes the gradients for all available excitation operators, like
+        :meth:`_compute_gradients`, but the observable is converted once and the energies
+        of all the excitations are sampled together, in a single batch of circuits.
+
+        Args:
+            excitation_pool (list): pool of excitation operators
+            theta (list): list of (up to now) optimal parameters
+            delta (float): finite difference step size (for gradient computation)
+            var_form (VariationalForm): current variational form
+            operator (LegacyBaseOperator): system Hamiltonian
+
+        Returns:
+            list: List of pairs consisting of gradient and excitation operator.
+        """
+        if isinstance(operator, LegacyBaseOperator):
+            operator = operator.to_opflow()
+        expectation = ExpectationFactory.build(operator=operator, backend=self.quantum_instance)
+        observable_meas = expectation.convert(StateFn(operator, is_measurement=True))
+        expect_ops = []
+        for exc in excitation_pool:
+            var_form.push_hopping_operator(exc)
+            for parameters in (theta + [-delta], theta + [delta]):
+                wave_function = var_form.construct_circuit(parameters)
+                expect_ops.append(observable_meas.compose(CircuitStateFn(wave_function)).reduce())
+            var_form.pop_hopping_operator()
+
+        sampled_expect_ops = CircuitSampler(self.quantum_instance).convert(ListOp(expect_ops))
+        energies = np.real(sampled_expect_ops.eval())
+        gradients = (energies[0::2] - energies[1::2]) / (2 * delta)
+        return [(np.abs(gradient), exc) for gradient, exc in zip(gradients, excitation_pool)]
+
     def _run(self) -> 'VQEAdaptResult':
         """
         Run the algorithm to compute the minimum eigenvalue.
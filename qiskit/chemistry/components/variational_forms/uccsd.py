@@ -17,26 +17,37 @@ Also, for more information on the tapering see: https://arxiv.org/abs/1701.08213
 And for singlet q-UCCD (full) and pair q-UCCD see: https://arxiv.org/abs/1911.10864
 """
 
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict, Tuple
 import logging
 import sys
 import collections
 import copy
+import hashlib
+import json
+import os
 
 import numpy as np
 from qiskit.aqua.utils.validation import validate_min, validate_in_set
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit import Gate, ParameterVector, ParameterExpression
+from qiskit.circuit.exceptions import CircuitError
 from qiskit.tools import parallel_map
 from qiskit.tools.events import TextProgressBar
 
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.components.initial_states import InitialState
 from qiskit.aqua.operators import WeightedPauliOperator, Z2Symmetries
+from qiskit.aqua.operators.legacy import (pack_operators, unpack_operators,
+                                          pack_z2_symmetries)
+from qiskit.aqua.utils import atomic_write
 from qiskit.aqua.components.variational_forms import VariationalForm
 from qiskit.chemistry.fermionic_operator import FermionicOperator
 
 logger = logging.getLogger(__name__)
 
+# bumped when the content of the stored hopping operators changes
+_HOPPING_OPERATORS_FORMAT_VERSION = 2
+
 
 class UCCSD(VariationalForm):
     """
@@ -44,8 +55,17 @@ class UCCSD(VariationalForm):
     variational form.
     For more information, see https://arxiv.org/abs/1805.04340
     And for the singlet q-UCCD (full) and pair q-UCCD) see: https://arxiv.org/abs/1911.10864
+
+    The hopping operators are memoized by the number of orbitals and particles, the qubit
+    mapping, the two qubit reduction and the Z2 symmetries, so that building the variational
+    form again, e.g. in a scan of bond lengths, reuses the operators of the excitations mapped
+    before. Given ``hopping_operator_cache_dir``, they are also stored on disk.
     """
 
+    # the settings whose hopping operators are kept in memory
+    _HOPPING_OPERATORS_CACHE_SIZE = 16
+    _hopping_operators_cache = collections.OrderedDict()  # type: collections.OrderedDict
+
     def __init__(self,
                  num_orbitals: int,
                  num_particles: Union[List[int], int],
@@ -62,7 +82,9 @@ class UCCSD(VariationalForm):
                  method_doubles: str = 'ucc',
                  excitation_type: str = 'sd',
                  same_spin_doubles: bool = True,
-                 skip_commute_test: bool = False) -> None:
+                 skip_commute_test: bool = False,
+                 hopping_operator_cache_dir: Optional[str] = None,
+                 cache_circuit: bool = False) -> None:
         """Constructor.
 
         Args:
@@ -92,6 +114,13 @@ class UCCSD(VariationalForm):
             skip_commute_test: when tapering excitation operators we test and exclude any that do
                                 not commute with symmetries. This test can be skipped to include
                                 all tapered excitation operators whether they commute or not.
+            hopping_operator_cache_dir: a directory where the hopping operators are also stored,
+                                if given, so that other processes building the same variational
+                                form load them instead of mapping them again.
+            cache_circuit: build the circuit once, with a ``ParameterVector``, and return bound
+                                copies of it afterwards. The evolutions of the excitations are
+                                inlined and the CNOT ladders and basis changes shared by
+                                consecutive Pauli terms are cancelled.
 
 
          Raises:
@@ -136,6 +165,8 @@ class UCCSD(VariationalForm):
         self._two_qubit_reduction = two_qubit_reduction
         self._num_time_slices = num_time_slices
         self._shallow_circuit_concat = shallow_circuit_concat
+        self._cache_circuit = cache_circuit
+        self._circuit_template = None
 
         # advanced parameters
         self._method_singles = method_singles
@@ -143,6 +174,9 @@ class UCCSD(VariationalForm):
         self._excitation_type = excitation_type
         self.same_spin_doubles = same_spin_doubles
         self._skip_commute_test = skip_commute_test
+        self._hopping_operator_cache_dir = hopping_operator_cache_dir
+        if hopping_operator_cache_dir is not None:
+            os.makedirs(hopping_operator_cache_dir, exist_ok=True)
 
         self._single_excitations, self._double_excitations = \
             UCCSD.compute_excitation_lists([self._num_alpha, self._num_beta], self._num_orbitals,
@@ -234,23 +268,82 @@ class UCCSD(VariationalForm):
         """
         return self._excitation_pool
 
+    def _hopping_operators_key(self):
+        # the symmetries are hashed in the layout they are stored in
+        arrays = {}
+        z2_symmetries = pack_z2_symmetries(arrays, 'z2', self._z2_symmetries)
+        digest = hashlib.sha256()
+        digest.update(json.dumps([_HOPPING_OPERATORS_FORMAT_VERSION, self._num_orbitals,
+                                  self._num_particles, self._qubit_mapping,
+                                  self._two_qubit_reduction, z2_symmetries,
+                                  self._skip_commute_test]).encode('utf8'))
+        for name in sorted(arrays):
+            digest.update(name.encode('utf8'))
+            digest.update(np.ascontiguousarray(arrays[name]).tobytes())
+        return digest.hexdigest()
+
+    def _hopping_operators_path(self, key):
+        return os.path.join(self._hopping_operator_cache_dir, 'uccsd_hopping_{}.npz'.format(key))
+
     def _build_hopping_operators(self):
-        if logger.isEnabledFor(logging.DEBUG):
-            TextProgressBar(sys.stderr)
+        # the hopping operators only depend on the settings of the key, the ones of the
+        # excitations mapped before, by this or another instance, are reused
+        key = self._hopping_operators_key()
+        operators = UCCSD._hopping_operators_cache.pop(key, None)
+        if operators is None and self._hopping_operator_cache_dir is not None:
+            path = self._hopping_operators_path(key)
+            try:
+                with np.load(path, allow_pickle=False) as arrays:
+                    unpacked = unpack_operators(arrays)
+                if unpacked is not None:
+                    ops, _, values = unpacked
+                    operators = dict(zip(map(tuple, values['excitations']), ops))
+                    logger.info('Loaded %s hopping operators from %s', len(ops), path)
+            except FileNotFoundError:
+                pass
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.warning('Ignoring the unreadable hopping operators %s: %s', path, str(ex))
+        if operators is None:
+            operators = {}
+        UCCSD._hopping_operators_cache[key] = operators
+        while len(UCCSD._hopping_operators_cache) > UCCSD._HOPPING_OPERATORS_CACHE_SIZE:
+            UCCSD._hopping_operators_cache.popitem(last=False)
+
+        excitations = self._single_excitations + self._double_excitations
+        missing = [index for index in excitations if tuple(index) not in operators]
+        if missing:
+            if logger.isEnabledFor(logging.DEBUG):
+                TextProgressBar(sys.stderr)
+
+            results = parallel_map(UCCSD._build_hopping_operator,
+                                   missing,
+                                   task_args=(self._num_orbitals, self._num_particles,
+                                              self._qubit_mapping, self._two_qubit_reduction,
+                                              self._z2_symmetries,
+                                              self._skip_commute_test),
+                                   num_processes=aqua_globals.num_processes)
+            for op, index in results:
+                operators[tuple(index)] = op if op is not None and not op.is_empty() else None
+            if self._hopping_operator_cache_dir is not None:
+                # the excitations which were skipped are stored as None
+                arrays = pack_operators(
+                    list(operators.values()),
+                    values={'excitations': [list(index) for index in operators]})
+                try:
+                    atomic_write(self._hopping_operators_path(key),
+                                 lambda file: np.savez_compressed(file, **arrays))
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.warning('Failed to store the hopping operators in %s: %s',
+                                   self._hopping_operator_cache_dir, str(ex))
+        logger.debug('Mapped %s of %s hopping operators', len(missing), len(excitations))
 
-        results = parallel_map(UCCSD._build_hopping_operator,
-                               self._single_excitations + self._double_excitations,
-                               task_args=(self._num_orbitals, self._num_particles,
-                                          self._qubit_mapping, self._two_qubit_reduction,
-                                          self._z2_symmetries,
-                                          self._skip_commute_test),
-                               num_processes=aqua_globals.num_processes)
         hopping_ops = []
         s_e_list = []
         d_e_list = []
-        for op, index in results:
-            if op is not None and not op.is_empty():
-                hopping_ops.append(op)
+        for index in excitations:
+            op = operators[tuple(index)]
+            if op is not None:
+                hopping_ops.append(op.copy())
                 if len(index) == 2:  # for double excitation
                     s_e_list.append(index)
                 else:  # for double excitation
@@ -288,19 +381,27 @@ class UCCSD(VariationalForm):
             WeightedPauliOperator: qubit_op
             list: index
         """
-        h_1 = np.zeros((num_orbitals, num_orbitals))
-        h_2 = np.zeros((num_orbitals, num_orbitals, num_orbitals, num_orbitals))
+        # the excitation and its conjugate are mapped directly from their sparse integrals,
+        # listed in the order numpy.nonzero gives for the dense h1, h2 of a FermionicOperator
+        terms = {}  # type: Dict[Tuple[int, ...], float]
         if len(index) == 2:
             i, j = index
-            h_1[i, j] = 1.0
-            h_1[j, i] = -1.0
+            terms[(i, j)] = 1.0
+            terms[(j, i)] = -1.0
         elif len(index) == 4:
             i, j, k, m = index
-            h_2[i, j, k, m] = 1.0
-            h_2[m, k, j, i] = -1.0
-
-        dummpy_fer_op = FermionicOperator(h1=h_1, h2=h_2)
-        qubit_op = dummpy_fer_op.mapping(qubit_mapping)
+            terms[(i, j, k, m)] = 1.0
+            terms[(m, k, j, i)] = -1.0
+        integrals = {rank: (tuple(np.zeros((rank, 0), dtype=int)), np.zeros(0))
+                     for rank in (2, 4)}
+        if terms:
+            indices = sorted(terms)
+            integrals[len(index)] = (tuple(np.array(indices).T),
+                                     np.array([terms[idx] for idx in indices]))
+        # pylint: disable=protected-access
+        table = FermionicOperator._map_terms(qubit_mapping.lower(), num_orbitals,
+                                             integrals[2], integrals[4], threshold=1e-8)
+        qubit_op = WeightedPauliOperator(paulis=table.to_paulis())
         if two_qubit_reduction:
             qubit_op = Z2Symmetries.two_qubit_reduction(qubit_op, num_particles)
 
@@ -339,6 +440,7 @@ class UCCSD(VariationalForm):
 
         # reset internal excitation list to be empty
         self._hopping_ops = []
+        self._circuit_template = None
         self._num_parameters = len(self._hopping_ops) * self._reps
         self._bounds = [(-np.pi, np.pi) for _ in range(self._num_parameters)]
 
@@ -350,6 +452,7 @@ class UCCSD(VariationalForm):
             excitation (WeightedPauliOperator): the new hopping operator to be added
         """
         self._hopping_ops.append(excitation)
+        self._circuit_template = None
         self._num_parameters = len(self._hopping_ops) * self._reps
         self._bounds = [(-np.pi, np.pi) for _ in range(self._num_parameters)]
 
@@ -358,6 +461,7 @@ class UCCSD(VariationalForm):
         Pops the hopping operator that was added last.
         """
         self._hopping_ops.pop()
+        self._circuit_template = None
         self._num_parameters = len(self._hopping_ops) * self._reps
         self._bounds = [(-np.pi, np.pi) for _ in range(self._num_parameters)]
 
@@ -380,6 +484,9 @@ class UCCSD(VariationalForm):
 
         if q is None:
             q = QuantumRegister(self._num_qubits, name='q')
+        if self._cache_circuit:
+            return self._bind_circuit_template(parameters, q)
+
         if self._initial_state is not None:
             circuit = self._initial_state.construct_circuit('circuit', q)
         else:
@@ -390,20 +497,7 @@ class UCCSD(VariationalForm):
             TextProgressBar(sys.stderr)
             self._logging_construct_circuit = False
 
-        num_excitations = len(self._hopping_ops)
-
-        if not self.uccd_singlet:
-            list_excitation_operators = [
-                (self._hopping_ops[index % num_excitations], parameters[index])
-                for index in range(self._reps * num_excitations)]
-        else:
-            list_excitation_operators = []
-            counter = 0
-            for i in range(int(self._reps * self.num_groups)):
-                for _ in range(len(self._double_excitations_grouped[i % self.num_groups])):
-                    list_excitation_operators.append((self._hopping_ops[counter],
-                                                      parameters[i]))
-                    counter += 1
+        list_excitation_operators = self._list_excitation_operators(parameters)
 
         # TODO to uncomment to update for Operator flow:
         # from functools import reduce
@@ -430,6 +524,93 @@ class UCCSD(VariationalForm):
 
         return circuit
 
+    def _list_excitation_operators(self, parameters):
+        num_excitations = len(self._hopping_ops)
+
+        if not self.uccd_singlet:
+            list_excitation_operators = [
+                (self._hopping_ops[index % num_excitations], parameters[index])
+                for index in range(self._reps * num_excitations)]
+        else:
+            list_excitation_operators = []
+            counter = 0
+            for i in range(int(self._reps * self.num_groups)):
+                for _ in range(len(self._double_excitations_grouped[i % self.num_groups])):
+                    list_excitation_operators.append((self._hopping_ops[counter],
+                                                      parameters[i]))
+                    counter += 1
+        return list_excitation_operators
+
+    def _build_circuit_template(self, q):
+        """ build the circuit with a ParameterVector, inlining the evolutions of the
+        excitations and cancelling the gates undone by the next Pauli term """
+        params = ParameterVector('θ', self._num_parameters)
+        if self._initial_state is not None:
+            circuit = self._initial_state.construct_circuit('circuit', q)
+        else:
+            circuit = QuantumCircuit(q)
+
+        results = parallel_map(UCCSD._construct_circuit_for_one_excited_operator,
+                               self._list_excitation_operators(params),
+                               task_args=(q, self._num_time_slices),
+                               num_processes=aqua_globals.num_processes)
+        # the gates of the initial state are part of the cancellation too
+        data = circuit._data
+        circuit._data = []
+        for qc in results:
+            for evolution, qargs, _ in qc._data:
+                definition = evolution.definition
+                qubits = {qubit: qargs[i] for i, qubit in enumerate(definition.qubits)}
+                data.extend((inst, [qubits[qubit] for qubit in inst_qargs], [])
+                            for inst, inst_qargs, _ in definition.data)
+        num_gates = len(data)
+        data = _cancel_inverse_gates(data)
+        logger.debug('Built the circuit template, %s of %s gates cancelled',
+                     num_gates - len(data), num_gates)
+        for inst, qargs, cargs in data:
+            circuit._append(inst, qargs, cargs)
+
+        # the parameterized gates are bound from the affine expressions of their parameter
+        positions, param_indices, offsets, slopes = [], [], [], []
+        param_index = {param: i for i, param in enumerate(params)}
+        for position, (inst, _, _) in enumerate(circuit._data):
+            if len(inst.params) != 1 or not isinstance(inst.params[0], ParameterExpression):
+                continue
+            expr = inst.params[0]
+            param, = expr.parameters
+            positions.append(position)
+            param_indices.append(param_index[param])
+            offsets.append(float(expr.bind({param: 0.0})))
+            slopes.append(float(expr.bind({param: 1.0})) - offsets[-1])
+        self._circuit_template = (q, params, circuit,
+                                  (np.array(positions, dtype=int),
+                                   np.array(param_indices, dtype=int),
+                                   np.array(offsets), np.array(slopes)))
+
+    def _bind_circuit_template(self, parameters, q):
+        if self._circuit_template is None or self._circuit_template[0] != q:
+            self._build_circuit_template(q)
+        _, params, template, (positions, param_indices, offsets, slopes) = \
+            self._circuit_template
+
+        if any(isinstance(param, ParameterExpression) for param in parameters):
+            if list(parameters) == list(params):
+                return template.copy()
+            return template.assign_parameters(dict(zip(params, parameters)))
+
+        # the gates without parameters are shared with the template
+        values = offsets + slopes * np.asarray(parameters, dtype=float)[param_indices]
+        data = list(template._data)
+        for position, value in zip(positions, values):
+            inst, qargs, cargs = data[position]
+            inst = copy.copy(inst)
+            inst._definition = None
+            inst.params = [float(value)]
+            data[position] = (inst, qargs, cargs)
+        circuit = QuantumCircuit(*template.qregs, name=template.name)
+        circuit._data = data
+        return circuit
+
     @staticmethod
     def _construct_circuit_for_one_excited_operator(qubit_op_and_param, qr, num_time_slices):
         qubit_op, param = qubit_op_and_param
@@ -796,3 +977,65 @@ class UCCSD(VariationalForm):
                         ordered_labels.append(l_e[1])
 
         return ordered_labels
+
+
+# two-qubit gates which are their own inverse
+_SELF_INVERSE_GATES = {'cx', 'cy', 'cz', 'swap'}
+
+
+def _gate_matrix(inst, matrices):
+    key = (inst.name, tuple(inst.params))
+    matrix = matrices.get(key)
+    if matrix is None:
+        matrix = matrices[key] = inst.to_matrix()
+    return matrix
+
+
+def _are_inverse(inst_1, inst_2, matrices):
+    """ whether a gate undoes the previous one on the same qubits """
+    if not isinstance(inst_1, Gate) or not isinstance(inst_2, Gate) \
+            or any(isinstance(param, ParameterExpression)
+                   for param in inst_1.params + inst_2.params):
+        return False
+    if inst_1.name in _SELF_INVERSE_GATES:
+        return inst_1.name == inst_2.name
+    if inst_1.num_qubits != 1 or inst_2.num_qubits != 1:
+        return False
+    try:
+        product = _gate_matrix(inst_2, matrices) @ _gate_matrix(inst_1, matrices)
+    except CircuitError:
+        return False
+    return np.allclose(product, np.eye(2), atol=1e-12)
+
+
+def _cancel_inverse_gates(data):
+    """
+    Remove the pairs of gates which undo each other with nothing in between on their qubits,
+    as long as there are some. The consecutive evolutions of Pauli terms with the same CNOT
+    ladder and basis changes, e.g. the terms of an excitation, share their ladders this way.
+
+    Args:
+        data (list[tuple]): the instructions, with their qubits and clbits
+
+    Returns:
+        list[tuple]: the remaining instructions
+    """
+    kept = [True] * len(data)
+    # the kept instructions on each qubit, the last one being the one a new gate may undo
+    wires = collections.defaultdict(list)  # type: Dict[object, List[int]]
+    matrices = {}  # type: Dict[Tuple, np.ndarray]
+    for index, (inst, qargs, cargs) in enumerate(data):
+        if qargs and not cargs and wires[qargs[0]]:
+            previous = wires[qargs[0]][-1]
+            prev_inst, prev_qargs, prev_cargs = data[previous]
+            if list(prev_qargs) == list(qargs) and not prev_cargs \
+                    and all(wires[qubit] and wires[qubit][-1] == previous for qubit in qargs) \
+                    and _are_inverse(prev_inst, inst, matrices):
+                kept[previous] = False
+                kept[index] = False
+                for qubit in qargs:
+                    wires[qubit].pop()
+                continue
+        for qubit in list(qargs) + list(cargs):
+            wires[qubit].append(index)
+    return [entry for entry, keep in zip(data, kept) if keep]
@@ -46,6 +46,7 @@ Core
    :nosignatures:
 
    Hamiltonian
+   HamiltonianCache
    TransformationType
    QubitMappingType
 
@@ -54,11 +55,13 @@ Core
 from .chemistry_operator import (ChemistryOperator, MolecularChemistryResult,
                                  MolecularGroundStateResult, MolecularExcitedStatesResult)
 from .hamiltonian import Hamiltonian, TransformationType, QubitMappingType
+from .hamiltonian_cache import HamiltonianCache
 
 __all__ = ['ChemistryOperator',
            'MolecularChemistryResult',
            'MolecularGroundStateResult',
            'MolecularExcitedStatesResult',
            'Hamiltonian',
+           'HamiltonianCache',
            'TransformationType',
            'QubitMappingType']
@@ -26,6 +26,7 @@ from qiskit.chemistry.fermionic_operator import FermionicOperator
 from .chemistry_operator import (ChemistryOperator,
                                  MolecularGroundStateResult,
                                  DipoleTuple)
+from .hamiltonian_cache import HamiltonianCache
 from ..components.initial_states import HartreeFock
 
 logger = logging.getLogger(__name__)
@@ -56,7 +57,8 @@ class Hamiltonian(ChemistryOperator):
                  two_qubit_reduction: bool = True,
                  freeze_core: bool = False,
                  orbital_reduction: Optional[List[int]] = None,
-                 z2symmetry_reduction: Optional[Union[str, List[int]]] = None) -> None:
+                 z2symmetry_reduction: Optional[Union[str, List[int]]] = None,
+                 cache: Optional[HamiltonianCache] = None) -> None:
         """
         Args:
             transformation: full or particle_hole
@@ -79,6 +81,9 @@ class Hamiltonian(ChemistryOperator):
                 symmetries found in the main operator if this operator commutes with the main
                 operator symmetry. If it does not then the operator will be discarded since no
                 meaningful measurement can take place.
+            cache: An on-disk cache of the computed operators, keyed by the integrals of the
+                molecule and the above settings. When given, running again on a molecule with
+                the same integrals loads the operators from the cache.
         Raises:
             QiskitChemistryError: Invalid symmetry reduction
         """
@@ -96,6 +101,7 @@ class Hamiltonian(ChemistryOperator):
                 if z2symmetry_reduction != 'auto':
                     raise QiskitChemistryError('Invalid z2symmetry_reduction value')
         self._z2symmetry_reduction = z2symmetry_reduction
+        self._cache = cache
 
         # Store values that are computed by the classical logic in order
         # that later they may be combined with the quantum result
@@ -122,6 +128,14 @@ class Hamiltonian(ChemistryOperator):
         self._nuclear_dipole_moment = qmolecule.nuclear_dipole_moment
         self._reverse_dipole_sign = qmolecule.reverse_dipole_sign
 
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache.key(qmolecule, self._cache_settings())
+            entry = self._cache.load(cache_key)
+            if entry is not None:
+                logger.debug('Operators loaded from the cache, ready to run algorithm')
+                return self._restore_cache_entry(entry)
+
         core_list = qmolecule.core_orbitals if self._freeze_core else []
         reduce_list = self._orbital_reduction
 
@@ -270,9 +284,46 @@ class Hamiltonian(ChemistryOperator):
             qubit_op, aux_ops, z2symmetries = self._process_z2symmetry_reduction(qubit_op, aux_ops)
         self._add_molecule_info(self.INFO_Z2SYMMETRIES, z2symmetries)
 
+        if cache_key is not None:
+            self._cache.store(cache_key, qubit_op, aux_ops, z2symmetries,
+                              self._cache_entry_values())
+
         logger.debug('Processing complete ready to run algorithm')
         return qubit_op, aux_ops
 
+    # the computed shifts, restored along with the cached operators
+    _CACHED_SHIFTS = ['_energy_shift', '_x_dipole_shift', '_y_dipole_shift', '_z_dipole_shift',
+                      '_ph_energy_shift', '_ph_x_dipole_shift', '_ph_y_dipole_shift',
+                      '_ph_z_dipole_shift']
+
+    def _cache_settings(self):
+        z2symmetry_reduction = self._z2symmetry_reduction
+        if z2symmetry_reduction is not None and not isinstance(z2symmetry_reduction, str):
+            z2symmetry_reduction = [int(i) for i in z2symmetry_reduction]
+        return {'transformation': self._transformation,
+                'qubit_mapping': self._qubit_mapping,
+                'two_qubit_reduction': self._two_qubit_reduction,
+                'freeze_core': self._freeze_core,
+                'orbital_reduction': [int(i) for i in self._orbital_reduction],
+                'z2symmetry_reduction': z2symmetry_reduction}
+
+    def _cache_entry_values(self):
+        values = {name: float(getattr(self, name)) for name in Hamiltonian._CACHED_SHIFTS}
+        values['num_particles'] = [int(i) for i in self._molecule_info[self.INFO_NUM_PARTICLES]]
+        values['num_orbitals'] = int(self._molecule_info[self.INFO_NUM_ORBITALS])
+        values['two_qubit_reduction'] = bool(self._molecule_info[self.INFO_TWO_QUBIT_REDUCTION])
+        return values
+
+    def _restore_cache_entry(self, entry):
+        values = entry['values']
+        for name in Hamiltonian._CACHED_SHIFTS:
+            setattr(self, name, values[name])
+        self._add_molecule_info(self.INFO_NUM_PARTICLES, values['num_particles'])
+        self._add_molecule_info(self.INFO_NUM_ORBITALS, values['num_orbitals'])
+        self._add_molecule_info(self.INFO_TWO_QUBIT_REDUCTION, values['two_qubit_reduction'])
+        self._add_molecule_info(self.INFO_Z2SYMMETRIES, entry['z2_symmetries'])
+        return entry['qubit_op'], entry['aux_ops']
+
     def _process_z2symmetry_reduction(self, qubit_op, aux_ops):
 
         z2_symmetries = Z2Symmetries.find_Z2_symmetries(qubit_op)
@@ -0,0 +1,218 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" On-disk cache of the qubit operators computed by the Hamiltonian core """
+
+from typing import Any, Dict, List, Optional, Tuple
+import glob
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+from qiskit.aqua.operators import WeightedPauliOperator, Z2Symmetries
+from qiskit.aqua.operators.legacy import pack_operators, unpack_operators
+from qiskit.aqua.utils import atomic_write
+from qiskit.chemistry import QMolecule
+
+logger = logging.getLogger(__name__)
+
+# the integrals the qubit operators are computed from
+_QMOLECULE_FIELDS = ['num_orbitals', 'num_alpha', 'num_beta',
+                     'mo_onee_ints', 'mo_onee_ints_b',
+                     'mo_eri_ints', 'mo_eri_ints_bb', 'mo_eri_ints_ba',
+                     'x_dip_mo_ints', 'x_dip_mo_ints_b',
+                     'y_dip_mo_ints', 'y_dip_mo_ints_b',
+                     'z_dip_mo_ints', 'z_dip_mo_ints_b']
+
+# bumped when the content of the entries changes
+_FORMAT_VERSION = 1
+
+
+class HamiltonianCache:
+    """
+    A content-addressed, size-bounded, on-disk cache of the qubit operators computed by
+    :class:`~qiskit.chemistry.core.Hamiltonian`.
+
+    The entries are keyed by a hash of the integrals of the molecule and of the settings of
+    the transformation, so that computing the same active space again, e.g. in a scan of bond
+    lengths, loads the operators instead of mapping and tapering them again. Each entry is a
+    compressed ``.npz`` file holding the packed Paulis and the weights of the operators. When
+    the files exceed the size limit, the least recently used ones are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1 << 30) -> None:
+        """
+        Args:
+            cache_dir: the directory of the cache files, created if needed.
+            max_bytes: the maximum total size of the cache files.
+
+        Raises:
+            ValueError: invalid max_bytes
+        """
+        if max_bytes < 1:
+            raise ValueError('The cache size must be positive, got {}'.format(max_bytes))
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_dir(self) -> str:
+        """ the directory of the cache files """
+        return self._cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        """ the maximum total size of the cache files """
+        return self._max_bytes
+
+    @property
+    def hits(self) -> int:
+        """ the number of lookups found in the cache """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """ the number of lookups not found in the cache """
+        return self._misses
+
+    def stats(self) -> Dict[str, int]:
+        """ Returns the hit and miss counts and the current size of the cache. """
+        files = self._files()
+        return {'hits': self._hits, 'misses': self._misses, 'entries': len(files),
+                'bytes': sum(size for _, size, _ in files), 'max_bytes': self._max_bytes}
+
+    @staticmethod
+    def key(qmolecule: QMolecule, settings: Dict[str, Any]) -> str:
+        """
+        Compute the key of the operators of a molecule.
+
+        Args:
+            qmolecule: the molecule
+            settings: the settings of the transformation, values must be JSON serializable
+
+        Returns:
+            the hex digest of the key
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps([_FORMAT_VERSION, settings], sort_keys=True).encode('utf8'))
+        digest.update(json.dumps(qmolecule.core_orbitals).encode('utf8'))
+        for field in _QMOLECULE_FIELDS:
+            value = getattr(qmolecule, field)
+            if value is None:
+                digest.update(field.encode('utf8') + b':none')
+                continue
+            value = np.ascontiguousarray(value)
+            digest.update('{}:{}:{}'.format(field, value.dtype.str, value.shape).encode('utf8'))
+            digest.update(value.tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, '{}.npz'.format(key))
+
+    def _files(self) -> List[Tuple[float, int, str]]:
+        files = []
+        for path in glob.glob(os.path.join(self._cache_dir, '*.npz')):
+            try:
+                stat = os.stat(path)
+            except OSError:  # removed by another process
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the operators of a key.
+
+        Args:
+            key: the key of the operators
+
+        Returns:
+            the entry stored by :meth:`store`, with the keys ``qubit_op``, ``aux_ops``,
+            ``z2_symmetries`` and ``values``, or None if the key is not in the cache.
+        """
+        path = self._path(key)
+        entry = None
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                unpacked = unpack_operators(arrays)
+            if unpacked is not None:
+                operators, z2_symmetries, values = unpacked
+                entry = {'qubit_op': operators[0],
+                         'aux_ops': operators[1:],
+                         'z2_symmetries': z2_symmetries or Z2Symmetries([], [], [], None),
+                         'values': values}
+            # the modification time orders the files for the eviction
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning('Ignoring the unreadable cached operators %s: %s', path, str(ex))
+        if entry is None:
+            self._misses += 1
+            logger.info('Hamiltonian cache miss (hits: %s, misses: %s)', self._hits, self._misses)
+        else:
+            self._hits += 1
+            logger.info('Hamiltonian cache hit (hits: %s, misses: %s)', self._hits, self._misses)
+        return entry
+
+    def store(self,
+              key: str,
+              qubit_op: WeightedPauliOperator,
+              aux_ops: List[Optional[WeightedPauliOperator]],
+              z2_symmetries: Z2Symmetries,
+              values: Dict[str, Any]) -> None:
+        """
+        Store the operators of a key, then evict the least recently used entries if the
+        cache exceeds its size.
+
+        Args:
+            key: the key of the operators
+            qubit_op: the main operator
+            aux_ops: the auxiliary operators, which may be None
+            z2_symmetries: the symmetries the operators were tapered with
+            values: other results, values must be JSON serializable
+        """
+        arrays = pack_operators([qubit_op] + list(aux_ops), z2_symmetries, values)
+        try:
+            atomic_write(self._path(key), lambda file: np.savez_compressed(file, **arrays))
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning('Failed to store the operators in %s: %s', self._cache_dir, str(ex))
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        # the most recent entry is kept even if it is larger than the limit by itself
+        for _, size, path in files[:-1]:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+                logger.debug('Evicted cached operators %s', path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """ Remove all the cache files and reset the statistics. """
+        for _, _, path in self._files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._hits = 0
+        self._misses = 0
@@ -12,10 +12,11 @@
 
 """FCIDump dumper."""
 
-from typing import List, Optional, Union, TextIO, Tuple
-import itertools
+from typing import Dict, List, Optional, Union, TextIO, Tuple
 import numpy as np
 
+_LINE_FORMAT = '%23.16E%4d%4d%4d%4d\n'
+
 
 def dump(outpath: str, norb: int, nelec: int, hijs: np.ndarray, hijkls: np.ndarray, einact: float,
          ms2: int = 0, orbsym: Optional[List[str]] = None, isym: int = 1
@@ -66,20 +67,19 @@ def dump(outpath: str, norb: int, nelec: int, hijs: np.ndarray, hijkls: np.ndarr
         _write_to_outfile(outfile, einact, (0, 0, 0, 0))
 
 
-def _dump_1e_ints(hij: List[float],
+def _dump_1e_ints(hij: np.ndarray,
                   mos: Union[range, List[int]],
                   outfile: TextIO,
                   beta: bool = False) -> None:
     idx_offset = 1 if not beta else 1+len(mos)
-    hij_elements = set()
-    for i, j in itertools.product(mos, repeat=2):
-        if i == j:
-            _write_to_outfile(outfile, hij[i][j], (i+idx_offset, j+idx_offset, 0, 0))
-            continue
-        if (j, i) in hij_elements and np.isclose(hij[i][j], hij[j][i]):
-            continue
-        _write_to_outfile(outfile, hij[i][j], (i+idx_offset, j+idx_offset, 0, 0))
-        hij_elements.add((i, j))
+    mos = np.asarray(mos, dtype=int)
+    hij = np.asarray(hij)[np.ix_(mos, mos)]
+    # the lower triangle is only written where it differs from the upper one
+    i, j = np.indices(hij.shape).reshape(2, -1)
+    written = (i <= j) | ~np.isclose(hij[i, j], hij[j, i])
+    i, j = i[written], j[written]
+    zeros = np.zeros_like(i)
+    _write_to_outfile(outfile, hij[i, j], (mos[i]+idx_offset, mos[j]+idx_offset, zeros, zeros))
 
 
 def _dump_2e_ints(hijkl: np.ndarray,
@@ -89,35 +89,42 @@ def _dump_2e_ints(hijkl: np.ndarray,
     idx_offsets = [1, 1]
     for b in range(beta):
         idx_offsets[1-b] += len(mos)
-    hijkl_elements = set()
-    # pylint: disable=invalid-name
-    for elem in itertools.product(mos, repeat=4):
-        if np.isclose(hijkl[elem], 0.0, atol=1e-14):
-            continue
-        if len(set(elem)) == 1:
-            _write_to_outfile(outfile, hijkl[elem], (*[e+idx_offsets[0] for e in elem[:2]],
-                                                     *[e+idx_offsets[1] for e in elem[2:]]))
-            continue
-        if beta != 1 and elem[::-1] in hijkl_elements and \
-                np.isclose(hijkl[elem], hijkl[elem[::-1]]):
-            continue
-        bra_perms = set(itertools.permutations(elem[:2]))
-        ket_perms = set(itertools.permutations(elem[2:]))
-        if beta == 1:
-            permutations = itertools.product(bra_perms, ket_perms)
-        else:
-            permutations = itertools.chain(
-                itertools.product(bra_perms, ket_perms),
-                itertools.product(ket_perms, bra_perms)
-            )
-        for perm in {e1 + e2 for e1, e2 in permutations}:
-            if perm in hijkl_elements and np.isclose(hijkl[elem], hijkl[perm]):
-                break
-        else:
-            _write_to_outfile(outfile, hijkl[elem], (*[e+idx_offsets[0] for e in elem[:2]],
-                                                     *[e+idx_offsets[1] for e in elem[2:]]))
-            hijkl_elements.add(elem)
+    mos = np.asarray(mos, dtype=int)
+    hijkl = np.asarray(hijkl)[np.ix_(mos, mos, mos, mos)]
+    # the nonzero elements, in lexicographic order
+    elems = np.argwhere(~np.isclose(hijkl, 0.0, atol=1e-14))
+    values = hijkl[tuple(elems.T)]
+    # ( ij | kl ) gives { ( ij | kl ), ( ij | lk ), ( ji | kl ), ( ji | lk ) }
+    # AND, if the spins are equal, { ( kl | ij ), ( kl | ji ), ( lk | ij ), ( lk | ji ) }
+    # BUT NOT ( ik | jl ) etc.
+    permutations = [(0, 1, 2, 3), (1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2)]
+    if beta != 1:
+        permutations += [(2, 3, 0, 1), (3, 2, 0, 1), (2, 3, 1, 0), (3, 2, 1, 0)]
+    strides = len(mos) ** np.arange(3, -1, -1)
+    classes = np.min([elems[:, perm] @ strides for perm in permutations], axis=0)
+    # the first element of each symmetry class is written, the others only if their value
+    # differs from the ones written before
+    _, first, inverse = np.unique(classes, return_index=True, return_inverse=True)
+    written = np.zeros(len(values), dtype=bool)
+    written[first] = True
+    differing = np.flatnonzero(~written & ~np.isclose(values, values[first[inverse]]))
+    class_values = {}  # type: Dict[int, List[float]]
+    for idx in differing:
+        previous = class_values.setdefault(inverse[idx], [values[first[inverse[idx]]]])
+        if not any(np.isclose(values[idx], value) for value in previous):
+            previous.append(values[idx])
+            written[idx] = True
+    elems = mos[elems[written]]
+    _write_to_outfile(outfile, values[written], tuple(
+        elems[:, n] + idx_offsets[n // 2] for n in range(4)))
 
 
-def _write_to_outfile(outfile: TextIO, value: float, indices: Tuple):
-    outfile.write('{:23.16E}{:4d}{:4d}{:4d}{:4d}\n'.format(value, *indices))
+def _write_to_outfile(outfile: TextIO, values: np.ndarray, indices: Tuple[np.ndarray, ...],
+                      chunk_size: int = 1 << 16) -> None:
+    """Writes the lines of the values and their indices, a chunk of lines at a time."""
+    values = np.asarray(values, dtype=float).ravel().tolist()
+    indices = [np.asarray(index, dtype=int).ravel().tolist() for index in indices]
+    for start in range(0, len(values), chunk_size):
+        chunk = list(zip(values[start:start+chunk_size],
+                         *[index[start:start+chunk_size] for index in indices]))
+        outfile.write(''.join(_LINE_FORMAT % line for line in chunk))
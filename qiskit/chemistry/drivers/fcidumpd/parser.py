@@ -12,38 +12,217 @@
 
 """FCIDump parser."""
 
-from typing import Any, Dict, Set, Tuple
-import itertools
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 import re
+import warnings
 import numpy as np
 
 from qiskit.chemistry import QiskitChemistryError
 
+# the number of characters of the integral lines parsed at once
+_CHUNK_SIZE = 1 << 24
 
-def parse(fcidump: str) -> Dict[str, Any]:
+# the index permutations of the integrals which leave them unchanged
+_SYMMETRIES = {
+    # <i|h|j> = <j|h|i>
+    '2fold': [(0, 1), (1, 0)],
+    # ( ij | kl ) = ( ji | kl ) = ( ij | lk ) = ( ji | lk ), when the spins of the bra and the
+    # ket differ
+    '4fold': [(0, 1, 2, 3), (1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2)],
+    # the same AND ( kl | ij ) = ( kl | ji ) = ( lk | ij ) = ( lk | ji ), BUT NOT ( ik | jl ) etc.
+    '8fold': [(0, 1, 2, 3), (3, 2, 1, 0), (1, 0, 2, 3), (0, 1, 3, 2),
+              (1, 0, 3, 2), (2, 3, 0, 1), (3, 2, 0, 1), (2, 3, 1, 0)],
+}
+
+
+class FCIDumpIntegrals:
+    """
+    Integrals of an FCIDump file, kept as the entries of the file: the values of the other
+    elements follow from the permutational symmetry of the integrals. Entries of the same
+    symmetry class with the same value are only kept once.
+    """
+
+    def __init__(self, indices: np.ndarray, values: np.ndarray, norb: int,
+                 symmetry: str) -> None:
+        """
+        Args:
+            indices: the zero-based indices of the entries, of shape (number of entries, 2) for
+                one-electron and (number of entries, 4) for two-electron integrals.
+            values: the values of the entries.
+            norb: the number of orbitals.
+            symmetry: the permutational symmetry of the integrals, '2fold', '4fold' or
+                '8fold'.
+        """
+        self._indices = indices
+        self._values = values
+        self._norb = norb
+        self._symmetry = symmetry
+
+    @property
+    def indices(self) -> np.ndarray:
+        """ the zero-based indices of the entries """
+        return self._indices
+
+    @property
+    def values(self) -> np.ndarray:
+        """ the values of the entries """
+        return self._values
+
+    @property
+    def norb(self) -> int:
+        """ the number of orbitals """
+        return self._norb
+
+    @property
+    def symmetry(self) -> str:
+        """ the permutational symmetry of the integrals """
+        return self._symmetry
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def transpose(self) -> 'FCIDumpIntegrals':
+        """ Returns the integrals with the order of the indices reversed. """
+        return FCIDumpIntegrals(self._indices[:, ::-1], self._values, self._norb,
+                                self._symmetry)
+
+    def to_dense(self) -> np.ndarray:
+        """ Returns the dense array of the integrals, the elements without entry in their
+        symmetry class being zero. """
+        rank = self._indices.shape[1]
+        dense = np.zeros((self._norb,) * rank)
+        # the elements given by the file take precedence over their symmetric ones, and the
+        # transposed elements over the other permutations
+        for permutation in _SYMMETRIES[self._symmetry][::-1]:
+            dense[tuple(self._indices[:, permutation].T)] = self._values
+        return dense
+
+
+def parse(fcidump: str, dense: bool = True, chunk_size: int = _CHUNK_SIZE) -> Dict[str, Any]:
     # pylint: disable=wrong-spelling-in-comment
     """Parses a FCIDump output.
 
+    The integral lines are read and converted a chunk at a time, and kept as sparse entries
+    until the dense arrays are built.
+
     Args:
         fcidump: Path to the FCIDump file.
+        dense: Whether the integrals are returned as dense arrays, or as
+            :class:`FCIDumpIntegrals`.
+        chunk_size: The number of characters of the integral lines parsed at once.
     Raises:
         QiskitChemistryError: If the input file cannot be found, if a required field in the FCIDump
-            file is missing, if wrong integral indices are encountered, or if the alpha/beta or
-            beta/alpha 2-electron integrals are mixed.
+            file is missing, if a line of integrals is malformed, if wrong integral indices are
+            encountered, or if the alpha/beta or beta/alpha 2-electron integrals are mixed.
     Returns:
         A dictionary storing the parsed data.
     """
     try:
         with open(fcidump, 'r') as file:
-            fcidump_str = file.read()
+            metadata, text = _read_namelist(file, chunk_size)
+            output = _parse_namelist(metadata)
+            values, indices = _read_entries(file, text, chunk_size)
     except OSError as ex:
         raise QiskitChemistryError("Input file '{}' cannot be read!".format(fcidump)) from ex
 
-    output = {}  # type: Dict[str, Any]
+    norb = output['NORB']
+    # If the FCIDump file resulted from an unrestricted spin calculation the indices will label spin
+    # rather than molecular orbitals. This means, that a line must exist which encodes the
+    # coefficient for the spin orbital with index (norb*2, norb*2). By checking for such a line we
+    # can distinguish between unrestricted and restricted FCIDump files.
+    _uhf = bool(np.any((indices[:, 0] == 2 * norb) & (indices[:, 1] == 2 * norb)
+                       & (indices[:, 2] == 0) & (indices[:, 3] == 0)))
+
+    # the rest of the FCIDump will hold lines of the form x i a j b
+    # a few cases have to be treated differently:
+    # i, a, j and b are all zero: x is the core energy
+    # TODO: a, j and b are all zero: x is the energy of the i-th MO  (often not supported)
+    # j and b are both zero: x is the 1e-integral between i and a (x = <i|h|a>)
+    # otherwise: x is the Coulomb integral ( x = (ia|jb) )
+    # Note: differing naming than ijkl due to E741 and this iajb is inline with this:
+    # https://hande.readthedocs.io/en/latest/manual/integrals.html#fcidump-format
+    # pylint: disable=invalid-name
+    i, a, j, b = indices.T
+    ecore = (i == 0) & (a == 0) & (j == 0) & (b == 0)
+    if np.any(ecore):
+        output['ecore'] = float(values[ecore][-1])
+    mo_energies = (i != 0) & (a == 0) & (j == 0) & (b == 0)
+    onee = (j == 0) & (b == 0) & ~ecore & ~mo_energies
+    twoe = ~(j == 0) | ~(b == 0)
 
-    # FCIDump starts with a Fortran namelist of meta data
-    namelist_end = re.search('(/|&END)', fcidump_str)
-    metadata = fcidump_str[:namelist_end.start(0)]
+    # the blocks of the integrals, as the ranges of the indices of each pair
+    alpha, beta = (1, norb), (norb + 1, 2 * norb)
+    onee_blocks = [('hij', [alpha], '2fold')]
+    twoe_blocks = [('hijkl', [alpha, alpha], '8fold')]
+    if _uhf:
+        onee_blocks.append(('hij_b', [beta], '2fold'))
+        twoe_blocks.extend([('hijkl_ab', [alpha, beta], '4fold'),
+                            ('hijkl_ba', [beta, alpha], '4fold'),
+                            ('hijkl_bb', [beta, beta], '8fold')])
+    integrals = {}  # type: Dict[str, Optional[FCIDumpIntegrals]]
+    for rows, blocks, name in [(onee, onee_blocks, '1-electron'),
+                               (twoe, twoe_blocks, '2-electron')]:
+        rank = 2 if name == '1-electron' else 4
+        block_indices = indices[rows][:, :rank]
+        block_values = values[rows]
+        known = np.zeros(len(block_values), dtype=bool)
+        for key, ranges, symmetry in blocks:
+            in_block = ~known
+            for pair, (low, high) in enumerate(ranges):
+                pair_indices = block_indices[:, 2 * pair:2 * pair + 2]
+                in_block &= np.all((pair_indices >= low) & (pair_indices <= high), axis=1)
+            known |= in_block
+            offsets = np.repeat([low for low, _ in ranges], 2)
+            integrals[key] = _unique_entries(block_indices[in_block] - offsets,
+                                             block_values[in_block], norb, symmetry)
+        if not np.all(known):
+            unknown = tuple(int(index) for index in block_indices[~known][0])
+            raise QiskitChemistryError("Unkown {} integral indices encountered in '{}'".format(
+                name, unknown))
+
+    hijkl_ba = hijkl_bb = hij_b = None
+    if _uhf:
+        hij_b = integrals['hij_b']
+        hijkl_bb = integrals['hijkl_bb']
+        hijkl_ab, hijkl_ba = integrals['hijkl_ab'], integrals['hijkl_ba']
+
+        # assert that EITHER hijkl_ab OR hijkl_ba were given
+        if np.allclose(hijkl_ab.values, 0.0) == np.allclose(hijkl_ba.values, 0.0):
+            raise QiskitChemistryError("Encountered mixed sets of indices for the 2-electron \
+                    integrals. Either alpha/beta or beta/alpha matrix should be specified.")
+
+        if np.allclose(hijkl_ba.values, 0.0):
+            hijkl_ba = hijkl_ab.transpose()
+
+    output['hij'] = integrals['hij']
+    output['hij_b'] = hij_b
+    output['hijkl'] = integrals['hijkl']
+    output['hijkl_ba'] = hijkl_ba
+    output['hijkl_bb'] = hijkl_bb
+    if dense:
+        for key in ['hij', 'hij_b', 'hijkl', 'hijkl_ba', 'hijkl_bb']:
+            if output[key] is not None:
+                output[key] = output[key].to_dense()
+
+    return output
+
+
+def _read_namelist(file: TextIO, chunk_size: int) -> Tuple[str, str]:
+    """Reads the Fortran namelist of meta data the FCIDump starts with, and returns it together
+    with the text read past its end."""
+    text = ''
+    while True:
+        namelist_end = re.search('(/|&END)', text)
+        if namelist_end is not None:
+            return text[:namelist_end.start(0)], text[namelist_end.end(0):]
+        block = file.read(chunk_size)
+        if not block:
+            raise QiskitChemistryError("The end of the namelist of the FCIDump format is missing!")
+        text += block
+
+
+def _parse_namelist(metadata: str) -> Dict[str, Any]:
+    output = {}  # type: Dict[str, Any]
     metadata = ' '.join(metadata.split())  # replace duplicate whitespace and newlines
     # we know what elements to look for so we don't get too fancy with the parsing
     # pattern explanation:
@@ -86,158 +265,84 @@ def parse(fcidump: str) -> Dict[str, Any]:
     output['THRRES'] = float(_thrres.groups()[0]) if _thrres else 0.1
     _nroot = re.search('NROOT'+pattern, metadata)
     output['NROOT'] = int(_nroot.groups()[0]) if _nroot else 1
-
-    # If the FCIDump file resulted from an unrestricted spin calculation the indices will label spin
-    # rather than molecular orbitals. This means, that a line must exist which encodes the
-    # coefficient for the spin orbital with index (norb*2, norb*2). By checking for such a line we
-    # can distinguish between unrestricted and restricted FCIDump files.
-    _uhf = bool(re.search(r'.*(\s+{}\s+{}\s+0\s+0)'.format(norb*2, norb*2),
-                          fcidump_str[namelist_end.start(0):]))
-
-    # the rest of the FCIDump will hold lines of the form x i a j b
-    # a few cases have to be treated differently:
-    # i, a, j and b are all zero: x is the core energy
-    # TODO: a, j and b are all zero: x is the energy of the i-th MO  (often not supported)
-    # j and b are both zero: x is the 1e-integral between i and a (x = <i|h|a>)
-    # otherwise: x is the Coulomb integral ( x = (ia|jb) )
-    hij = np.zeros((norb, norb))
-    hij_elements = set(itertools.product(range(norb), repeat=2))
-    hijkl = np.zeros((norb, norb, norb, norb))
-    hijkl_elements = set(itertools.product(range(norb), repeat=4))
-    hij_b = hijkl_ab = hijkl_ba = hijkl_bb = None
-    hij_b_elements = hijkl_ab_elements = hijkl_ba_elements = hijkl_bb_elements = set()
-    if _uhf:
-        beta_range = [n+norb for n in range(norb)]
-        hij_b = np.zeros((norb, norb))
-        hij_b_elements = set(itertools.product(beta_range, repeat=2))
-        hijkl_ab = np.zeros((norb, norb, norb, norb))
-        hijkl_ba = np.zeros((norb, norb, norb, norb))
-        hijkl_bb = np.zeros((norb, norb, norb, norb))
-        hijkl_ab_elements = set(itertools.product(
-            range(norb), range(norb), beta_range, beta_range
-        ))
-        hijkl_ba_elements = set(itertools.product(
-            beta_range, beta_range, range(norb), range(norb)
-        ))
-        hijkl_bb_elements = set(itertools.product(beta_range, repeat=4))
-    orbital_data = fcidump_str[namelist_end.end(0):].split('\n')
-    for orbital in orbital_data:
-        if not orbital:
-            continue
-        x = float(orbital.split()[0])
-        # Note: differing naming than ijkl due to E741 and this iajb is inline with this:
-        # https://hande.readthedocs.io/en/latest/manual/integrals.html#fcidump-format
-        i, a, j, b = [int(i) for i in orbital.split()[1:]]  # pylint: disable=invalid-name
-        if i == a == j == b == 0:
-            output['ecore'] = x
-        elif a == j == b == 0:
-            # TODO: x is the energy of the i-th MO
-            continue
-        elif j == b == 0:
-            try:
-                hij_elements.remove((i-1, a-1))
-                hij[i-1][a-1] = x
-            except KeyError as ex:
-                if _uhf:
-                    hij_b_elements.remove((i-1, a-1))
-                    hij_b[i-1-norb][a-1-norb] = x
-                else:
-                    raise QiskitChemistryError("Unkown 1-electron integral indices encountered in \
-                            '{}'".format((i, a))) from ex
-        else:
-            try:
-                hijkl_elements.remove((i-1, a-1, j-1, b-1))
-                hijkl[i-1][a-1][j-1][b-1] = x
-            except KeyError as ex:
-                if _uhf:
-                    try:
-                        hijkl_ab_elements.remove((i-1, a-1, j-1, b-1))
-                        hijkl_ab[i-1][a-1][j-1-norb][b-1-norb] = x
-                    except KeyError:
-                        try:
-                            hijkl_ba_elements.remove((i-1, a-1, j-1, b-1))
-                            hijkl_ba[i-1-norb][a-1-norb][j-1][b-1] = x
-                        except KeyError:
-                            hijkl_bb_elements.remove((i-1, a-1, j-1, b-1))
-                            hijkl_bb[i-1-norb][a-1-norb][j-1-norb][b-1-norb] = x
-                else:
-                    raise QiskitChemistryError("Unkown 2-electron integral indices encountered in \
-                            '{}'".format((i, a, j, b))) from ex
-
-    # iterate over still empty elements in 1-electron matrix and populate with symmetric ones
-    # if any elements are not populated these will be zero
-    _permute_1e_ints(hij, hij_elements, norb)
-
-    if _uhf:
-        # do the same for beta spin
-        _permute_1e_ints(hij_b, hij_b_elements, norb, beta=True)
-
-    # do the same of the 2-electron 4D matrix
-    _permute_2e_ints(hijkl, hijkl_elements, norb)
-
-    if _uhf:
-        # do the same for beta spin
-        _permute_2e_ints(hijkl_bb, hijkl_bb_elements, norb, beta=2)
-        _permute_2e_ints(hijkl_ab, hijkl_ab_elements, norb, beta=1)  # type: ignore
-        _permute_2e_ints(hijkl_ba, hijkl_ba_elements, norb, beta=1)  # type: ignore
-
-        # assert that EITHER hijkl_ab OR hijkl_ba were given
-        if np.allclose(hijkl_ab, 0.0) == np.allclose(hijkl_ba, 0.0):
-            raise QiskitChemistryError("Encountered mixed sets of indices for the 2-electron \
-                    integrals. Either alpha/beta or beta/alpha matrix should be specified.")
-
-        if np.allclose(hijkl_ba, 0.0):
-            hijkl_ba = hijkl_ab.transpose()
-
-    output['hij'] = hij
-    output['hij_b'] = hij_b
-    output['hijkl'] = hijkl
-    output['hijkl_ba'] = hijkl_ba
-    output['hijkl_bb'] = hijkl_bb
-
     return output
 
 
-def _permute_1e_ints(hij: np.ndarray,
-                     elements: Set[Tuple[int, ...]],
-                     norb: int,
-                     beta: bool = False) -> None:
-    for elem in elements.copy():
-        shifted = tuple(e-(beta * norb) for e in elem)
-        hij[shifted] = hij[shifted[::-1]]
-        elements.remove(elem)
+def _read_entries(file: TextIO, text: str, chunk_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reads the lines ``x i a j b`` following the namelist, a chunk of complete lines at a
+    time, and returns the values x and the indices (i, a, j, b) of all of them."""
+    values = []  # type: List[np.ndarray]
+    indices = []  # type: List[np.ndarray]
+    while True:
+        block = file.read(chunk_size)
+        text += block
+        end = text.rfind('\n') + 1 if block else len(text)
+        if end > 0:
+            chunk_values, chunk_indices = _parse_entries(text[:end])
+            values.append(chunk_values)
+            indices.append(chunk_indices)
+            text = text[end:]
+        if not block:
+            break
+    return (np.concatenate(values) if values else np.zeros(0),
+            np.concatenate(indices) if indices else np.zeros((0, 4), dtype=int))
 
 
-def _permute_2e_ints(hijkl: np.ndarray,
-                     elements: Set[Tuple[int, ...]],
-                     norb: int,
-                     beta: int = 0) -> None:
-    # pylint: disable=wrong-spelling-in-comment
-    for elem in elements.copy():
-        shifted = tuple(e-((e >= norb) * norb) for e in elem)
-        # initially look for "transposed" element if spins are equal
-        if beta != 1 and elem[::-1] not in elements:
-            hijkl[shifted] = hijkl[shifted[::-1]]
-            elements.remove(elem)
+def _parse_entries(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    # Fortran writes the exponents of double precision numbers with a D
+    if 'D' in text or 'd' in text:
+        text = text.replace('D', 'E').replace('d', 'e')
+    text = text.strip()
+    num_lines = text.count('\n') + 1 if text else 0
+    with warnings.catch_warnings():
+        # the conversion warns about the text it cannot read, which is handled below
+        warnings.simplefilter('ignore')
+        numbers = np.fromstring(text, sep=' ')
+    if numbers.size == 5 * num_lines:
+        entries = numbers.reshape(num_lines, 5)
+        indices = entries[:, 1:].astype(int)
+        if np.array_equal(indices, entries[:, 1:]):
+            return entries[:, 0].copy(), indices
+    # blank or malformed lines: fall back to converting the lines one by one
+    values = []  # type: List[float]
+    line_indices = []  # type: List[List[int]]
+    for line in text.split('\n'):
+        fields = line.split()
+        if not fields:
             continue
-        # then look at permutations of indices within the bra and ket respectively
-        bra_perms = set(itertools.permutations(elem[:2]))
-        ket_perms = set(itertools.permutations(elem[2:]))
-        if beta == 1:
-            # generally (ij|ab) != (ab|ij)
-            # thus, the possible permutations are much less when the spins differ
-            permutations = itertools.product(bra_perms, ket_perms)
-        else:
-            # ( ij | kl ) gives { ( ij | kl ), ( ij | lk ), ( ji | kl ), ( ji | lk ) }
-            # AND { ( kl | ij ), ( kl | ji ), ( lk | ij ), ( lk | ji ) }
-            # BUT NOT ( ik | jl ) etc.
-            permutations = itertools.chain(
-                itertools.product(bra_perms, ket_perms),
-                itertools.product(ket_perms, bra_perms)
-            )
-        for perm in {e1 + e2 for e1, e2 in permutations}:
-            if perm in elements:
-                continue
-            hijkl[shifted] = hijkl[tuple([e-((e >= norb) * norb) for e in perm])]
-            elements.remove(elem)
-            break
+        try:
+            if len(fields) != 5:
+                raise ValueError()
+            values.append(float(fields[0]))
+            line_indices.append([int(index) for index in fields[1:]])
+        except ValueError as ex:
+            raise QiskitChemistryError(
+                "Malformed integral line encountered: '{}'".format(line)) from ex
+    return np.array(values, dtype=float), np.array(line_indices, dtype=int).reshape(-1, 4)
+
+
+def _unique_entries(indices: np.ndarray, values: np.ndarray, norb: int,
+                    symmetry: str) -> FCIDumpIntegrals:
+    """Returns the integrals of the entries, dropping the ones overwritten by a later entry for
+    the same element and, for the symmetry classes in which all elements have the same value, all
+    but the first entry."""
+    if len(values) == 0:
+        return FCIDumpIntegrals(indices, values, norb, symmetry)
+    rank = indices.shape[1]
+    strides = norb ** np.arange(rank - 1, -1, -1)
+    # the last entry of an element wins
+    flat = indices @ strides
+    _, last = np.unique(flat[::-1], return_index=True)
+    kept = np.sort(len(flat) - 1 - last)
+    indices, values = indices[kept], values[kept]
+    # the symmetry class of an element is labelled by its smallest permutation
+    classes = np.min([indices[:, permutation] @ strides
+                      for permutation in _SYMMETRIES[symmetry]], axis=0)
+    order = np.argsort(classes, kind='stable')
+    starts = np.flatnonzero(np.diff(classes[order], prepend=-1))
+    uniform = (np.minimum.reduceat(values[order], starts)
+               == np.maximum.reduceat(values[order], starts))
+    first = np.zeros(len(values), dtype=bool)
+    first[order[starts]] = True
+    keep = first | ~np.repeat(uniform, np.diff(np.append(starts, len(values))))[np.argsort(order)]
+    return FCIDumpIntegrals(indices[keep], values[keep], norb, symmetry)
@@ -28,13 +28,17 @@ class HDF5Driver(BaseDriver):
     """
 
     def __init__(self,
-                 hdf5_input: str = 'molecule.hdf5') -> None:
+                 hdf5_input: str = 'molecule.hdf5',
+                 lazy: bool = False) -> None:
         """
         Args:
             hdf5_input: Path to HDF5 file
+            lazy: if True, the orbitals and integrals are read from the file on first access,
+                see :meth:`~qiskit.chemistry.QMolecule.load`.
         """
         super().__init__()
         self._hdf5_input = hdf5_input
+        self._lazy = lazy
         self._work_path = None
 
     @property
@@ -56,5 +60,5 @@ class HDF5Driver(BaseDriver):
             raise LookupError('HDF5 file not found: {}'.format(hdf5_file))
 
         molecule = QMolecule(hdf5_file)
-        molecule.load()
+        molecule.load(lazy=self._lazy)
         return molecule
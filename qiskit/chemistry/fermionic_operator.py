@@ -12,6 +12,7 @@
 
 """ Fermionic Operator """
 
+from typing import Dict, Tuple
 import itertools
 import logging
 import sys
@@ -23,12 +24,18 @@ from qiskit.tools.events import TextProgressBar
 
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators.legacy import PackedPauliTable
+from qiskit.aqua.operators.legacy.pauli_table import sum_by_index
 from .qiskit_chemistry_error import QiskitChemistryError
 from .bksf import bksf_mapping
 from .particle_hole import particle_hole_transformation
+from .qmolecule import QMolecule
 
 logger = logging.getLogger(__name__)
 
+# number of non-zero two-body integrals mapped at once
+_MAPPING_CHUNK_SIZE = 1 << 14
+
 
 class FermionicOperator:
     """
@@ -50,6 +57,9 @@ class FermionicOperator:
 
     """
 
+    # products of the mapped ladder operators, per (map_type, number of modes)
+    _mapping_tables = {}  # type: Dict[Tuple[str, int], Tuple[PackedPauliTable, ...]]
+
     def __init__(self, h1, h2=None, ph_trans_shift=None):
         """
         This class requires the integrals stored in the '*chemist*' notation
@@ -144,23 +154,12 @@ class FermionicOperator:
         Args:
             unitary_matrix (numpy.ndarray): A 2-D unitary matrix for h1 transformation.
         """
-        num_modes = unitary_matrix.shape[0]
-        temp_ret = np.zeros((num_modes, num_modes, num_modes, num_modes),
-                            dtype=unitary_matrix.dtype)
         unitary_matrix_dagger = np.conjugate(unitary_matrix)
+        self._h2 = QMolecule.twoeints2mo_general(self._h2, unitary_matrix_dagger, unitary_matrix,
+                                                 unitary_matrix_dagger, unitary_matrix)
 
-        # option 3: temp1 is a 3-D tensor, temp2 and temp3 are 2-D tensors
-        # pylint: disable=unsubscriptable-object
-        for a_i in range(num_modes):
-            temp1 = np.einsum('i,i...->...', unitary_matrix_dagger[:, a_i], self._h2)
-            for b_i in range(num_modes):
-                temp2 = np.einsum('j,j...->...', unitary_matrix[:, b_i], temp1)
-                temp3 = np.einsum('kc,k...->...c', unitary_matrix_dagger, temp2)
-                temp_ret[a_i, b_i, :, :] = np.einsum('ld,l...c->...cd', unitary_matrix, temp3)
-
-        self._h2 = temp_ret
-
-    def _jordan_wigner_mode(self, n):
+    @staticmethod
+    def _jordan_wigner_mode(n):
         r"""
         Jordan_Wigner mode.
 
@@ -189,7 +188,8 @@ class FermionicOperator:
             a_list.append((Pauli(a_z, a_x), Pauli(b_z, b_x)))
         return a_list
 
-    def _parity_mode(self, n):
+    @staticmethod
+    def _parity_mode(n):
         """
         Parity mode.
 
@@ -212,7 +212,8 @@ class FermionicOperator:
             a_list.append((Pauli(a_z, a_x), Pauli(b_z, b_x)))
         return a_list
 
-    def _bravyi_kitaev_mode(self, n):
+    @staticmethod
+    def _bravyi_kitaev_mode(n):
         """
         Bravyi-Kitaev mode.
 
@@ -343,8 +344,10 @@ class FermionicOperator:
         """
         Map fermionic operator to qubit operator.
 
-        Using multiprocess to speedup the mapping, the improvement can be
-        observed when h2 is a non-sparse matrix.
+        The products of the mapped ladder operators are computed once per mapping type and
+        number of modes, the integrals are then scattered on them with array operations.
+        The two-body integrals are mapped in chunks, in multiple processes when there are
+        enough of them, the improvement can be observed when h2 is a non-sparse matrix.
 
         Args:
             map_type (str): case-insensitive mapping type.
@@ -365,52 +368,164 @@ class FermionicOperator:
         self._map_type = map_type
         n = self._modes  # number of fermionic modes / qubits
         map_type = map_type.lower()
-        if map_type == 'jordan_wigner':
-            a_list = self._jordan_wigner_mode(n)
-        elif map_type == 'parity':
-            a_list = self._parity_mode(n)
-        elif map_type == 'bravyi_kitaev':
-            a_list = self._bravyi_kitaev_mode(n)
-        elif map_type == 'bksf':
+        if map_type == 'bksf':
             return bksf_mapping(self)
-        else:
+        if map_type not in ('jordan_wigner', 'parity', 'bravyi_kitaev'):
             raise QiskitChemistryError('Please specify the supported modes: '
                                        'jordan_wigner, parity, bravyi_kitaev, bksf')
+        one_body_terms = (np.nonzero(self._h1), self._h1[np.nonzero(self._h1)])
+        two_body_terms = (np.nonzero(self._h2), self._h2[np.nonzero(self._h2)])
+        table = FermionicOperator._map_terms(map_type, n, one_body_terms, two_body_terms,
+                                             threshold)
+        pauli_list = WeightedPauliOperator(paulis=table.to_paulis())
 
-        # ###################################################################
-        # ###########    BUILDING THE MAPPED HAMILTONIAN     ################
-        # ###################################################################
+        if self._ph_trans_shift is not None:
+            pauli_term = [self._ph_trans_shift, Pauli.from_label('I' * self._modes)]
+            pauli_list += WeightedPauliOperator(paulis=[pauli_term])
 
-        pauli_list = WeightedPauliOperator(paulis=[])
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Mapping one-body terms to Qubit Hamiltonian:")
-            TextProgressBar(output_handler=sys.stderr)
-        results = parallel_map(FermionicOperator._one_body_mapping,
-                               [(self._h1[i, j], a_list[i], a_list[j])
-                                for i, j in itertools.product(range(n), repeat=2)
-                                if self._h1[i, j] != 0],
-                               task_args=(threshold,), num_processes=aqua_globals.num_processes)
-        for result in results:
-            pauli_list += result
-        pauli_list.chop(threshold=threshold)
+        return pauli_list
+
+    @staticmethod
+    def _map_terms(map_type, n, one_body_terms, two_body_terms, threshold):
+        """
+        Map the non-zero integrals of a fermionic operator to Paulis.
 
+        Args:
+            map_type (str): "jordan_wigner", "parity" or "bravyi_kitaev"
+            n (int): number of modes
+            one_body_terms (tuple): the indices (i, j) and the values of the one-body integrals,
+                in the order of numpy.nonzero
+            two_body_terms (tuple): the indices (i, j, k, m) and the values of the two-body
+                integrals, in the order of numpy.nonzero
+            threshold (float): threshold for Pauli simplification
+
+        Returns:
+            PackedPauliTable: the simplified Paulis
+        """
+        tables = FermionicOperator._mapping_tables.get((map_type, n))
+        if tables is None:
+            if map_type == 'jordan_wigner':
+                a_list = FermionicOperator._jordan_wigner_mode(n)
+            elif map_type == 'parity':
+                a_list = FermionicOperator._parity_mode(n)
+            else:
+                a_list = FermionicOperator._bravyi_kitaev_mode(n)
+            tables = FermionicOperator._ladder_products(a_list)
+            FermionicOperator._mapping_tables[(map_type, n)] = tables
+
+        one_body, creation_pairs, annihilation_pairs = tables
+
+        # h1(i,j) adag_i a_j, the 4 products of the Paulis of modes i and j are
+        # precomputed in the rows of (i, j)
+        (i, j), values = one_body_terms
+        rows = (4 * (i * n + j)[:, None] + np.arange(4)).ravel()
+        table = one_body[rows]
+        table = PackedPauliTable(table.x, table.z, table.coeffs * np.repeat(values, 4), n)
+        table = FermionicOperator._merge_terms(table, np.repeat(np.arange(len(i)), 4), threshold)
+        coeffs, kept = table.chop_mask(threshold)
+        table = PackedPauliTable(table.x[kept], table.z[kept], coeffs[kept], n)
+
+        # h2(i,j,k,m) adag_i adag_k a_m a_j, the products of adag_i adag_k and of a_m a_j are
+        # precomputed in the rows of (i, k) and (m, j). The mapped terms of the chunks of
+        # non-zero integrals are merged in each chunk first, in parallel if there are many.
+        indices, values = two_body_terms
+        chunks = [(tuple(index[start:start + _MAPPING_CHUNK_SIZE] for index in indices),
+                   values[start:start + _MAPPING_CHUNK_SIZE])
+                  for start in range(0, len(values), _MAPPING_CHUNK_SIZE)]
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Mapping two-body terms to Qubit Hamiltonian:")
             TextProgressBar(output_handler=sys.stderr)
-        results = parallel_map(FermionicOperator._two_body_mapping,
-                               [(self._h2[i, j, k, m], a_list[i], a_list[j], a_list[k], a_list[m])
-                                for i, j, k, m in itertools.product(range(n), repeat=4)
-                                if self._h2[i, j, k, m] != 0],
-                               task_args=(threshold,), num_processes=aqua_globals.num_processes)
-        for result in results:
-            pauli_list += result
-        pauli_list.chop(threshold=threshold)
+        results = parallel_map(FermionicOperator._two_body_chunk_mapping, chunks,
+                               task_args=(creation_pairs, annihilation_pairs, threshold),
+                               num_processes=aqua_globals.num_processes)
+        table = PackedPauliTable(np.concatenate([table.x] + [result.x for result in results]),
+                                 np.concatenate([table.z] + [result.z for result in results]),
+                                 np.concatenate([table.coeffs] + [result.coeffs
+                                                                  for result in results]), n)
+        table, _ = table.simplify()
+        coeffs, kept = table.chop_mask(threshold)
+        return PackedPauliTable(table.x[kept], table.z[kept], coeffs[kept], n)
 
-        if self._ph_trans_shift is not None:
-            pauli_term = [self._ph_trans_shift, Pauli.from_label('I' * self._modes)]
-            pauli_list += WeightedPauliOperator(paulis=[pauli_term])
+    @staticmethod
+    def _ladder_products(a_list):
+        """
+        Products of the Paulis of the mapped ladder operators.
 
-        return pauli_list
+        The creation operator of mode i is (a_list[i][0] - i a_list[i][1]) / 2 and the
+        annihilation operator is (a_list[i][0] + i a_list[i][1]) / 2.
+
+        Args:
+            a_list (list[Tuple]): the pair of Paulis of each mode
+
+        Returns:
+            tuple(PackedPauliTable, PackedPauliTable, PackedPauliTable): the terms of adag_i a_j,
+                adag_i adag_k and a_m a_j, the 4 terms of each pair of modes (i, j) being in
+                the rows 4 * (i * n + j) to 4 * (i * n + j) + 3.
+        """
+        n = len(a_list)
+        paulis = [pauli for pair in a_list for pauli in pair]
+        creation = PackedPauliTable.from_paulis([[(-1j) ** (k % 2) / 2, pauli]
+                                                 for k, pauli in enumerate(paulis)])
+        annihilation = PackedPauliTable.from_paulis([[1j ** (k % 2) / 2, pauli]
+                                                     for k, pauli in enumerate(paulis)])
+        # rows of dot are ordered as (i, alpha, j, beta), they are regrouped by (i, j)
+        order = np.arange(4 * n * n).reshape(n, 2, n, 2).transpose(0, 2, 1, 3).ravel()
+        return (creation.dot(annihilation)[order], creation.dot(creation)[order],
+                annihilation.dot(annihilation)[order])
+
+    @staticmethod
+    def _two_body_chunk_mapping(chunk, creation_pairs, annihilation_pairs, threshold):
+        """
+        Subroutine for the mapping of a chunk of two-body integrals.
+
+        Args:
+            chunk (tuple): the indices (i, j, k, m) and the values of non-zero integrals
+            creation_pairs (PackedPauliTable): the terms of adag_i adag_k
+            annihilation_pairs (PackedPauliTable): the terms of a_m a_j
+            threshold (float): threshold to remove a pauli
+
+        Returns:
+            PackedPauliTable: the merged terms of the chunk
+        """
+        (i, j, k, m), values = chunk
+        n = creation_pairs.num_qubits
+        # the 16 products of adag_i adag_k (alpha, beta) with a_m a_j (gamma, delta)
+        rows = np.broadcast_to(4 * (i * n + k)[:, None, None] + np.arange(4)[None, :, None],
+                               (len(values), 4, 4)).ravel()
+        other_rows = np.broadcast_to(4 * (m * n + j)[:, None, None] + np.arange(4)[None, None, :],
+                                     (len(values), 4, 4)).ravel()
+        table = creation_pairs.multiply(annihilation_pairs, rows, other_rows)
+        table = PackedPauliTable(table.x, table.z, table.coeffs * np.repeat(values, 16), n)
+        return FermionicOperator._merge_terms(table, np.repeat(np.arange(len(values)), 16),
+                                              threshold)
+
+    @staticmethod
+    def _merge_terms(table, terms, threshold):
+        """
+        Merge the mapped Paulis as the terms would be added one by one to a
+        WeightedPauliOperator: the Paulis of each term whose weights are above threshold are
+        merged and the ones with zero weight are removed, then the Paulis of all terms are
+        merged in order of their first appearance.
+
+        Args:
+            table (PackedPauliTable): the mapped Paulis
+            terms (numpy.ndarray): the index of the term of each Pauli, in increasing order
+            threshold (float): threshold to remove a pauli
+
+        Returns:
+            PackedPauliTable: the merged Paulis
+        """
+        kept = np.absolute(table.coeffs) > threshold
+        table, terms = table[kept], terms[kept]
+        _, paulis = table.unique()
+        _, first, inverse = np.unique(terms * max(1, len(table)) + paulis,
+                                      return_index=True, return_inverse=True)
+        weights = sum_by_index(table.coeffs, inverse.ravel(), len(first))
+        order = np.argsort(first)
+        order = order[weights[order] != 0]
+        table = table[first[order]]
+        table, _ = PackedPauliTable(table.x, table.z, weights[order], table.num_qubits).simplify()
+        return table
 
     @staticmethod
     def _one_body_mapping(h1_ij_aij, threshold):
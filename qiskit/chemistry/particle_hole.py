@@ -12,6 +12,9 @@
 
 """ Particle Hole """
 
+import functools
+import itertools
+
 import numpy as np
 
 
@@ -1955,10 +1958,130 @@ def normal_order_integrals(n_qubits, n_occupied, array_to_normal_order,
     return h1_new, h2_new, id_term
 
 
+class _Recorder:
+    """ Stands for h1_old or h2_old in normal_order_integrals, records the read entries """
+
+    def __init__(self, ndim, reads, prefix=()):
+        self._ndim = ndim
+        self._reads = reads
+        self._prefix = prefix
+
+    def __getitem__(self, index):
+        key = self._prefix + (index,)
+        if len(key) < self._ndim:
+            return _Recorder(self._ndim, self._reads, key)
+        self._reads.add(key)
+        return 1.
+
+
+@functools.lru_cache(maxsize=None)
+def _normal_order_rules(array_mapping, occupied, ranks):
+    """
+    The contributions of ``normal_order_integrals`` for all the index tuples of a class,
+    the tuples of a class having the same occupied positions and the same ordering of
+    their indices, which are all that the normal ordering depends on.
+
+    Args:
+        array_mapping (tuple): e.g. ('adag', 'adag', 'a', 'a')
+        occupied (tuple): whether the index at each position is an occupied orbital
+        ranks (tuple): the rank of the index at each position among the distinct indices
+
+    Returns:
+        list: the rules (target, target positions, source, source positions, coefficient),
+        each adding ``coefficient * source[indices at source positions]`` to
+        ``target[indices at target positions]``, where target is 'h1', 'h2' or 'id' and
+        source is 'h1' or 'h2'.
+    """
+    num_ranks = max(ranks) + 1
+    n_occupied = sorted({rank for rank, occ in zip(ranks, occupied) if occ})
+    position = {rank: ranks.index(rank) for rank in range(num_ranks)}
+    indices = list(ranks)
+
+    # the entries read from h1_old and h2_old
+    reads = set()
+    normal_order_integrals(num_ranks, n_occupied, indices, list(array_mapping),
+                           _Recorder(2, reads), _Recorder(4, reads),
+                           np.zeros([num_ranks] * 2), np.zeros([num_ranks] * 4))
+
+    rules = []
+    # the contributions are linear in the entries read, find them one at a time
+    for read in sorted(reads, key=lambda key: (len(key), key)):
+        h1_old = np.zeros([num_ranks] * 2)
+        h2_old = np.zeros([num_ranks] * 4)
+        (h1_old if len(read) == 2 else h2_old)[read] = 1.
+        h1_new, h2_new, id_term = normal_order_integrals(
+            num_ranks, n_occupied, indices, list(array_mapping), h1_old, h2_old,
+            np.zeros([num_ranks] * 2), np.zeros([num_ranks] * 4))
+        source = ('h1' if len(read) == 2 else 'h2', tuple(position[r] for r in read))
+        for target, array in (('h1', h1_new), ('h2', h2_new)):
+            for key in zip(*np.nonzero(array)):
+                rules.append((target, tuple(position[r] for r in key)) + source
+                             + (float(array[key]),))
+        if id_term != 0:
+            rules.append(('id', ()) + source + (id_term,))
+    return rules
+
+
+def _normal_order_all(n_qubits, occupied, array_mapping, h1_old, h2_old, h1_new, h2_new):
+    """
+    Add the contributions of ``normal_order_integrals`` for all the index tuples of
+    length ``len(array_mapping)`` to ``h1_new`` and ``h2_new``, the index tuples being
+    processed by classes of identical normal ordering with array operations.
+
+    Returns:
+        float: the identity term
+    """
+    length = len(array_mapping)
+    tuples = np.indices([n_qubits] * length).reshape(length, -1)
+    # the class of each tuple, given by its occupied positions and the comparisons of
+    # its indices
+    pairs = list(itertools.combinations(range(length), 2))
+    codes = np.zeros(tuples.shape[1], dtype=np.int64)
+    for i in range(length):
+        codes = 2 * codes + occupied[tuples[i]]
+    for i, j in pairs:
+        codes = 3 * codes + np.sign(tuples[i] - tuples[j]) + 1
+    _, representatives, classes = np.unique(codes, return_index=True, return_inverse=True)
+    order = np.argsort(classes, kind='stable')
+    bounds = np.searchsorted(classes[order], np.arange(len(representatives) + 1))
+
+    sources = {'h1': h1_old, 'h2': h2_old}
+    targets = {'h1': [], 'h2': []}
+    id_term = 0.
+    for class_index, representative in enumerate(representatives):
+        indices = tuples[:, representative]
+        distinct = sorted(set(indices.tolist()))
+        ranks = tuple(distinct.index(index) for index in indices)
+        rules = _normal_order_rules(tuple(array_mapping),
+                                    tuple(bool(occupied[index]) for index in indices), ranks)
+        if not rules:
+            continue
+        members = tuples[:, order[bounds[class_index]:bounds[class_index + 1]]]
+        for target, target_pos, source, source_pos, coeff in rules:
+            values = coeff * sources[source][tuple(members[k] for k in source_pos)]
+            if target == 'id':
+                id_term += values.sum()
+            else:
+                targets[target].append((np.ravel_multi_index(
+                    tuple(members[k] for k in target_pos), [n_qubits] * len(target_pos)), values))
+
+    for target, new in (('h1', h1_new), ('h2', h2_new)):
+        if targets[target]:
+            flat_indices = np.concatenate([flat for flat, _ in targets[target]])
+            values = np.concatenate([value for _, value in targets[target]])
+            new += np.bincount(flat_indices, weights=values,
+                               minlength=new.size).reshape(new.shape)
+    return id_term
+
+
 def particle_hole_transformation(n_qubits, num_particles, h1_old_matrix, h2_old_matrix):
     """
     This function produces the necessary h1, h2, identity for work with Fermionic Operators script.
 
+    The terms of all the one and two body index tuples are normal ordered at once, by classes
+    of tuples with the same occupied positions and the same ordering of indices, for which
+    ``normal_order_integrals`` is evaluated once.
+
     Args:
         n_qubits (int): number of qubits
         num_particles (list): number of alphas, number of betas
@@ -1975,10 +2098,8 @@ def particle_hole_transformation(n_qubits, num_particles, h1_old_matrix, h2_old_
     h1_new_sum = np.zeros([n_qubits, n_qubits])
     h2_new_sum = np.zeros([n_qubits, n_qubits, n_qubits, n_qubits])
 
-    h2_old_matrix = -2 * h2_old_matrix.copy()
-    h2_old_matrix = np.einsum('IJKL->IKLJ', h2_old_matrix.copy())
-
-    h1_old_matrix = h1_old_matrix.copy()
+    h2_old_matrix = -2 * h2_old_matrix
+    h2_old_matrix = np.einsum('IJKL->IKLJ', h2_old_matrix)
 
     # put labels of occupied orbitals in the list in interleaved spin convention
     n_occupied = []
@@ -1986,54 +2107,18 @@ def particle_hole_transformation(n_qubits, num_particles, h1_old_matrix, h2_old_
         n_occupied.append(2 * a_i)
     for b in range(num_beta):
         n_occupied.append(2 * b + 1)
-
-    for r in range(n_qubits):
-        for s in range(n_qubits):  # pylint: disable=invalid-name
-            for i in n_occupied:
-
-                h1_old_matrix[r][s] += h2_old_matrix[r][i][s][i].copy() - \
-                    h2_old_matrix[r][i][i][s].copy()
-
-    identities_new_sum = 0
-
-    # n_el = num_alpha + num_beta
-
-    for i in range(n_qubits):
-        for j in range(n_qubits):
-
-            indices_1 = [i, j]
-            array_mapping_1 = ['adag', 'a']
-
-            h1_new_matrix = np.zeros([n_qubits, n_qubits])
-            h2_new_matrix = np.zeros([n_qubits, n_qubits, n_qubits, n_qubits])
-
-            h1_new_matrix, h2_new_matrix, identities = normal_order_integrals(
-                n_qubits, n_occupied, indices_1, array_mapping_1, h1_old_matrix,
-                h2_old_matrix, h1_new_matrix, h2_new_matrix)
-
-            h1_new_sum += h1_new_matrix
-            h2_new_sum += h2_new_matrix
-            identities_new_sum += identities
-
-    for i in range(n_qubits):
-        for j in range(n_qubits):
-            for k in range(n_qubits):
-                for l_i in range(n_qubits):
-
-                    array_to_be_ordered = [i, j, k, l_i]
-
-                    array_mapping_2 = ['adag', 'adag', 'a', 'a']
-
-                    h1_new_matrix = np.zeros([n_qubits, n_qubits])
-                    h2_new_matrix = np.zeros([n_qubits, n_qubits, n_qubits, n_qubits])
-
-                    h1_new_matrix, h2_new_matrix, identities = normal_order_integrals(
-                        n_qubits, n_occupied, array_to_be_ordered, array_mapping_2,
-                        h1_old_matrix, h2_old_matrix, h1_new_matrix, h2_new_matrix)
-
-                    h1_new_sum += h1_new_matrix
-                    h2_new_sum += h2_new_matrix
-                    identities_new_sum += identities
+    occupied = np.zeros(n_qubits, dtype=bool)
+    occupied[n_occupied] = True
+
+    h1_old_matrix = h1_old_matrix \
+        + np.einsum('risi->rs', h2_old_matrix[:, n_occupied][:, :, :, n_occupied]) \
+        - np.einsum('riis->rs', h2_old_matrix[:, n_occupied][:, :, n_occupied])
+
+    identities_new_sum = _normal_order_all(n_qubits, occupied, ['adag', 'a'],
+                                           h1_old_matrix, h2_old_matrix, h1_new_sum, h2_new_sum)
+    identities_new_sum += _normal_order_all(n_qubits, occupied, ['adag', 'adag', 'a', 'a'],
+                                            h1_old_matrix, h2_old_matrix,
+                                            h1_new_sum, h2_new_sum)
 
     h2_new_sum = np.einsum('IKMJ->IJKM', h2_new_sum)
 
@@ -12,7 +12,8 @@
 
 """ QMolecule """
 
-from typing import List
+from typing import List, Optional
+import collections
 import os
 import logging
 import tempfile
@@ -110,6 +111,9 @@ class QMolecule:
         self.nuclear_dipole_moment = None
         self.reverse_dipole_sign = False
 
+        # the array fields loaded lazily and not read yet, with their datasets
+        self._lazy_fields = {}
+
     @property
     def one_body_integrals(self):
         """ Returns one body electron integrals. """
@@ -182,19 +186,20 @@ class QMolecule:
 
         return self._filename
 
-    def load(self):
-        """loads info saved."""
+    def load(self, lazy: bool = False) -> None:
+        """
+        Loads info saved.
+
+        Args:
+            lazy: if True, the orbital coefficients and energies and the integrals are read
+                from the file on first access only, memory-mapped when they are stored
+                contiguously. See also :meth:`integrals_block`.
+        """
         try:
             if self._filename is None:
                 return
 
             with h5py.File(self._filename, "r") as file:
-                def read_array(name):
-                    _data = file[name][...]
-                    if _data.dtype == numpy.bool and _data.size == 1 and not _data:
-                        _data = None
-                    return _data
-
                 # A version field was added to save format from version 2 so if
                 # there is no version then we have original (version 1) format
                 version = 1
@@ -225,11 +230,6 @@ class QMolecule:
                 self.num_alpha = int(data) if data.dtype.num != 0 else None
                 data = file["orbitals/num_beta"][...]
                 self.num_beta = int(data) if data.dtype.num != 0 else None
-                self.mo_coeff = read_array("orbitals/mo_coeff")
-                self.mo_coeff_b = read_array("orbitals/mo_coeff_B") if version > 1 else None
-                self.orbital_energies = read_array("orbitals/orbital_energies")
-                self.orbital_energies_b = \
-                    read_array("orbitals/orbital_energies_B") if version > 1 else None
 
                 # Molecule geometry
                 data = file["geometry/molecular_charge"][...]
@@ -242,50 +242,86 @@ class QMolecule:
                 self.atom_symbol = [a.decode('utf8') for a in data]
                 self.atom_xyz = file["geometry/atom_xyz"][...]
 
-                # 1 and 2 electron integrals in AO basis
-                self.hcore = read_array("integrals/hcore") if version > 1 else None
-                self.hcore_b = read_array("integrals/hcore_B") if version > 1 else None
-                self.kinetic = read_array("integrals/kinetic") if version > 1 else None
-                self.overlap = read_array("integrals/overlap") if version > 1 else None
-                self.eri = read_array("integrals/eri") if version > 1 else None
-
-                # 1 and 2 electron integrals in MO basis
-                self.mo_onee_ints = read_array("integrals/mo_onee_ints")
-                self.mo_onee_ints_b = \
-                    read_array("integrals/mo_onee_ints_B") if version > 1 else None
-                self.mo_eri_ints = read_array("integrals/mo_eri_ints")
-                self.mo_eri_ints_bb = \
-                    read_array("integrals/mo_eri_ints_BB") if version > 1 else None
-                self.mo_eri_ints_ba = \
-                    read_array("integrals/mo_eri_ints_BA") if version > 1 else None
-
-                # dipole integrals in AO basis
-                self.x_dip_ints = read_array("dipole/x_dip_ints") if version > 1 else None
-                self.y_dip_ints = read_array("dipole/y_dip_ints") if version > 1 else None
-                self.z_dip_ints = read_array("dipole/z_dip_ints") if version > 1 else None
-
-                # dipole integrals in MO basis
-                self.x_dip_mo_ints = read_array("dipole/x_dip_mo_ints")
-                self.x_dip_mo_ints_b = read_array("dipole/x_dip_mo_ints_B") if version > 1 else None
-                self.y_dip_mo_ints = read_array("dipole/y_dip_mo_ints")
-                self.y_dip_mo_ints_b = read_array("dipole/y_dip_mo_ints_B") if version > 1 else None
-                self.z_dip_mo_ints = read_array("dipole/z_dip_mo_ints")
-                self.z_dip_mo_ints_b = read_array("dipole/z_dip_mo_ints_B") if version > 1 else None
+                # orbital coefficients and energies, 1 and 2 electron integrals in AO and
+                # MO basis and dipole integrals in AO and MO basis
+                self._lazy_fields = {}
+                for name, (path, first_version) in _ARRAY_FIELDS.items():
+                    if version < first_version:
+                        setattr(self, name, None)
+                    elif lazy and not _is_none_dataset(file[path]):
+                        # the field is read by its descriptor on first access
+                        self.__dict__.pop(name, None)
+                        self._lazy_fields[name] = path
+                    else:
+                        setattr(self, name, _read_dataset(file[path]))
+
                 self.nuclear_dipole_moment = file["dipole/nuclear_dipole_moment"][...]
                 self.reverse_dipole_sign = file["dipole/reverse_dipole_sign"][...]
 
         except OSError:
             pass
 
-    def save(self, file_name=None):
-        """Saves the info from the driver."""
+    def _read_lazy_field(self, name):
+        path = self._lazy_fields.pop(name)
+        with h5py.File(self._filename, "r") as file:
+            return _read_dataset(file[path], self._filename)
+
+    def integrals_block(self, name: str, orbitals: List[int]) -> Optional[numpy.ndarray]:
+        """
+        Get the block of an array field over the given orbitals on each of its axes, e.g. the
+        MO integrals of an active space. If the field was loaded lazily and not accessed yet,
+        only the block is read from the file.
+
+        Args:
+            name: the name of the field, e.g. ``mo_onee_ints`` or ``mo_eri_ints``
+            orbitals: the indices of the orbitals
+
+        Returns:
+            the block of the field, None if the field is None
+
+        Raises:
+            ValueError: name is not an array field
+        """
+        if name not in _ARRAY_FIELDS:
+            raise ValueError('{} is not an array field of QMolecule'.format(name))
+        orbitals = numpy.asarray(orbitals, dtype=int)
+        path = self._lazy_fields.get(name)
+        if path is None:
+            value = getattr(self, name)
+            if value is None:
+                return None
+            return numpy.array(value[numpy.ix_(*[orbitals] * value.ndim)])
+        with h5py.File(self._filename, "r") as file:
+            return _read_block(file[path], orbitals, self._filename)
+
+    def save(self,
+             file_name: Optional[str] = None,
+             compression: Optional[str] = None,
+             pack_symmetric: bool = False) -> None:
+        """
+        Saves the info from the driver.
+
+        Args:
+            file_name: the name of the file, the file of this instance if None
+            compression: an HDF5 compression filter, e.g. ``gzip``, for the chunked arrays.
+                The arrays are stored contiguously, and can be memory-mapped when loaded
+                lazily, if None.
+            pack_symmetric: if True, the two electron integrals with the 8-fold or 4-fold
+                permutational symmetry of real orbitals are stored packed, i.e. only their
+                unique values.
+        """
         file = None
         if file_name is not None:
-            self.remove_file(file_name)
             file = file_name
         else:
             file = self.filename
-            self.remove_file()
+        # the fields still in the file, or memory-mapped from it, are read before it is removed
+        for name in _ARRAY_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, numpy.memmap) \
+                    and os.path.abspath(value.filename) == os.path.abspath(file):
+                setattr(self, name, numpy.array(value))
+        self.remove_file(file)
 
         with h5py.File(file, "w") as file:
             def create_dataset(group, name, value):
@@ -302,10 +338,23 @@ class QMolecule:
                     except Exception:  # pylint: disable=broad-except
                         return False
 
+                kwargs = {}
+                if compression is not None and numpy.ndim(value) > 0 and numpy.size(value) > 1:
+                    kwargs = {'compression': compression, 'chunks': True}
                 if is_float(value):
-                    group.create_dataset(name, data=value, dtype="float64")
+                    group.create_dataset(name, data=value, dtype="float64", **kwargs)
                 else:
-                    group.create_dataset(name, data=(value if value is not None else False))
+                    group.create_dataset(name, data=(value if value is not None else False),
+                                         **kwargs)
+
+            def create_eri_dataset(group, name, value):
+                packing = _eri_packing(value) if pack_symmetric and value is not None else None
+                if packing is None:
+                    create_dataset(group, name, value)
+                    return
+                create_dataset(group, name, _pack_eri(value, packing))
+                group[name].attrs['packing'] = packing
+                group[name].attrs['shape'] = value.shape
 
             file.create_dataset("version", data=(self.QMOLECULE_VERSION,))
 
@@ -352,12 +401,12 @@ class QMolecule:
             create_dataset(g_integrals, "hcore_B", self.hcore_b)
             create_dataset(g_integrals, "kinetic", self.kinetic)
             create_dataset(g_integrals, "overlap", self.overlap)
-            create_dataset(g_integrals, "eri", self.eri)
+            create_eri_dataset(g_integrals, "eri", self.eri)
             create_dataset(g_integrals, "mo_onee_ints", self.mo_onee_ints)
             create_dataset(g_integrals, "mo_onee_ints_B", self.mo_onee_ints_b)
-            create_dataset(g_integrals, "mo_eri_ints", self.mo_eri_ints)
-            create_dataset(g_integrals, "mo_eri_ints_BB", self.mo_eri_ints_bb)
-            create_dataset(g_integrals, "mo_eri_ints_BA", self.mo_eri_ints_ba)
+            create_eri_dataset(g_integrals, "mo_eri_ints", self.mo_eri_ints)
+            create_eri_dataset(g_integrals, "mo_eri_ints_BB", self.mo_eri_ints_bb)
+            create_eri_dataset(g_integrals, "mo_eri_ints_BA", self.mo_eri_ints_ba)
 
             # dipole integrals
             g_dipole = file.create_group("dipole")
@@ -398,34 +447,125 @@ class QMolecule:
         return numpy.dot(numpy.dot(numpy.transpose(moc), ints), moc)
 
     @staticmethod
-    def twoeints2mo(ints, moc):
+    def twoeints2mo(ints, moc, block_size=None, out=None):
         """Converts two-body integrals from AO to MO basis
 
-        Returns two electron integrals in AO basis converted to given MO basis
+        Returns two electron integrals in AO basis converted to given MO basis.
+        When the integrals have the 8-fold permutational symmetry of real orbitals
+        and are transformed in memory, only the unique pairs of indices are transformed.
+        See :meth:`twoeints2mo_general` for the block-streaming mode.
 
         Args:
-            ints (numpy.ndarray): N^2 two electron integrals in AO basis
+            ints (numpy.ndarray): N^4 two electron integrals in AO basis
             moc (numpy.ndarray): Molecular orbital coefficients
+            block_size (int, optional): Number of values of the first MO index transformed
+                at once, which bounds the memory used besides the integrals.
+            out (Union(str, numpy.ndarray, h5py.Dataset), optional): The array, or the
+                name of a ``.npy`` file memory-mapped, where the MO integrals are written
+                block by block.
 
         Returns:
             numpy.ndarray: integrals in MO basis
         """
-        dim = ints.shape[0]
-        eri_mo = numpy.zeros((dim, dim, dim, dim))
+        if block_size is None and out is None and QMolecule._has_8fold_symmetry(ints, moc):
+            return QMolecule._twoeints2mo_symmetric(ints, moc)
+        return QMolecule.twoeints2mo_general(ints, moc, moc, moc, moc,
+                                             block_size=block_size, out=out)
 
-        for a_i in range(dim):
-            temp1 = numpy.einsum('i,i...->...', moc[:, a_i], ints)
-            for b_i in range(dim):
-                temp2 = numpy.einsum('j,j...->...', moc[:, b_i], temp1)
-                temp3 = numpy.einsum('kc,k...->...c', moc, temp2)
-                eri_mo[a_i, b_i, :, :] = numpy.einsum('ld,l...c->...cd', moc, temp3)
+    @staticmethod
+    def twoeints2mo_general(ints, moc1, moc2, moc3, moc4, block_size=None, out=None):
+        """Converts two-body integrals from AO to MO basis with a coefficients matrix per index
 
+        The MO integrals ``(ij|kl) = sum_pqrs moc1[p, i] moc2[q, j] moc3[r, k] moc4[s, l] (pq|rs)``
+        are computed by four quarter transforms, each one a matrix product. In the
+        block-streaming mode, a block of ``block_size`` values of the first MO index is
+        transformed at a time and written to ``out``, so that only the AO integrals, which may
+        be memory-mapped too, and one block are held in memory.
+
+        Args:
+            ints (numpy.ndarray): N^4 two electron integrals in AO basis
+            moc1 (numpy.ndarray): Molecular orbital coefficients of the first index
+            moc2 (numpy.ndarray): Molecular orbital coefficients of the second index
+            moc3 (numpy.ndarray): Molecular orbital coefficients of the third index
+            moc4 (numpy.ndarray): Molecular orbital coefficients of the fourth index
+            block_size (int, optional): Number of values of the first MO index transformed
+                at once, all of them if None.
+            out (Union(str, numpy.ndarray, h5py.Dataset), optional): The array, or the
+                name of a ``.npy`` file memory-mapped, where the MO integrals are written
+                block by block.
+
+        Returns:
+            Union(numpy.ndarray, h5py.Dataset): integrals in MO basis, ``out`` if given.
+        """
+        shape = (moc1.shape[1], moc2.shape[1], moc3.shape[1], moc4.shape[1])
+        dtype = numpy.result_type(ints, moc1, moc2, moc3, moc4)
+        if isinstance(out, str):
+            out = numpy.lib.format.open_memmap(out, mode='w+', dtype=dtype, shape=shape)
+        if block_size is None:
+            block_size = shape[0]
+        block_size = max(1, block_size)
+
+        eri_mo = out
+        for start in range(0, shape[0], block_size):
+            # (pq|rs) -> (iq|rs) -> (ir|sj) -> (is|jk) -> (ij|kl), the contracted index
+            # is always the second one, so that each step is a single matrix product
+            temp = numpy.tensordot(moc1[:, start:start + block_size], ints, axes=([0], [0]))
+            temp = numpy.tensordot(temp, moc2, axes=([1], [0]))
+            temp = numpy.tensordot(temp, moc3, axes=([1], [0]))
+            temp = numpy.tensordot(temp, moc4, axes=([1], [0]))
+            if eri_mo is None:
+                if block_size >= shape[0]:
+                    return temp
+                eri_mo = numpy.empty(shape, dtype=dtype)
+            eri_mo[start:start + block_size] = temp
+        if isinstance(eri_mo, numpy.memmap):
+            eri_mo.flush()
         return eri_mo
 
     @staticmethod
-    def twoeints2mo_general(ints, moc1, moc2, moc3, moc4):
-        """ twoeints2mo_general """
-        return numpy.einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc1, moc2, moc3, moc4)
+    def _has_8fold_symmetry(ints, moc):
+        """ Whether (pq|rs) = (qp|rs) = (rs|pq), which implies the other symmetries """
+        if numpy.iscomplexobj(ints) or numpy.iscomplexobj(moc) or ints.ndim != 4 \
+                or len(set(ints.shape)) != 1:
+            return False
+        norbs = ints.shape[0]
+        atol = 1e-12 * max(1., numpy.abs(ints).max(initial=0.))
+        pairs = ints.reshape(norbs * norbs, norbs * norbs)
+        if numpy.abs(pairs - pairs.T).max(initial=0.) > atol:
+            return False
+        bras = ints.reshape(norbs, norbs, norbs * norbs)
+        return numpy.abs(bras - bras.transpose(1, 0, 2)).max(initial=0.) <= atol
+
+    @staticmethod
+    def _twoeints2mo_symmetric(ints, moc, max_block_elements=1 << 24):
+        """ Transform integrals with 8-fold symmetry on the unique index pairs only """
+        num_ao, num_mo = moc.shape
+        ao_rows, ao_cols = numpy.triu_indices(num_ao)
+        mo_rows, mo_cols = numpy.triu_indices(num_mo)
+        # position of the pair (p, q) in the packed pairs, for either order
+        ao_pairs = numpy.empty((num_ao, num_ao), dtype=int)
+        ao_pairs[ao_rows, ao_cols] = ao_pairs[ao_cols, ao_rows] = numpy.arange(len(ao_rows))
+        mo_pairs = numpy.empty((num_mo, num_mo), dtype=int)
+        mo_pairs[mo_rows, mo_cols] = mo_pairs[mo_cols, mo_rows] = numpy.arange(len(mo_rows))
+        block = max(1, max_block_elements // (num_ao * num_ao))
+
+        # transform the kets of the unique bra pairs: (pq|rs) -> (pq|kl), k <= l
+        half = numpy.empty((len(ao_rows), len(mo_rows)))
+        for start in range(0, len(ao_rows), block):
+            kets = ints[ao_rows[start:start + block], ao_cols[start:start + block]]
+            half[start:start + block] = \
+                numpy.matmul(moc.T, numpy.matmul(kets, moc))[:, mo_rows, mo_cols]
+
+        # transform the bras of the unique ket pairs: (pq|kl) -> (ij|kl), i <= j
+        packed = numpy.empty((len(mo_rows), len(mo_rows)))
+        half = half.T
+        for start in range(0, len(mo_rows), block):
+            bras = half[start:start + block][:, ao_pairs]
+            packed[:, start:start + block] = \
+                numpy.matmul(moc.T, numpy.matmul(bras, moc))[:, mo_rows, mo_cols].T
+
+        pair_indices = mo_pairs.reshape(-1)
+        return packed[numpy.ix_(pair_indices, pair_indices)].reshape((num_mo,) * 4)
 
     @staticmethod
     def onee_to_spin(mohij, mohij_b=None, threshold=1E-12):
@@ -449,19 +589,11 @@ class QMolecule:
         norbs = mohij.shape[0]
         nspin_orbs = 2*norbs
 
-        # One electron terms
+        # One electron terms, only between orbitals of the same spin
         moh1_qubit = numpy.zeros([nspin_orbs, nspin_orbs])
-        for p in range(nspin_orbs):  # pylint: disable=invalid-name
-            for q in range(nspin_orbs):
-                spinp = int(p/norbs)
-                spinq = int(q/norbs)
-                if spinp % 2 != spinq % 2:
-                    continue
-                ints = mohij if spinp == 0 else mohij_b
-                orbp = int(p % norbs)
-                orbq = int(q % norbs)
-                if abs(ints[orbp, orbq]) > threshold:
-                    moh1_qubit[p, q] = ints[orbp, orbq]
+        for spin, ints in enumerate((mohij, mohij_b)):
+            orbs = slice(spin * norbs, (spin + 1) * norbs)
+            moh1_qubit[orbs, orbs] = numpy.where(numpy.abs(ints) > threshold, ints, 0.)
 
         return moh1_qubit
 
@@ -506,30 +638,14 @@ class QMolecule:
         #            .
         #            .
 
-        # Two electron terms
+        # Two electron terms, the spins of p and s, and of q and r, are the same
         moh2_qubit = numpy.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
-        for p in range(nspin_orbs):  # pylint: disable=invalid-name
-            for q in range(nspin_orbs):
-                for r in range(nspin_orbs):
-                    for s in range(nspin_orbs):  # pylint: disable=invalid-name
-                        spinp = int(p/norbs)
-                        spinq = int(q/norbs)
-                        spinr = int(r/norbs)
-                        spins = int(s/norbs)
-                        if spinp != spins:
-                            continue
-                        if spinq != spinr:
-                            continue
-                        if spinp == 0:
-                            ints = ints_aa if spinq == 0 else ints_ba
-                        else:
-                            ints = ints_ab if spinq == 0 else ints_bb
-                        orbp = int(p % norbs)
-                        orbq = int(q % norbs)
-                        orbr = int(r % norbs)
-                        orbs = int(s % norbs)
-                        if abs(ints[orbp, orbq, orbr, orbs]) > threshold:
-                            moh2_qubit[p, q, r, s] = -0.5*ints[orbp, orbq, orbr, orbs]
+        for spinp, spinq, ints in ((0, 0, ints_aa), (0, 1, ints_ba),
+                                   (1, 0, ints_ab), (1, 1, ints_bb)):
+            orbs_p = slice(spinp * norbs, (spinp + 1) * norbs)
+            orbs_q = slice(spinq * norbs, (spinq + 1) * norbs)
+            moh2_qubit[orbs_p, orbs_q, orbs_q, orbs_p] = \
+                numpy.where(numpy.abs(ints) > threshold, -0.5 * ints, 0.)
 
         return moh2_qubit
 
@@ -664,3 +780,168 @@ class QMolecule:
             logger.info("Core orbitals list %s", self.core_orbitals)
         finally:
             numpy.set_printoptions(**opts)
+
+
+# the array fields, with their datasets and the version of the format they were added in
+_ARRAY_FIELDS = collections.OrderedDict([
+    ('mo_coeff', ('orbitals/mo_coeff', 1)),
+    ('mo_coeff_b', ('orbitals/mo_coeff_B', 2)),
+    ('orbital_energies', ('orbitals/orbital_energies', 1)),
+    ('orbital_energies_b', ('orbitals/orbital_energies_B', 2)),
+    ('hcore', ('integrals/hcore', 2)),
+    ('hcore_b', ('integrals/hcore_B', 2)),
+    ('kinetic', ('integrals/kinetic', 2)),
+    ('overlap', ('integrals/overlap', 2)),
+    ('eri', ('integrals/eri', 2)),
+    ('mo_onee_ints', ('integrals/mo_onee_ints', 1)),
+    ('mo_onee_ints_b', ('integrals/mo_onee_ints_B', 2)),
+    ('mo_eri_ints', ('integrals/mo_eri_ints', 1)),
+    ('mo_eri_ints_bb', ('integrals/mo_eri_ints_BB', 2)),
+    ('mo_eri_ints_ba', ('integrals/mo_eri_ints_BA', 2)),
+    ('x_dip_ints', ('dipole/x_dip_ints', 2)),
+    ('y_dip_ints', ('dipole/y_dip_ints', 2)),
+    ('z_dip_ints', ('dipole/z_dip_ints', 2)),
+    ('x_dip_mo_ints', ('dipole/x_dip_mo_ints', 1)),
+    ('x_dip_mo_ints_b', ('dipole/x_dip_mo_ints_B', 2)),
+    ('y_dip_mo_ints', ('dipole/y_dip_mo_ints', 1)),
+    ('y_dip_mo_ints_b', ('dipole/y_dip_mo_ints_B', 2)),
+    ('z_dip_mo_ints', ('dipole/z_dip_mo_ints', 1)),
+    ('z_dip_mo_ints_b', ('dipole/z_dip_mo_ints_B', 2)),
+])
+
+
+class _LazyField:
+    """ An array field of QMolecule read from its file on first access. Once read, or assigned,
+    the value is an instance attribute, which takes precedence over this descriptor. """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self._name not in instance._lazy_fields:  # pylint: disable=protected-access
+            raise AttributeError(self._name)
+        value = instance._read_lazy_field(self._name)  # pylint: disable=protected-access
+        instance.__dict__[self._name] = value
+        return value
+
+
+for _name in _ARRAY_FIELDS:
+    setattr(QMolecule, _name, _LazyField(_name))
+
+
+def _is_none_dataset(dataset):
+    """ None values are saved as a False scalar """
+    return dataset.dtype == bool and dataset.size == 1 and not dataset[()]
+
+
+def _read_dataset(dataset, file_name=None):
+    """
+    Read an array field, unpacking the packed integrals.
+
+    Args:
+        dataset (h5py.Dataset): the dataset
+        file_name (str): the name of the file, to memory-map the dataset if it is stored
+            contiguously, read if None
+
+    Returns:
+        Union(numpy.ndarray, None): the array
+    """
+    if _is_none_dataset(dataset):
+        return None
+    packing = dataset.attrs.get('packing')
+    if packing is not None:
+        return _unpack_eri(dataset[()], packing, tuple(dataset.attrs['shape']))
+    if file_name is not None:
+        mapped = _memmap_dataset(dataset, file_name)
+        if mapped is not None:
+            return mapped
+    return dataset[...]
+
+
+def _memmap_dataset(dataset, file_name):
+    """ memory-map a contiguous, uncompressed dataset, copy on write, None if it is not """
+    if dataset.chunks is not None or dataset.compression is not None or dataset.size == 0 \
+            or dataset.dtype.hasobject:
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+    return numpy.memmap(file_name, dtype=dataset.dtype, mode='c', offset=offset,
+                        shape=dataset.shape)
+
+
+def _read_block(dataset, orbitals, file_name):
+    """ read the block of a dataset over the given orbitals on each axis """
+    if _is_none_dataset(dataset):
+        return None
+    packing = dataset.attrs.get('packing')
+    if packing is not None:
+        ndim = len(dataset.attrs['shape'])
+        index = numpy.ix_(*[orbitals] * ndim)
+        pairs = _pair_index(*numpy.broadcast_arrays(index[0], index[1]))
+        pairs_2 = _pair_index(*numpy.broadcast_arrays(index[2], index[3]))
+        if packing == '8fold':
+            positions = _pair_index(pairs, pairs_2)
+            start, stop = positions.min(), positions.max() + 1
+            return dataset[start:stop][positions - start]
+        # 4fold: read the bounding rows and columns of the pairs
+        rows = slice(pairs.min(), pairs.max() + 1)
+        cols = slice(pairs_2.min(), pairs_2.max() + 1)
+        return dataset[rows, cols][pairs - rows.start, pairs_2 - cols.start]
+    mapped = _memmap_dataset(dataset, file_name)
+    if mapped is not None:
+        return numpy.array(mapped[numpy.ix_(*[orbitals] * mapped.ndim)])
+    # the chunked datasets are read a slab of the first axis at a time
+    rest = numpy.ix_(*[orbitals] * (dataset.ndim - 1))
+    return numpy.stack([dataset[int(i)][rest] for i in orbitals])
+
+
+def _pair_index(i, j):
+    """ the index of the unordered pair (i, j) in the lower triangle, row by row """
+    high, low = numpy.maximum(i, j), numpy.minimum(i, j)
+    return high * (high + 1) // 2 + low
+
+
+def _eri_packing(ints):
+    """ '8fold' if (pq|rs) = (qp|rs) = (pq|sr) = (rs|pq), '4fold' without the last one,
+    None otherwise """
+    if not isinstance(ints, numpy.ndarray) or ints.ndim != 4 or numpy.iscomplexobj(ints) \
+            or len(set(ints.shape)) != 1:
+        return None
+    norbs = ints.shape[0]
+    atol = 1e-12 * max(1., numpy.abs(ints).max(initial=0.))
+    bras = ints.reshape(norbs, norbs, norbs * norbs)
+    if numpy.abs(bras - bras.transpose(1, 0, 2)).max(initial=0.) > atol:
+        return None
+    kets = ints.reshape(norbs * norbs, norbs, norbs)
+    if numpy.abs(kets - kets.transpose(0, 2, 1)).max(initial=0.) > atol:
+        return None
+    pairs = ints.reshape(norbs * norbs, norbs * norbs)
+    return '8fold' if numpy.abs(pairs - pairs.T).max(initial=0.) <= atol else '4fold'
+
+
+def _pack_eri(ints, packing):
+    """ the unique values of the integrals: the pairs of the lower triangle for 4fold,
+    and the lower triangle of these for 8fold """
+    rows, cols = numpy.tril_indices(ints.shape[0])
+    packed = ints[rows, cols][:, rows, cols]
+    if packing == '8fold':
+        packed = packed[numpy.tril_indices(len(rows))]
+    return packed
+
+
+def _unpack_eri(packed, packing, shape):
+    norbs = shape[0]
+    orbitals = numpy.arange(norbs)
+    pairs = _pair_index(orbitals[:, None], orbitals[None, :])
+    ints = numpy.empty(shape, dtype=packed.dtype)
+    # one first index at a time bounds the memory of the indices
+    for i in range(norbs):
+        bras, kets = pairs[i][:, None, None], pairs[None, :, :]
+        if packing == '8fold':
+            ints[i] = packed[_pair_index(bras, kets)]
+        else:
+            ints[i] = packed[bras, kets]
+    return ints
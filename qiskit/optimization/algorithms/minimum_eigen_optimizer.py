@@ -237,33 +237,52 @@ def _eigenvector_to_solutions(eigenvector: Union[dict, np.ndarray, StateFn],
     elif isinstance(eigenvector, StateFn):
         eigenvector = eigenvector.to_matrix()
 
-    solutions = []
     if isinstance(eigenvector, dict):
         all_counts = sum(eigenvector.values())
+        bitstrs = []  # type: List[str]
+        probabilities = []  # type: List[float]
         # iterate over all samples
         for bitstr, count in eigenvector.items():
             sampling_probability = count / all_counts
             # add the bitstring, if the sampling probability exceeds the threshold
             if sampling_probability > 0:
                 if sampling_probability >= min_probability:
-                    value = qubo.objective.evaluate([int(bit) for bit in bitstr])
-                    solutions += [(bitstr, value, sampling_probability)]
+                    bitstrs.append(bitstr)
+                    probabilities.append(sampling_probability)
 
     elif isinstance(eigenvector, np.ndarray):
         num_qubits = int(np.log2(eigenvector.size))
-        probabilities = np.abs(eigenvector * eigenvector.conj())
+        all_probabilities = np.abs(eigenvector * eigenvector.conj())
 
-        # iterate over all states and their sampling probabilities
-        for i, sampling_probability in enumerate(probabilities):
-
-            # add the i-th state if the sampling probability exceeds the threshold
-            if sampling_probability > 0:
-                if sampling_probability >= min_probability:
-                    bitstr = '{:b}'.format(i).rjust(num_qubits, '0')[::-1]
-                    value = qubo.objective.evaluate([int(bit) for bit in bitstr])
-                    solutions += [(bitstr, value, sampling_probability)]
+        # add the states whose sampling probability exceeds the threshold
+        indices = np.flatnonzero((all_probabilities > 0) &
+                                 (all_probabilities >= min_probability))
+        bitstrs = ['{:b}'.format(i).rjust(num_qubits, '0')[::-1] for i in indices]
+        probabilities = list(all_probabilities[indices])
 
     else:
         raise TypeError('Unsupported format of eigenvector. Provide a dict or numpy.ndarray.')
 
-    return solutions
+    values = _evaluate_objective(qubo, bitstrs)
+    return list(zip(bitstrs, values, probabilities))
+
+
+def _evaluate_objective(qubo: QuadraticProgram, bitstrs: List[str]) -> List[float]:
+    """Evaluate the objective of the QUBO on all the bitstrings at once.
+
+    Args:
+        qubo: The QUBO to evaluate at the bitstrings.
+        bitstrs: The bitstrings, whose i-th character is the value of the i-th variable.
+
+    Returns:
+        The value of the objective at each bitstring.
+    """
+    if not bitstrs:
+        return []
+    x = np.frombuffer(''.join(bitstrs).encode(), dtype=np.uint8).reshape(len(bitstrs), -1)
+    x = (x - ord('0')).astype(float)
+    objective = qubo.objective
+    quadratic = objective.quadratic.coefficients.tocsr()
+    values = objective.constant + x.dot(objective.linear.to_array()) + \
+        np.einsum('ij,ji->i', x, quadratic.dot(x.T))
+    return [float(value) for value in values]
@@ -20,7 +20,7 @@ from math import fsum, isclose
 import warnings
 import numpy as np
 from numpy import (ndarray, zeros, bool as nbool)
-from scipy.sparse import spmatrix
+from scipy.sparse import spmatrix, coo_matrix
 
 from docplex.mp.constr import (LinearConstraint as DocplexLinearConstraint,
                                QuadraticConstraint as DocplexQuadraticConstraint,
@@ -31,7 +31,8 @@ from docplex.mp.model_reader import ModelReader
 from docplex.mp.quad import QuadExpr
 
 from qiskit.aqua import MissingOptionalLibraryError
-from qiskit.aqua.operators import I, OperatorBase, PauliOp, WeightedPauliOperator, SummedOp, ListOp
+from qiskit.aqua.operators import (I, OperatorBase, PauliOp, IsingOp, WeightedPauliOperator,
+                                   SummedOp, ListOp)
 from qiskit.quantum_info import Pauli
 from .constraint import Constraint, ConstraintSense
 from .linear_constraint import LinearConstraint
@@ -880,9 +881,14 @@ class QuadraticProgram:
         """
         return SubstituteVariables().substitute_variables(self, constants, variables)
 
-    def to_ising(self) -> Tuple[OperatorBase, float]:
+    def to_ising(self, diagonal: bool = False) -> Tuple[OperatorBase, float]:
         """Return the Ising Hamiltonian of this problem.
 
+        Args:
+            diagonal: If True, the Hamiltonian is returned as an ``IsingOp`` holding the
+                coefficients of its Z and ZZ terms in a sparse matrix instead of a sum of
+                ``PauliOp`` s, which is much cheaper for large problems.
+
         Returns:
             qubit_op: The qubit operator for the problem
             offset: The constant value in the Ising Hamiltonian.
@@ -911,71 +917,92 @@ class QuadraticProgram:
                                           'constraints, and then, it converters equality '
                                           'constraints to penalty terms of the object function.')
 
-        # initialize Hamiltonian.
         num_nodes = self.get_num_vars()
-        pauli_list = []
-        offset = 0
-        zero = zeros(num_nodes, dtype=nbool)
+        rows, cols, coeffs, offset = self._ising_terms()
 
-        # set a sign corresponding to a maximized or minimized problem.
-        # sign == 1 is for minimized problem. sign == -1 is for maximized problem.
-        sense = self.objective.sense.value
-
-        # convert a constant part of the object function into Hamiltonian.
-        offset += self.objective.constant * sense
+        if diagonal:
+            return IsingOp(coo_matrix((coeffs, (rows, cols)), shape=(num_nodes, num_nodes))), offset
 
-        # convert linear parts of the object function into Hamiltonian.
-        for idx, coef in self.objective.linear.to_dict().items():
+        zero = zeros(num_nodes, dtype=nbool)
+        pauli_ops = []
+        for i, j, coeff in zip(rows, cols, coeffs):
             z_p = zeros(num_nodes, dtype=nbool)
-            weight = coef * sense / 2
-            z_p[idx] = True
-
-            pauli_list.append([-weight, Pauli(z_p, zero)])
-            offset += weight
-
-        # convert quadratic parts of the object function into Hamiltonian.
-        # first merge coefficients (i, j) and (j, i)
-        coeffs = {}  # type: Dict
-        for (i, j), coeff in self.objective.quadratic.to_dict().items():
-            if j < i:  # type: ignore
-                coeffs[(j, i)] = coeffs.get((j, i), 0.0) + coeff
-            else:
-                coeffs[(i, j)] = coeffs.get((i, j), 0.0) + coeff
-
-        # create Pauli terms
-        for (i, j), coeff in coeffs.items():
-
-            weight = coeff * sense / 4
+            z_p[i] = True
+            z_p[j] = True
+            pauli_ops.append(PauliOp(Pauli(z_p, zero), coeff=coeff))
+
+        # the terms are unique, so the operator is built at once without reducing it.
+        # if there is no term, return an identity operator of appropriate size
+        if not pauli_ops:
+            qubit_op = I ^ num_nodes  # type: OperatorBase
+        elif len(pauli_ops) == 1:
+            qubit_op = pauli_ops[0]
+        else:
+            qubit_op = SummedOp.from_terms(pauli_ops)
 
-            if i == j:
-                offset += weight
-            else:
-                z_p = zeros(num_nodes, dtype=nbool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([weight, Pauli(z_p, zero)])
+        return qubit_op, offset
 
-            z_p = zeros(num_nodes, dtype=nbool)
-            z_p[i] = True
-            pauli_list.append([-weight, Pauli(z_p, zero)])
+    def _ising_terms(self) -> Tuple[ndarray, ndarray, ndarray, float]:
+        """Compute the Z and ZZ terms of the Ising Hamiltonian of the objective with array
+        operations on its sparse coefficients.
 
-            z_p = zeros(num_nodes, dtype=nbool)
-            z_p[j] = True
-            pauli_list.append([-weight, Pauli(z_p, zero)])
+        The coefficients are accumulated in the order of appearance of the terms in the
+        objective, term by term, so that they do not depend on the summation algorithm.
 
-            offset += weight
+        Returns:
+            The qubit indices ``i`` and ``j`` and the coefficient of each term, in order of
+            first appearance, where ``i == j`` stands for the term Z_i and ``i < j`` for the
+            term Z_i Z_j, and the constant value in the Ising Hamiltonian.
+        """
+        num_nodes = self.get_num_vars()
 
-        # Remove paulis whose coefficients are zeros.
-        qubit_op = sum(PauliOp(pauli, coeff=coeff) for coeff, pauli in pauli_list)
+        # set a sign corresponding to a maximized or minimized problem.
+        # sign == 1 is for minimized problem. sign == -1 is for maximized problem.
+        sense = self.objective.sense.value
 
-        # qubit_op could be the integer 0, in this case return an identity operator of
-        # appropriate size
-        if isinstance(qubit_op, OperatorBase):
-            qubit_op = qubit_op.reduce()
-        else:
-            qubit_op = I ^ num_nodes
+        # linear parts of the object function: x_i = (1 - Z_i) / 2
+        linear = self.objective.linear.coefficients.tocoo()
+        linear_indices = linear.col.astype(np.int64)
+        linear_weights = linear.data * sense / 2
 
-        return qubit_op, offset
+        # quadratic parts of the object function: x_i x_j = (1 - Z_i - Z_j + Z_i Z_j) / 4
+        # first merge coefficients (i, j) and (j, i)
+        quadratic = self.objective.quadratic.coefficients.tocoo()
+        pair_rows = np.minimum(quadratic.row, quadratic.col).astype(np.int64)
+        pair_cols = np.maximum(quadratic.row, quadratic.col).astype(np.int64)
+        _, first, inverse = np.unique(pair_rows * num_nodes + pair_cols,
+                                      return_index=True, return_inverse=True)
+        merged = np.zeros(len(first))
+        np.add.at(merged, inverse, quadratic.data)
+        order = np.argsort(first)
+        pair_rows, pair_cols = pair_rows[first[order]], pair_cols[first[order]]
+        pair_weights = merged[order] * sense / 4
+        diagonal = pair_rows == pair_cols
+
+        # each pair contributes the terms Z_i Z_j (unless i == j), Z_i and Z_j in this order
+        keep = np.ones((len(pair_weights), 3), dtype=nbool)
+        keep[:, 0] = ~diagonal
+        term_rows = np.concatenate(
+            [linear_indices, np.stack([pair_rows, pair_rows, pair_cols], axis=1)[keep]])
+        term_cols = np.concatenate(
+            [linear_indices, np.stack([pair_cols, pair_rows, pair_cols], axis=1)[keep]])
+        term_weights = np.concatenate(
+            [-linear_weights,
+             np.stack([pair_weights, -pair_weights, -pair_weights], axis=1)[keep]])
+
+        # sum up the duplicate terms, np.add.at is unbuffered and adds in order
+        _, first, inverse = np.unique(term_rows * num_nodes + term_cols,
+                                      return_index=True, return_inverse=True)
+        coeffs = np.zeros(len(first))
+        np.add.at(coeffs, inverse, term_weights)
+        order = np.argsort(first)
+
+        # cumsum adds in order, unlike the pairwise summation of np.sum
+        offset_terms = np.concatenate([[self.objective.constant * sense], linear_weights,
+                                       np.repeat(pair_weights, 1 + diagonal)])
+        offset = float(np.cumsum(offset_terms)[-1])
+
+        return term_rows[first[order]], term_cols[first[order]], coeffs[order], offset
 
     def from_ising(self,
                    qubit_op: Union[OperatorBase, WeightedPauliOperator],
@@ -0,0 +1,82 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test PackedCounts """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+import numpy as np
+from qiskit.quantum_info import Pauli
+from qiskit.aqua import aqua_globals
+from qiskit.aqua.operators.legacy import PackedPauliTable, PackedCounts
+
+
+def _sign(bitstr, pauli):
+    support = np.logical_or(pauli.x, pauli.z)
+    bits = np.array([b == '1' for b in reversed(bitstr)])
+    return -1.0 if np.sum(np.logical_and(bits, support)) % 2 else 1.0
+
+
+class TestPackedCounts(QiskitAquaTestCase):
+    """PackedCounts tests."""
+
+    def setUp(self):
+        super().setUp()
+        aqua_globals.random_seed = 0
+        self.num_qubits = 5
+        outcomes = aqua_globals.random.integers(0, 2 ** self.num_qubits, size=40)
+        self.counts = {}
+        for outcome in outcomes:
+            key = format(outcome, '0{}b'.format(self.num_qubits))
+            self.counts[key] = self.counts.get(key, 0) + int(outcome % 7 + 1)
+        self.paulis = [[1.0, Pauli.from_label(label)]
+                       for label in ['ZZIII', 'IXIZI', 'YIIIZ', 'IIIII', 'ZZZZZ']]
+
+    def test_means_and_covariance(self):
+        """ means and covariance match the per-bitstring definition """
+        packed = PackedCounts(self.counts)
+        table = PackedPauliTable.from_paulis(self.paulis)
+        num_shots = sum(self.counts.values())
+        self.assertEqual(packed.num_shots, num_shots)
+
+        signs = np.array([[_sign(key, pauli) for _, pauli in self.paulis]
+                          for key in self.counts.keys()])
+        weights = np.array(list(self.counts.values()), dtype=float)
+        expected_means = weights.dot(signs) / num_shots
+        centered = signs - expected_means
+        expected_cov = np.einsum('k,ki,kj->ij', weights, centered, centered) / (num_shots - 1)
+
+        means = packed.means(table)
+        np.testing.assert_array_almost_equal(means, expected_means)
+        np.testing.assert_array_almost_equal(packed.covariance(table), expected_cov)
+
+    def test_mean_and_variance(self):
+        """ weighted group mean and variance """
+        packed = PackedCounts(self.counts)
+        weights = np.array([0.5, -0.25, 1j, 2.0, 0.1])
+        table = PackedPauliTable.from_paulis([[w, p] for w, (_, p) in zip(weights, self.paulis)])
+        means = packed.means(table)
+        cov = packed.covariance(table)
+        avg, var = packed.mean_and_variance(table)
+        self.assertAlmostEqual(avg, weights.dot(means))
+        self.assertAlmostEqual(var, weights.dot(cov).dot(weights))
+
+    def test_single_shot(self):
+        """ covariance of a single shot is zero """
+        packed = PackedCounts({'101': 1})
+        table = PackedPauliTable.from_paulis([[1.0, Pauli.from_label('ZZI')]])
+        np.testing.assert_array_equal(packed.means(table), [-1.0])
+        np.testing.assert_array_equal(packed.covariance(table), [[0.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
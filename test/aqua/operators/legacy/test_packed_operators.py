@@ -0,0 +1,60 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the packing of operators """
+
+import io
+import unittest
+from test.aqua import QiskitAquaTestCase
+import numpy as np
+from qiskit.quantum_info import Pauli
+from qiskit.aqua.operators.legacy import (WeightedPauliOperator, Z2Symmetries,
+                                          pack_operators, unpack_operators)
+
+
+class TestPackedOperators(QiskitAquaTestCase):
+    """ pack_operators and unpack_operators tests """
+
+    def test_round_trip(self):
+        """ the operators, symmetries and values are restored from an .npz file """
+        z2_symmetries = Z2Symmetries([Pauli.from_label('ZZI')], [Pauli.from_label('IXI')],
+                                     [1], [-1])
+        tapered = WeightedPauliOperator(paulis=[[0.5, Pauli.from_label('XZ')],
+                                                [-0.25j, Pauli.from_label('YY')]],
+                                        name='tapered', z2_symmetries=z2_symmetries)
+        other = WeightedPauliOperator(paulis=[[1.5, Pauli.from_label('IZX')]])
+        file = io.BytesIO()
+        np.savez_compressed(file, **pack_operators([tapered, None, other], z2_symmetries,
+                                                   {'energy': -1.5}))
+        file.seek(0)
+        with np.load(file, allow_pickle=False) as arrays:
+            operators, loaded_z2_symmetries, values = unpack_operators(arrays)
+
+        self.assertEqual(len(operators), 3)
+        self.assertIsNone(operators[1])
+        for operator, expected in zip([operators[0], operators[2]], [tapered, other]):
+            self.assertEqual(operator, expected)
+            self.assertEqual(operator.name, expected.name)
+        self.assertEqual(str(operators[0].z2_symmetries), str(z2_symmetries))
+        self.assertIsNone(operators[2].z2_symmetries)
+        self.assertEqual(str(loaded_z2_symmetries), str(z2_symmetries))
+        self.assertEqual(values, {'energy': -1.5})
+
+    def test_other_version(self):
+        """ arrays of another version of the layout are not unpacked """
+        arrays = pack_operators([WeightedPauliOperator(paulis=[[1, Pauli.from_label('Z')]])])
+        arrays['meta'] = np.array(str(arrays['meta']).replace('"version": 1', '"version": 0'))
+        self.assertIsNone(unpack_operators(arrays))
+
+
+if __name__ == '__main__':
+    unittest.main()
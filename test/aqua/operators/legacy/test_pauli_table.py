@@ -0,0 +1,200 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test PackedPauliTable """
+
+import unittest
+from unittest.mock import patch
+from test.aqua import QiskitAquaTestCase
+import numpy as np
+from scipy import sparse as scisparse
+from scipy.linalg import hadamard
+from ddt import ddt, data
+from qiskit.quantum_info import Pauli, SparsePauliOp
+from qiskit.aqua import aqua_globals
+from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators.legacy import PackedPauliTable
+from qiskit.aqua.operators.legacy import pauli_table
+from qiskit.aqua.operators.legacy.pauli_table import walsh_hadamard
+
+
+def _random_paulis(num_paulis, num_qubits):
+    labels = aqua_globals.random.choice(list('IXYZ'), size=(num_paulis, num_qubits))
+    weights = aqua_globals.random.random(num_paulis) + 1j * aqua_globals.random.random(num_paulis)
+    return [[w, Pauli.from_label(''.join(label))] for w, label in zip(weights, labels)]
+
+
+@ddt
+class TestPackedPauliTable(QiskitAquaTestCase):
+    """PackedPauliTable tests."""
+
+    def setUp(self):
+        super().setUp()
+        aqua_globals.random_seed = 0
+
+    @data(3, 64, 70)
+    def test_round_trip(self, num_qubits):
+        """ pack and unpack test """
+        paulis = _random_paulis(20, num_qubits)
+        table = PackedPauliTable.from_paulis(paulis)
+        self.assertEqual(len(table), 20)
+        self.assertEqual(table.num_qubits, num_qubits)
+        for (weight, pauli), (new_weight, new_pauli) in zip(paulis, table.to_paulis()):
+            self.assertEqual(pauli, new_pauli)
+            self.assertEqual(weight, new_weight)
+
+    @data(3, 70)
+    def test_dot(self, num_qubits):
+        """ product with phases test """
+        paulis_1 = _random_paulis(8, num_qubits)
+        paulis_2 = _random_paulis(5, num_qubits)
+        table = PackedPauliTable.from_paulis(paulis_1).dot(PackedPauliTable.from_paulis(paulis_2))
+        products = table.to_paulis()
+        idx = 0
+        for weight_1, pauli_1 in paulis_1:
+            for weight_2, pauli_2 in paulis_2:
+                pauli, sign = Pauli.sgn_prod(pauli_1, pauli_2)
+                self.assertEqual(products[idx][1], pauli)
+                self.assertAlmostEqual(products[idx][0], weight_1 * weight_2 * sign)
+                idx += 1
+
+    @data(3, 70)
+    def test_multiply(self, num_qubits):
+        """ pairwise product with phases test """
+        paulis_1 = _random_paulis(8, num_qubits)
+        paulis_2 = _random_paulis(5, num_qubits)
+        rows, other_rows = np.array([0, 3, 3, 7, 1]), np.array([4, 0, 2, 2, 1])
+        table = PackedPauliTable.from_paulis(paulis_1).multiply(
+            PackedPauliTable.from_paulis(paulis_2), rows, other_rows)
+        for (weight, pauli), row, other_row in zip(table.to_paulis(), rows, other_rows):
+            expected, sign = Pauli.sgn_prod(paulis_1[row][1], paulis_2[other_row][1])
+            self.assertEqual(pauli, expected)
+            self.assertAlmostEqual(weight, paulis_1[row][0] * paulis_2[other_row][0] * sign)
+
+    @data(3, 70)
+    def test_commutator(self, num_qubits):
+        """ commutator of the anticommuting pairs test """
+        paulis_1 = _random_paulis(8, num_qubits)
+        paulis_2 = _random_paulis(5, num_qubits)
+        op_1 = WeightedPauliOperator(paulis=paulis_1)
+        op_2 = WeightedPauliOperator(paulis=paulis_2)
+        expected = op_1 * op_2 - op_2 * op_1
+        expected.chop(1e-12)
+        table, _ = PackedPauliTable.from_paulis(op_1.paulis).commutator(
+            PackedPauliTable.from_paulis(op_2.paulis)).simplify()
+        weights, mask = table.chop_mask(1e-12)
+        commutator = {pauli.to_label(): weight
+                      for (_, pauli), weight in zip(table.to_paulis(), weights) if weight != 0}
+        self.assertEqual(sorted(commutator), sorted(p.to_label() for _, p in expected.paulis))
+        for weight, pauli in expected.paulis:
+            self.assertAlmostEqual(commutator[pauli.to_label()], weight)
+        self.assertEqual(int(mask.sum()), len(expected.paulis))
+
+    def test_simplify(self):
+        """ simplify keeps the order of first appearance """
+        paulis = [[1, Pauli.from_label('ZZ')], [2, Pauli.from_label('XI')],
+                  [3, Pauli.from_label('ZZ')], [4, Pauli.from_label('IY')]]
+        table, inverse = PackedPauliTable.from_paulis(paulis).simplify()
+        self.assertListEqual([p.to_label() for _, p in table.to_paulis()], ['ZZ', 'XI', 'IY'])
+        np.testing.assert_array_almost_equal(table.coeffs, [4, 2, 4])
+        np.testing.assert_array_equal(inverse, [0, 1, 0, 2])
+
+    def test_commutes_with(self):
+        """ symplectic commutation test """
+        table = PackedPauliTable.from_paulis([[1, Pauli.from_label(label)]
+                                              for label in ['XX', 'ZZ', 'XI', 'IZ']])
+        expected = [[True, True, True, False],
+                    [True, True, False, True],
+                    [True, False, True, True],
+                    [False, True, True, True]]
+        np.testing.assert_array_equal(table.commutes_with(table), expected)
+
+    def test_operator_multiply(self):
+        """ WeightedPauliOperator product matches the term-by-term product """
+        op_1 = WeightedPauliOperator(paulis=_random_paulis(10, 4))
+        op_2 = WeightedPauliOperator(paulis=_random_paulis(10, 4))
+        expected = WeightedPauliOperator(paulis=[])
+        for weight_1, pauli_1 in op_1.paulis:
+            for weight_2, pauli_2 in op_2.paulis:
+                pauli, sign = Pauli.sgn_prod(pauli_1, pauli_2)
+                expected += WeightedPauliOperator(paulis=[[weight_1 * weight_2 * sign, pauli]])
+        diff = op_1 * op_2 - expected
+        diff.chop(1e-12)
+        self.assertTrue(diff.is_empty())
+
+    def test_walsh_hadamard(self):
+        """ fast Walsh-Hadamard transform test """
+        values = aqua_globals.random.random((3, 16)) + 1j * aqua_globals.random.random((3, 16))
+        np.testing.assert_array_almost_equal(walsh_hadamard(values), values @ hadamard(16))
+
+    @data('dense', 'csr', 'diagonal', 'banded')
+    def test_from_matrix(self, kind):
+        """ decomposition of a matrix test """
+        num_qubits = 4
+        dim = 2 ** num_qubits
+        matrix = aqua_globals.random.random((dim, dim)) \
+            + 1j * aqua_globals.random.random((dim, dim))
+        if kind == 'diagonal':
+            matrix = np.diag(np.diag(matrix))
+        elif kind == 'banded':
+            matrix = np.triu(np.tril(matrix, 1), -1)
+        if kind != 'dense':
+            matrix = scisparse.csr_matrix(matrix)
+        table = PackedPauliTable.from_matrix(matrix)
+        expected = SparsePauliOp.from_operator(
+            matrix.toarray() if kind != 'dense' else matrix, atol=1e-12)
+        self.assertListEqual([pauli.to_label() for _, pauli in table.to_paulis()],
+                             expected.table.to_labels())
+        np.testing.assert_array_almost_equal(table.coeffs, expected.coeffs)
+        if kind == 'diagonal':
+            self.assertFalse(np.any(table.x))
+
+    def test_from_matrix_atol(self):
+        """ the weights bounded by atol are dropped """
+        matrix = 0.5 * np.kron(np.array([[0, 1], [1, 0]]), np.eye(2)) + 1e-9 * np.eye(4)
+        table = PackedPauliTable.from_matrix(matrix, atol=1e-8)
+        self.assertListEqual([pauli.to_label() for _, pauli in table.to_paulis()], ['XI'])
+        np.testing.assert_array_almost_equal(table.coeffs, [0.5])
+
+    @data(3, 6)
+    def test_to_spmatrix(self, num_qubits):
+        """ sparse matrix of the sum test """
+        paulis = _random_paulis(30, num_qubits)
+        expected = sum(weight * pauli.to_spmatrix() for weight, pauli in paulis)
+        matrix = PackedPauliTable.from_paulis(paulis).to_spmatrix()
+        self.assertTrue(matrix.has_sorted_indices)
+        np.testing.assert_array_almost_equal(matrix.toarray(), expected.toarray())
+
+    @data(True, False)
+    def test_to_linear_operator(self, cached):
+        """ matrix-free product test """
+        paulis = _random_paulis(30, 5)
+        expected = sum(weight * pauli.to_spmatrix() for weight, pauli in paulis)
+        with patch.object(pauli_table, '_LINEAR_OPERATOR_CACHE_SIZE', 1 << 20 if cached else 0):
+            operator = PackedPauliTable.from_paulis(paulis).to_linear_operator()
+        vectors = aqua_globals.random.random((32, 2))
+        np.testing.assert_array_almost_equal(operator.matvec(vectors[:, 0]),
+                                             expected @ vectors[:, 0])
+        np.testing.assert_array_almost_equal(operator.matmat(vectors), expected @ vectors)
+
+    def test_to_linear_operator_real(self):
+        """ the operator of real matrix elements is real """
+        paulis = [[0.5, Pauli.from_label('XZ')], [0.25, Pauli.from_label('YY')],
+                  [-1.0, Pauli.from_label('IZ')]]
+        operator = PackedPauliTable.from_paulis(paulis).to_linear_operator()
+        self.assertEqual(operator.dtype, np.float64)
+        expected = sum(weight * pauli.to_matrix() for weight, pauli in paulis)
+        np.testing.assert_array_almost_equal(operator.matmat(np.eye(4)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
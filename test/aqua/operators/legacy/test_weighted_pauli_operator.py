@@ -22,11 +22,27 @@ from qiskit import BasicAer, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import EfficientSU2
 from qiskit.quantum_info import Pauli, state_fidelity
 from qiskit.aqua import aqua_globals, QuantumInstance
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators import WeightedPauliOperator, Z2Symmetries
 from qiskit.aqua.operators.legacy import op_converter
 from qiskit.aqua.components.initial_states import Custom
 
 
+def _reference_taper(z2_symmetries, operator, tapering_values):
+    """ the term by term tapering """
+    for clifford in z2_symmetries.cliffords:
+        operator = clifford * operator * clifford
+    operator_out = WeightedPauliOperator(paulis=[])
+    for coeff, pauli in operator.paulis:
+        for idx, qubit_idx in enumerate(z2_symmetries.sq_list):
+            if pauli.z[qubit_idx] or pauli.x[qubit_idx]:
+                coeff = tapering_values[idx] * coeff
+        z_temp = np.delete(pauli.z.copy(), np.asarray(z2_symmetries.sq_list))
+        x_temp = np.delete(pauli.x.copy(), np.asarray(z2_symmetries.sq_list))
+        operator_out += WeightedPauliOperator(paulis=[[coeff, Pauli(z_temp, x_temp)]])
+    operator_out.chop(0.0)
+    return operator_out
+
+
 @ddt
 class TestWeightedPauliOperator(QiskitAquaTestCase):
     """WeightedPauliOperator tests."""
@@ -142,6 +158,24 @@ class TestWeightedPauliOperator(QiskitAquaTestCase):
         self.assertEqual(2, len(op_a.paulis))
         self.assertEqual(0.75, op_a.paulis[0][0])
 
+    def test_iadd_incremental(self):
+        """ repeated iadd test, with the list of paulis replaced in between """
+        labels = [''.join(label) for label in itertools.product('IXZ', repeat=3)]
+        op_a = WeightedPauliOperator(paulis=[])
+        for i, label in enumerate(labels + labels[:5]):
+            op_a += WeightedPauliOperator(paulis=[[i, Pauli.from_label(label)]])
+        op_a.simplify()
+        op_a += WeightedPauliOperator(paulis=[[1, Pauli.from_label(labels[0])],
+                                              [1, Pauli.from_label('YYY')],
+                                              [2, Pauli.from_label(labels[0])]])
+        expected = [[i, Pauli.from_label(label)] for i, label in enumerate(labels)]
+        for i in range(5):
+            expected[i][0] += len(labels) + i
+        expected[0][0] += 3
+        expected.append([1, Pauli.from_label('YYY')])
+        self.assertEqual(op_a, WeightedPauliOperator(paulis=expected))
+        self.assertEqual(len(op_a.paulis), len(labels) + 1)
+
     def test_add(self):
         """ add test """
         pauli_a = 'IXYZ'
@@ -610,6 +644,46 @@ class TestWeightedPauliOperator(QiskitAquaTestCase):
         expectation_value, _ = eval_op(wpo2)
         self.assertAlmostEqual(expectation_value, -3.0, places=2)
 
+    def test_taper(self):
+        """ taper test """
+        # the Paulis which commute with ZZIIII, IIZZII and XIXIXI
+        symmetries = [Pauli.from_label(label) for label in ['ZZIIII', 'IIZZII', 'XIXIXI']]
+        paulis = []
+        for label in aqua_globals.random.choice(list('IXYZ'), size=(2000, 6)):
+            pauli = Pauli.from_label(''.join(label))
+            if all(WeightedPauliOperator(paulis=[[1, pauli]]).commute_with(
+                    WeightedPauliOperator(paulis=[[1, symmetry]])) for symmetry in symmetries):
+                paulis.append([aqua_globals.random.random() - 0.5, pauli])
+        operator = WeightedPauliOperator(paulis=paulis)
+        z2_symmetries = Z2Symmetries.find_Z2_symmetries(operator)
+        self.assertEqual(len(z2_symmetries.sq_list), 3)
+
+        tapered_ops = z2_symmetries.taper(operator)
+        sectors = list(itertools.product([1, -1], repeat=3))
+        self.assertEqual(len(tapered_ops), len(sectors))
+        for tapered_op, sector in zip(tapered_ops, sectors):
+            expected = _reference_taper(z2_symmetries, operator, list(sector))
+            self.assertEqual(tapered_op.num_qubits, 3)
+            self.assertEqual(tapered_op.z2_symmetries.tapering_values, list(sector))
+            self.assertEqual(tapered_op.print_details(), expected.print_details())
+
+        tapered_op = z2_symmetries.taper(operator, tapering_values=[1, -1, -1])
+        self.assertEqual(tapered_op.print_details(), tapered_ops[3].print_details())
+
+    def test_two_qubit_reduction(self):
+        """ two qubit reduction test """
+        paulis = []
+        for label in aqua_globals.random.choice(list('IXYZ'), size=(200, 6)):
+            # Z or I on the qubits 2 and 5
+            label[0], label[3] = aqua_globals.random.choice(list('IZ'), size=2)
+            paulis.append([aqua_globals.random.random() - 0.5,
+                           Pauli.from_label(''.join(label))])
+        operator = WeightedPauliOperator(paulis=paulis)
+        tapered_op = Z2Symmetries.two_qubit_reduction(operator, [1, 2])
+        expected = _reference_taper(tapered_op.z2_symmetries, operator, [-1, -1])
+        self.assertEqual(tapered_op.num_qubits, 4)
+        self.assertEqual(tapered_op.print_details(), expected.print_details())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,8 +21,9 @@ import scipy.linalg
 import qiskit
 from qiskit.circuit import ParameterVector, Parameter
 
+from qiskit.aqua import AquaError, aqua_globals
 from qiskit.aqua.operators import (X, Y, Z, I, CX, H, ListOp, CircuitOp, Zero, EvolutionFactory,
-                                   EvolvedOp, PauliTrotterEvolution, QDrift)
+                                   EvolvedOp, PauliTrotterEvolution, QDrift, SummedOp, Suzuki)
 
 
 # pylint: disable=invalid-name
@@ -135,6 +136,106 @@ class TestEvolution(QiskitAquaTestCase):
         for p in thetas:
             self.assertIn(p, evo.to_circuit().parameters)
 
+    def test_abelian_evolution(self):
+        """ evolution of a sum of commuting Paulis by a single diagonalization """
+        op = SummedOp([0.3 * (X ^ X ^ I), -0.5 * (Y ^ Y ^ I), 0.7 * (Z ^ Z ^ I), 0.2 * (X ^ X ^ X),
+                       0.4 * (I ^ I ^ X), 0.25 * (I ^ I ^ I)], abelian=True)
+        evolution = PauliTrotterEvolution().convert(EvolvedOp(op))
+        self.assertIsInstance(evolution, CircuitOp)
+        np.testing.assert_array_almost_equal(evolution.to_matrix(),
+                                             scipy.linalg.expm(-1j * op.to_matrix()))
+
+        with self.assertRaises(AquaError):
+            PauliTrotterEvolution().convert(EvolvedOp(SummedOp([X, Z], abelian=True)))
+
+    def test_grouped_evolution(self):
+        """ evolution of the Abelian groups of a sum of Paulis """
+        op = (0.5 * Z ^ Z ^ I) + (0.3 * I ^ Z ^ Z) + (0.2 * X ^ X ^ I) - (0.4 * I ^ X ^ X) \
+            + (0.1 * Y ^ I ^ Y)
+        grouped = PauliTrotterEvolution(trotter_mode=Suzuki(reps=10), group_paulis=True)
+        ungrouped = PauliTrotterEvolution(trotter_mode=Suzuki(reps=10))
+        grouped_evolution = grouped.convert(op.exp_i())
+        ungrouped_evolution = ungrouped.convert(op.exp_i())
+        ref_mat = scipy.linalg.expm(-1j * op.to_matrix())
+        np.testing.assert_array_almost_equal(grouped_evolution.to_matrix(), ref_mat, decimal=2)
+        np.testing.assert_array_almost_equal(grouped_evolution.to_matrix(),
+                                             ungrouped_evolution.to_matrix(), decimal=2)
+        grouped_ops = grouped_evolution.to_circuit().count_ops()
+        ungrouped_ops = ungrouped_evolution.to_circuit().count_ops()
+        self.assertLessEqual(grouped_ops['cx'], ungrouped_ops['cx'])
+
+        # a sum forming a single group is evolved exactly
+        op = (0.5 * Z ^ Z ^ I) + (0.3 * I ^ Z ^ Z) + (0.2 * Z ^ Z ^ Z)
+        evolution = grouped.convert(op.exp_i())
+        np.testing.assert_array_almost_equal(evolution.to_matrix(),
+                                             scipy.linalg.expm(-1j * op.to_matrix()))
+
+    def test_grouped_parameterized_evolution(self):
+        """ grouped evolution with parameterized coefficients """
+        thetas = ParameterVector('θ', length=4)
+        op = (thetas[0] * Z ^ Z) + (thetas[1] * I ^ Z) + (thetas[2] * X ^ X) + (thetas[3] * X ^ I)
+        evolution = PauliTrotterEvolution(group_paulis=True).convert(op.exp_i())
+        circuit = evolution.to_circuit()
+        self.assertEqual(set(thetas), circuit.parameters)
+        values = [0.1, -0.2, 0.3, 0.4]
+        bound = evolution.bind_parameters(dict(zip(thetas, values)))
+        numeric = (0.1 * Z ^ Z) + (-0.2 * I ^ Z) + (0.3 * X ^ X) + (0.4 * X ^ I)
+        expected = PauliTrotterEvolution(group_paulis=True).convert(numeric.exp_i())
+        np.testing.assert_array_almost_equal(bound.to_matrix(), expected.to_matrix())
+
+    def test_abelian_parameterized_identity(self):
+        """ grouped evolution keeps the phase of a parameterized identity """
+        thetas = ParameterVector('θ', length=3)
+        op = (thetas[0] * Z ^ Z) + (thetas[1] * I ^ I) + (thetas[2] * X ^ X)
+        evolution = PauliTrotterEvolution(group_paulis=True).convert(op.exp_i())
+        self.assertEqual(set(thetas), evolution.to_circuit().parameters)
+        values = [0.1, 0.7, -0.3]
+        bound = evolution.bind_parameters(dict(zip(thetas, values)))
+        numeric = (0.1 * Z ^ Z) + (0.7 * I ^ I) + (-0.3 * X ^ X)
+        np.testing.assert_array_almost_equal(bound.to_matrix(),
+                                             scipy.linalg.expm(-1j * numeric.to_matrix()))
+
+    def test_lazy_suzuki(self):
+        """ lazy Suzuki trotterization test """
+        op = (0.3 * X ^ Y ^ I) + (0.5 * Z ^ Z ^ I) + (0.2 * I ^ X ^ X) - (0.4 * Y ^ I ^ Z) \
+            + (0.6 * I ^ I ^ Y)
+        for order, reps in [(1, 2), (2, 3), (4, 1)]:
+            with self.subTest(order=order, reps=reps):
+                evolution = PauliTrotterEvolution(
+                    trotter_mode=Suzuki(reps=reps, order=order)).convert(op.exp_i())
+                lazy_evolution = PauliTrotterEvolution(
+                    trotter_mode=Suzuki(reps=reps, order=order, lazy=True)).convert(op.exp_i())
+                self.assertIsInstance(lazy_evolution, CircuitOp)
+                # a single gate, whose definition is built on demand
+                self.assertEqual(len(lazy_evolution.to_circuit().data), 1)
+                np.testing.assert_array_almost_equal(lazy_evolution.to_matrix(),
+                                                     evolution.to_matrix())
+
+    def test_lazy_parameterized_evolution(self):
+        """ lazy parameterized evolution test """
+        thetas = ParameterVector('θ', length=3)
+        op = (thetas[0] * X ^ Y) + (thetas[1] * Z ^ Z) + (thetas[2] * I ^ X)
+        evolution = PauliTrotterEvolution(trotter_mode=Suzuki(reps=2, lazy=True)).convert(
+            op.exp_i())
+        self.assertEqual(set(thetas), evolution.to_circuit().parameters)
+        for values in [[0.1, 0.2, 0.3], [-0.4, 0.5, 0.6]]:
+            bound = evolution.bind_parameters(dict(zip(thetas, values)))
+            numeric = (values[0] * X ^ Y) + (values[1] * Z ^ Z) + (values[2] * I ^ X)
+            expected = PauliTrotterEvolution(trotter_mode=Suzuki(reps=2)).convert(
+                numeric.exp_i())
+            np.testing.assert_array_almost_equal(bound.to_matrix(), expected.to_matrix())
+
+    def test_lazy_qdrift(self):
+        """ lazy QDrift test """
+        op = (2 * Z ^ Z) + (3 * X ^ X) - (4 * Y ^ Y) + (.5 * Z ^ I)
+        aqua_globals.random_seed = 11
+        evolution = PauliTrotterEvolution(trotter_mode=QDrift()).convert(op.exp_i())
+        aqua_globals.random_seed = 11
+        lazy_evolution = PauliTrotterEvolution(trotter_mode=QDrift(lazy=True)).convert(
+            op.exp_i())
+        self.assertIsInstance(lazy_evolution, CircuitOp)
+        np.testing.assert_array_almost_equal(lazy_evolution.to_matrix(), evolution.to_matrix())
+
     def test_qdrift(self):
         """ QDrift test """
         op = (2 * Z ^ Z) + (3 * X ^ X) - (4 * Y ^ Y) + (.5 * Z ^ I)
@@ -0,0 +1,138 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test IsingOp """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+import scipy.linalg
+from ddt import ddt, data
+
+from qiskit import BasicAer
+from qiskit.aqua import QuantumInstance, AquaError
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+from qiskit.quantum_info import Pauli
+from qiskit.aqua.operators import (X, Z, I, H, CX, Zero, PrimitiveOp, IsingOp, StateFn,
+                                   DictStateFn, ExpectationFactory, PauliExpectation,
+                                   CircuitSampler)
+
+
+# pylint: disable=invalid-name
+
+class TestIsingOp(QiskitAquaTestCase):
+    """IsingOp tests."""
+
+    def setUp(self):
+        super().setUp()
+        # 2 Z_0 - Z_2 + 0.5 Z_0 Z_1 + 1.5 Z_1 Z_2 - Z_0 Z_3
+        self.matrix = np.array([[2, 0.5, 0, 0],
+                                [0, 0, 1, 0],
+                                [0, 0.5, -1, 0],
+                                [-1, 0, 0, 0]])
+        self.pauli_op = 2 * (I ^ I ^ I ^ Z) - (I ^ Z ^ I ^ I) + 0.5 * (I ^ I ^ Z ^ Z) \
+            + 1.5 * (I ^ Z ^ Z ^ I) - (Z ^ I ^ I ^ Z)
+        self.ising_op = IsingOp(self.matrix, coeff=0.5)
+
+    def test_construction(self):
+        """ test the terms of an IsingOp and its conversions """
+        np.testing.assert_array_equal(self.ising_op.linear, [2, 0, -1, 0])
+        np.testing.assert_array_equal(self.ising_op.quadratic.toarray(),
+                                      [[0, 0.5, 0, -1], [0, 0, 1.5, 0], [0, 0, 0, 0], [0, 0, 0, 0]])
+        self.assertEqual(self.ising_op.num_qubits, 4)
+        self.assertEqual(self.ising_op.to_pauli_op(), 0.5 * self.pauli_op)
+        self.assertEqual(IsingOp.from_pauli_op(self.pauli_op), IsingOp(self.matrix))
+        np.testing.assert_array_almost_equal(self.ising_op.to_matrix(),
+                                             0.5 * self.pauli_op.to_matrix())
+        self.assertEqual(2 * self.ising_op + IsingOp(self.matrix), IsingOp(2 * self.matrix))
+        with self.assertRaises(AquaError):
+            IsingOp.from_pauli_op(X ^ Z)
+        with self.assertRaises(AquaError):
+            IsingOp.from_pauli_op((I ^ I) + (Z ^ Z))
+
+    def test_permute(self):
+        """ test permute and expand """
+        permuted = self.ising_op.permute([1, 0, 4, 2])
+        expected = PrimitiveOp(Pauli.from_label('IIIZI'), coeff=1) \
+            - PrimitiveOp(Pauli.from_label('ZIIII'), coeff=0.5) \
+            + PrimitiveOp(Pauli.from_label('IIIZZ'), coeff=0.25) \
+            + PrimitiveOp(Pauli.from_label('ZIIIZ'), coeff=0.75) \
+            - PrimitiveOp(Pauli.from_label('IIZZI'), coeff=0.5)
+        np.testing.assert_array_almost_equal(permuted.to_matrix(), expected.to_matrix())
+        np.testing.assert_array_almost_equal((I ^ self.ising_op).to_matrix(),
+                                             0.5 * (I ^ self.pauli_op).to_matrix())
+
+    def test_energies(self):
+        """ test energies, expectation and eval """
+        bitstrs = ['0000', '0101', '1110', '0011']
+        expected = [np.real(0.5 * self.pauli_op.to_matrix()[int(b, 2), int(b, 2)])
+                    for b in bitstrs]
+        np.testing.assert_array_almost_equal(self.ising_op.energies(bitstrs), expected)
+        bits = np.array([[int(b) for b in reversed(bitstr)] for bitstr in bitstrs])
+        np.testing.assert_array_almost_equal(self.ising_op.energies(bits), expected)
+        counts = dict(zip(bitstrs, [1, 2, 3, 4]))
+        self.assertAlmostEqual(self.ising_op.expectation(counts),
+                               np.dot([1, 2, 3, 4], expected) / 10)
+
+        state = DictStateFn({'0101': 0.6, '1110': 0.8})
+        np.testing.assert_array_almost_equal(self.ising_op.eval(state).to_matrix(),
+                                             (0.5 * self.pauli_op).eval(state).to_matrix())
+        state = (H ^ H ^ H ^ H) @ Zero
+        self.assertAlmostEqual((~StateFn(self.ising_op) @ state).eval(),
+                               (~StateFn(0.5 * self.pauli_op) @ state).eval())
+
+    def test_exp_i(self):
+        """ test exp_i """
+        evolution = (0.3 * self.ising_op).exp_i()
+        expected = scipy.linalg.expm(-0.3j * self.ising_op.to_matrix())
+        np.testing.assert_array_almost_equal(evolution.to_matrix(), expected)
+
+        with self.assertRaises(ValueError):
+            IsingOp(self.matrix, coeff=0.5j).exp_i()
+        with self.assertRaises(ValueError):
+            IsingOp(self.matrix + 0.1j * np.eye(4)).exp_i()
+        with self.assertRaises(ValueError):
+            IsingOp(self.matrix + 0.1j * np.eye(4, k=1)).exp_i()
+
+    def test_numpy_minimum_eigensolver(self):
+        """ test NumPyMinimumEigensolver with an IsingOp """
+        result = NumPyMinimumEigensolver(self.ising_op).compute_minimum_eigenvalue()
+        self.assertAlmostEqual(result.eigenvalue,
+                               np.min(np.linalg.eigvalsh(0.5 * self.pauli_op.to_matrix())))
+
+
+@ddt
+class TestIsingOpExpectation(QiskitAquaTestCase):
+    """IsingOp expectation value tests."""
+
+    @data('statevector_simulator', 'qasm_simulator')
+    def test_expectation(self, backend_name):
+        """ test the expectation of an IsingOp """
+        ising_op = IsingOp([[1, 2], [0, -0.5]])
+        state = CX @ (I ^ H) @ Zero
+        backend = BasicAer.get_backend(backend_name)
+        q_instance = QuantumInstance(backend, shots=8192,
+                                     seed_simulator=50, seed_transpiler=50)
+        expectation = ExpectationFactory.build(ising_op, q_instance)
+        self.assertIsInstance(expectation, PauliExpectation)
+
+        converted = expectation.convert(~StateFn(ising_op) @ state)
+        sampled = CircuitSampler(q_instance).convert(converted)
+        self.assertAlmostEqual(sampled.eval(), 2, delta=0.1)
+        if backend_name == 'qasm_simulator':
+            # the energies of '00' and '11' are 2.5 and 1.5
+            self.assertAlmostEqual(expectation.compute_variance(sampled), 0.25, delta=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
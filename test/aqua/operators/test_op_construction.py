@@ -28,7 +28,7 @@ from qiskit.circuit import QuantumCircuit, QuantumRegister, Instruction, Paramet
 
 from qiskit.extensions.exceptions import ExtensionError
 from qiskit.quantum_info import Operator, Pauli, Statevector
-from qiskit.circuit.library import CZGate, ZGate
+from qiskit.circuit.library import CXGate, CZGate, ZGate
 
 from qiskit.aqua.operators import (
     X, Y, Z, I, CX, T, H, Minus, PrimitiveOp, PauliOp, CircuitOp, MatrixOp, EvolvedOp, StateFn,
@@ -203,6 +203,15 @@ class TestOpConstruction(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(
             op6.to_matrix(), op5.to_matrix() + Operator.from_label('+r').data)
 
+    def test_pauli_sum_to_spmatrix(self):
+        """ the matrices of a sum of PauliOp, written at once """
+        op = 0.5 * (X ^ Y ^ I) + (-1.2 + 0.3j) * (Z ^ Z ^ X) + 0.7 * (Y ^ X ^ X) \
+            + 2 * (I ^ I ^ Z) - 0.4 * (Z ^ Z ^ X)
+        expected = sum(term.coeff * term.primitive.to_matrix() for term in op.oplist)
+        np.testing.assert_array_almost_equal(op.to_spmatrix().toarray(), expected)
+        np.testing.assert_array_almost_equal((1.5 * op).to_matrix(), 1.5 * expected)
+        np.testing.assert_array_almost_equal(op.to_matrix_op().to_matrix(), expected)
+
     def test_circuit_op_to_matrix(self):
         """ test CircuitOp.to_matrix """
         qc = QuantumCircuit(1)
@@ -358,6 +367,58 @@ class TestOpConstruction(QiskitAquaTestCase):
             self.assertListEqual([str(op.primitive) for op in sum_op], ['XX', 'YY', 'ZZ'])
             self.assertListEqual([op.coeff for op in sum_op], [10, 2, 3])
 
+    def test_summed_op_collapse_primitives(self):
+        """Test collapse_summands on circuit, matrix and parameterized summands"""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.rx(0.5, 1)
+        same_circuit = QuantumCircuit(2)
+        same_circuit.h(0)
+        same_circuit.rx(0.5, 1)
+        param = Parameter('a')
+        param_circuit = QuantumCircuit(2)
+        param_circuit.rx(param, 1)
+        matrix = (X ^ Y).to_matrix_op()
+        sum_op = SummedOp([CircuitOp(circuit), MatrixOp(matrix.primitive, coeff=2),
+                           CircuitOp(param_circuit), CircuitOp(same_circuit, coeff=3),
+                           (X ^ Y).to_matrix_op(), CircuitOp(param_circuit),
+                           ListOp([X ^ Z]), ListOp([X ^ Z])], coeff=2)
+        sum_op = sum_op.collapse_summands()
+        self.assertEqual(len(sum_op), 4)
+        self.assertEqual(sum_op[0], CircuitOp(circuit, coeff=8))
+        self.assertEqual(sum_op[1], MatrixOp(matrix.primitive, coeff=6))
+        self.assertEqual(sum_op[2], CircuitOp(param_circuit, coeff=4))
+        self.assertEqual(sum_op[3].coeff, 4)
+
+        # gates which only differ by their open controls are not merged
+        closed = QuantumCircuit(2)
+        closed.cx(0, 1)
+        open_control = QuantumCircuit(2)
+        open_control.append(CXGate(ctrl_state=0), [0, 1])
+        sum_op = SummedOp([CircuitOp(closed), CircuitOp(open_control)])
+        collapsed = sum_op.collapse_summands()
+        self.assertEqual(len(collapsed), 2)
+        np.testing.assert_array_almost_equal(collapsed.to_matrix(), sum_op.to_matrix())
+
+    def test_summed_op_from_terms(self):
+        """Test SummedOp.from_terms and reduce of a large sum"""
+        terms = [PauliOp(Pauli.from_label(''.join(label)), coeff=i)
+                 for i, label in enumerate(itertools.product('IXYZ', repeat=5))]
+        sum_op = SummedOp.from_terms(terms + [SummedOp(terms[:10], coeff=2), terms[3]], coeff=0.5)
+        self.assertEqual(len(sum_op), len(terms) + 11)
+        self.assertEqual(sum_op.coeff, 0.5)
+        self.assertEqual(sum_op[len(terms) + 1], 2 * terms[1])
+
+        reduced = sum_op.reduce()
+        self.assertEqual(len(reduced), len(terms))
+        self.assertEqual(reduced.coeff, 1)
+        expected = [0.5 * i for i in range(len(terms))]
+        for i in range(10):
+            expected[i] *= 3
+        expected[3] += 1.5
+        self.assertListEqual([op.coeff for op in reduced], expected)
+        np.testing.assert_array_almost_equal(reduced.to_matrix(), sum_op.to_matrix())
+
     def test_compose_op_of_different_dim(self):
         """
         Test if smaller operator expands to correct dim when composed with bigger operator.
@@ -23,7 +23,9 @@ from qiskit.aqua.operators import (X, Y, Z, I, CX, H, S,
                                    ListOp, Zero, One, Plus, Minus, StateFn,
                                    PauliExpectation, CircuitSampler)
 
-from qiskit import BasicAer
+from qiskit import BasicAer, QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import ParameterVector
+from qiskit.aqua.operators.converters.circuit_sampler import _CircuitBinder
 
 
 # pylint: disable=invalid-name
@@ -205,6 +207,50 @@ class TestPauliExpectation(QiskitAquaTestCase):
                                              [1, .5**.5, (1 + .5**.5), 1],
                                              decimal=1)
 
+    def test_parameterized_circuit_sampler(self):
+        """ Test the binding of many parameterizations of a transpiled circuit """
+        theta = ParameterVector('θ', 4)
+        circuit = QuantumCircuit(2)
+        circuit.ry(theta[0], 0)
+        circuit.ry(2 * theta[1] + theta[0], 1)
+        circuit.cx(0, 1)
+        circuit.rz(theta[2], 1)
+        circuit.rx(theta[3] - theta[2], 0)
+        observable = (Z ^ Z) + 0.5 * (X ^ I)
+        expect_op = self.expect.convert(~StateFn(observable) @ StateFn(circuit))
+
+        backend = BasicAer.get_backend('statevector_simulator')
+        sampler = CircuitSampler(QuantumInstance(backend))
+        values = np.random.RandomState(self.seed).uniform(-np.pi, np.pi, (5, 4))
+        for _ in range(2):
+            params = {param: list(values[:, i]) for i, param in enumerate(theta)}
+            sampled = sampler.convert(expect_op, params=params).eval()
+            expected = [(~StateFn(observable) @ StateFn(
+                circuit.assign_parameters(dict(zip(theta, row))))).eval() for row in values]
+            np.testing.assert_array_almost_equal(sampled, expected)
+            values = values[::-1]
+
+    def test_circuit_binder(self):
+        """ Test the bound circuits match assign_parameters and leave the template intact """
+        theta = ParameterVector('θ', 2)
+        template = QuantumCircuit(QuantumRegister(2, 'q'), ClassicalRegister(2, 'c'),
+                                  name='template', global_phase=0.3)
+        template.h(0)
+        template.ry(theta[0], 0)
+        template.crz(2 * theta[1], 0, 1)
+        template.measure([0, 1], [0, 1])
+        reference = template.copy()
+        bindings = [{theta[0]: 0.1, theta[1]: -0.4}, {theta[0]: 1.2, theta[1]: 0.5}]
+        bound = _CircuitBinder(template).bind(bindings)
+        for circuit, binding in zip(bound, bindings):
+            self.assertEqual(circuit, template.assign_parameters(binding))
+            self.assertEqual(circuit.name, 'template')
+            self.assertFalse(circuit.parameters)
+        bound[0].x(1)
+        bound[0].add_register(QuantumRegister(1, 'extra'))
+        self.assertEqual(template, reference)
+        self.assertEqual(set(template.parameters), set(theta))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,8 @@ from qiskit.circuit import ParameterVector
 from qiskit.quantum_info import Statevector
 
 from qiskit.aqua.operators import (StateFn, Zero, One, Plus, Minus, PrimitiveOp,
-                                   SummedOp, H, I, Z, X, Y, CX, CircuitStateFn, DictToCircuitSum)
+                                   SummedOp, H, I, Z, X, Y, CX, CircuitStateFn, DictToCircuitSum,
+                                   DictStateFn)
 
 
 # pylint: disable=invalid-name
@@ -201,6 +202,22 @@ class TestStateConstruction(QiskitAquaTestCase):
         self.assertEqual(bound.coeff, 0.3)
         self.assertEqual(bound.primitive.coeff, 0.2)
 
+    def test_pauli_eval_dict(self):
+        """ PauliOp and sum of PauliOps applied on a DictStateFn """
+        statedict = {'1011': .5, '0100': .1j, '0001': -.2, '1111': .5, '0110': .3}
+        dict_fn = StateFn(statedict)
+        paulis = [X ^ Y ^ Z ^ I, Z ^ Z ^ I ^ Y, 0.5 * (Y ^ Y ^ X ^ X), -1.5j * (I ^ I ^ I ^ I)]
+        vector = dict_fn.to_matrix()
+        for pauli in paulis:
+            np.testing.assert_array_almost_equal(pauli.eval(dict_fn).to_matrix(),
+                                                 pauli.to_matrix() @ vector)
+        pauli_sum = SummedOp(paulis, coeff=2.0)
+        result = pauli_sum.eval(dict_fn)
+        self.assertIsInstance(result, DictStateFn)
+        np.testing.assert_array_almost_equal(result.to_matrix(), pauli_sum.to_matrix() @ vector)
+        expectation = StateFn(pauli_sum, is_measurement=True).eval(dict_fn)
+        self.assertAlmostEqual(expectation, np.conj(vector) @ pauli_sum.to_matrix() @ vector)
+
 
 if __name__ == '__main__':
     unittest.main()
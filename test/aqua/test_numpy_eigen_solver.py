@@ -17,7 +17,7 @@ from test.aqua import QiskitAquaTestCase
 import numpy as np
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import NumPyEigensolver
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators import WeightedPauliOperator, I, X, Y, Z
 
 
 class TestNumPyEigensolver(QiskitAquaTestCase):
@@ -51,6 +51,38 @@ class TestNumPyEigensolver(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(result.eigenvalues.real,
                                              [-1.85727503, -1.24458455, -0.88272215, -0.22491125])
 
+    def test_ce_matrix_free(self):
+        """ Test sums of Paulis applied without their matrices """
+        qubit_op = (0.5 * (X ^ X ^ I ^ I) + 0.3 * (I ^ Y ^ Y ^ I) - 0.2 * (Z ^ I ^ I ^ Z)
+                    + 0.1 * (I ^ I ^ X ^ Z) - 0.4 * (Z ^ Z ^ Z ^ Z))
+        aux_operators = [Z ^ Z ^ I ^ I, None, 0.5 * (I ^ I ^ I ^ X)]
+        expected = NumPyEigensolver(qubit_op, k=3, aux_operators=aux_operators).run()
+        result = NumPyEigensolver(qubit_op, k=3, aux_operators=aux_operators,
+                                  matrix_free=True).run()
+        np.testing.assert_array_almost_equal(result.eigenvalues, expected.eigenvalues)
+        self.assertEqual(len(result.eigenstates), 3)
+        for values, expected_values in zip(result.aux_operator_eigenvalues,
+                                           expected.aux_operator_eigenvalues):
+            self.assertIsNone(values[1])
+            for i in [0, 2]:
+                np.testing.assert_array_almost_equal(values[i], expected_values[i])
+
+        # a diagonal operator
+        diagonal_op = (Z ^ I ^ I ^ I) + 0.5 * (Z ^ Z ^ I ^ I) - 0.25 * (I ^ I ^ I ^ Z)
+        expected = NumPyEigensolver(diagonal_op, k=3).run()
+        result = NumPyEigensolver(diagonal_op, k=3, matrix_free=True).run()
+        np.testing.assert_array_almost_equal(result.eigenvalues, expected.eigenvalues)
+
+    def test_ce_warm_start(self):
+        """ Test warm starts from the previous eigenvector along a scan """
+        algo = NumPyEigensolver(k=1, matrix_free=True, warm_start=True)
+        for strength in [0.1, 0.2, 0.3]:
+            qubit_op = (Z ^ Z ^ I) + (I ^ Z ^ Z) + strength * ((X ^ I ^ I) + (I ^ X ^ I)
+                                                               + (I ^ I ^ X))
+            expected = NumPyEigensolver(qubit_op).run()
+            result = algo.compute_eigenvalues(qubit_op)
+            np.testing.assert_array_almost_equal(result.eigenvalues, expected.eigenvalues)
+
     def test_ce_fail(self):
         """ Test no operator """
         algo = NumPyEigensolver()
@@ -0,0 +1,107 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test run_qobj """
+
+import threading
+import unittest
+from unittest.mock import patch
+import warnings
+from test.aqua import QiskitAquaTestCase
+
+from qiskit import BasicAer, QuantumCircuit, assemble, transpile
+from qiskit.test.mock import FakeVigo
+from qiskit.aqua import AquaError
+from qiskit.aqua.utils import run_circuits
+
+
+class TestRunCircuits(QiskitAquaTestCase):
+    """run_qobj tests."""
+
+    def setUp(self):
+        super().setUp()
+        # circuits with distinct deterministic outcomes
+        self.circuits = []
+        for i in range(7):
+            circuit = QuantumCircuit(3, 3)
+            for j in range(3):
+                if (i >> j) & 1:
+                    circuit.x(j)
+            circuit.measure(range(3), range(3))
+            self.circuits.append(circuit)
+        self.expected = [{'{:03b}'.format(i): 128} for i in range(7)]
+        warnings.filterwarnings('ignore', message='Aer not found')
+
+    def test_split_qobj(self):
+        """ test the results of the split qobj are combined in order """
+        backend = BasicAer.get_backend('qasm_simulator')
+        qobj = assemble(transpile(self.circuits, backend), shots=128)
+        with patch.object(run_circuits, 'MAX_CIRCUITS_PER_JOB', '2'):
+            result = run_circuits.run_qobj(qobj, backend)
+        self.assertEqual([result.get_counts(i) for i in range(7)], self.expected)
+
+    def test_autorecover_pipeline(self):
+        """ test the pipelined jobs on a non-simulator backend """
+        statuses = []
+
+        def callback(job_id, job_status, queue_position, job):
+            # pylint: disable=unused-argument
+            statuses.append(job_status)
+
+        qobj = assemble(transpile(self.circuits, FakeVigo()), shots=128)
+        with patch.object(run_circuits, 'MAX_CIRCUITS_PER_JOB', '2'), \
+                patch.object(run_circuits, 'MAX_JOBS_IN_FLIGHT', '2'):
+            result = run_circuits.run_qobj(qobj, FakeVigo(), job_callback=callback)
+        self.assertTrue(result.success)
+        self.assertEqual([result.get_counts(i) for i in range(7)], self.expected)
+        self.assertEqual(statuses.count(run_circuits.JobStatus.DONE), 4)
+
+    def test_autorecover_stop(self):
+        """ test the running jobs are no longer polled once a job failed """
+        threads = set()
+        polled = threading.Event()
+        first_name = self.circuits[0].name
+
+        def job_status(job, job_id, max_wait=5, stop_event=None):
+            # pylint: disable=unused-argument
+            if job.qobj().experiments[0].header.name == first_name:
+                # fail once the other job is being polled
+                polled.wait(10)
+                raise AquaError('status failure')
+            threads.add(threading.current_thread())
+            polled.set()
+            return run_circuits.JobStatus.RUNNING
+
+        qobj = assemble(transpile(self.circuits, FakeVigo()), shots=128)
+        with patch.object(run_circuits, 'MAX_CIRCUITS_PER_JOB', '2'), \
+                patch.object(run_circuits, 'MAX_JOBS_IN_FLIGHT', '2'), \
+                patch.object(run_circuits, '_safe_get_job_status', side_effect=job_status):
+            with self.assertRaises(AquaError):
+                run_circuits.run_qobj(qobj, FakeVigo(), qjob_config={'wait': 60})
+        self.assertTrue(threads)
+        for thread in threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+
+    def test_combine_results(self):
+        """ test the results of the jobs are not modified when they are combined """
+        backend = BasicAer.get_backend('qasm_simulator')
+        circuits = transpile(self.circuits, backend)
+        first = backend.run(assemble(circuits[:2], shots=128)).result()
+        second = backend.run(assemble(circuits[2:], shots=128)).result()
+        combined = run_circuits._combine_result_objects(first, second)
+        self.assertEqual(len(first.results), 2)
+        self.assertEqual([combined.get_counts(i) for i in range(7)], self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
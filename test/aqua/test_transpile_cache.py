@@ -0,0 +1,119 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the transpile cache of QuantumInstance """
+
+import os
+import tempfile
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import CXGate
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.utils import circuit_fingerprint, TranspileCache, atomic_write
+
+
+class TestTranspileCache(QiskitAquaTestCase):
+    """Transpile cache tests."""
+
+    def _circuit(self, name='a'):
+        theta = Parameter(name)
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 2)
+        circuit.rz(2 * theta, 2)
+        circuit.measure_all()
+        return circuit
+
+    def test_fingerprint(self):
+        """ test structurally equal circuits share a fingerprint """
+        circuit = self._circuit()
+        self.assertEqual(circuit_fingerprint(circuit), circuit_fingerprint(self._circuit()))
+        self.assertNotEqual(circuit_fingerprint(circuit), circuit_fingerprint(self._circuit('b')))
+        other = self._circuit()
+        other.x(1)
+        self.assertNotEqual(circuit_fingerprint(circuit), circuit_fingerprint(other))
+        # open controls do not change the name of the gate
+        closed, open_control = QuantumCircuit(2), QuantumCircuit(2)
+        closed.cx(0, 1)
+        open_control.append(CXGate(ctrl_state=0), [0, 1])
+        self.assertNotEqual(circuit_fingerprint(closed), circuit_fingerprint(open_control))
+
+    def test_quantum_instance_cache(self):
+        """ test transpiled circuits are reused with the names and parameters of the input """
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'),
+                                           coupling_map=[[0, 1], [1, 2]],
+                                           basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                           seed_transpiler=50,
+                                           transpile_cache_size=128)
+        first = quantum_instance.transpile(self._circuit())[0]
+        circuit = self._circuit()
+        circuit.name = 'other'
+        second, third = quantum_instance.transpile([circuit, circuit])
+        self.assertEqual(quantum_instance.transpile_cache.hits, 2)
+        self.assertEqual(quantum_instance.transpile_cache.misses, 1)
+        self.assertEqual(second.name, 'other')
+        self.assertEqual(set(second.parameters), set(circuit.parameters))
+        self.assertEqual(second, third)
+        self.assertIsNot(second, third)
+        self.assertEqual(second.assign_parameters({list(circuit.parameters)[0]: 1.0}),
+                         first.assign_parameters({list(first.parameters)[0]: 1.0}))
+
+        # the cache keys include the transpiler settings
+        quantum_instance.set_config(optimization_level=0)
+        quantum_instance.transpile(circuit)
+        self.assertEqual(quantum_instance.transpile_cache.misses, 2)
+
+        disabled = QuantumInstance(BasicAer.get_backend('qasm_simulator'))
+        self.assertIsNone(disabled.transpile_cache)
+
+    def test_cache_dir(self):
+        """ test the eviction of the cache and the reuse of its directory """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TranspileCache(max_size=1, cache_dir=cache_dir)
+            first, second = self._circuit(), QuantumCircuit(1)
+            cache.put('first', first)
+            cache.put('second', second)
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.get('first', first), first)
+            self.assertEqual(cache.stats()['disk_hits'], 1)
+
+            quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                               transpile_cache_size=128,
+                                               transpile_cache_dir=cache_dir)
+            quantum_instance.transpile(self._circuit())
+            other = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                    transpile_cache_size=128, transpile_cache_dir=cache_dir)
+            other.transpile(self._circuit())
+            self.assertEqual(other.transpile_cache.disk_hits, 1)
+            self.assertEqual(other.transpile_cache.misses, 0)
+
+    def test_atomic_write(self):
+        """ test a failed write leaves the previous file and no temporary file """
+        def failing_writer(file):
+            file.write(b'partial')
+            raise ValueError('failure')
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, 'file')
+            atomic_write(path, lambda file: file.write(b'content'))
+            with self.assertRaises(ValueError):
+                atomic_write(path, failing_writer)
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), b'content')
+            self.assertListEqual(os.listdir(cache_dir), ['file'])
+
+
+if __name__ == '__main__':
+    unittest.main()
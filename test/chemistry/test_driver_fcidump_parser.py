@@ -0,0 +1,115 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test FCIDump parser and dumper """
+
+import os
+import tempfile
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+from ddt import ddt, data
+from qiskit.chemistry import QiskitChemistryError
+from qiskit.chemistry.drivers.fcidumpd.dumper import dump
+from qiskit.chemistry.drivers.fcidumpd.parser import parse, FCIDumpIntegrals
+
+
+def _random_integrals(norb, rng, same_spin=True):
+    hij = rng.uniform(-1, 1, (norb, norb))
+    hijkl = rng.uniform(-1, 1, (norb, norb, norb, norb))
+    hijkl = hijkl + hijkl.transpose(1, 0, 2, 3)
+    hijkl = hijkl + hijkl.transpose(0, 1, 3, 2)
+    if same_spin:
+        hij = hij + hij.T
+        hijkl = hijkl + hijkl.transpose(2, 3, 0, 1)
+    return hij, hijkl
+
+
+@ddt
+class TestFCIDumpParser(QiskitChemistryTestCase):
+    """ FCIDump parser and dumper tests """
+
+    def setUp(self):
+        super().setUp()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._tmp_dir.name, 'test.fcidump')
+
+    def tearDown(self):
+        super().tearDown()
+        self._tmp_dir.cleanup()
+
+    def _write(self, lines):
+        with open(self._path, 'w') as file:
+            file.write('&FCI NORB=2,NELEC=2,MS2=0,\n ORBSYM=1,1,\n ISYM=1,\n&END\n')
+            file.write('\n'.join(lines) + '\n')
+
+    @data(False, True)
+    def test_round_trip(self, uhf):
+        """ the dumped integrals are parsed back, densely or sparsely """
+        rng = np.random.RandomState(11)
+        hij, hijkl = _random_integrals(4, rng)
+        hij_b = hijkl_ba = hijkl_bb = None
+        if uhf:
+            hij_b, hijkl_bb = _random_integrals(4, rng)
+            _, hijkl_ba = _random_integrals(4, rng, same_spin=False)
+        hijkl[hijkl < 0] = 0.0
+        dump(self._path, 4, 3, (hij, hij_b), (hijkl, hijkl_ba, hijkl_bb), -1.5, ms2=1)
+        dense = parse(self._path)
+        sparse = parse(self._path, dense=False, chunk_size=64)
+        self.assertEqual(dense['NORB'], 4)
+        self.assertEqual(dense['NELEC'], 3)
+        self.assertEqual(dense['MS2'], 1)
+        self.assertAlmostEqual(dense['ecore'], -1.5)
+        expected = {'hij': hij, 'hij_b': hij_b, 'hijkl': hijkl, 'hijkl_ba': hijkl_ba,
+                    'hijkl_bb': hijkl_bb}
+        for key, value in expected.items():
+            if value is None:
+                self.assertIsNone(dense[key])
+                self.assertIsNone(sparse[key])
+                continue
+            np.testing.assert_array_almost_equal(dense[key], value)
+            self.assertIsInstance(sparse[key], FCIDumpIntegrals)
+            np.testing.assert_array_equal(sparse[key].to_dense(), dense[key])
+        # only the symmetry-unique nonzero elements are kept
+        self.assertEqual(len(sparse['hij']), 10)
+        self.assertLessEqual(len(sparse['hijkl']), 55)
+
+    def test_redundant_entries(self):
+        """ entries repeating the value of their symmetry class are dropped, others kept """
+        self._write(['1.0D+00 1 2 1 1', '1.0D+00 2 1 1 1', '1.0D+00 1 1 2 1',
+                     '0.5 1 2 2 2', '0.25 2 1 2 2', '3.0 2 2 2 2', '9.0 2 2 2 2',
+                     '0.1 1 2 0 0', '0.2 2 1 0 0', '0.7 1 0 0 0', '2.0 0 0 0 0'])
+        output = parse(self._path, dense=False)
+        self.assertEqual(output['ecore'], 2.0)
+        self.assertEqual(len(output['hijkl']), 4)
+        hijkl = output['hijkl'].to_dense()
+        self.assertEqual(hijkl[1, 0, 0, 0], 1.0)
+        self.assertEqual(hijkl[0, 1, 1, 1], 0.5)
+        self.assertEqual(hijkl[1, 0, 1, 1], 0.25)
+        self.assertEqual(hijkl[1, 1, 1, 1], 9.0)
+        np.testing.assert_array_equal(output['hij'].to_dense(), [[0.0, 0.1], [0.2, 0.0]])
+
+    def test_malformed_line(self):
+        """ a malformed line raises an error """
+        self._write(['1.0 1 1 1 1', '1.0 1 1 1', '2.0 0 0 0 0'])
+        with self.assertRaises(QiskitChemistryError):
+            parse(self._path)
+
+    def test_unknown_indices(self):
+        """ indices out of range raise an error """
+        self._write(['1.0 1 1 3 1', '2.0 0 0 0 0'])
+        with self.assertRaises(QiskitChemistryError):
+            parse(self._path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,5 +27,15 @@ class TestDriverHDF5(QiskitChemistryTestCase, TestDriver):
         self.qmolecule = driver.run()
 
 
+class TestDriverHDF5Lazy(QiskitChemistryTestCase, TestDriver):
+    """HDF5 Driver lazy loading tests."""
+
+    def setUp(self):
+        super().setUp()
+        driver = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5'),
+                            lazy=True)
+        self.qmolecule = driver.run()
+
+
 if __name__ == '__main__':
     unittest.main()
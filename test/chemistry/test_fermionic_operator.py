@@ -13,13 +13,16 @@
 """ Test Fermionic Operator """
 
 import copy
+import itertools
 import unittest
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
+from ddt import ddt, data
 from qiskit.aqua.utils import random_unitary
+from qiskit.aqua.operators import WeightedPauliOperator
 from qiskit.aqua.operators.legacy import op_converter
 from qiskit.chemistry import FermionicOperator, QiskitChemistryError
-from qiskit.chemistry.drivers import PySCFDriver, UnitsType
+from qiskit.chemistry.drivers import PySCFDriver, UnitsType, HDF5Driver
 
 
 def h2_transform_slow(h2_, unitary_matrix):
@@ -54,6 +57,64 @@ def h2_transform_slow(h2_, unitary_matrix):
     return temp_ret
 
 
+def mapping_slow(fer_op, map_type, threshold=0.00000001):
+    """
+    Map fermionic operator to qubit operator term by term.
+    Args:
+        fer_op (FermionicOperator): the operator to map
+        map_type (str): "jordan_wigner", "parity" or "bravyi_kitaev"
+        threshold (float): threshold for Pauli simplification
+    Returns:
+        WeightedPauliOperator: the qubit operator
+    """
+    # pylint: disable=protected-access
+    n = fer_op.modes
+    a_list = {'jordan_wigner': fer_op._jordan_wigner_mode,
+              'parity': fer_op._parity_mode,
+              'bravyi_kitaev': fer_op._bravyi_kitaev_mode}[map_type](n)
+    pauli_list = WeightedPauliOperator(paulis=[])
+    for i, j in itertools.product(range(n), repeat=2):
+        if fer_op.h1[i, j] != 0:
+            pauli_list += FermionicOperator._one_body_mapping(
+                (fer_op.h1[i, j], a_list[i], a_list[j]), threshold)
+    pauli_list.chop(threshold=threshold)
+    for i, j, k, m in itertools.product(range(n), repeat=4):
+        if fer_op.h2[i, j, k, m] != 0:
+            pauli_list += FermionicOperator._two_body_mapping(
+                (fer_op.h2[i, j, k, m], a_list[i], a_list[j], a_list[k], a_list[m]), threshold)
+    pauli_list.chop(threshold=threshold)
+    return pauli_list
+
+
+@ddt
+class TestFermionicOperatorMapping(QiskitChemistryTestCase):
+    """Fermionic Operator mapping tests."""
+
+    def assert_same_paulis(self, qubit_op, reference_op):
+        """ check the Paulis are the same and in the same order """
+        self.assertListEqual([pauli for _, pauli in qubit_op.paulis],
+                             [pauli for _, pauli in reference_op.paulis])
+        np.testing.assert_array_almost_equal([weight for weight, _ in qubit_op.paulis],
+                                             [weight for weight, _ in reference_op.paulis])
+
+    @data('jordan_wigner', 'parity', 'bravyi_kitaev')
+    def test_mapping(self, map_type):
+        """ mapping test against the term by term mapping """
+        driver = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5'))
+        molecule = driver.run()
+        fer_op = FermionicOperator(h1=molecule.one_body_integrals,
+                                   h2=molecule.two_body_integrals)
+        self.assert_same_paulis(fer_op.mapping(map_type), mapping_slow(fer_op, map_type))
+
+        rng = np.random.RandomState(5)
+        h_1 = rng.rand(5, 5) * (rng.rand(5, 5) > 0.3)
+        h_2 = rng.rand(5, 5, 5, 5) * (rng.rand(5, 5, 5, 5) > 0.7)
+        fer_op = FermionicOperator(h1=h_1 + h_1.T, h2=h_2)
+        self.assert_same_paulis(fer_op.mapping(map_type), mapping_slow(fer_op, map_type))
+        self.assert_same_paulis(fer_op.mapping(map_type, threshold=0.05),
+                                mapping_slow(fer_op, map_type, threshold=0.05))
+
+
 class TestFermionicOperator(QiskitChemistryTestCase):
     """Fermionic Operator tests."""
 
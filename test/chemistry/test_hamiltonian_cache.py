@@ -0,0 +1,110 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Hamiltonian Cache """
+
+import os
+import tempfile
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+from ddt import ddt, data, unpack
+from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.core import (Hamiltonian, HamiltonianCache,
+                                   TransformationType, QubitMappingType)
+
+
+@ddt
+class TestHamiltonianCache(QiskitChemistryTestCase):
+    """ Hamiltonian cache tests """
+
+    def setUp(self):
+        super().setUp()
+        driver = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5'))
+        self.qmolecule = driver.run()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self._tmp_dir.name, 'cache')
+
+    def tearDown(self):
+        super().tearDown()
+        self._tmp_dir.cleanup()
+
+    def _assert_equal_ops(self, op_1, op_2):
+        self.assertEqual(op_1 is None, op_2 is None)
+        if op_1 is None:
+            return
+        self.assertEqual(op_1.num_qubits, op_2.num_qubits)
+        self.assertEqual(op_1.print_details(), op_2.print_details())
+        self.assertEqual(str(op_1.z2_symmetries), str(op_2.z2_symmetries))
+
+    @data((QubitMappingType.JORDAN_WIGNER, False, None),
+          (QubitMappingType.PARITY, True, None),
+          (QubitMappingType.JORDAN_WIGNER, False, 'auto'))
+    @unpack
+    def test_hit(self, qubit_mapping, two_qubit_reduction, z2symmetry_reduction):
+        """ the cached operators are the computed ones """
+        cache = HamiltonianCache(self.cache_dir)
+
+        def run():
+            core = Hamiltonian(transformation=TransformationType.FULL,
+                               qubit_mapping=qubit_mapping,
+                               two_qubit_reduction=two_qubit_reduction,
+                               freeze_core=False,
+                               orbital_reduction=[],
+                               z2symmetry_reduction=z2symmetry_reduction,
+                               cache=cache)
+            qubit_op, aux_ops = core.run(self.qmolecule)
+            return core, qubit_op, aux_ops
+
+        core, qubit_op, aux_ops = run()
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        cached_core, cached_qubit_op, cached_aux_ops = run()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        self._assert_equal_ops(qubit_op, cached_qubit_op)
+        self.assertEqual(len(aux_ops), len(cached_aux_ops))
+        for aux_op, cached_aux_op in zip(aux_ops, cached_aux_ops):
+            self._assert_equal_ops(aux_op, cached_aux_op)
+
+        z2symmetries = core.molecule_info.pop('z2symmetries')
+        cached_z2symmetries = cached_core.molecule_info.pop('z2symmetries')
+        self.assertEqual(str(z2symmetries), str(cached_z2symmetries))
+        self.assertEqual(z2symmetries.tapering_values, cached_z2symmetries.tapering_values)
+        self.assertEqual(core.molecule_info, cached_core.molecule_info)
+        self.assertAlmostEqual(core._energy_shift, cached_core._energy_shift)
+        self.assertAlmostEqual(core._ph_energy_shift, cached_core._ph_energy_shift)
+        self.assertAlmostEqual(core._hf_energy, cached_core._hf_energy)
+
+    def test_key(self):
+        """ the key depends on the settings and on the integrals """
+        settings = {'qubit_mapping': 'parity'}
+        key = HamiltonianCache.key(self.qmolecule, settings)
+        self.assertEqual(key, HamiltonianCache.key(self.qmolecule, dict(settings)))
+        self.assertNotEqual(key, HamiltonianCache.key(self.qmolecule, {'qubit_mapping': 'bk'}))
+        self.qmolecule.mo_onee_ints = self.qmolecule.mo_onee_ints + 1e-9
+        self.assertNotEqual(key, HamiltonianCache.key(self.qmolecule, settings))
+
+    def test_evict(self):
+        """ the least recently used entries are removed """
+        cache = HamiltonianCache(self.cache_dir, max_bytes=1)
+        for qubit_mapping in (QubitMappingType.JORDAN_WIGNER, QubitMappingType.PARITY):
+            core = Hamiltonian(qubit_mapping=qubit_mapping, two_qubit_reduction=False,
+                               freeze_core=False, cache=cache)
+            core.run(self.qmolecule)
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['misses'], 2)
+        cache.clear()
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,11 +12,46 @@
 
 """ Test Particle Hole """
 
+import unittest
 from test.chemistry import QiskitChemistryTestCase
-from ddt import ddt, idata, unpack
+import numpy as np
+from ddt import ddt, data, idata, unpack
 from qiskit.aqua.algorithms import NumPyMinimumEigensolver
 from qiskit.chemistry import FermionicOperator, QiskitChemistryError
-from qiskit.chemistry.drivers import PySCFDriver, UnitsType, HFMethodType
+from qiskit.chemistry.drivers import (PySCFDriver, UnitsType, HFMethodType,
+                                      HDF5Driver, FCIDumpDriver)
+from qiskit.chemistry.particle_hole import (particle_hole_transformation,
+                                            normal_order_integrals)
+
+
+def _reference_ph_transform(n_qubits, num_particles, h1_old, h2_old):
+    """ the transformation normal ordering each index tuple in turn """
+    h1_new_sum = np.zeros([n_qubits, n_qubits])
+    h2_new_sum = np.zeros([n_qubits, n_qubits, n_qubits, n_qubits])
+    h2_old = np.einsum('IJKL->IKLJ', -2 * h2_old)
+    h1_old = h1_old.copy()
+    n_occupied = [2 * i for i in range(num_particles[0])] + \
+        [2 * i + 1 for i in range(num_particles[1])]
+    for r in range(n_qubits):
+        for s in range(n_qubits):  # pylint: disable=invalid-name
+            for i in n_occupied:
+                h1_old[r][s] += h2_old[r][i][s][i] - h2_old[r][i][i][s]
+    identities = 0
+    for indices in np.ndindex(n_qubits, n_qubits):
+        h1_new, h2_new, identity = normal_order_integrals(
+            n_qubits, n_occupied, list(indices), ['adag', 'a'], h1_old, h2_old,
+            np.zeros([n_qubits] * 2), np.zeros([n_qubits] * 4))
+        h1_new_sum += h1_new
+        h2_new_sum += h2_new
+        identities += identity
+    for indices in np.ndindex(n_qubits, n_qubits, n_qubits, n_qubits):
+        h1_new, h2_new, identity = normal_order_integrals(
+            n_qubits, n_occupied, list(indices), ['adag', 'adag', 'a', 'a'], h1_old, h2_old,
+            np.zeros([n_qubits] * 2), np.zeros([n_qubits] * 4))
+        h1_new_sum += h1_new
+        h2_new_sum += h2_new
+        identities += identity
+    return h1_new_sum, np.einsum('IKMJ->IJKM', h2_new_sum), identities
 
 
 @ddt
@@ -77,3 +112,25 @@ class TestParticleHole(QiskitChemistryTestCase):
 
         self.assertAlmostEqual(result.eigenvalue.real,
                                ph_result.eigenvalue.real - ph_shift, msg=config)
+
+    @data('test_driver_hdf5.hdf5', 'test_driver_fcidump_lih.fcidump',
+          'test_driver_fcidump_oh.fcidump')
+    def test_particle_hole_regression(self, file_name):
+        """ particle hole transformation against the term by term normal ordering """
+        path = self.get_resource_path(file_name)
+        driver = HDF5Driver(path) if file_name.endswith('.hdf5') else FCIDumpDriver(path)
+        molecule = driver.run()
+        fer_op = FermionicOperator(h1=molecule.one_body_integrals, h2=molecule.two_body_integrals)
+        num_particles = [molecule.num_alpha, molecule.num_beta]
+
+        h_1, h_2, energy_shift = particle_hole_transformation(fer_op.modes, num_particles,
+                                                              fer_op.h1, fer_op.h2)
+        ref_h_1, ref_h_2, ref_energy_shift = _reference_ph_transform(
+            fer_op.modes, num_particles, fer_op.h1, fer_op.h2)
+        np.testing.assert_array_almost_equal(h_1, ref_h_1)
+        np.testing.assert_array_almost_equal(h_2, ref_h_2)
+        self.assertAlmostEqual(energy_shift, ref_energy_shift)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the commutators and the matrices of the equation of motion """
+
+import unittest
+
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+from ddt import ddt, data
+
+from qiskit import BasicAer, QuantumCircuit, QuantumRegister
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.algorithms import NumPyEigensolver
+from qiskit.aqua.operators import Z2Symmetries, commutator
+from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.core import Hamiltonian, QubitMappingType
+from qiskit.chemistry.algorithms import QEomEE
+from qiskit.chemistry.algorithms.eigen_solvers.q_equation_of_motion import QEquationOfMotion
+
+
+def _to_dict(operator):
+    return {pauli.to_label(): weight for weight, pauli in operator.paulis}
+
+
+@ddt
+class TestQEomCommutators(QiskitChemistryTestCase):
+    """ Test the commutators and the matrices of the equation of motion """
+
+    def setUp(self):
+        super().setUp()
+        driver = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5'))
+        molecule = driver.run()
+        core = Hamiltonian(qubit_mapping=QubitMappingType.JORDAN_WIGNER,
+                           two_qubit_reduction=False, freeze_core=False)
+        self.qubit_op, _ = core.run(molecule)
+        self.num_orbitals = core.molecule_info['num_orbitals']
+        self.num_particles = core.molecule_info['num_particles']
+        self.z2_symmetries = Z2Symmetries.find_Z2_symmetries(self.qubit_op)
+        self.tapered_op = self.z2_symmetries.taper(self.qubit_op)[5]
+
+    def _build_eom(self, tapered):
+        if tapered:
+            return QEquationOfMotion(self.tapered_op, self.num_orbitals, self.num_particles,
+                                     qubit_mapping='jordan_wigner',
+                                     z2_symmetries=self.tapered_op.z2_symmetries,
+                                     untapered_op=self.qubit_op)
+        return QEquationOfMotion(self.qubit_op, self.num_orbitals, self.num_particles,
+                                 qubit_mapping='jordan_wigner')
+
+    @data(False, True)
+    def test_commutators(self, tapered):
+        """ the commutators are the ones of the legacy operators """
+        eom = self._build_eom(tapered)
+        excitations_list = eom._de_list + eom._se_list
+        hopping_operators, type_of_commutativities = \
+            eom.build_hopping_operators(excitations_list)
+        q_commutators, w_commutators, m_commutators, v_commutators, _ = \
+            eom.build_all_commutators(excitations_list, hopping_operators,
+                                      type_of_commutativities)
+
+        def _key(excitations):
+            return '_'.join([str(x) for x in excitations])
+
+        def _assert_commutator(actual, expected):
+            if not expected.is_empty() and tapered:
+                expected = self.tapered_op.z2_symmetries.taper(expected)
+            if expected.is_empty():
+                self.assertIsNone(actual)
+                return
+            actual, expected = _to_dict(actual), _to_dict(expected)
+            self.assertEqual(sorted(actual), sorted(expected))
+            for label, weight in expected.items():
+                self.assertAlmostEqual(actual[label], weight)
+
+        num_checked = 0
+        for m_u, n_u in zip(*np.triu_indices(len(excitations_list))):
+            left = hopping_operators[_key(excitations_list[m_u])]
+            right_1 = hopping_operators[_key(excitations_list[n_u])]
+            right_2 = hopping_operators[_key(reversed(excitations_list[n_u]))]
+            if tapered and (type_of_commutativities[_key(excitations_list[m_u])]
+                            != type_of_commutativities[_key(excitations_list[n_u])]):
+                continue
+            _assert_commutator(q_commutators[m_u][n_u],
+                               commutator(left, self.qubit_op, right_1))
+            _assert_commutator(w_commutators[m_u][n_u], commutator(left, right_1))
+            _assert_commutator(m_commutators[m_u][n_u],
+                               commutator(left, self.qubit_op, right_2))
+            _assert_commutator(v_commutators[m_u][n_u], commutator(left, right_2))
+            num_checked += 1
+        self.assertGreater(num_checked, 0)
+
+    @data(False, True)
+    def test_excitation_energies(self, tapered):
+        """ the excitation energies are the eigenvalues of the Hamiltonian """
+        core = Hamiltonian(qubit_mapping=QubitMappingType.PARITY, two_qubit_reduction=True,
+                           freeze_core=False)
+        qubit_op, _ = core.run(HDF5Driver(
+            hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5')).run())
+        reference = NumPyEigensolver(qubit_op, k=2 ** qubit_op.num_qubits).run()
+        if tapered:
+            eom_ee = QEomEE(self.tapered_op, num_orbitals=self.num_orbitals,
+                            num_particles=self.num_particles, qubit_mapping='jordan_wigner',
+                            two_qubit_reduction=False,
+                            z2_symmetries=self.tapered_op.z2_symmetries,
+                            untapered_op=self.qubit_op)
+        else:
+            eom_ee = QEomEE(self.qubit_op, num_orbitals=self.num_orbitals,
+                            num_particles=self.num_particles, qubit_mapping='jordan_wigner',
+                            two_qubit_reduction=False)
+        result = eom_ee.run()
+        np.testing.assert_array_almost_equal(reference.eigenvalues.real, result['energies'])
+
+    def test_eom_matrices(self):
+        """ the matrices measured with a quantum instance """
+        eom = self._build_eom(False)
+        excitations_list = eom._de_list + eom._se_list
+        commutators = eom.build_all_commutators(excitations_list,
+                                                *eom.build_hopping_operators(excitations_list))
+        # a superposition of the Hartree-Fock state and of a double excitation
+        wave_fn = QuantumCircuit(QuantumRegister(4, 'q'))
+        wave_fn.ry(0.4, 0)
+        wave_fn.x(1)
+        wave_fn.cx(0, 1)
+        wave_fn.cx(0, 2)
+        wave_fn.cx(0, 3)
+        wave_fn.x(0)
+        wave_fn.x(2)
+        statevector = BasicAer.get_backend('statevector_simulator')
+        state = QuantumInstance(statevector).execute(wave_fn).get_statevector(wave_fn)
+
+        expected = eom.build_eom_matrices(excitations_list, *commutators, state)
+        actual = eom.build_eom_matrices(excitations_list, *commutators, wave_fn,
+                                        QuantumInstance(statevector))
+        for actual_mat, expected_mat in zip(actual[:4], expected[:4]):
+            np.testing.assert_array_almost_equal(actual_mat, expected_mat)
+        self.assertTrue(np.any(np.abs(expected[0]) > 1e-3))
+
+        qasm = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=8192,
+                               seed_simulator=7, seed_transpiler=7)
+        actual = eom.build_eom_matrices(excitations_list, *commutators, wave_fn, qasm)
+        # the weights of the double commutators are large, so is the shot noise
+        for actual_mat, expected_mat in zip(actual[:4], expected[:4]):
+            np.testing.assert_allclose(actual_mat, expected_mat, atol=0.5)
+        self.assertGreater(np.abs(actual[4]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
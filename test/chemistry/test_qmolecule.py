@@ -0,0 +1,167 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test QMolecule integral transformations """
+
+import os
+import tempfile
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+import h5py
+from qiskit.chemistry import QMolecule
+
+
+def _reference_twoe_to_spin(mohijkl, mohijkl_bb, mohijkl_ba, threshold=1E-12):
+    """ the element by element conversion to spin orbitals """
+    ints_aa = np.einsum('ijkl->ljik', mohijkl)
+    ints_bb = np.einsum('ijkl->ljik', mohijkl_bb)
+    ints_ba = np.einsum('ijkl->ljik', mohijkl_ba)
+    ints_ab = np.einsum('ijkl->ljik', mohijkl_ba.transpose())
+    norbs = mohijkl.shape[0]
+    nspin_orbs = 2 * norbs
+    moh2_qubit = np.zeros([nspin_orbs] * 4)
+    for index in np.ndindex(*moh2_qubit.shape):
+        spinp, spinq, spinr, spins = (idx // norbs for idx in index)
+        if spinp == spins and spinq == spinr:
+            ints = {(0, 0): ints_aa, (0, 1): ints_ba,
+                    (1, 0): ints_ab, (1, 1): ints_bb}[(spinp, spinq)]
+            orbs = tuple(idx % norbs for idx in index)
+            if abs(ints[orbs]) > threshold:
+                moh2_qubit[index] = -0.5 * ints[orbs]
+    return moh2_qubit
+
+
+class TestQMolecule(QiskitChemistryTestCase):
+    """ QMolecule integral transformation tests """
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.RandomState(7)
+        self.norbs = 6
+        eri = rng.rand(*[self.norbs] * 4)
+        eri = eri + eri.transpose(1, 0, 2, 3)
+        eri = eri + eri.transpose(0, 1, 3, 2)
+        self.eri = eri + eri.transpose(2, 3, 0, 1)
+        self.moc = rng.rand(self.norbs, self.norbs)
+        self.moc_b = rng.rand(self.norbs, self.norbs)
+        self.reference = np.einsum('pqrs,pi,qj,rk,sl->ijkl',
+                                   self.eri, self.moc, self.moc, self.moc, self.moc)
+
+    def test_twoeints2mo(self):
+        """ test the transformation of integrals with and without 8-fold symmetry """
+        np.testing.assert_array_almost_equal(QMolecule.twoeints2mo(self.eri, self.moc),
+                                             self.reference)
+        eri = self.eri + np.random.RandomState(3).rand(*self.eri.shape)
+        np.testing.assert_array_almost_equal(
+            QMolecule.twoeints2mo(eri, self.moc),
+            np.einsum('pqrs,pi,qj,rk,sl->ijkl', eri, self.moc, self.moc, self.moc, self.moc))
+        np.testing.assert_array_almost_equal(
+            QMolecule.twoeints2mo_general(self.eri, self.moc_b, self.moc_b, self.moc, self.moc),
+            np.einsum('pqrs,pi,qj,rk,sl->ijkl',
+                      self.eri, self.moc_b, self.moc_b, self.moc, self.moc))
+        # fewer molecular orbitals than atomic orbitals
+        moc = self.moc[:, :4]
+        np.testing.assert_array_almost_equal(
+            QMolecule.twoeints2mo(self.eri, moc),
+            np.einsum('pqrs,pi,qj,rk,sl->ijkl', self.eri, moc, moc, moc, moc))
+
+    def test_twoeints2mo_blocks(self):
+        """ test the transformation streamed block by block """
+        np.testing.assert_array_almost_equal(
+            QMolecule.twoeints2mo(self.eri, self.moc, block_size=4), self.reference)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'eri_mo.npy')
+            QMolecule.twoeints2mo(self.eri, self.moc, block_size=4, out=file_name)
+            np.testing.assert_array_almost_equal(np.load(file_name), self.reference)
+
+            with h5py.File(os.path.join(tmp_dir, 'eri_mo.hdf5'), 'w') as file:
+                dataset = file.create_dataset('eri_mo', shape=self.reference.shape, dtype='f8')
+                QMolecule.twoeints2mo(self.eri, self.moc, block_size=5, out=dataset)
+                np.testing.assert_array_almost_equal(dataset[()], self.reference)
+
+    def test_to_spin(self):
+        """ test the conversion of integrals to spin orbitals """
+        rng = np.random.RandomState(11)
+        ints_aa, ints_bb, ints_ba = rng.rand(3, 3, 3, 3, 3) - 0.5
+        # without beta integrals, the alpha ones are used for all spins
+        ints_restricted = ints_aa + ints_aa.transpose()
+        for threshold in (1E-12, 0.2):
+            np.testing.assert_array_equal(
+                QMolecule.twoe_to_spin(ints_aa, ints_bb, ints_ba, threshold=threshold),
+                _reference_twoe_to_spin(ints_aa, ints_bb, ints_ba, threshold=threshold))
+            np.testing.assert_array_equal(
+                QMolecule.twoe_to_spin(ints_restricted, threshold=threshold),
+                _reference_twoe_to_spin(ints_restricted, ints_restricted, ints_restricted,
+                                        threshold=threshold))
+
+        h1_a, h1_b = rng.rand(2, 3, 3) - 0.5
+        expected = np.zeros((6, 6))
+        expected[:3, :3] = np.where(np.abs(h1_a) > 0.2, h1_a, 0)
+        expected[3:, 3:] = np.where(np.abs(h1_b) > 0.2, h1_b, 0)
+        np.testing.assert_array_equal(QMolecule.onee_to_spin(h1_a, h1_b, threshold=0.2),
+                                      expected)
+
+    def test_lazy_load(self):
+        """ test the lazy loading of the fields, their blocks and the packed layouts """
+        qmolecule = QMolecule()
+        qmolecule.num_atoms = 1
+        qmolecule.atom_symbol = ['H']
+        qmolecule.atom_xyz = np.zeros((1, 3))
+        qmolecule.num_orbitals = self.norbs
+        qmolecule.mo_coeff = self.moc
+        qmolecule.mo_onee_ints = self.moc + self.moc.T
+        qmolecule.mo_eri_ints = self.reference
+        # (ij|kl) = (ji|kl) = (ij|lk), without the exchange of the pairs
+        eri_ba = np.random.RandomState(5).rand(*self.reference.shape)
+        eri_ba = eri_ba + eri_ba.transpose(1, 0, 2, 3)
+        eri_ba = eri_ba + eri_ba.transpose(0, 1, 3, 2)
+        qmolecule.mo_eri_ints_ba = eri_ba
+        orbitals = [4, 1, 2]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for compression, pack_symmetric in [(None, False), ('gzip', False), (None, True)]:
+                file_name = os.path.join(tmp_dir, 'molecule.hdf5')
+                qmolecule.save(file_name, compression=compression,
+                               pack_symmetric=pack_symmetric)
+                with h5py.File(file_name, 'r') as file:
+                    self.assertEqual(file['integrals/mo_eri_ints'].attrs.get('packing'),
+                                     '8fold' if pack_symmetric else None)
+                    self.assertEqual(file['integrals/mo_eri_ints_BA'].attrs.get('packing'),
+                                     '4fold' if pack_symmetric else None)
+
+                loaded = QMolecule(file_name)
+                loaded.load(lazy=True)
+                self.assertIsNone(loaded.mo_onee_ints_b)
+                for name, ndim in [('mo_onee_ints', 2), ('mo_eri_ints', 4),
+                                   ('mo_eri_ints_ba', 4)]:
+                    self.assertNotIn(name, loaded.__dict__)
+                    np.testing.assert_array_almost_equal(
+                        loaded.integrals_block(name, orbitals),
+                        getattr(qmolecule, name)[np.ix_(*[orbitals] * ndim)])
+                    self.assertNotIn(name, loaded.__dict__)
+                    np.testing.assert_array_almost_equal(getattr(loaded, name),
+                                                         getattr(qmolecule, name))
+                    np.testing.assert_array_almost_equal(
+                        loaded.integrals_block(name, orbitals),
+                        getattr(qmolecule, name)[np.ix_(*[orbitals] * ndim)])
+                self.assertEqual(isinstance(loaded.mo_coeff, np.memmap), compression is None)
+
+                # saving a lazy molecule over its own file
+                loaded.save()
+                reloaded = QMolecule(file_name)
+                reloaded.load()
+                np.testing.assert_array_almost_equal(reloaded.mo_coeff, self.moc)
+                np.testing.assert_array_almost_equal(reloaded.mo_eri_ints, self.reference)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the cached circuit of UCCSD """
+
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+from ddt import ddt, data, unpack
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import ParameterVector
+from qiskit.quantum_info import Statevector
+from qiskit.chemistry.components.initial_states import HartreeFock
+from qiskit.chemistry.components.variational_forms import UCCSD
+from qiskit.chemistry.components.variational_forms.uccsd import _cancel_inverse_gates
+
+
+def _statevector(circuit):
+    return Statevector.from_instruction(circuit).data
+
+
+@ddt
+class TestUCCSDCircuitTemplate(QiskitChemistryTestCase):
+    """ UCCSD cached circuit tests """
+
+    def _var_forms(self, qubit_mapping, two_qubit_reduction, method_doubles='ucc'):
+        initial_state = HartreeFock(8, [2, 1], qubit_mapping, two_qubit_reduction)
+        return [UCCSD(num_orbitals=8, num_particles=[2, 1], initial_state=initial_state,
+                      qubit_mapping=qubit_mapping, two_qubit_reduction=two_qubit_reduction,
+                      method_doubles=method_doubles, cache_circuit=cache_circuit)
+                for cache_circuit in (False, True)]
+
+    @data(('jordan_wigner', False, 'ucc'), ('parity', True, 'ucc'),
+          ('parity', True, 'succ_full'))
+    @unpack
+    def test_bound_circuit(self, qubit_mapping, two_qubit_reduction, method_doubles):
+        """ the bound copies of the template are the built circuits, with fewer CNOTs """
+        var_form, cached = self._var_forms(qubit_mapping, two_qubit_reduction, method_doubles)
+        rng = np.random.RandomState(5)
+        for _ in range(2):
+            params = rng.uniform(-np.pi, np.pi, var_form.num_parameters)
+            circuit = cached.construct_circuit(params)
+            self.assertFalse(circuit.parameters)
+            np.testing.assert_array_almost_equal(
+                _statevector(circuit), _statevector(var_form.construct_circuit(params)))
+        # pylint: disable=protected-access
+        template = cached._circuit_template[2]
+        cached.construct_circuit(params)
+        self.assertIs(cached._circuit_template[2], template)
+        expected_ops = transpile(var_form.construct_circuit(params), basis_gates=['u', 'p', 'cx'],
+                                 optimization_level=0).count_ops()
+        self.assertLess(circuit.count_ops()['cx'], expected_ops['cx'])
+
+    def test_parameterized(self):
+        """ the template is returned with the given parameters """
+        var_form, cached = self._var_forms('parity', True)
+        params = ParameterVector('x', cached.num_parameters)
+        circuit = cached.construct_circuit(params)
+        self.assertEqual(circuit.parameters, set(params))
+        values = np.random.RandomState(7).uniform(-np.pi, np.pi, var_form.num_parameters)
+        np.testing.assert_array_almost_equal(
+            _statevector(circuit.assign_parameters(dict(zip(params, values)))),
+            _statevector(var_form.construct_circuit(values)))
+
+    def test_hopping_operators_changed(self):
+        """ the template is built again when the hopping operators change """
+        var_form, cached = self._var_forms('parity', True)
+        cached.manage_hopping_operators()
+        self.assertEqual(cached.construct_circuit([]).count_ops().get('cx', 0), 0)
+        cached.push_hopping_operator(cached.excitation_pool[3])
+        var_form.manage_hopping_operators()
+        var_form.push_hopping_operator(var_form.excitation_pool[3])
+        np.testing.assert_array_almost_equal(_statevector(cached.construct_circuit([0.4])),
+                                             _statevector(var_form.construct_circuit([0.4])))
+
+    def test_cancel_inverse_gates(self):
+        """ the gates undoing the previous ones on their qubits are cancelled """
+        circuit = QuantumCircuit(3)
+        circuit.u(np.pi / 2, -np.pi / 2, np.pi / 2, 0)
+        circuit.h(1)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.p(0.3, 2)
+        circuit.cx(1, 2)
+        circuit.cx(0, 1)
+        circuit.cx(0, 1)
+        circuit.h(1)
+        circuit.u(-np.pi / 2, -np.pi / 2, np.pi / 2, 0)
+        circuit.cx(0, 2)
+        circuit.x(2)
+        circuit.cx(0, 2)
+        kept = _cancel_inverse_gates(circuit.data)
+        self.assertListEqual([inst.name for inst, _, _ in kept],
+                             ['u', 'h', 'cx', 'cx', 'p', 'cx', 'h', 'u', 'cx', 'x', 'cx'])
+        reduced = QuantumCircuit(3)
+        for inst, qargs, cargs in kept:
+            reduced.append(inst, qargs, cargs)
+        np.testing.assert_array_almost_equal(_statevector(reduced), _statevector(circuit))
+
+
+if __name__ == '__main__':
+    unittest.main()
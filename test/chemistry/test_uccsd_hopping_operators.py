@@ -0,0 +1,137 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the hopping operators of UCCSD """
+
+import tempfile
+import unittest
+from unittest.mock import patch
+from test.chemistry import QiskitChemistryTestCase
+import numpy as np
+from ddt import ddt, data, unpack
+from qiskit.aqua.operators import WeightedPauliOperator, Z2Symmetries
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.components.variational_forms import UCCSD
+
+
+def _reference_hopping_operator(index, num_orbitals, num_particles, qubit_mapping,
+                                two_qubit_reduction, z2_symmetries):
+    """ the hopping operator mapped from the dense integrals """
+    h_1 = np.zeros((num_orbitals, num_orbitals))
+    h_2 = np.zeros((num_orbitals, num_orbitals, num_orbitals, num_orbitals))
+    if len(index) == 2:
+        i, j = index
+        h_1[i, j] = 1.0
+        h_1[j, i] = -1.0
+    else:
+        i, j, k, m = index
+        h_2[i, j, k, m] = 1.0
+        h_2[m, k, j, i] = -1.0
+    qubit_op = FermionicOperator(h1=h_1, h2=h_2).mapping(qubit_mapping)
+    if two_qubit_reduction:
+        qubit_op = Z2Symmetries.two_qubit_reduction(qubit_op, num_particles)
+    if not z2_symmetries.is_empty():
+        for symmetry in z2_symmetries.symmetries:
+            if not qubit_op.commute_with(WeightedPauliOperator(paulis=[[1.0, symmetry]])):
+                return None
+        qubit_op = z2_symmetries.taper(qubit_op)
+    return qubit_op
+
+
+@ddt
+class TestUCCSDHoppingOperators(QiskitChemistryTestCase):
+    """ UCCSD hopping operators tests """
+
+    def setUp(self):
+        super().setUp()
+        # pylint: disable=protected-access
+        UCCSD._hopping_operators_cache.clear()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        # pylint: disable=protected-access
+        UCCSD._hopping_operators_cache.clear()
+        self._tmp_dir.cleanup()
+
+    def _assert_reference_ops(self, var_form, num_orbitals, num_particles, qubit_mapping,
+                              two_qubit_reduction, z2_symmetries):
+        single, double = UCCSD.compute_excitation_lists(num_particles, num_orbitals)
+        expected = [_reference_hopping_operator(index, num_orbitals, num_particles,
+                                                qubit_mapping, two_qubit_reduction,
+                                                z2_symmetries) for index in single + double]
+        expected = [op for op in expected if op is not None and not op.is_empty()]
+        # pylint: disable=protected-access
+        ops = var_form._hopping_ops
+        self.assertEqual(len(ops), len(expected))
+        for op, expected_op in zip(ops, expected):
+            self.assertEqual(op.print_details(), expected_op.print_details())
+            self.assertEqual(str(op.z2_symmetries), str(expected_op.z2_symmetries))
+
+    @data(('jordan_wigner', False), ('parity', False), ('parity', True),
+          ('bravyi_kitaev', False))
+    @unpack
+    def test_direct_mapping(self, qubit_mapping, two_qubit_reduction):
+        """ the hopping operators are the ones mapped from the dense integrals """
+        var_form = UCCSD(num_orbitals=8, num_particles=[2, 1], qubit_mapping=qubit_mapping,
+                         two_qubit_reduction=two_qubit_reduction)
+        self._assert_reference_ops(var_form, 8, [2, 1], qubit_mapping, two_qubit_reduction,
+                                   Z2Symmetries([], [], [], []))
+
+    def test_tapered(self):
+        """ the tapered hopping operators, skipping the ones not commuting with the
+        symmetries """
+        driver = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5'))
+        qmolecule = driver.run()
+        fer_op = FermionicOperator(h1=qmolecule.one_body_integrals,
+                                   h2=qmolecule.two_body_integrals)
+        z2_symmetries = Z2Symmetries.find_Z2_symmetries(fer_op.mapping('jordan_wigner'))
+        z2_symmetries.tapering_values = [1] * len(z2_symmetries.sq_list)
+        var_form = UCCSD(num_orbitals=4, num_particles=[1, 1], qubit_mapping='jordan_wigner',
+                         two_qubit_reduction=False, z2_symmetries=z2_symmetries)
+        self._assert_reference_ops(var_form, 4, [1, 1], 'jordan_wigner', False, z2_symmetries)
+
+    def test_memoized(self):
+        """ the hopping operators are mapped once per settings """
+        var_form = UCCSD(num_orbitals=6, num_particles=[1, 1])
+        with patch.object(UCCSD, '_build_hopping_operator') as build:
+            other = UCCSD(num_orbitals=6, num_particles=[1, 1], active_unoccupied=[0])
+            build.assert_not_called()
+        # pylint: disable=protected-access
+        self.assertEqual(other._single_excitations, [[0, 1], [3, 4]])
+        self.assertEqual(other._hopping_ops[0].print_details(),
+                         var_form._hopping_ops[0].print_details())
+        self.assertIsNot(other._hopping_ops[0], var_form._hopping_ops[0])
+        # other settings are mapped again
+        jordan_wigner = UCCSD(num_orbitals=6, num_particles=[1, 1],
+                              qubit_mapping='jordan_wigner', two_qubit_reduction=False)
+        self.assertEqual(jordan_wigner.num_qubits, 6)
+
+    def test_stored(self):
+        """ the hopping operators are loaded from the cache directory """
+        var_form = UCCSD(num_orbitals=6, num_particles=[1, 1],
+                         hopping_operator_cache_dir=self._tmp_dir.name)
+        # pylint: disable=protected-access
+        UCCSD._hopping_operators_cache.clear()
+        with patch.object(UCCSD, '_build_hopping_operator') as build:
+            loaded = UCCSD(num_orbitals=6, num_particles=[1, 1],
+                           hopping_operator_cache_dir=self._tmp_dir.name)
+            build.assert_not_called()
+        self.assertEqual(len(loaded._hopping_ops), len(var_form._hopping_ops))
+        for op, expected in zip(loaded._hopping_ops, var_form._hopping_ops):
+            self.assertEqual(op.print_details(), expected.print_details())
+            self.assertEqual(str(op.z2_symmetries), str(expected.z2_symmetries))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,9 @@
 import unittest
 from test.chemistry import QiskitChemistryTestCase
 
-from qiskit.aqua import aqua_globals
+import numpy as np
+from qiskit import BasicAer
+from qiskit.aqua import aqua_globals, QuantumInstance
 from qiskit.aqua.components.optimizers import L_BFGS_B
 from qiskit.aqua.operators.legacy.op_converter import to_weighted_pauli_operator
 from qiskit.aqua.operators.legacy.weighted_pauli_operator import Z2Symmetries
@@ -23,7 +25,7 @@ from qiskit.chemistry import FermionicOperator
 from qiskit.chemistry.algorithms import VQEAdapt
 from qiskit.chemistry.components.initial_states import HartreeFock
 from qiskit.chemistry.components.variational_forms import UCCSD
-from qiskit.chemistry.drivers import PySCFDriver, UnitsType
+from qiskit.chemistry.drivers import PySCFDriver, UnitsType, HDF5Driver
 from qiskit.chemistry import QiskitChemistryError
 
 
@@ -125,5 +127,40 @@ class TestVQEAdaptUCCSD(QiskitChemistryTestCase):
                 self.assertEqual(is_cycle, VQEAdapt._check_cyclicity(seq))
 
 
+class TestVQEAdaptGradients(QiskitChemistryTestCase):
+    """ Test the gradients of the excitations in Adaptive VQE """
+
+    def setUp(self):
+        super().setUp()
+        driver = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5'))
+        molecule = driver.run()
+        self.num_particles = molecule.num_alpha + molecule.num_beta
+        self.num_spin_orbitals = molecule.num_orbitals * 2
+        fer_op = FermionicOperator(h1=molecule.one_body_integrals, h2=molecule.two_body_integrals)
+        self.qubit_op = fer_op.mapping('jordan_wigner')
+        self.init_state = HartreeFock(self.num_spin_orbitals, self.num_particles,
+                                      qubit_mapping='jordan_wigner', two_qubit_reduction=False)
+
+    def test_batched_gradients(self):
+        """ the batched gradients are the gradients of each excitation in turn """
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        gradients = []
+        for batch_gradients in (True, False):
+            var_form_base = UCCSD(self.num_spin_orbitals, self.num_particles,
+                                  qubit_mapping='jordan_wigner', two_qubit_reduction=False,
+                                  initial_state=self.init_state)
+            algorithm = VQEAdapt(self.qubit_op, var_form_base, L_BFGS_B(), delta=0.1,
+                                 quantum_instance=quantum_instance,
+                                 batch_gradients=batch_gradients)
+            gradients.append(algorithm._compute_gradients(var_form_base.excitation_pool, [],
+                                                          0.1, var_form_base, self.qubit_op,
+                                                          L_BFGS_B()))
+            self.assertEqual(len(gradients[-1]), len(var_form_base.excitation_pool))
+            self.assertEqual(var_form_base._hopping_ops, [])
+        np.testing.assert_array_almost_equal([grad for grad, _ in gradients[0]],
+                                             [grad for grad, _ in gradients[1]])
+        self.assertGreater(max(grad for grad, _ in gradients[0]), 1e-3)
+
+
 if __name__ == '__main__':
     unittest.main()
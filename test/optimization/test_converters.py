@@ -405,6 +405,36 @@ class TestConverters(QiskitOptimizationTestCase):
         self.assertEqual(qubitop, QUBIT_OP_MAXIMIZE_SAMPLE)
         self.assertEqual(offset, OFFSET_MAXIMIZE_SAMPLE)
 
+    def test_quadratic_program_to_ising_energies(self):
+        """ Test the Ising Hamiltonian of a QUBO reproduces the objective values """
+        num_vars = 6
+        rng = np.random.RandomState(5)
+        quadratic = rng.randint(-5, 5, size=(num_vars, num_vars))
+        quadratic[1, :] = 0
+        quadratic[:, 1] = 0
+        linear = rng.randint(-5, 5, size=num_vars)
+        linear[1] = 0
+        for maximize in [False, True]:
+            with self.subTest(maximize=maximize):
+                op = QuadraticProgram()
+                for _ in range(num_vars):
+                    op.binary_var()
+                if maximize:
+                    op.maximize(constant=3, linear=linear, quadratic=quadratic)
+                else:
+                    op.minimize(constant=3, linear=linear, quadratic=quadratic)
+                qubitop, offset = op.to_ising()
+                self.assertFalse(any(term.primitive.z[1] for term in qubitop))
+                energies = qubitop.to_matrix().diagonal().real + offset
+                sense = op.objective.sense.value
+                for k, energy in enumerate(energies):
+                    x = [(k >> i) & 1 for i in range(num_vars)]
+                    self.assertAlmostEqual(energy, sense * op.objective.evaluate(x))
+                ising_op, ising_offset = op.to_ising(diagonal=True)
+                self.assertEqual(ising_offset, offset)
+                np.testing.assert_array_almost_equal(ising_op.to_diagonal() + ising_offset,
+                                                     energies)
+
     def test_ising_to_quadraticprogram_linear(self):
         """ Test optimization problem to operators with linear=True"""
         op = QUBIT_OP_MAXIMIZE_SAMPLE